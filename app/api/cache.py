@@ -0,0 +1,107 @@
+"""
+API Response Caching - Decorator for cacheable GET endpoints
+"""
+import functools
+import inspect
+import json
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.deps import get_current_player_id
+from app.utils.cache import (
+    SCOPE_GLOBAL,
+    SCOPE_PLAYER,
+    ResponseCache,
+    build_cache_key,
+    etag_matches,
+    player_tag,
+    response_cache
+)
+
+
+def cached_response(
+    ttl: float,
+    scope: str = SCOPE_GLOBAL,
+    tags: Iterable[str] = (),
+    response_model: Optional[Any] = None,
+    cache: Optional[ResponseCache] = None
+) -> Callable:
+    """
+    Cache a GET endpoint's serialized response.
+
+    On a miss the endpoint runs, its result is validated against
+    response_model once and the JSON bytes are stored. Hits return the
+    stored bytes directly (no service call, no validation), or 304 when
+    If-None-Match matches the ETag.
+
+    Player-scoped entries are keyed by the caller and also tagged with
+    player_tag(tag, player_id) so one player's entries can be dropped.
+
+    Args:
+        ttl: Time to live in seconds
+        scope: SCOPE_GLOBAL or SCOPE_PLAYER
+        tags: Invalidation tags
+        response_model: Model/type used to validate and serialize misses
+        cache: Cache to use (defaults to the shared response cache)
+
+    Returns:
+        Endpoint decorator
+    """
+    tags = tuple(tags)
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def decorator(endpoint: Callable) -> Callable:
+        signature = inspect.signature(endpoint)
+        wants_request = "request" in signature.parameters
+        parameters = list(signature.parameters.values())
+        if not wants_request:
+            parameters.append(inspect.Parameter(
+                "request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+            ))
+        route = f"{endpoint.__module__}.{endpoint.__qualname__}"
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"] if wants_request else kwargs.pop("request")
+            store = cache or response_cache
+
+            player_id = None
+            entry_tags = set(tags)
+            if scope == SCOPE_PLAYER:
+                player_id = await get_current_player_id(request.headers.get("authorization"))
+                entry_tags.update(player_tag(tag, player_id) for tag in tags)
+
+            key = build_cache_key(route, request.url.path, request.url.query, player_id)
+            entry = store.get(key)
+            status = "HIT"
+
+            if entry is None:
+                status = "MISS"
+                result = await endpoint(*args, **kwargs)
+                if isinstance(result, Response):
+                    return result
+                if adapter is not None:
+                    body = adapter.dump_json(adapter.validate_python(result), by_alias=True)
+                else:
+                    body = json.dumps(
+                        jsonable_encoder(result), separators=(",", ":"), ensure_ascii=False
+                    ).encode()
+                entry = store.set(key, body, ttl, entry_tags)
+
+            visibility = "private" if scope == SCOPE_PLAYER else "public"
+            headers = {
+                "ETag": entry.etag,
+                "Cache-Control": f"{visibility}, max-age={store.ttl_remaining(entry)}",
+                "X-Cache": status
+            }
+            if etag_matches(request.headers.get("if-none-match"), entry.etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=entry.body, media_type="application/json", headers=headers)
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,275 @@
+"""
+API Dependencies - Shared services and request context for endpoints
+
+Services that read or write the database are built per request around
+the request's session (get_db_session), which commits when the request
+succeeds. Repositories are imported on first use, keeping SQLAlchemy
+out of startup.
+Services holding only in-process state or a Redis client (battle
+sessions, leaderboards, gacha tables) are shared by the worker.
+"""
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from fastapi import Depends, Header, WebSocket
+
+from app.config.settings import get_settings
+from app.core.exceptions import AuthenticationException, AuthorizationException
+from app.core.security import get_subject_from_token
+from app.repositories.battle_repository import BattleRepository, RedisBattleRepository
+from app.repositories.leaderboard_repository import (
+    InMemoryLeaderboardRepository,
+    RedisLeaderboardRepository
+)
+from app.services.battle_service import BattleService
+from app.services.battle_session_service import BattleSessionService
+from app.services.equipment_service import EquipmentService
+from app.services.gacha_service import GachaService
+from app.services.gear_optimizer_service import GearOptimizerService
+from app.services.hero_service import HeroService
+from app.services.leaderboard_service import LeaderboardService
+from app.services.player_service import PlayerService
+from app.services.story_service import StoryService
+from app.services.team_builder_service import TeamBuilderService
+from app.services.team_service import TeamService
+from app.utils.profiling import ProfileStore
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# Player used when no token is sent in debug mode (matches AuthService mocks)
+DEBUG_PLAYER_ID = "mock-player-uuid"
+
+
+async def get_current_player_id(
+    authorization: Optional[str] = Header(default=None)
+) -> str:
+    """
+    Resolve the player ID from the bearer token.
+
+    Args:
+        authorization: The Authorization header
+
+    Returns:
+        The authenticated player ID
+
+    Raises:
+        AuthenticationException: If no token was sent outside debug mode
+        InvalidTokenException: If the token is invalid
+    """
+    if not authorization:
+        return _resolve_player_id(None)
+
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise AuthenticationException("Invalid authorization header")
+
+    return _resolve_player_id(token)
+
+
+async def get_websocket_player_id(websocket: WebSocket) -> str:
+    """
+    Resolve the player ID for a WebSocket connection.
+
+    Browsers cannot set headers on WebSocket handshakes, so the token
+    may also be passed as the ``token`` query parameter.
+
+    Args:
+        websocket: The WebSocket connection
+
+    Returns:
+        The authenticated player ID
+    """
+    token = websocket.query_params.get("token")
+    if token:
+        return _resolve_player_id(token)
+    return await get_current_player_id(websocket.headers.get("authorization"))
+
+
+async def require_admin(player_id: str = Depends(get_current_player_id)) -> str:
+    """
+    Allow only players listed in ADMIN_PLAYER_IDS.
+
+    Returns:
+        The admin's player ID
+
+    Raises:
+        AuthorizationException: If the player is not an admin
+    """
+    if player_id not in get_settings().ADMIN_PLAYER_IDS:
+        raise AuthorizationException("Admin access required")
+    return player_id
+
+
+def _resolve_player_id(token: Optional[str]) -> str:
+    """Decode a token, falling back to the debug player when allowed."""
+    if not token:
+        if get_settings().DEBUG:
+            return DEBUG_PLAYER_ID
+        raise AuthenticationException("Not authenticated")
+    return get_subject_from_token(token)
+
+
+@lru_cache()
+def get_battle_repository() -> BattleRepository:
+    """Get the battle store (shared by every worker when it is Redis)"""
+    settings = get_settings()
+    if settings.BATTLE_STORE_BACKEND == "redis":
+        return RedisBattleRepository(url=settings.REDIS_URL)
+    return BattleRepository()
+
+
+@lru_cache()
+def get_battle_service() -> BattleService:
+    """Get the shared battle service"""
+    return BattleService()
+
+
+@lru_cache()
+def get_leaderboard_service() -> LeaderboardService:
+    """Get the shared leaderboard service"""
+    settings = get_settings()
+    if settings.LEADERBOARD_BACKEND == "redis":
+        repository = RedisLeaderboardRepository(url=settings.REDIS_URL)
+    else:
+        repository = InMemoryLeaderboardRepository()
+    return LeaderboardService(repository=repository)
+
+
+async def get_db_session() -> AsyncIterator["AsyncSession"]:
+    """
+    Get the request's database session (committed if the request succeeds).
+
+    Wraps app.config.database.get_db, imported on first use so that
+    starting the app does not load SQLAlchemy.
+    """
+    from app.config.database import get_db
+
+    async with asynccontextmanager(get_db)() as session:
+        yield session
+
+
+def get_player_service(db: "AsyncSession" = Depends(get_db_session)) -> PlayerService:
+    """Get a player service on the request's session"""
+    from app.repositories.player_repository import PlayerRepository
+
+    return PlayerService(
+        player_repository=PlayerRepository(db),
+        leaderboard_service=get_leaderboard_service()
+    )
+
+
+def get_hero_service(
+    db: "AsyncSession" = Depends(get_db_session),
+    player_service: PlayerService = Depends(get_player_service)
+) -> HeroService:
+    """Get a hero service on the request's session"""
+    from app.repositories.equipment_repository import EquipmentRepository
+    from app.repositories.hero_repository import HeroRepository
+
+    return HeroService(
+        hero_repository=HeroRepository(db),
+        equipment_repository=EquipmentRepository(db),
+        player_service=player_service,
+        leaderboard_service=get_leaderboard_service()
+    )
+
+
+def get_equipment_service(
+    db: "AsyncSession" = Depends(get_db_session),
+    player_service: PlayerService = Depends(get_player_service),
+    hero_service: HeroService = Depends(get_hero_service)
+) -> EquipmentService:
+    """Get an equipment service on the request's session"""
+    from app.repositories.equipment_repository import EquipmentRepository
+
+    return EquipmentService(
+        equipment_repository=EquipmentRepository(db),
+        player_service=player_service,
+        hero_service=hero_service
+    )
+
+
+def get_gear_optimizer_service(
+    db: "AsyncSession" = Depends(get_db_session),
+    hero_service: HeroService = Depends(get_hero_service)
+) -> GearOptimizerService:
+    """Get a gear optimizer service on the request's session"""
+    from app.repositories.equipment_repository import EquipmentRepository
+
+    return GearOptimizerService(
+        equipment_repository=EquipmentRepository(db),
+        hero_service=hero_service
+    )
+
+
+def get_team_service(
+    db: "AsyncSession" = Depends(get_db_session),
+    hero_service: HeroService = Depends(get_hero_service)
+) -> TeamService:
+    """Get a team service on the request's session"""
+    from app.repositories.team_repository import TeamRepository
+
+    return TeamService(hero_service=hero_service, team_repository=TeamRepository(db))
+
+
+@lru_cache()
+def get_gacha_service() -> GachaService:
+    """Get the shared gacha service"""
+    return GachaService()
+
+
+def get_story_service(
+    db: "AsyncSession" = Depends(get_db_session),
+    player_service: PlayerService = Depends(get_player_service)
+) -> StoryService:
+    """Get a story service on the request's session"""
+    from app.repositories.player_repository import PlayerRepository
+
+    return StoryService(
+        player_service=player_service,
+        battle_service=get_battle_service(),
+        player_repository=PlayerRepository(db),
+        leaderboard_service=get_leaderboard_service()
+    )
+
+
+def get_team_builder_service(
+    db: "AsyncSession" = Depends(get_db_session),
+    team_service: TeamService = Depends(get_team_service),
+    story_service: StoryService = Depends(get_story_service)
+) -> TeamBuilderService:
+    """Get a team builder service on the request's session"""
+    from app.repositories.hero_repository import HeroRepository
+
+    return TeamBuilderService(
+        hero_repository=HeroRepository(db),
+        team_service=team_service,
+        story_service=story_service,
+        battle_service=get_battle_service()
+    )
+
+
+@lru_cache()
+def get_battle_session_service() -> BattleSessionService:
+    """Get this worker's battle session cache"""
+    settings = get_settings()
+    return BattleSessionService(
+        battle_repository=get_battle_repository(),
+        battle_service=get_battle_service(),
+        capacity=settings.BATTLE_SESSION_CACHE_SIZE,
+        flush_every=settings.BATTLE_FLUSH_EVERY,
+        leaderboard_service=get_leaderboard_service()
+    )
+
+
+@lru_cache()
+def get_profile_store() -> ProfileStore:
+    """Get the store for captured request profiles"""
+    settings = get_settings()
+    directory = settings.PROFILING_DIR or os.path.join(tempfile.gettempdir(), "ngoa_long_profiles")
+    return ProfileStore(directory, max_files=settings.PROFILING_MAX_FILES)
@@ -0,0 +1,398 @@
+"""
+Application Lifespan - Startup warm-up and readiness
+
+A fresh worker would otherwise pay for its first requests: building the
+story layout and factory templates, compiling gacha tables, loading the
+JWT/crypto backends, opening DB connections and filling the response
+cache. The lifespan does that work before the server accepts traffic.
+
+Liveness (/health) only says the process is up. Readiness (/ready) says
+warm-up finished and every step succeeded, and reports pool status,
+cache warmness and the static data version.
+
+Steps that fail (e.g. the database was still starting) are retried in
+the background with exponential backoff, so a worker becomes ready once
+its dependencies are up instead of staying degraded until a restart.
+Request paths read and write the database, so the database steps
+failing means requests fail too; readiness keeping the worker out of
+rotation until then is intended.
+"""
+import asyncio
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.config.settings import Settings, get_settings
+from app.domain.static_data import static_data
+from app.utils.cache import CACHE_TAG_EQUIPMENT_TEMPLATES, invalidate_cached_responses, response_cache
+
+
+logger = logging.getLogger(__name__)
+
+# Header marking the lifespan's own requests (for logs and metrics filters)
+WARMUP_HEADER = "x-warmup"
+
+
+@dataclass
+class WarmupStep:
+    """
+    Outcome of one warm-up step.
+
+    Attributes:
+        ok: Whether the step succeeded
+        seconds: Time the step took
+        detail: What the step loaded
+        error: Error message when the step failed
+        attempts: Times the step has run
+    """
+
+    ok: bool
+    seconds: float
+    detail: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    attempts: int = 1
+
+
+@dataclass
+class WarmupState:
+    """
+    Warm-up progress of this worker.
+
+    Attributes:
+        finished: Whether every step has run
+        seconds: Total warm-up time
+        retrying: Whether failed steps are being retried in the background
+        steps: Outcome per step name
+    """
+
+    finished: bool = False
+    seconds: float = 0.0
+    retrying: bool = False
+    steps: Dict[str, WarmupStep] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        """Warm-up finished and no step failed"""
+        return self.finished and all(step.ok for step in self.steps.values())
+
+
+async def _load_static_data(app, settings: Settings) -> Dict[str, Any]:
+    """Build the story layout and the hero/skill template factories."""
+    from app.domain.factories import get_hero_factory, get_skill_factory
+    from app.services.story_service import CHAPTERS
+
+    if static_data.get_story_layout() is None:
+        static_data.load_story_chapters(CHAPTERS)
+    return {
+        "version": static_data.version,
+        "story_version": static_data.story_version,
+        "equipment_sets": len(static_data.get_equipment_sets()),
+        "hero_templates": len(get_hero_factory().get_all_templates()),
+        "skill_templates": len(get_skill_factory().get_all_templates())
+    }
+
+
+async def _load_equipment_templates(app, settings: Settings) -> Dict[str, Any]:
+    """Load EquipmentTemplate rows into the registry (fusion and gear optimizer read them)."""
+    if not settings.WARMUP_EQUIPMENT_TEMPLATES:
+        return {"skipped": True}
+
+    from app.config.database import get_session_factory
+    from app.repositories.equipment_repository import EquipmentTemplateRepository
+
+    async with get_session_factory()() as session:
+        templates = await EquipmentTemplateRepository(session).get_all()
+    static_data.load_equipment_templates(templates)
+    invalidate_cached_responses(CACHE_TAG_EQUIPMENT_TEMPLATES)
+    return {"equipment_templates": len(templates), "version": static_data.version}
+
+
+async def _rebuild_leaderboards(app, settings: Settings) -> Dict[str, Any]:
+    """
+    Seed the level, power and stars boards from the database (an
+    in-process board starts empty). Wins only come from battle results.
+    """
+    if not settings.WARMUP_LEADERBOARDS:
+        return {"skipped": True}
+
+    from app.api.deps import get_leaderboard_service
+    from app.config.database import get_session_factory
+    from app.repositories.hero_repository import HeroRepository
+    from app.repositories.player_repository import PlayerRepository
+    from app.services.hero_service import HeroService
+    from app.services.player_service import PlayerService
+    from app.services.story_service import StoryService
+
+    leaderboard_service = get_leaderboard_service()
+    async with get_session_factory()() as session:
+        player_repository = PlayerRepository(session)
+        return {
+            "level": await PlayerService(
+                player_repository=player_repository,
+                leaderboard_service=leaderboard_service
+            ).rebuild_level_board(),
+            "power": await HeroService(
+                hero_repository=HeroRepository(session),
+                leaderboard_service=leaderboard_service
+            ).rebuild_power_board(),
+            "stars": await StoryService(
+                player_repository=player_repository,
+                leaderboard_service=leaderboard_service
+            ).rebuild_stars_board()
+        }
+
+
+async def _compile_gacha_tables(app, settings: Settings) -> Dict[str, Any]:
+    """Compile the roll table of every active banner."""
+    from app.services.gacha_service import compile_banner_tables
+
+    return {"banners": sorted(compile_banner_tables())}
+
+
+async def _prime_security(app, settings: Settings) -> Dict[str, Any]:
+    """Sign and verify a token and build the password context."""
+    from app.core.security import create_access_token, get_password_context, verify_access_token
+
+    verify_access_token(create_access_token("warmup"))
+    get_password_context()
+    return {"algorithm": settings.ALGORITHM}
+
+
+async def _open_database_pool(app, settings: Settings) -> Dict[str, Any]:
+    """Open WARMUP_DB_CONNECTIONS connections so they stay pooled."""
+    count = settings.WARMUP_DB_CONNECTIONS
+    if count <= 0:
+        return {"skipped": True}
+
+    from app.config.database import get_engine
+
+    engine = get_engine()
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
+    return {"connections": count, "pool": engine.pool.status()}
+
+
+async def _prime_routes(app, settings: Settings) -> Dict[str, Any]:
+    """GET each WARMUP_PATHS route in-process to fill the response cache."""
+    statuses = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+        for path in settings.WARMUP_PATHS:
+            response = await client.get(path, headers={WARMUP_HEADER: "1"})
+            statuses[path] = response.status_code
+
+    failed = {path: code for path, code in statuses.items() if code >= 400}
+    if failed:
+        raise RuntimeError(f"Warm-up requests failed: {failed}")
+    return {"paths": statuses, "cache_entries": len(response_cache)}
+
+
+# Run in order; later steps rely on the earlier ones
+WARMUP_STEPS = {
+    "static_data": _load_static_data,
+    "equipment_templates": _load_equipment_templates,
+    "leaderboards": _rebuild_leaderboards,
+    "gacha_tables": _compile_gacha_tables,
+    "security": _prime_security,
+    "database_pool": _open_database_pool,
+    "response_cache": _prime_routes
+}
+
+
+async def warm_up(app, settings: Optional[Settings] = None) -> WarmupState:
+    """
+    Run every warm-up step and store the outcome on app.state.warmup.
+
+    A failing step is logged and recorded; the others still run, and
+    readiness reports the worker as not ready.
+
+    Args:
+        app: The FastAPI application
+        settings: Settings to use (defaults to the app settings)
+
+    Returns:
+        The warm-up state
+    """
+    settings = settings or get_settings()
+    state = WarmupState()
+    app.state.warmup = state
+
+    started = time.perf_counter()
+    for name in WARMUP_STEPS:
+        await _run_step(app, settings, state, name)
+    state.seconds = time.perf_counter() - started
+    state.finished = True
+    logger.info("Warm-up finished in %.3fs (ready: %s)", state.seconds, state.ready)
+    return state
+
+
+async def retry_failed_steps(app, state: WarmupState, settings: Optional[Settings] = None) -> bool:
+    """
+    Re-run failed warm-up steps with exponential backoff.
+
+    Waits WARMUP_RETRY_DELAY seconds before the first retry and doubles
+    the wait (up to WARMUP_RETRY_MAX_DELAY) after every round that still
+    has failures, for at most WARMUP_RETRY_ATTEMPTS rounds. Failed steps
+    are re-run in WARMUP_STEPS order.
+
+    Args:
+        app: The FastAPI application
+        state: Warm-up state to update
+        settings: Settings to use (defaults to the app settings)
+
+    Returns:
+        Whether every step succeeded in the end
+    """
+    settings = settings or get_settings()
+    delay = settings.WARMUP_RETRY_DELAY
+    state.retrying = True
+    try:
+        for _ in range(settings.WARMUP_RETRY_ATTEMPTS):
+            if state.ready:
+                break
+            await asyncio.sleep(delay)
+            for name, step in list(state.steps.items()):
+                if not step.ok:
+                    await _run_step(app, settings, state, name, attempts=step.attempts + 1)
+            delay = min(delay * 2, settings.WARMUP_RETRY_MAX_DELAY)
+    finally:
+        state.retrying = False
+    logger.info("Warm-up retries finished (ready: %s)", state.ready)
+    return state.ready
+
+
+async def _run_step(
+    app,
+    settings: Settings,
+    state: WarmupState,
+    name: str,
+    attempts: int = 1
+) -> None:
+    """Run one warm-up step and record its outcome."""
+    step_started = time.perf_counter()
+    try:
+        detail = await WARMUP_STEPS[name](app, settings)
+    except Exception as error:
+        logger.exception("Warm-up step %s failed (attempt %d)", name, attempts)
+        state.steps[name] = WarmupStep(
+            ok=False, seconds=time.perf_counter() - step_started, error=str(error),
+            attempts=attempts
+        )
+    else:
+        state.steps[name] = WarmupStep(
+            ok=True, seconds=time.perf_counter() - step_started, detail=detail,
+            attempts=attempts
+        )
+
+
+def _database_status() -> Dict[str, Any]:
+    """Pool status, without creating the engine if nothing has used it."""
+    database = sys.modules.get("app.config.database")
+    if database is None or not database.get_engine.cache_info().currsize:
+        return {"engine": "not created"}
+    pool = database.get_engine().pool
+    status = {"engine": "created", "pool": pool.status()}
+    if hasattr(pool, "checkedout"):
+        status["checked_out"] = pool.checkedout()
+        status["checked_in"] = pool.checkedin()
+    return status
+
+
+def readiness_report(state: Optional[WarmupState]) -> Dict[str, Any]:
+    """
+    Build the readiness response body.
+
+    Args:
+        state: Warm-up state (None if the lifespan has not run)
+
+    Returns:
+        Readiness report; "status" is "ready", "starting" or "degraded"
+    """
+    if state is None or not state.finished:
+        status = "starting"
+    elif state.ready:
+        status = "ready"
+    else:
+        status = "degraded"
+
+    steps = state.steps if state is not None else {}
+    cache_step = steps.get("response_cache")
+    return {
+        "status": status,
+        "static_data_version": static_data.version,
+        "database": _database_status(),
+        "cache": {
+            "warm": bool(cache_step and cache_step.ok),
+            "entries": len(response_cache)
+        },
+        "warmup": {
+            "seconds": round(state.seconds, 4) if state is not None else None,
+            "retrying": bool(state and state.retrying),
+            "steps": {
+                name: {
+                    "ok": step.ok,
+                    "ms": round(step.seconds * 1000, 2),
+                    "attempts": step.attempts,
+                    **({"error": step.error} if step.error else step.detail)
+                }
+                for name, step in steps.items()
+            }
+        }
+    }
+
+
+async def _flush_battle_sessions() -> None:
+    """Checkpoint live battles, if this worker ever started one."""
+    deps = sys.modules.get("app.api.deps")
+    if deps is None or not deps.get_battle_session_service.cache_info().currsize:
+        return
+    try:
+        await deps.get_battle_session_service().flush_all()
+    except Exception:
+        logger.exception("Flushing battle sessions on shutdown failed")
+
+
+async def _dispose_engine() -> None:
+    """Close pooled connections, if the engine was ever created."""
+    database = sys.modules.get("app.config.database")
+    if database is not None and database.get_engine.cache_info().currsize:
+        await database.get_engine().dispose()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """
+    FastAPI lifespan: warm up before serving, retrying failed steps in the
+    background; on shutdown stop retrying, checkpoint live battles, then
+    release the pool.
+
+    Args:
+        app: The FastAPI application
+    """
+    settings = get_settings()
+    retry = None
+    if settings.WARMUP_ENABLED:
+        state = await warm_up(app, settings)
+        if not state.ready and settings.WARMUP_RETRY_ATTEMPTS > 0:
+            retry = asyncio.create_task(retry_failed_steps(app, state, settings))
+    else:
+        app.state.warmup = WarmupState(finished=True)
+    yield
+    if retry is not None:
+        retry.cancel()
+        try:
+            await retry
+        except asyncio.CancelledError:
+            pass
+    await _flush_battle_sessions()
+    await _dispose_engine()
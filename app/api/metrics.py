@@ -0,0 +1,148 @@
+"""
+API Metrics - Request instrumentation middleware and endpoint timing
+"""
+import functools
+import inspect
+import time
+from typing import Callable, Optional
+
+from fastapi.routing import APIRoute
+
+from app.utils.metrics import (
+    UNMATCHED_ROUTE,
+    MetricsRegistry,
+    get_request_timings,
+    metrics,
+    start_request_timings
+)
+
+
+# Request header that opts a response into the timing breakdown
+TIMING_REQUEST_HEADER = b"x-debug-timing"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency, status and response size.
+
+    Routes are labelled by their template (e.g. /api/v1/heroes/{hero_id}),
+    so label cardinality stays bounded. Requests sending X-Debug-Timing
+    get a Server-Timing header splitting the time into db, service and
+    serialization.
+    """
+
+    def __init__(
+        self,
+        app,
+        registry: Optional[MetricsRegistry] = None,
+        allow_breakdown: bool = True
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            registry: Registry to record into (defaults to the shared one)
+            allow_breakdown: Whether the timing header is honoured
+        """
+        self.app = app
+        self.registry = registry or metrics
+        self.allow_breakdown = allow_breakdown
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        timings = start_request_timings()
+        wants_breakdown = self.allow_breakdown and any(
+            name == TIMING_REQUEST_HEADER for name, _ in scope.get("headers", ())
+        )
+        response = {"status": 500, "bytes": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                if wants_breakdown:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(timings.breakdown())))
+                    message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        registry.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            registry.in_flight -= 1
+            route = scope.get("route")
+            registry.record_request(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                response["status"],
+                time.perf_counter() - timings.started_at,
+                response["bytes"],
+                timings
+            )
+
+
+def _server_timing(breakdown: dict) -> bytes:
+    """Render a breakdown (seconds) as a Server-Timing header value (ms)."""
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.2f}" for name, seconds in breakdown.items()
+    ).encode("latin-1")
+
+
+def timed_endpoint(endpoint: Callable) -> Callable:
+    """
+    Wrap an endpoint so its run time is added to the request timings.
+
+    Args:
+        endpoint: Endpoint function (sync or async)
+
+    Returns:
+        Wrapped endpoint with the same signature
+    """
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _add_endpoint_time(time.perf_counter() - started)
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _add_endpoint_time(time.perf_counter() - started)
+    return sync_wrapper
+
+
+def _add_endpoint_time(seconds: float) -> None:
+    timings = get_request_timings()
+    if timings is not None:
+        timings.endpoint_seconds += seconds
+
+
+def instrument_routes(app) -> None:
+    """
+    Time the endpoint function of every API route on an app.
+
+    Call after all routers are included. The route's request handler
+    looks up dependant.call on every request, so swapping it keeps
+    routing, dependencies and serialization untouched.
+
+    Args:
+        app: FastAPI application
+    """
+    for route in app.routes:
+        if isinstance(route, APIRoute) and not getattr(route.dependant.call, "__timed__", False):
+            route.dependant.call = timed_endpoint(route.dependant.call)
+            route.dependant.call.__timed__ = True
@@ -0,0 +1,91 @@
+"""
+API Profiling - Stack-sampling middleware for sampled and slow requests
+"""
+import asyncio
+import random
+import time
+from typing import Callable, Optional
+from urllib.parse import parse_qsl
+
+from app.utils.metrics import UNMATCHED_ROUTE
+from app.utils.profiling import ProfileStore, StackSampler, sampler as shared_sampler
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware saving a stack profile of selected requests.
+
+    Every request is sampled while in flight; when it finishes, the
+    profile is kept if the request took at least slow_seconds or was
+    picked by sample_rate, and dropped otherwise. Only installed when
+    profiling is enabled, so there is no cost when it is off.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        slow_seconds: float = 0.5,
+        sampler: Optional[StackSampler] = None,
+        chance: Callable[[], float] = random.random
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            store: Where kept profiles are saved
+            sample_rate: Fraction of requests kept regardless of latency
+            slow_seconds: Requests at least this slow are always kept
+            sampler: Stack sampler (defaults to the shared one)
+            chance: Source of uniform [0, 1) values for sample_rate
+        """
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+        self.sampler = sampler or shared_sampler
+        self.chance = chance
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            await send(message)
+
+        profile = self.sampler.track()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stacks = self.sampler.untrack(profile)
+            samples = sum(stacks.values())
+            seconds = time.perf_counter() - profile.started_at
+            reason = None
+            if seconds >= self.slow_seconds:
+                reason = "slow"
+            elif self.sample_rate and self.chance() < self.sample_rate:
+                reason = "sampled"
+
+            if reason is not None and samples:
+                route = scope.get("route")
+                record = {
+                    "reason": reason,
+                    "method": scope["method"],
+                    "route": getattr(route, "path", UNMATCHED_ROUTE),
+                    "path": scope["path"],
+                    "path_params": dict(scope.get("path_params") or {}),
+                    "query": dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"))),
+                    "status": response["status"],
+                    "duration_ms": round(seconds * 1000, 3),
+                    "interval_ms": self.sampler.interval * 1000,
+                    "samples": samples,
+                    "stacks": dict(stacks)
+                }
+                await asyncio.to_thread(self.store.save, record)
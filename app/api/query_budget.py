@@ -0,0 +1,43 @@
+"""
+API Query Budgets - Per-request statement tracking middleware
+"""
+from typing import Optional
+
+from app.utils.query_budget import QueryTracker, get_query_budget, query_tracker
+
+
+class QueryBudgetMiddleware:
+    """
+    ASGI middleware checking each request's statements against its route budget.
+
+    Development and test only: every statement is normalized, which is
+    too costly for production traffic. Requests that match no route are
+    not checked.
+    """
+
+    def __init__(self, app, tracker: Optional[QueryTracker] = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            tracker: Tracker to record into (defaults to the shared one)
+        """
+        self.app = app
+        self.tracker = tracker or query_tracker
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = self.tracker.start()
+        await self.app(scope, receive, send)
+
+        route = scope.get("route")
+        if route is not None:
+            self.tracker.finish(
+                queries,
+                f"{scope['method']} {route.path}",
+                get_query_budget(route.endpoint)
+            )
@@ -0,0 +1,70 @@
+"""
+Admin API Endpoints
+"""
+import asyncio
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from app.api.deps import get_profile_store, require_admin
+from app.core.exceptions import ResourceNotFoundException
+from app.utils.profiling import ProfileStore, to_collapsed
+
+router = APIRouter()
+
+
+# Response schemas
+class ProfileSummaryResponse(BaseModel):
+    """Captured request profile (without stacks)"""
+    id: str
+    captured_at: float
+    reason: str
+    method: str
+    route: str
+    path: str
+    path_params: Dict[str, str]
+    query: Dict[str, str]
+    status: int
+    duration_ms: float
+    interval_ms: float
+    samples: int
+
+
+# Endpoints
+@router.get("/profiles", response_model=List[ProfileSummaryResponse])
+async def list_profiles(
+    limit: int = Query(default=50, ge=1, le=500),
+    route: Optional[str] = None,
+    admin_id: str = Depends(require_admin),
+    store: ProfileStore = Depends(get_profile_store)
+):
+    """
+    List captured request profiles, newest first.
+
+    - **limit**: Most profiles to return
+    - **route**: Only profiles of this route template
+    """
+    return await asyncio.to_thread(store.list, limit, route)
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(
+    profile_id: str,
+    admin_id: str = Depends(require_admin),
+    store: ProfileStore = Depends(get_profile_store)
+):
+    """
+    Download a profile as collapsed stacks ("frame;frame count" lines).
+
+    Feed to flamegraph.pl, speedscope or inferno.
+
+    - **profile_id**: Profile ID from the list
+    """
+    record = store.get(profile_id)
+    if record is None:
+        raise ResourceNotFoundException("Profile", profile_id)
+    return PlainTextResponse(
+        to_collapsed(record),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'}
+    )
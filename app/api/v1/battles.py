@@ -1,12 +1,52 @@
 """
 Battles API Endpoints
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from fastapi import (
+    APIRouter,
+    Depends,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status
+)
+from pydantic import BaseModel, Field
+
+from app.api.deps import (
+    get_battle_repository,
+    get_battle_session_service,
+    get_current_player_id,
+    get_hero_service,
+    get_websocket_player_id,
+    get_story_service,
+    get_team_service
+)
+from app.core.exceptions import BaseAppException, ValidationException
+from app.domain.entities.battle import Battle
+from app.domain.entities.character import Character
+from app.domain.entities.hero import Hero
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+from app.repositories.battle_repository import BattleRepository
+from app.services.battle_session_service import BattleSessionService
+from app.services.hero_service import HeroService
+from app.services.story_service import StoryService
+from app.services.team_service import TeamService
+from app.utils.battle_frames import (
+    BattleFrameEncoder,
+    decode_frame,
+    encode_frame,
+    error_frame,
+    supports_binary
+)
 
 router = APIRouter()
 
+# Response header naming the worker that holds a battle in memory.
+# Load balancers can use it to route follow-up requests (sticky routing).
+BATTLE_WORKER_HEADER = "X-Battle-Worker"
+
 
 # Request/Response schemas
 class StartBattleRequest(BaseModel):
@@ -17,10 +57,23 @@ class StartBattleRequest(BaseModel):
 
 class ActionRequest(BaseModel):
     """Battle action request schema"""
-    action_type: str  # attack, skill, move
+    action_type: str  # attack, skill, defend
     skill_id: Optional[str] = None
-    target_ids: List[str]
-    destination: Optional[dict] = None  # {"x": 0, "y": 1} for move
+    target_ids: List[str] = []
+
+
+class BatchActionItem(BaseModel):
+    """Single action in an explicit batch"""
+    action_type: str
+    skill_id: Optional[str] = None
+    target_ids: List[str] = []
+
+
+class BatchActionRequest(BaseModel):
+    """Batched turns request schema"""
+    policy: Literal["auto", "repeat_last", "actions"] = "auto"
+    actions: List[BatchActionItem] = []
+    max_turns: int = Field(default=30, ge=1, le=100)
 
 
 class CharacterStateResponse(BaseModel):
@@ -57,6 +110,24 @@ class ActionResultResponse(BaseModel):
     heal_amount: Optional[List[dict]] = None
     effects_applied: Optional[List[dict]] = None
     skill_used: Optional[str] = None
+    enemy_actions: List[dict] = []
+    battle_ended: bool = False
+    result: Optional[str] = None
+
+
+class BatchActionResponse(BaseModel):
+    """
+    Batched turns response schema.
+    
+    Each action row is [actor_id, code, target_ids, damage, crits, killed_ids]
+    with code a=attack, s=skill, d=defend, p=pass.
+    """
+    turns_played: int
+    actions: List[list]
+    stop_reason: str
+    battle_ended: bool
+    result: Optional[str] = None
+    state: BattleStateResponse
 
 
 class BattleResultResponse(BaseModel):
@@ -67,159 +138,300 @@ class BattleResultResponse(BaseModel):
     exp_gained: int
     gold_gained: int
     drops: List[dict]
-    first_clear: bool
+
+
+# Helpers
+def _character_state(character: Character) -> dict:
+    """Convert a battle character to the response format."""
+    return {
+        "id": character.id,
+        "name": character.name,
+        "element": character.element.name,
+        "position": {"x": character.position.x, "y": character.position.y},
+        "current_hp": character.current_hp,
+        "max_hp": character.stats.hp,
+        "current_mana": character.current_mana,
+        "max_mana": character.max_mana,
+        "is_alive": character.is_alive,
+        "status_effects": list(character.status_effects)
+    }
+
+
+def _battle_state(battle: Battle) -> dict:
+    """Convert a battle to the response format."""
+    current = battle.get_current_actor()
+    return {
+        "battle_id": battle.id,
+        "turn_number": battle.turn_number,
+        "current_actor_id": current.id if current else "",
+        "is_player_turn": battle.is_player_turn(),
+        "player_team": [_character_state(h) for h in battle.player_team],
+        "enemy_team": [_character_state(e) for e in battle.enemy_team],
+        "weather": battle.weather
+    }
+
+
+def _damage_dealt(action: dict) -> Optional[List[dict]]:
+    """Extract per-target damage from an action result."""
+    if "targets" in action:
+        return action["targets"]
+    if "damage" in action:
+        return [{
+            "target_id": action["target_ids"][0],
+            "damage": action["damage"],
+            "is_crit": action["is_crit"]
+        }]
+    return None
+
+
+async def _build_player_team(
+    team: dict,
+    player_id: str,
+    hero_service: HeroService
+) -> List[Hero]:
+    """Build battle heroes from a team's members (heroes are loaded in one query)."""
+    details = await hero_service.get_hero_details(
+        [member["hero_id"] for member in team["members"]], player_id
+    )
+    heroes = []
+    for member in team["members"]:
+        hero_data = details[member["hero_id"]]
+        heroes.append(Hero(
+            id=member["hero_id"],
+            name=hero_data["name"],
+            element=Element[hero_data["element"]],
+            position=GridPosition(member["position"]["x"], member["position"]["y"]),
+            stats=HexagonStats(**hero_data["stats"]),
+            template_id=hero_data["template_id"],
+            level=hero_data["level"]
+        ))
+    return heroes
 
 
 # Endpoints
 @router.post("/start", response_model=BattleStateResponse)
-async def start_battle(request: StartBattleRequest):
+async def start_battle(
+    request: StartBattleRequest,
+    response: Response,
+    player_id: str = Depends(get_current_player_id),
+    sessions: BattleSessionService = Depends(get_battle_session_service),
+    team_service: TeamService = Depends(get_team_service),
+    hero_service: HeroService = Depends(get_hero_service),
+    story_service: StoryService = Depends(get_story_service)
+):
     """
     Start a new battle against a stage.
     
     - **stage_id**: ID of the stage to battle
     - **team_id**: ID of the player's team to use
     """
-    # TODO: Implement with service layer
-    return {
-        "battle_id": "new-battle-uuid",
-        "turn_number": 1,
-        "current_actor_id": "hero-1-uuid",
-        "is_player_turn": True,
-        "player_team": [
-            {
-                "id": "hero-1-uuid",
-                "name": "Quan Vũ",
-                "element": "KIM",
-                "position": {"x": 0, "y": 1},
-                "current_hp": 1000,
-                "max_hp": 1000,
-                "current_mana": 0,
-                "max_mana": 100,
-                "is_alive": True,
-                "status_effects": []
-            }
-        ],
-        "enemy_team": [
-            {
-                "id": "enemy-1-uuid",
-                "name": "Hoàng Cân Binh",
-                "element": "MOC",
-                "position": {"x": 2, "y": 1},
-                "current_hp": 500,
-                "max_hp": 500,
-                "current_mana": 0,
-                "max_mana": 50,
-                "is_alive": True,
-                "status_effects": []
-            }
-        ],
-        "weather": None
-    }
+    team = await team_service.get_team(request.team_id, player_id)
+    player_team = await _build_player_team(team, player_id, hero_service)
+    if not player_team:
+        raise ValidationException("Team has no members")
+    
+    enemy_team = await story_service.get_stage_enemies(request.stage_id)
+    battle = await sessions.start_battle(
+        player_id=player_id,
+        stage_id=request.stage_id,
+        player_team=player_team,
+        enemy_team=enemy_team
+    )
+    
+    response.headers[BATTLE_WORKER_HEADER] = sessions.worker_id
+    return _battle_state(battle)
 
 
 @router.post("/{battle_id}/action", response_model=ActionResultResponse)
-async def execute_action(battle_id: str, request: ActionRequest):
+async def execute_action(
+    battle_id: str,
+    request: ActionRequest,
+    response: Response,
+    player_id: str = Depends(get_current_player_id),
+    sessions: BattleSessionService = Depends(get_battle_session_service)
+):
     """
     Execute an action in battle.
     
-    - **action_type**: Type of action (attack, skill, move)
+    Enemy turns that follow are played out and returned in
+    **enemy_actions**.
+    
+    - **action_type**: Type of action (attack, skill, defend)
     - **skill_id**: Skill ID if using a skill
     - **target_ids**: List of target character IDs
-    - **destination**: Grid position if moving
     """
-    # TODO: Implement with service layer
+    result = await sessions.execute_action(
+        battle_id,
+        player_id,
+        request.action_type,
+        target_ids=request.target_ids,
+        skill_id=request.skill_id
+    )
+    action = result["action"]
+    
+    response.headers[BATTLE_WORKER_HEADER] = sessions.worker_id
     return {
-        "action_type": request.action_type,
-        "actor_id": "hero-1-uuid",
+        "action_type": action["action_type"],
+        "actor_id": action["actor_id"],
         "target_ids": request.target_ids,
-        "damage_dealt": [{"target_id": request.target_ids[0], "damage": 150, "is_crit": False}],
+        "damage_dealt": _damage_dealt(action),
         "heal_amount": None,
         "effects_applied": None,
-        "skill_used": request.skill_id
+        "skill_used": request.skill_id,
+        "enemy_actions": result["enemy_actions"],
+        "battle_ended": result["battle_ended"],
+        "result": result["result"]
     }
 
 
+@router.post("/{battle_id}/actions/batch", response_model=BatchActionResponse)
+async def execute_batch(
+    battle_id: str,
+    request: BatchActionRequest,
+    response: Response,
+    player_id: str = Depends(get_current_player_id),
+    sessions: BattleSessionService = Depends(get_battle_session_service)
+):
+    """
+    Play several player turns in one request (auto-battle / skip).
+    
+    Stops after **max_turns** player actions, when the battle ends, or
+    when an explicit action list runs out or hits an invalid action.
+    
+    - **policy**: "auto", "repeat_last" or "actions"
+    - **actions**: Explicit actions for the "actions" policy
+    - **max_turns**: Maximum number of player actions to take
+    """
+    result = await sessions.execute_batch(
+        battle_id,
+        player_id,
+        request.policy,
+        actions=[action.model_dump() for action in request.actions],
+        max_turns=request.max_turns
+    )
+    battle = await sessions.get_battle(battle_id, player_id)
+    
+    response.headers[BATTLE_WORKER_HEADER] = sessions.worker_id
+    return {**result, "state": _battle_state(battle)}
+
+
 @router.get("/{battle_id}/state", response_model=BattleStateResponse)
-async def get_battle_state(battle_id: str):
+async def get_battle_state(
+    battle_id: str,
+    response: Response,
+    player_id: str = Depends(get_current_player_id),
+    sessions: BattleSessionService = Depends(get_battle_session_service)
+):
     """Get current battle state"""
-    # TODO: Implement with service layer
-    return {
-        "battle_id": battle_id,
-        "turn_number": 3,
-        "current_actor_id": "hero-1-uuid",
-        "is_player_turn": True,
-        "player_team": [
-            {
-                "id": "hero-1-uuid",
-                "name": "Quan Vũ",
-                "element": "KIM",
-                "position": {"x": 1, "y": 1},
-                "current_hp": 850,
-                "max_hp": 1000,
-                "current_mana": 30,
-                "max_mana": 100,
-                "is_alive": True,
-                "status_effects": []
-            }
-        ],
-        "enemy_team": [
-            {
-                "id": "enemy-1-uuid",
-                "name": "Hoàng Cân Binh",
-                "element": "MOC",
-                "position": {"x": 2, "y": 1},
-                "current_hp": 200,
-                "max_hp": 500,
-                "current_mana": 20,
-                "max_mana": 50,
-                "is_alive": True,
-                "status_effects": []
-            }
-        ],
-        "weather": None
-    }
+    battle = await sessions.get_battle(battle_id, player_id)
+    response.headers[BATTLE_WORKER_HEADER] = sessions.worker_id
+    return _battle_state(battle)
+
+
+@router.websocket("/{battle_id}/ws")
+async def battle_channel(
+    websocket: WebSocket,
+    battle_id: str,
+    encoding: str = "json",
+    sessions: BattleSessionService = Depends(get_battle_session_service)
+):
+    """
+    Live battle channel.
+    
+    Sends a full snapshot on connect, then accepts action frames and
+    pushes only what changed after each one. See
+    app/utils/battle_frames.py for the frame schema.
+    
+    - **encoding**: "msgpack" for binary frames (falls back to JSON
+      text when msgpack is not installed on the server)
+    - **token**: Access token (query parameter or Authorization header)
+    """
+    binary = encoding == "msgpack" and supports_binary()
+    encoder = BattleFrameEncoder()
+    
+    async def send(frame: dict) -> None:
+        data = encode_frame(frame, binary=binary)
+        if binary:
+            await websocket.send_bytes(data)
+        else:
+            await websocket.send_text(data)
+    
+    await websocket.accept()
+    try:
+        player_id = await get_websocket_player_id(websocket)
+        battle = await sessions.get_battle(battle_id, player_id)
+    except BaseAppException as exc:
+        await send(error_frame(exc.error_code, exc.message))
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await send(encoder.full(battle))
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            
+            try:
+                frame = decode_frame(message.get("bytes") or message.get("text") or "")
+            except ValueError as exc:
+                await send(error_frame("INVALID_FRAME", str(exc)))
+                continue
+            
+            if frame["t"] == "resync":
+                await send(encoder.full(battle))
+            elif frame["t"] == "action":
+                try:
+                    result = await sessions.execute_action(
+                        battle_id,
+                        player_id,
+                        frame.get("action_type", ""),
+                        target_ids=frame.get("target_ids"),
+                        skill_id=frame.get("skill_id")
+                    )
+                except BaseAppException as exc:
+                    await send(error_frame(exc.error_code, exc.message))
+                    continue
+                # The session may have been rehydrated by another request
+                battle = await sessions.get_battle(battle_id, player_id)
+                events = [result["action"]] + result["enemy_actions"]
+                await send(encoder.delta(battle, events))
+            else:
+                await send(error_frame("INVALID_FRAME", f"Unknown frame type '{frame['t']}'"))
+    except WebSocketDisconnect:
+        return
 
 
 @router.post("/{battle_id}/end", response_model=BattleResultResponse)
-async def end_battle(battle_id: str):
+async def end_battle(
+    battle_id: str,
+    player_id: str = Depends(get_current_player_id),
+    sessions: BattleSessionService = Depends(get_battle_session_service)
+):
     """
     End battle and get rewards.
     Called automatically when all enemies are defeated or can be called to forfeit.
     """
-    # TODO: Implement with service layer
-    return {
-        "battle_id": battle_id,
-        "victory": True,
-        "stars": 3,
-        "exp_gained": 150,
-        "gold_gained": 500,
-        "drops": [
-            {"item_id": "exp_book_1", "quantity": 2},
-            {"item_id": "gold_chest", "quantity": 1}
-        ],
-        "first_clear": True
-    }
+    return await sessions.end_battle(battle_id, player_id)
 
 
 @router.get("/history")
 async def get_battle_history(
     page: int = 1,
-    per_page: int = 20
+    per_page: int = 20,
+    player_id: str = Depends(get_current_player_id),
+    battle_repository: BattleRepository = Depends(get_battle_repository)
 ):
     """Get player's battle history"""
-    # TODO: Implement with service layer
+    battles = await battle_repository.get_battle_history(
+        player_id,
+        skip=(page - 1) * per_page,
+        limit=per_page
+    )
     return {
-        "battles": [
-            {
-                "battle_id": "past-battle-uuid",
-                "stage_id": "stage_1_1",
-                "stage_name": "Hoàng Cân Chi Loạn",
-                "victory": True,
-                "stars": 3,
-                "completed_at": "2024-01-15T10:30:00Z"
-            }
-        ],
-        "total": 1,
+        "battles": battles,
+        "total": await battle_repository.count_battle_history(player_id),
         "page": page,
         "per_page": per_page
     }
@@ -1,10 +1,18 @@
 """
 Equipment API Endpoints
 """
-from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException, status
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from pydantic import BaseModel, Field
 
+from app.api.cache import cached_response
+from app.api.deps import get_current_player_id, get_equipment_service
+from app.domain.static_data import static_data
+from app.domain.value_objects.hexagon_stats import STAT_FIELDS
+from app.services.equipment_service import EquipmentService
+from app.utils.cache import CACHE_TAG_EQUIPMENT_SETS, CACHE_TAG_EQUIPMENT_TEMPLATES
+from app.utils.query_budget import query_budget
+
 router = APIRouter()
 
 
@@ -68,9 +76,25 @@ class EnhanceResponse(BaseModel):
     gold_spent: int
 
 
+class EnhanceToLevelRequest(BaseModel):
+    """Enhance to target level request"""
+    target_level: int = Field(ge=2, le=30)
+
+
+class BatchEnhanceRequest(BaseModel):
+    """Batch enhancement request"""
+    targets: Dict[str, int] = Field(min_length=1, max_length=100)  # equipment_id -> target level
+
+
+class BatchEnhanceResponse(BaseModel):
+    """Batch enhancement response"""
+    results: List[EnhanceResponse]
+    gold_spent: int
+
+
 class FuseRequest(BaseModel):
     """Fusion request"""
-    equipment_ids: List[str] = Field(min_length=2)
+    equipment_ids: List[str] = Field(min_length=2, max_length=5)
 
 
 class FuseResponse(BaseModel):
@@ -79,6 +103,17 @@ class FuseResponse(BaseModel):
     consumed_equipment: List[str]
 
 
+class FuseDuplicatesRequest(BaseModel):
+    """Fuse all duplicates request"""
+    group_size: int = Field(default=3, ge=2, le=5)
+
+
+class FuseDuplicatesResponse(BaseModel):
+    """Fuse all duplicates response"""
+    fusions: List[FuseResponse]
+    consumed_count: int
+
+
 class EquipmentSetResponse(BaseModel):
     """Equipment set response"""
     id: str
@@ -90,6 +125,17 @@ class EquipmentSetResponse(BaseModel):
     pieces: List[str] = Field(default_factory=list)
 
 
+class EquipmentTemplateResponse(BaseModel):
+    """Equipment template response"""
+    id: str
+    name: str
+    equipment_type: str
+    rarity: int
+    set_id: Optional[str] = None
+    base_stats: EquipmentStatsResponse
+    required_level: int
+
+
 # Endpoints
 @router.get("", response_model=EquipmentListResponse)
 async def get_equipment_list(
@@ -127,21 +173,39 @@ async def get_equipment_list(
 
 
 @router.get("/sets", response_model=List[EquipmentSetResponse])
+@cached_response(
+    ttl=3600,
+    tags=[CACHE_TAG_EQUIPMENT_SETS],
+    response_model=List[EquipmentSetResponse]
+)
 async def get_equipment_sets():
     """
     Get all equipment sets.
     """
-    # TODO: Implement with service layer
+    return [equipment_set.to_dict() for equipment_set in static_data.get_equipment_sets()]
+
+
+@router.get("/templates", response_model=List[EquipmentTemplateResponse])
+@cached_response(
+    ttl=3600,
+    tags=[CACHE_TAG_EQUIPMENT_TEMPLATES],
+    response_model=List[EquipmentTemplateResponse]
+)
+async def get_equipment_templates():
+    """
+    Get all equipment templates.
+    """
     return [
         {
-            "id": "thanh_long",
-            "name": "Thanh Long Yểm Nguyệt",
-            "description": "Set trang bị của Quan Vũ",
-            "two_piece_bonus": {"atk": 15, "crit": 10},
-            "three_piece_bonus": {"unique_effect": "Giảm 20% sát thương"},
-            "four_piece_bonus": None,
-            "pieces": ["thanh_long_dao", "thanh_long_giap", "thanh_long_phu"]
+            "id": template.id,
+            "name": template.name,
+            "equipment_type": template.equipment_type,
+            "rarity": template.rarity,
+            "set_id": template.set_id,
+            "base_stats": {name: getattr(template.base_stats, name) for name in STAT_FIELDS},
+            "required_level": template.required_level
         }
+        for template in static_data.get_equipment_templates()
     ]
 
 
@@ -191,24 +255,66 @@ async def enhance_equipment(equipment_id: str, request: EnhanceRequest):
     }
 
 
+@router.post("/enhance/batch", response_model=BatchEnhanceResponse)
+@query_budget(6)
+async def enhance_equipment_batch(
+    request: BatchEnhanceRequest,
+    player_id: str = Depends(get_current_player_id),
+    equipment_service: EquipmentService = Depends(get_equipment_service)
+):
+    """
+    Enhance several equipment items at once.
+    
+    - **targets**: Target level per equipment ID
+    """
+    return await equipment_service.enhance_many(player_id, request.targets)
+
+
+@router.post("/{equipment_id}/enhance-to", response_model=EnhanceResponse)
+async def enhance_equipment_to_level(
+    equipment_id: str,
+    request: EnhanceToLevelRequest,
+    player_id: str = Depends(get_current_player_id),
+    equipment_service: EquipmentService = Depends(get_equipment_service)
+):
+    """
+    Enhance equipment straight to a target level.
+    
+    - **equipment_id**: Equipment ID
+    - **target_level**: Level to reach (capped at the rarity's max level)
+    """
+    return await equipment_service.enhance_to_level(
+        equipment_id, player_id, request.target_level
+    )
+
+
 @router.post("/fuse", response_model=FuseResponse)
-async def fuse_equipment(request: FuseRequest):
+@query_budget(6)
+async def fuse_equipment(
+    request: FuseRequest,
+    player_id: str = Depends(get_current_player_id),
+    equipment_service: EquipmentService = Depends(get_equipment_service)
+):
     """
     Fuse multiple equipment into one.
     
-    - **equipment_ids**: List of equipment IDs to fuse
+    - **equipment_ids**: List of equipment IDs to fuse (the first is the primary)
     """
-    # TODO: Implement with service layer
-    return {
-        "result_equipment": {
-            "id": "fused-equipment-uuid",
-            "template_id": "upgraded_sword",
-            "name": "Thanh Long Đao +",
-            "equipment_type": "weapon",
-            "rarity": "legendary",
-            "level": 1,
-            "power": 150,
-            "equipped_by": None
-        },
-        "consumed_equipment": request.equipment_ids
-    }
+    return await equipment_service.fuse(player_id, request.equipment_ids)
+
+
+@router.post("/fuse/duplicates", response_model=FuseDuplicatesResponse)
+@query_budget(6)
+async def fuse_duplicate_equipment(
+    request: FuseDuplicatesRequest,
+    player_id: str = Depends(get_current_player_id),
+    equipment_service: EquipmentService = Depends(get_equipment_service)
+):
+    """
+    Fuse every group of duplicate pieces in the inventory.
+    
+    Locked and equipped pieces are never consumed.
+    
+    - **group_size**: Pieces per fusion
+    """
+    return await equipment_service.fuse_all_duplicates(player_id, request.group_size)
@@ -2,9 +2,14 @@
 Gacha API Endpoints
 """
 from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from pydantic import BaseModel, Field
 
+from app.api.cache import cached_response
+from app.api.deps import get_gacha_service
+from app.services.gacha_service import GachaService
+from app.utils.cache import CACHE_TAG_GACHA_BANNERS
+
 router = APIRouter()
 
 
@@ -75,29 +80,16 @@ class GachaHistoryResponse(BaseModel):
 
 # Endpoints
 @router.get("/banners", response_model=List[BannerResponse])
-async def get_banners():
+@cached_response(
+    ttl=300,
+    tags=[CACHE_TAG_GACHA_BANNERS],
+    response_model=List[BannerResponse]
+)
+async def get_banners(gacha_service: GachaService = Depends(get_gacha_service)):
     """
     Get all available gacha banners.
     """
-    # TODO: Implement with service layer
-    return [
-        {
-            "id": "standard",
-            "name": "Banner Tiêu Chuẩn",
-            "rates": {"3": 80, "4": 18, "5": 2},
-            "cost_single": 160,
-            "cost_multi": 1440,
-            "featured": None
-        },
-        {
-            "id": "limited_quan_vu",
-            "name": "Banner Quan Vũ",
-            "rates": {"3": 75, "4": 20, "5": 5},
-            "cost_single": 160,
-            "cost_multi": 1440,
-            "featured": "quan_vu"
-        }
-    ]
+    return await gacha_service.get_banners()
 
 
 @router.get("/banners/{banner_id}", response_model=BannerDetailResponse)
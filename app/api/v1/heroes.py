@@ -1,9 +1,17 @@
 """
 Heroes API Endpoints
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.api.cache import cached_response
+from app.api.deps import get_current_player_id, get_gear_optimizer_service, get_hero_service
+from app.domain.factories import get_hero_factory
+from app.services.gear_optimizer_service import GearOptimizerService
+from app.services.hero_service import HeroService
+from app.utils.cache import CACHE_TAG_HERO_TEMPLATES
+from app.utils.query_budget import query_budget
 
 router = APIRouter()
 
@@ -38,6 +46,18 @@ class HeroResponse(BaseModel):
     power: int
 
 
+class HeroTemplateResponse(BaseModel):
+    """Hero template response schema"""
+    template_id: str
+    name: str
+    element: str
+    rarity: int
+    description: str
+    base_stats: HeroStatsResponse
+    default_skills: List[str]
+    growth_rates: Dict[str, float]
+
+
 class HeroListResponse(BaseModel):
     """Hero list response schema"""
     heroes: List[HeroResponse]
@@ -60,19 +80,66 @@ class LevelUpResponse(BaseModel):
     stats: HeroStatsResponse
 
 
+class BulkLevelUpRequest(BaseModel):
+    """Bulk level up request schema"""
+    hero_ids: List[str] = Field(min_length=1, max_length=100)
+    exp_pool: int = Field(ge=0)
+
+
+class BulkLevelUpHeroResponse(LevelUpResponse):
+    """Per-hero result of a bulk level up"""
+    exp: int
+    exp_gained: int
+
+
+class BulkLevelUpResponse(BaseModel):
+    """Bulk level up response schema"""
+    heroes: List[BulkLevelUpHeroResponse]
+    exp_spent: int
+
+
 class EquipRequest(BaseModel):
     """Equip equipment request schema"""
     equipment_id: str
     slot: str  # weapon, armor, accessory, relic
 
 
+class GearOptimizeRequest(BaseModel):
+    """Gear optimizer request schema"""
+    weights: Dict[str, float] = Field(default_factory=lambda: {"atk": 1.0})
+    min_stats: Dict[str, int] = Field(default_factory=dict)
+    top_k: int = Field(default=3, ge=1, le=10)
+    time_budget_ms: int = Field(default=200, ge=10, le=2000)
+
+
+class GearLoadoutResponse(BaseModel):
+    """One optimized loadout"""
+    score: float
+    equipment: Dict[str, Optional[str]]
+    stats: HeroStatsResponse
+    set_bonus: HeroStatsResponse
+
+
+class GearOptimizeResponse(BaseModel):
+    """Gear optimizer response schema"""
+    hero_id: str
+    loadouts: List[GearLoadoutResponse]
+    inventory_size: int
+    candidates: int
+    explored: int
+    timed_out: bool
+    elapsed_ms: float
+
+
 # Endpoints
 @router.get("", response_model=HeroListResponse)
 async def get_heroes(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     element: Optional[str] = None,
-    rarity: Optional[int] = None
+    rarity: Optional[int] = None,
+    player_id: str = Depends(get_current_player_id),
+    hero_service: HeroService = Depends(get_hero_service)
 ):
     """
     Get player's heroes with filtering and pagination.
@@ -82,48 +149,68 @@ async def get_heroes(
     - **element**: Filter by element (KIM, MOC, THUY, HOA, THO)
     - **rarity**: Filter by rarity (1-6)
     """
-    # TODO: Implement with service layer
-    sample_hero = {
-        "id": "sample-hero-uuid",
-        "template_id": "quan_vu",
-        "name": "Quan Vũ",
-        "element": "KIM",
-        "rarity": 5,
-        "level": 1,
-        "exp": 0,
-        "stars": 1,
-        "ascension_level": 0,
-        "awakening_level": 0,
-        "stats": {"hp": 1000, "atk": 120, "def_": 80, "spd": 95, "crit": 15, "dex": 10},
-        "power": 1320
-    }
-    
-    return {
-        "heroes": [sample_hero],
-        "total": 1,
-        "page": page,
-        "per_page": per_page
-    }
+    return await hero_service.get_heroes(
+        player_id, page=page, per_page=per_page, element=element, rarity=rarity
+    )
+
+
+@router.get("/templates", response_model=List[HeroTemplateResponse])
+@cached_response(
+    ttl=3600,
+    tags=[CACHE_TAG_HERO_TEMPLATES],
+    response_model=List[HeroTemplateResponse]
+)
+async def get_hero_templates():
+    """
+    Get all hero templates.
+    """
+    return [
+        {
+            "template_id": template.template_id,
+            "name": template.name,
+            "element": template.element.name,
+            "rarity": template.rarity,
+            "description": template.description,
+            "base_stats": {
+                "hp": template.base_hp,
+                "atk": template.base_atk,
+                "def_": template.base_def,
+                "spd": template.base_spd,
+                "crit": template.base_crit,
+                "dex": template.base_dex
+            },
+            "default_skills": template.default_skills,
+            "growth_rates": template.growth_rates
+        }
+        for template in get_hero_factory().get_all_templates()
+    ]
 
 
 @router.get("/{hero_id}", response_model=HeroResponse)
-async def get_hero(hero_id: str):
-    """Get specific hero details"""
-    # TODO: Implement with service layer
-    return {
-        "id": hero_id,
-        "template_id": "quan_vu",
-        "name": "Quan Vũ",
-        "element": "KIM",
-        "rarity": 5,
-        "level": 1,
-        "exp": 0,
-        "stars": 1,
-        "ascension_level": 0,
-        "awakening_level": 0,
-        "stats": {"hp": 1000, "atk": 120, "def_": 80, "spd": 95, "crit": 15, "dex": 10},
-        "power": 1320
-    }
+async def get_hero(
+    hero_id: str,
+    player_id: str = Depends(get_current_player_id),
+    hero_service: HeroService = Depends(get_hero_service)
+):
+    """Get specific hero details, with equipment and set bonuses applied"""
+    details = await hero_service.get_hero_details([hero_id], player_id)
+    return details[hero_id]
+
+
+@router.post("/level-up/bulk", response_model=BulkLevelUpResponse)
+@query_budget(4)
+async def level_up_heroes_bulk(
+    request: BulkLevelUpRequest,
+    player_id: str = Depends(get_current_player_id),
+    hero_service: HeroService = Depends(get_hero_service)
+):
+    """
+    Split an EXP pool evenly across several heroes.
+    
+    - **hero_ids**: Heroes to level
+    - **exp_pool**: Total EXP to distribute
+    """
+    return await hero_service.level_up_bulk(player_id, request.hero_ids, request.exp_pool)
 
 
 @router.post("/{hero_id}/level-up", response_model=LevelUpResponse)
@@ -197,6 +284,31 @@ async def equip_item(hero_id: str, request: EquipRequest):
     }
 
 
+@router.post("/{hero_id}/optimize-gear", response_model=GearOptimizeResponse)
+async def optimize_gear(
+    hero_id: str,
+    request: GearOptimizeRequest,
+    player_id: str = Depends(get_current_player_id),
+    optimizer_service: GearOptimizerService = Depends(get_gear_optimizer_service)
+):
+    """
+    Find the best loadouts for a hero from the player's equipment.
+    
+    - **weights**: Weight per stat to maximize (e.g. {"atk": 1, "crit": 2})
+    - **min_stats**: Minimum final stats (e.g. {"spd": 150})
+    - **top_k**: Number of loadouts to return
+    - **time_budget_ms**: Search time budget
+    """
+    return await optimizer_service.optimize(
+        hero_id,
+        player_id,
+        request.weights,
+        min_stats=request.min_stats,
+        top_k=request.top_k,
+        time_budget_ms=request.time_budget_ms
+    )
+
+
 @router.delete("/{hero_id}/equip/{slot}")
 async def unequip_item(hero_id: str, slot: str):
     """
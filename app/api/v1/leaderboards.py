@@ -0,0 +1,76 @@
+"""
+Leaderboards API Endpoints
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from app.api.deps import get_current_player_id, get_leaderboard_service
+from app.services.leaderboard_service import LeaderboardService
+
+router = APIRouter()
+
+
+# Response schemas
+class LeaderboardEntryResponse(BaseModel):
+    """Leaderboard entry"""
+    rank: int
+    player_id: str
+    score: int
+
+
+class LeaderboardPageResponse(BaseModel):
+    """One page of a leaderboard"""
+    board: str
+    page: int
+    per_page: int
+    total: int
+    entries: List[LeaderboardEntryResponse]
+
+
+# Endpoints
+@router.get("/{board}", response_model=LeaderboardPageResponse)
+async def get_leaderboard(
+    board: str,
+    page: int = Query(default=1, ge=1),
+    per_page: int = Query(default=20, ge=1, le=LeaderboardService.MAX_PER_PAGE),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service)
+):
+    """
+    Get the top players of a leaderboard.
+
+    - **board**: level, power, stars or wins
+    - **page**: Page number
+    - **per_page**: Entries per page
+    """
+    return await leaderboard_service.get_top(board, page, per_page)
+
+
+@router.get("/{board}/me", response_model=Optional[LeaderboardEntryResponse])
+async def get_my_rank(
+    board: str,
+    player_id: str = Depends(get_current_player_id),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service)
+):
+    """
+    Get the current player's rank (null when not ranked).
+
+    - **board**: level, power, stars or wins
+    """
+    return await leaderboard_service.get_rank(board, player_id)
+
+
+@router.get("/{board}/around", response_model=List[LeaderboardEntryResponse])
+async def get_players_around_me(
+    board: str,
+    radius: int = Query(default=5, ge=0, le=LeaderboardService.MAX_RADIUS),
+    player_id: str = Depends(get_current_player_id),
+    leaderboard_service: LeaderboardService = Depends(get_leaderboard_service)
+):
+    """
+    Get the players ranked just above and below the current player.
+
+    - **board**: level, power, stars or wins
+    - **radius**: Entries on each side
+    """
+    return await leaderboard_service.get_around(board, player_id, radius)
@@ -3,7 +3,9 @@ API v1 Router - Aggregates all API endpoints
 """
 from fastapi import APIRouter
 
-from app.api.v1 import auth, heroes, battles, players, gacha, equipment, story, teams
+from app.api.v1 import (
+    admin, auth, heroes, battles, players, gacha, equipment, story, teams, leaderboards
+)
 
 api_router = APIRouter()
 
@@ -16,3 +18,5 @@ api_router.include_router(gacha.router, prefix="/gacha", tags=["Gacha"])
 api_router.include_router(equipment.router, prefix="/equipment", tags=["Equipment"])
 api_router.include_router(story.router, prefix="/story", tags=["Story"])
 api_router.include_router(teams.router, prefix="/teams", tags=["Teams"])
+api_router.include_router(leaderboards.router, prefix="/leaderboards", tags=["Leaderboards"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
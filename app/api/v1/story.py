@@ -2,9 +2,14 @@
 Story API Endpoints
 """
 from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from pydantic import BaseModel, Field
 
+from app.api.cache import cached_response
+from app.api.deps import get_current_player_id, get_story_service
+from app.services.story_service import StoryService
+from app.utils.cache import CACHE_TAG_STORY_CHAPTERS, SCOPE_PLAYER
+
 router = APIRouter()
 
 
@@ -76,33 +81,20 @@ class StoryProgressResponse(BaseModel):
 
 # Endpoints
 @router.get("/chapters", response_model=List[ChapterBriefResponse])
-async def get_chapters():
+@cached_response(
+    ttl=60,
+    scope=SCOPE_PLAYER,
+    tags=[CACHE_TAG_STORY_CHAPTERS],
+    response_model=List[ChapterBriefResponse]
+)
+async def get_chapters(
+    player_id: str = Depends(get_current_player_id),
+    story_service: StoryService = Depends(get_story_service)
+):
     """
     Get all story chapters with progress.
     """
-    # TODO: Implement with service layer
-    return [
-        {
-            "id": "chapter_1",
-            "chapter_number": 1,
-            "title": "Khởi Nghĩa Hoàng Cân",
-            "description": "Loạn Hoàng Cân nổi dậy, thiên hạ đại loạn",
-            "is_mythical": False,
-            "is_unlocked": True,
-            "stage_count": 10,
-            "stages_cleared": 3
-        },
-        {
-            "id": "chapter_2",
-            "chapter_number": 2,
-            "title": "Đổng Trác Loạn Kinh",
-            "description": "Đổng Trác kiểm soát triều đình",
-            "is_mythical": False,
-            "is_unlocked": False,
-            "stage_count": 10,
-            "stages_cleared": 0
-        }
-    ]
+    return await story_service.get_chapters(player_id)
 
 
 @router.get("/chapters/{chapter_id}", response_model=ChapterResponse)
@@ -2,9 +2,15 @@
 Teams API Endpoints
 """
 from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from pydantic import BaseModel, Field
 
+from app.api.cache import cached_response
+from app.api.deps import get_current_player_id, get_team_builder_service, get_team_service
+from app.services.team_builder_service import TeamBuilderService
+from app.services.team_service import TeamService
+from app.utils.cache import CACHE_TAG_FORMATIONS
+
 router = APIRouter()
 
 
@@ -72,110 +78,133 @@ class FormationResponse(BaseModel):
     bonuses: List[FormationBonusResponse]
 
 
+class AutoBuildRequest(BaseModel):
+    """Auto-build team request"""
+    stage_id: str
+    top_k: int = Field(default=3, ge=1, le=5)
+    time_budget_ms: int = Field(default=300, ge=10, le=2000)
+    simulate: int = Field(default=0, ge=0, le=3)
+
+
+class AutoBuildMemberResponse(TeamMemberResponse):
+    """Suggested team member"""
+    element: str
+
+
+class SimulationResponse(BaseModel):
+    """Validation battle result"""
+    victory: bool
+    turns: int
+    hp_remaining: int
+
+
+class SuggestedTeamResponse(BaseModel):
+    """Suggested team"""
+    formation_id: Optional[str] = None
+    power: int
+    score: float
+    members: List[AutoBuildMemberResponse]
+    simulation: Optional[SimulationResponse] = None
+
+
+class AutoBuildResponse(BaseModel):
+    """Auto-build team response"""
+    stage_id: str
+    teams: List[SuggestedTeamResponse]
+    roster_size: int
+    candidates: int
+    explored: int
+    timed_out: bool
+    elapsed_ms: float
+
+
 # Endpoints
 @router.get("", response_model=List[TeamResponse])
-async def get_teams():
+async def get_teams(
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Get all teams for current player.
     """
-    # TODO: Implement with service layer
-    return [
-        {
-            "id": "default-team-uuid",
-            "name": "Default Team",
-            "slot_number": 1,
-            "members": [
-                {
-                    "hero_id": "hero-1-uuid",
-                    "hero_name": "Quan Vũ",
-                    "position": {"x": 1, "y": 1},
-                    "power": 1500
-                }
-            ],
-            "formation_id": None,
-            "is_default": True,
-            "total_power": 1500
-        }
-    ]
+    return await team_service.get_teams(player_id)
 
 
 @router.post("", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
-async def create_team(request: CreateTeamRequest):
+async def create_team(
+    request: CreateTeamRequest,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Create a new team.
     
     - **name**: Team name
     """
-    # TODO: Implement with service layer
-    return {
-        "id": "new-team-uuid",
-        "name": request.name,
-        "slot_number": 2,
-        "members": [],
-        "formation_id": None,
-        "is_default": False,
-        "total_power": 0
-    }
+    return await team_service.create_team(player_id, request.name)
 
 
 @router.get("/formations", response_model=List[FormationResponse])
-async def get_formations():
+@cached_response(
+    ttl=3600,
+    tags=[CACHE_TAG_FORMATIONS],
+    response_model=List[FormationResponse]
+)
+async def get_formations(team_service: TeamService = Depends(get_team_service)):
     """
     Get all available formations.
     """
-    # TODO: Implement with service layer
-    return [
-        {
-            "id": "ngu_hanh_tran",
-            "name": "Ngũ Hành Trận",
-            "description": "Requires 5 heroes with all different elements",
-            "required_members": 5,
-            "bonuses": [
-                {"stat": "all", "value": 5, "bonus_type": "percent"},
-                {"stat": "element_power", "value": 20, "bonus_type": "percent"}
-            ]
-        },
-        {
-            "id": "long_dang_ho_khieu",
-            "name": "Long Đằng Hổ Khiếu",
-            "description": "Offensive formation for 3 heroes",
-            "required_members": 3,
-            "bonuses": [
-                {"stat": "atk", "value": 15, "bonus_type": "percent"},
-                {"stat": "spd", "value": 10, "bonus_type": "percent"}
-            ]
-        }
-    ]
+    return await team_service.get_formations()
+
+
+@router.post("/auto-build", response_model=AutoBuildResponse)
+async def auto_build_team(
+    request: AutoBuildRequest,
+    player_id: str = Depends(get_current_player_id),
+    team_builder_service: TeamBuilderService = Depends(get_team_builder_service)
+):
+    """
+    Suggest the best teams from the player's roster for a stage.
+    
+    Searches hero subsets, grid placements and formations, scoring team
+    power, element synergy and element advantage against the stage's
+    enemies.
+    
+    - **stage_id**: Target stage
+    - **top_k**: Number of teams to return
+    - **time_budget_ms**: Search time budget
+    - **simulate**: Number of top teams to validate with an auto-battle
+    """
+    return await team_builder_service.build_team(
+        player_id,
+        request.stage_id,
+        top_k=request.top_k,
+        time_budget_ms=request.time_budget_ms,
+        simulate=request.simulate
+    )
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
-async def get_team(team_id: str):
+async def get_team(
+    team_id: str,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Get specific team details.
     
     - **team_id**: Team ID
     """
-    # TODO: Implement with service layer
-    return {
-        "id": team_id,
-        "name": "Default Team",
-        "slot_number": 1,
-        "members": [
-            {
-                "hero_id": "hero-1-uuid",
-                "hero_name": "Quan Vũ",
-                "position": {"x": 1, "y": 1},
-                "power": 1500
-            }
-        ],
-        "formation_id": None,
-        "is_default": True,
-        "total_power": 1500
-    }
+    return await team_service.get_team(team_id, player_id)
 
 
 @router.put("/{team_id}", response_model=TeamResponse)
-async def update_team(team_id: str, request: UpdateTeamRequest):
+async def update_team(
+    team_id: str,
+    request: UpdateTeamRequest,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Update a team.
     
@@ -183,31 +212,33 @@ async def update_team(team_id: str, request: UpdateTeamRequest):
     - **name**: New team name
     - **members**: New members list
     """
-    # TODO: Implement with service layer
-    return {
-        "id": team_id,
-        "name": request.name or "Default Team",
-        "slot_number": 1,
-        "members": request.members or [],
-        "formation_id": None,
-        "is_default": True,
-        "total_power": 0
-    }
+    return await team_service.update_team(
+        team_id, player_id, name=request.name, members=request.members
+    )
 
 
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_team(team_id: str):
+async def delete_team(
+    team_id: str,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Delete a team.
     
     - **team_id**: Team ID
     """
-    # TODO: Implement with service layer
+    await team_service.delete_team(team_id, player_id)
     return None
 
 
 @router.post("/{team_id}/members", response_model=TeamResponse)
-async def add_team_member(team_id: str, request: AddMemberRequest):
+async def add_team_member(
+    team_id: str,
+    request: AddMemberRequest,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Add a hero to a team.
     
@@ -215,60 +246,38 @@ async def add_team_member(team_id: str, request: AddMemberRequest):
     - **hero_id**: Hero ID to add
     - **position**: Grid position
     """
-    # TODO: Implement with service layer
-    return {
-        "id": team_id,
-        "name": "Default Team",
-        "slot_number": 1,
-        "members": [
-            {
-                "hero_id": request.hero_id,
-                "hero_name": "New Hero",
-                "position": request.position.model_dump(),
-                "power": 1000
-            }
-        ],
-        "formation_id": None,
-        "is_default": True,
-        "total_power": 1000
-    }
+    return await team_service.add_member(
+        team_id, player_id, request.hero_id, request.position.model_dump()
+    )
 
 
 @router.delete("/{team_id}/members/{hero_id}", response_model=TeamResponse)
-async def remove_team_member(team_id: str, hero_id: str):
+async def remove_team_member(
+    team_id: str,
+    hero_id: str,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Remove a hero from a team.
     
     - **team_id**: Team ID
     - **hero_id**: Hero ID to remove
     """
-    # TODO: Implement with service layer
-    return {
-        "id": team_id,
-        "name": "Default Team",
-        "slot_number": 1,
-        "members": [],
-        "formation_id": None,
-        "is_default": True,
-        "total_power": 0
-    }
+    return await team_service.remove_member(team_id, player_id, hero_id)
 
 
 @router.put("/{team_id}/formation", response_model=TeamResponse)
-async def update_team_formation(team_id: str, request: UpdateFormationRequest):
+async def update_team_formation(
+    team_id: str,
+    request: UpdateFormationRequest,
+    player_id: str = Depends(get_current_player_id),
+    team_service: TeamService = Depends(get_team_service)
+):
     """
     Update team's formation.
     
     - **team_id**: Team ID
     - **formation_id**: Formation ID or null to clear
     """
-    # TODO: Implement with service layer
-    return {
-        "id": team_id,
-        "name": "Default Team",
-        "slot_number": 1,
-        "members": [],
-        "formation_id": request.formation_id,
-        "is_default": True,
-        "total_power": 0
-    }
+    return await team_service.update_formation(team_id, player_id, request.formation_id)
@@ -1,27 +1,63 @@
 """
 Database configuration and session management
+
+The engine and session factory are created on first use rather than at
+import, so importing models (or anything that imports them) does not
+load the database driver or need a reachable database.
 """
+from functools import lru_cache
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
 from sqlalchemy.orm import declarative_base
 
 from app.config.settings import get_settings
+from app.config.sqlite import SQLITE_CONNECT_ARGS, configure_sqlite_engine, is_sqlite
+from app.utils.metrics import instrument_engine
+from app.utils.query_budget import install_query_tracking
 
-settings = get_settings()
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    future=True
-)
+@lru_cache()
+def get_engine() -> AsyncEngine:
+    """Get the shared async engine (created and instrumented on first use)"""
+    settings = get_settings()
+    sqlite = is_sqlite(settings.DATABASE_URL)
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        **({"connect_args": SQLITE_CONNECT_ARGS} if sqlite else {})
+    )
+    
+    # Development/load-test stand-in (see app.config.sqlite)
+    if sqlite:
+        configure_sqlite_engine(engine)
+    
+    # Count statements and DB time per request
+    if settings.METRICS_ENABLED:
+        instrument_engine(engine)
+    
+    # Development/test: statement shapes per request for N+1 and budget checks
+    if settings.QUERY_TRACKING_ENABLED:
+        install_query_tracking(engine)
+    
+    return engine
+
+
+@lru_cache()
+def get_session_factory() -> async_sessionmaker:
+    """Get the shared async session factory"""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
 
-# Create async session factory
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
 
 # Base class for models
 Base = declarative_base()
@@ -29,7 +65,7 @@ Base = declarative_base()
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database session"""
-    async with async_session_factory() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -42,5 +78,5 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db() -> None:
     """Initialize database (create tables)"""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -27,6 +27,57 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32
+    
+    # Battle sessions
+    BATTLE_SESSION_CACHE_SIZE: int = 1024
+    BATTLE_FLUSH_EVERY: int = 10
+    # Battle store ("redis" shares battles between workers; "memory" is per process)
+    BATTLE_STORE_BACKEND: str = "redis"
+    
+    # Leaderboards ("redis" is shared by the workers; "memory" is per process)
+    LEADERBOARD_BACKEND: str = "redis"
+    
+    # Metrics
+    METRICS_ENABLED: bool = True
+    METRICS_TIMING_BREAKDOWN: bool = True
+    
+    # Query budgets (development/test: N+1 detection and per-route statement limits)
+    QUERY_TRACKING_ENABLED: bool = False
+    QUERY_BUDGET_STRICT: bool = False
+    QUERY_BUDGET_DEFAULT: int = 20
+    QUERY_REPEAT_THRESHOLD: int = 3
+    
+    # Profiling (opt-in): stack samples of sampled or slow requests
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_SLOW_MS: float = 500.0
+    PROFILING_INTERVAL_MS: float = 5.0
+    PROFILING_DIR: Optional[str] = None  # defaults to <tempdir>/ngoa_long_profiles
+    PROFILING_MAX_FILES: int = 200
+    
+    # Player IDs allowed to use the admin endpoints
+    ADMIN_PLAYER_IDS: list = []
+    
+    # Startup warm-up (readiness waits for it; liveness does not)
+    WARMUP_ENABLED: bool = True
+    WARMUP_DB_CONNECTIONS: int = 0
+    WARMUP_EQUIPMENT_TEMPLATES: bool = True  # load from the DB for fusion and the gear optimizer
+    WARMUP_LEADERBOARDS: bool = True  # seed the level, power and stars boards from the DB
+    WARMUP_RETRY_ATTEMPTS: int = 8  # background retry rounds for failed steps (0 disables)
+    WARMUP_RETRY_DELAY: float = 1.0  # seconds before the first retry; doubles each round
+    WARMUP_RETRY_MAX_DELAY: float = 60.0
+    WARMUP_PATHS: list = [
+        "/api/v1/gacha/banners",
+        "/api/v1/equipment/sets",
+        "/api/v1/equipment/templates",
+        "/api/v1/heroes/templates",
+        "/api/v1/teams/formations"
+    ]
+    
     # CORS
     ALLOWED_ORIGINS: list = ["http://localhost:3000"]
     
@@ -0,0 +1,52 @@
+"""
+SQLite support for development, tests and the load test
+
+Production runs on PostgreSQL (asyncpg). SQLite (aiosqlite) stands in
+where no server is available, with two differences papered over:
+
+- JSONB columns are created as JSON, which stores the same documents.
+- UUID columns are stored natively as text and read back as UUIDs, so
+  that, as with asyncpg, IDs may be bound as UUIDs or strings.
+"""
+import sqlite3
+import uuid
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.compiler import compiles
+
+
+# Connection arguments for create_async_engine
+SQLITE_CONNECT_ARGS = {"check_same_thread": False, "detect_types": sqlite3.PARSE_DECLTYPES}
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    """SQLite has no JSONB; its JSON type stores the same documents."""
+    return "JSON"
+
+
+sqlite3.register_adapter(uuid.UUID, str)
+sqlite3.register_converter("UUID", lambda value: uuid.UUID(value.decode()))
+
+
+def is_sqlite(url: str) -> bool:
+    """Whether a database URL points at SQLite"""
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def configure_sqlite_engine(engine: AsyncEngine) -> AsyncEngine:
+    """
+    Treat UUID columns as native on a SQLite engine.
+
+    The engine must have been created with SQLITE_CONNECT_ARGS.
+
+    Args:
+        engine: Engine on a SQLite URL
+
+    Returns:
+        The same engine
+    """
+    engine.dialect.supports_native_uuid = True
+    return engine
@@ -1,40 +1,51 @@
 # Core module
-from app.core.security import (
-    verify_password,
-    get_password_hash,
-    create_access_token,
-    create_refresh_token,
-    decode_token,
-    verify_access_token,
-    verify_refresh_token,
-    get_subject_from_token
-)
-from app.core.exceptions import (
-    BaseAppException,
-    AuthenticationException,
-    InvalidCredentialsException,
-    TokenExpiredException,
-    InvalidTokenException,
-    AuthorizationException,
-    ResourceNotFoundException,
-    PlayerNotFoundException,
-    HeroNotFoundException,
-    EquipmentNotFoundException,
-    TeamNotFoundException,
-    BattleNotFoundException,
-    StageNotFoundException,
-    ValidationException,
-    DuplicateResourceException,
-    InsufficientResourcesException,
-    InsufficientGoldException,
-    InsufficientGemsException,
-    InsufficientStaminaException,
-    BattleException,
-    GachaException,
-    HeroException,
-    EquipmentException,
-    TeamException
-)
+from app.utils.lazy import lazy_exports
+
+# Submodules load on first use, so importing app.core.exceptions
+# does not pull in jose and passlib
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "security": [
+        "verify_password",
+        "get_password_hash",
+        "create_access_token",
+        "create_refresh_token",
+        "decode_token",
+        "verify_access_token",
+        "verify_refresh_token",
+        "get_subject_from_token"
+    ],
+    "password_hasher": [
+        "PasswordHasher",
+        "get_password_hasher"
+    ],
+    "exceptions": [
+        "BaseAppException",
+        "AuthenticationException",
+        "InvalidCredentialsException",
+        "TokenExpiredException",
+        "InvalidTokenException",
+        "AuthorizationException",
+        "ResourceNotFoundException",
+        "PlayerNotFoundException",
+        "HeroNotFoundException",
+        "EquipmentNotFoundException",
+        "TeamNotFoundException",
+        "BattleNotFoundException",
+        "StageNotFoundException",
+        "ValidationException",
+        "DuplicateResourceException",
+        "ServerBusyException",
+        "InsufficientResourcesException",
+        "InsufficientGoldException",
+        "InsufficientGemsException",
+        "InsufficientStaminaException",
+        "BattleException",
+        "GachaException",
+        "HeroException",
+        "EquipmentException",
+        "TeamException"
+    ]
+})
 
 __all__ = [
     # Security
@@ -46,6 +57,8 @@ __all__ = [
     "verify_access_token",
     "verify_refresh_token",
     "get_subject_from_token",
+    "PasswordHasher",
+    "get_password_hasher",
     # Exceptions
     "BaseAppException",
     "AuthenticationException",
@@ -62,6 +75,7 @@ __all__ = [
     "StageNotFoundException",
     "ValidationException",
     "DuplicateResourceException",
+    "ServerBusyException",
     "InsufficientResourcesException",
     "InsufficientGoldException",
     "InsufficientGemsException",
@@ -232,6 +232,19 @@ class DuplicateResourceException(ValidationException):
         )
 
 
+# Availability Exceptions
+class ServerBusyException(BaseAppException):
+    """Exception when a bounded resource is saturated (back-pressure)"""
+    
+    def __init__(self, resource: str, retry_after: int = 1):
+        super().__init__(
+            message=f"Server is busy ({resource}), please retry later",
+            error_code="SERVER_BUSY",
+            status_code=429,
+            details={"resource": resource, "retry_after": retry_after}
+        )
+
+
 # Game-specific Exceptions
 class InsufficientResourcesException(BaseAppException):
     """Exception for insufficient resources (gold, gems, stamina, etc.)"""
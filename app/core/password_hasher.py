@@ -0,0 +1,161 @@
+"""
+Password Hasher - Runs bcrypt off the event loop on a bounded worker pool
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+from app.config.settings import get_settings
+from app.core.exceptions import ServerBusyException
+from app.core.security import get_password_context
+
+
+class PasswordHasher:
+    """
+    Bounded executor for password hashing and verification.
+
+    bcrypt releases the GIL while hashing, so a small thread pool runs
+    hashes in parallel without stalling the event loop. At most
+    ``max_workers + queue_limit`` operations are admitted at once; any
+    call beyond that is rejected immediately with ServerBusyException
+    (HTTP 429) rather than queueing behind a login storm.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        queue_limit: int = 32,
+        context: Optional[Any] = None
+    ):
+        """
+        Initialize the password hasher.
+
+        Args:
+            max_workers: Number of hashing threads
+            queue_limit: Operations allowed to wait for a free thread
+            context: passlib CryptContext (defaults to the app context)
+        """
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.context = context or get_password_context()
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of admitted (running + queued) operations"""
+        return self.max_workers + self.queue_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of operations currently running or queued"""
+        return self._in_flight
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a plain password.
+
+        Args:
+            password: The plain text password
+
+        Returns:
+            The hashed password
+
+        Raises:
+            ServerBusyException: If the hashing pool is saturated
+        """
+        return await self._submit(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain password against a hash.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: The hashed password to compare against
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            ServerBusyException: If the hashing pool is saturated
+        """
+        return await self._submit(self.context.verify, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if the stored hash is outdated.
+
+        Verification and rehash run as a single pool operation.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: The stored hash
+
+        Returns:
+            Tuple of (matches, new_hash). new_hash is None unless the
+            password matched and the hash was created with a different
+            cost factor than the one currently configured.
+
+        Raises:
+            ServerBusyException: If the hashing pool is saturated
+        """
+        return await self._submit(
+            self.context.verify_and_update, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once pending operations finish"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Admit an operation to the pool or reject it when saturated."""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise ServerBusyException("password_hasher")
+            self._in_flight += 1
+
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            self._release()
+            raise
+
+        # Release the slot when the worker finishes, not when the caller
+        # stops waiting, so cancelled requests still count until done
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        """Free one admission slot."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    """Get the shared password hasher configured from settings"""
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT
+    )
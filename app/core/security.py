@@ -2,18 +2,39 @@
 Security Utilities - JWT, Password Hashing, Authentication
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.config.settings import get_settings
 from app.core.exceptions import InvalidTokenException, TokenExpiredException
 
 settings = get_settings()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache()
+def get_password_context():
+    """
+    Get the shared password hashing context.
+    
+    Built on first use, so passlib and bcrypt are only loaded by
+    processes that hash passwords. min/max rounds are pinned to the
+    configured cost so needs_update() flags hashes created under a
+    different cost factor for rehash on login.
+    
+    Returns:
+        passlib CryptContext for bcrypt
+    """
+    from passlib.context import CryptContext
+    
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS
+    )
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,7 +48,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_password_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -40,7 +61,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password
     """
-    return pwd_context.hash(password)
+    return get_password_context().hash(password)
 
 
 def create_access_token(
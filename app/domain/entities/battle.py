@@ -85,6 +85,18 @@ class TurnOrder:
         self._sorted_order = [c for c in self._sorted_order if c.id != character_id]
         if self.current_index >= len(self._sorted_order):
             self.current_index = 0
+    
+    def restore(self, order_ids: List[str], current_index: int) -> None:
+        """
+        Restore a previously captured order and pointer.
+        
+        Args:
+            order_ids: Character IDs in turn order
+            current_index: Index of the current actor
+        """
+        by_id = {c.id: c for c in self.characters}
+        self._sorted_order = [by_id[cid] for cid in order_ids if cid in by_id]
+        self.current_index = current_index
 
 
 @dataclass
@@ -166,6 +178,33 @@ class Battle:
             self.turn_number += 1
             self._process_new_round()
     
+    def get_turn_pointer(self) -> Dict[str, Any]:
+        """
+        Capture the turn pointer (round, order and current index).
+        
+        Returns:
+            Dictionary that can be passed to restore_turn_pointer
+        """
+        if not self._turn_order:
+            self.calculate_turn_order()
+        return {
+            "turn_number": self.turn_number,
+            "order": [c.id for c in self._turn_order.get_order()],
+            "index": self._turn_order.current_index
+        }
+    
+    def restore_turn_pointer(self, pointer: Dict[str, Any]) -> None:
+        """
+        Restore a turn pointer captured by get_turn_pointer.
+        
+        Args:
+            pointer: Captured turn pointer
+        """
+        if not self._turn_order:
+            self.calculate_turn_order()
+        self.turn_number = pointer["turn_number"]
+        self._turn_order.restore(pointer["order"], pointer["index"])
+    
     def _process_new_round(self) -> None:
         """Process effects at the start of a new round"""
         # Process status effects, regeneration, etc.
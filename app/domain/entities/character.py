@@ -133,6 +133,6 @@ class Character:
         Returns:
             HexagonStats with all modifiers applied
         """
-        # For now, just return base stats
-        # TODO: Apply equipment and status effect modifiers
+        # Equipment, mount and formation are applied by Hero.get_effective_stats
+        # TODO: Apply status effect modifiers
         return self.stats
@@ -25,12 +25,58 @@ class Rarity(Enum):
     MYTHIC = "mythic"
 
 
+# Template base rarity (stars) to equipment rarity
+RARITY_BY_STARS = {
+    1: Rarity.COMMON,
+    2: Rarity.COMMON,
+    3: Rarity.RARE,
+    4: Rarity.EPIC,
+    5: Rarity.LEGENDARY,
+    6: Rarity.MYTHIC
+}
+
+# Max enhancement level by rarity
+MAX_ENHANCE_LEVELS = {
+    Rarity.COMMON: 10,
+    Rarity.RARE: 15,
+    Rarity.EPIC: 20,
+    Rarity.LEGENDARY: 25,
+    Rarity.MYTHIC: 30
+}
+
+# Gold per level to enhance (level N -> N+1 costs N * 100)
+ENHANCE_GOLD_PER_LEVEL = 100
+
+# Bonus stats gained per enhancement level, as a fraction of base stats
+ENHANCE_STAT_GAIN = 0.1
+
+
+def enhance_gold_cost(from_level: int, to_level: int) -> int:
+    """
+    Get the gold needed to enhance from one level to another.
+    
+    Sum of level * 100 for every level in [from_level, to_level).
+    
+    Args:
+        from_level: Current level
+        to_level: Target level
+        
+    Returns:
+        Total gold cost (0 if to_level <= from_level)
+    """
+    if to_level <= from_level:
+        return 0
+    levels = to_level - from_level
+    return ENHANCE_GOLD_PER_LEVEL * (from_level + to_level - 1) * levels // 2
+
+
 @dataclass
 class EnhanceResult:
     """Result of enhancement attempt"""
     success: bool
     new_level: int
     stats_gained: Optional[HexagonStats] = None
+    gold_cost: int = 0
 
 
 @dataclass
@@ -89,13 +135,7 @@ class Equipment:
     equipped_by: Optional[str] = None  # Hero ID if equipped
     
     # Max levels by rarity
-    _max_levels: Dict[Rarity, int] = field(default_factory=lambda: {
-        Rarity.COMMON: 10,
-        Rarity.RARE: 15,
-        Rarity.EPIC: 20,
-        Rarity.LEGENDARY: 25,
-        Rarity.MYTHIC: 30
-    })
+    _max_levels: Dict[Rarity, int] = field(default_factory=lambda: dict(MAX_ENHANCE_LEVELS))
     
     def get_max_level(self) -> int:
         """Get maximum enhancement level based on rarity"""
@@ -105,6 +145,22 @@ class Equipment:
         """Check if equipment can be enhanced"""
         return self.level < self.get_max_level()
     
+    def get_level_gain(self) -> HexagonStats:
+        """Get the bonus stats gained per enhancement level"""
+        return self.get_base_stats().multiply(ENHANCE_STAT_GAIN)
+    
+    def get_enhance_cost(self, target_level: int) -> int:
+        """
+        Get the gold needed to enhance from the current level.
+        
+        Args:
+            target_level: Level to reach (capped at max level)
+            
+        Returns:
+            Total gold cost
+        """
+        return enhance_gold_cost(self.level, min(target_level, self.get_max_level()))
+    
     def enhance(self) -> EnhanceResult:
         """
         Enhance equipment by 1 level.
@@ -112,41 +168,52 @@ class Equipment:
         Returns:
             EnhanceResult with success status and new stats
         """
-        if not self.can_enhance():
-            return EnhanceResult(success=False, new_level=self.level)
-        
-        self.level += 1
+        return self.enhance_to(self.level + 1)
+    
+    def enhance_to(self, target_level: int) -> EnhanceResult:
+        """
+        Enhance equipment straight to a target level.
         
-        # Calculate stat gains (10% of base per level)
-        stat_gain_multiplier = 0.1
+        Every level grants the same bonus (10% of base stats), so the
+        gain is computed once for the whole range.
         
-        hp_gain = int(self.base_hp * stat_gain_multiplier)
-        atk_gain = int(self.base_atk * stat_gain_multiplier)
-        def_gain = int(self.base_def * stat_gain_multiplier)
-        spd_gain = int(self.base_spd * stat_gain_multiplier)
-        crit_gain = int(self.base_crit * stat_gain_multiplier)
-        dex_gain = int(self.base_dex * stat_gain_multiplier)
+        Args:
+            target_level: Level to reach (capped at max level)
+            
+        Returns:
+            EnhanceResult with success status, new level and total stats gained
+        """
+        target_level = min(target_level, self.get_max_level())
+        if target_level <= self.level:
+            return EnhanceResult(success=False, new_level=self.level)
         
-        self.bonus_hp += hp_gain
-        self.bonus_atk += atk_gain
-        self.bonus_def += def_gain
-        self.bonus_spd += spd_gain
-        self.bonus_crit += crit_gain
-        self.bonus_dex += dex_gain
+        gold_cost = enhance_gold_cost(self.level, target_level)
+        stats_gained = self.get_level_gain().multiply(target_level - self.level)
         
-        stats_gained = HexagonStats(
-            hp=hp_gain,
-            atk=atk_gain,
-            def_=def_gain,
-            spd=spd_gain,
-            crit=crit_gain,
-            dex=dex_gain
-        )
+        self.level = target_level
+        self.bonus_hp += stats_gained.hp
+        self.bonus_atk += stats_gained.atk
+        self.bonus_def += stats_gained.def_
+        self.bonus_spd += stats_gained.spd
+        self.bonus_crit += stats_gained.crit
+        self.bonus_dex += stats_gained.dex
         
         return EnhanceResult(
             success=True,
             new_level=self.level,
-            stats_gained=stats_gained
+            stats_gained=stats_gained,
+            gold_cost=gold_cost
+        )
+    
+    def get_base_stats(self) -> HexagonStats:
+        """Get base stats without enhancement bonuses"""
+        return HexagonStats(
+            hp=self.base_hp,
+            atk=self.base_atk,
+            def_=self.base_def,
+            spd=self.base_spd,
+            crit=self.base_crit,
+            dex=self.base_dex
         )
     
     def get_total_stats(self) -> HexagonStats:
@@ -2,12 +2,34 @@
 Hero Entity - Player-controlled character
 """
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Mapping, Optional, Sequence, Tuple
 from app.domain.entities.character import Character
+from app.domain.services.stat_calculator import stat_calculator
 from app.domain.value_objects.element import Element
+from app.domain.value_objects.exp_table import ExpTable
 from app.domain.value_objects.hexagon_stats import HexagonStats
 from app.domain.value_objects.grid_position import GridPosition
 
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from app.domain.entities.equipment import Equipment
+    from app.domain.entities.mount import Mount
+    from app.domain.entities.team import Formation
+
+
+# Cumulative tables shared by heroes with the same EXP overrides
+_EXP_TABLES: Dict[FrozenSet[Tuple[int, int]], ExpTable] = {}
+
+
+def _get_exp_table(overrides: Dict[int, int]) -> ExpTable:
+    """Get the cumulative table for a set of per-level overrides."""
+    key = frozenset(overrides.items())
+    table = _EXP_TABLES.get(key)
+    if table is None:
+        fixed = dict(overrides)
+        table = ExpTable(lambda level: fixed.get(level, 100 + (level * 50)))
+        _EXP_TABLES[key] = table
+    return table
+
 
 @dataclass
 class LevelUpResult:
@@ -52,6 +74,9 @@ class Hero(Character):
     # Growth rates for stat calculation
     growth_rates: Dict[str, float] = field(default_factory=dict)
     
+    # Template level 1 stats (defaults to the initial stats)
+    base_stats: Optional[HexagonStats] = None
+    
     # Metadata
     is_locked: bool = False
     is_favorite: bool = False
@@ -65,6 +90,8 @@ class Hero(Character):
     def __post_init__(self) -> None:
         """Initialize hero-specific attributes"""
         super().__post_init__()
+        if self.base_stats is None:
+            self.base_stats = self.stats
     
     def get_required_exp(self, level: int) -> int:
         """Get EXP required to reach next level from current level"""
@@ -84,14 +111,12 @@ class Hero(Character):
             LevelUpResult with level up information
         """
         old_level = self.level
-        self.exp += amount
-        leveled_up = False
+        table = _get_exp_table(self._exp_table)
+        self.level, self.exp = table.apply(self.level, self.exp, amount)
         
-        # Check for level ups
-        while self.exp >= self.get_required_exp(self.level):
-            self.exp -= self.get_required_exp(self.level)
-            self.level += 1
-            leveled_up = True
+        leveled_up = self.level > old_level
+        if leveled_up:
+            # Stats depend only on the final level, so apply them once
             self._apply_level_up_stats()
         
         return LevelUpResult(
@@ -102,13 +127,46 @@ class Hero(Character):
         )
     
     def _apply_level_up_stats(self) -> None:
-        """Apply stat increases from leveling up"""
+        """Recompute stats for the current level through the stat pipeline"""
         if not self.growth_rates:
             return
         
-        # Apply growth rates to stats
-        # This will be handled by a stat calculator service
-        pass
+        new_stats = stat_calculator.calculate(
+            self.base_stats,
+            self.growth_rates,
+            self.level,
+            self.ascension_level,
+            self.awakening_level
+        )
+        hp_gained = max(0, new_stats.hp - self.stats.hp)
+        self.stats = new_stats
+        self.current_hp = min(new_stats.hp, self.current_hp + hp_gained)
+    
+    def get_effective_stats(
+        self,
+        equipment: Sequence["Equipment"] = (),
+        mount: Optional["Mount"] = None,
+        team_bonus: Optional[Mapping[str, Any]] = None,
+        formation: Optional["Formation"] = None
+    ) -> HexagonStats:
+        """
+        Calculate stats including equipment, mount and formation.
+        
+        The result is memoized per hero and reused until one of the
+        inputs (level, ascension, equipment levels, ...) changes.
+        
+        Args:
+            equipment: Pieces in the hero's slots
+            mount: Hero's mount
+            team_bonus: Team-wide flat bonus
+            formation: Active formation
+            
+        Returns:
+            HexagonStats with all modifiers applied
+        """
+        return stat_calculator.get_hero_stats(
+            self, equipment, mount, team_bonus, formation
+        )
     
     def get_max_level(self) -> int:
         """Get maximum level based on ascension level"""
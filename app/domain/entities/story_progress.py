@@ -0,0 +1,251 @@
+"""
+StoryProgress Entity - Compact per-player story progress
+
+Progress is indexed by the global stage ordinals of a StoryLayout:
+
+    - cleared: one bit per stage
+    - stars: two bits per stage (0-3)
+
+Running totals (stages cleared, stars, per-chapter clears and stars,
+completed chapters) are rebuilt once on load and kept current on every
+record, so unlock checks and the chapter overview are O(1).
+
+Serialized form (one binary column):
+
+    version (1 byte) | ordinal count (uint16 LE) | cleared bits | star pairs
+"""
+import struct
+from typing import Optional
+
+from app.domain.static_data import StoryLayout
+
+
+# Serialization format version
+PROGRESS_FORMAT_VERSION = 1
+
+# Highest star rating of a stage
+MAX_STAGE_STARS = 3
+
+_HEADER = struct.Struct("<BH")
+
+
+def _bitset_size(count: int) -> int:
+    """Bytes for one bit per ordinal."""
+    return (count + 7) // 8
+
+
+def _star_array_size(count: int) -> int:
+    """Bytes for two bits per ordinal."""
+    return (count + 3) // 4
+
+
+class StoryProgress:
+    """
+    A player's cleared stages and stars as bitsets.
+    """
+
+    def __init__(
+        self,
+        layout: StoryLayout,
+        cleared: Optional[bytes] = None,
+        stars: Optional[bytes] = None
+    ):
+        """
+        Initialize progress.
+
+        Args:
+            layout: Story layout the ordinals refer to
+            cleared: Cleared-stage bitset (shorter input is zero-padded)
+            stars: 2-bit star array (shorter input is zero-padded)
+        """
+        self.layout = layout
+        count = layout.stage_count
+        self._cleared = bytearray(_bitset_size(count))
+        self._stars = bytearray(_star_array_size(count))
+        if cleared:
+            self._cleared[:len(cleared)] = cleared[:len(self._cleared)]
+        if stars:
+            self._stars[:len(stars)] = stars[:len(self._stars)]
+        self._rebuild_totals()
+
+    # Queries
+
+    def is_cleared(self, ordinal: int) -> bool:
+        """Check if the stage at an ordinal is cleared"""
+        return bool(self._cleared[ordinal >> 3] >> (ordinal & 7) & 1)
+
+    def get_stars(self, ordinal: int) -> int:
+        """Best stars earned on the stage at an ordinal"""
+        return self._stars[ordinal >> 2] >> ((ordinal & 3) * 2) & 0b11
+
+    def get_chapter_cleared(self, chapter_index: int) -> int:
+        """Stages cleared in a chapter"""
+        return self._chapter_cleared[chapter_index]
+
+    def get_chapter_stars(self, chapter_index: int) -> int:
+        """Stars earned in a chapter"""
+        return self._chapter_stars[chapter_index]
+
+    def is_chapter_complete(self, chapter_index: int) -> bool:
+        """Check if every stage of a chapter is cleared"""
+        return self._chapter_cleared[chapter_index] >= self.layout.chapter_sizes[chapter_index]
+
+    def is_chapter_unlocked(self, chapter_index: int) -> bool:
+        """The first chapter is open; later ones need the previous chapter complete"""
+        return chapter_index == 0 or self.is_chapter_complete(chapter_index - 1)
+
+    def is_stage_unlocked(self, ordinal: int) -> bool:
+        """A chapter's first stage follows the chapter; later ones need the previous stage"""
+        previous = self.layout.previous_stages[ordinal]
+        if previous < 0:
+            return self.is_chapter_unlocked(self.layout.stage_chapters[ordinal])
+        return self.is_cleared(previous)
+
+    @property
+    def stages_cleared(self) -> int:
+        """Total stages cleared"""
+        return self._stages_cleared
+
+    @property
+    def stars_earned(self) -> int:
+        """Total stars earned"""
+        return self._stars_earned
+
+    @property
+    def chapters_cleared(self) -> int:
+        """Chapters with every stage cleared"""
+        return self._chapters_cleared
+
+    @property
+    def current_chapter(self) -> int:
+        """Index of the first incomplete chapter (the last chapter when all are complete)"""
+        return min(self._first_incomplete, max(len(self.layout.chapter_ids) - 1, 0))
+
+    # Updates
+
+    def record(self, ordinal: int, stars: int) -> bool:
+        """
+        Record a stage clear, keeping the best stars.
+
+        Args:
+            ordinal: Stage ordinal
+            stars: Stars earned (0-3)
+
+        Returns:
+            True if this is the stage's first clear
+        """
+        stars = max(0, min(stars, MAX_STAGE_STARS))
+        chapter_index = self.layout.stage_chapters[ordinal]
+        first_clear = not self.is_cleared(ordinal)
+
+        if first_clear:
+            self._cleared[ordinal >> 3] |= 1 << (ordinal & 7)
+            self._stages_cleared += 1
+            self._chapter_cleared[chapter_index] += 1
+            if self.is_chapter_complete(chapter_index):
+                self._chapters_cleared += 1
+                self._advance_current_chapter()
+
+        current = self.get_stars(ordinal)
+        if stars > current:
+            shift = (ordinal & 3) * 2
+            self._stars[ordinal >> 2] = (self._stars[ordinal >> 2] & ~(0b11 << shift)) | (stars << shift)
+            self._stars_earned += stars - current
+            self._chapter_stars[chapter_index] += stars - current
+
+        return first_clear
+
+    def relayout(self, layout: StoryLayout) -> "StoryProgress":
+        """
+        Move progress onto another layout, matching stages by ID.
+
+        Stages missing from the new layout are dropped; new stages
+        start uncleared.
+
+        Args:
+            layout: New story layout
+
+        Returns:
+            StoryProgress on the new layout
+        """
+        progress = StoryProgress(layout)
+        for stage_id, ordinal in self.layout.stage_ordinals.items():
+            new_ordinal = layout.stage_ordinals.get(stage_id)
+            if new_ordinal is not None and self.is_cleared(ordinal):
+                progress.record(new_ordinal, self.get_stars(ordinal))
+        return progress
+
+    # Serialization
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the binary column format."""
+        header = _HEADER.pack(PROGRESS_FORMAT_VERSION, self.layout.stage_count)
+        return header + bytes(self._cleared) + bytes(self._stars)
+
+    @classmethod
+    def from_bytes(cls, layout: StoryLayout, data: Optional[bytes]) -> "StoryProgress":
+        """
+        Load progress saved with to_bytes.
+
+        Progress saved for fewer ordinals (before stages were added) is
+        padded; ordinals beyond the layout are dropped.
+
+        Args:
+            layout: Current story layout
+            data: Saved bytes, or None for a new player
+
+        Returns:
+            StoryProgress
+
+        Raises:
+            ValueError: If the data is not in a known format
+        """
+        if not data:
+            return cls(layout)
+        if len(data) < _HEADER.size:
+            raise ValueError("Story progress data is truncated")
+
+        version, count = _HEADER.unpack_from(data)
+        if version != PROGRESS_FORMAT_VERSION:
+            raise ValueError(f"Unknown story progress format version {version}")
+
+        cleared_end = _HEADER.size + _bitset_size(count)
+        cleared = data[_HEADER.size:cleared_end]
+        stars = data[cleared_end:cleared_end + _star_array_size(count)]
+        return cls(layout, cleared, stars)
+
+    # Internals
+
+    def _rebuild_totals(self) -> None:
+        """Recount the running totals from the bitsets (once per load)."""
+        layout = self.layout
+        self._chapter_cleared = [0] * len(layout.chapter_ids)
+        self._chapter_stars = [0] * len(layout.chapter_ids)
+        self._stages_cleared = 0
+        self._stars_earned = 0
+
+        for ordinal, chapter_index in enumerate(layout.stage_chapters):
+            if chapter_index < 0:
+                continue
+            if self.is_cleared(ordinal):
+                self._chapter_cleared[chapter_index] += 1
+                self._stages_cleared += 1
+            stars = self.get_stars(ordinal)
+            self._chapter_stars[chapter_index] += stars
+            self._stars_earned += stars
+
+        self._chapters_cleared = sum(
+            1 for chapter_index in range(len(layout.chapter_ids))
+            if self.is_chapter_complete(chapter_index)
+        )
+        self._first_incomplete = 0
+        self._advance_current_chapter()
+
+    def _advance_current_chapter(self) -> None:
+        """Move the current chapter past completed chapters."""
+        while (
+            self._first_incomplete < len(self.layout.chapter_ids)
+            and self.is_chapter_complete(self._first_incomplete)
+        ):
+            self._first_incomplete += 1
+
@@ -4,9 +4,9 @@ Team Entity - Team composition and formation management
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any, Tuple, Set
-from collections import Counter
 
 from app.domain.entities.hero import Hero
+from app.domain.services.team_evaluator import TeamEvaluator
 from app.domain.value_objects.element import Element
 from app.domain.value_objects.grid_position import GridPosition
 
@@ -134,6 +134,18 @@ class Team:
     max_members: int = 5
     is_default: bool = False
     
+    # Incremental power/synergy/formation state, built on first use
+    _evaluator: Optional[TeamEvaluator] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def evaluator(self) -> TeamEvaluator:
+        """Get the team's incremental evaluator"""
+        if self._evaluator is None:
+            self._evaluator = TeamEvaluator.from_members(self.members, self.formation)
+        return self._evaluator
+    
     def add_member(self, hero: Hero, position: GridPosition) -> bool:
         """
         Add a hero to the team.
@@ -158,6 +170,8 @@ class Team:
             return False
         
         self.members.append(TeamSlot(hero=hero, position=position))
+        if self._evaluator is not None:
+            self._evaluator.add(hero, position)
         return True
     
     def remove_member(self, hero_id: str) -> bool:
@@ -173,6 +187,8 @@ class Team:
         for i, slot in enumerate(self.members):
             if slot.hero.id == hero_id:
                 self.members.pop(i)
+                if self._evaluator is not None:
+                    self._evaluator.remove(hero_id)
                 return True
         return False
     
@@ -196,6 +212,8 @@ class Team:
         for slot in self.members:
             if slot.hero.id == hero_id:
                 slot.position = new_position
+                if self._evaluator is not None:
+                    self._evaluator.move(hero_id, new_position)
                 return True
         
         return False
@@ -223,6 +241,22 @@ class Team:
             formation: Formation to set, or None to clear
         """
         self.formation = formation
+        if self._evaluator is not None:
+            self._evaluator.set_formation(formation)
+    
+    def refresh_member(self, hero_id: str) -> None:
+        """
+        Re-read a member's power after it levelled up or changed equipment.
+        
+        Args:
+            hero_id: ID of the member hero
+        """
+        if self._evaluator is None:
+            return
+        for slot in self.members:
+            if slot.hero.id == hero_id:
+                self._evaluator.refresh_member(slot.hero)
+                return
     
     def is_formation_active(self) -> bool:
         """
@@ -231,9 +265,7 @@ class Team:
         Returns:
             True if formation is active and requirements met
         """
-        if not self.formation:
-            return False
-        return self.formation.check_requirements(self)
+        return self.evaluator.is_formation_active()
     
     def get_total_power(self, include_formation: bool = True) -> int:
         """
@@ -245,17 +277,7 @@ class Team:
         Returns:
             Total power rating
         """
-        base_power = sum(slot.hero.get_total_power() for slot in self.members)
-        
-        if include_formation and self.is_formation_active():
-            # Apply formation bonus
-            all_bonus = self.formation.get_bonus_value("all")
-            base_power = int(base_power * (1 + all_bonus / 100))
-        
-        # Add synergy bonuses
-        synergy_bonus = self.calculate_element_synergy()
-        
-        return base_power + synergy_bonus
+        return self.evaluator.get_total_power(include_formation)
     
     def calculate_element_synergy(self) -> int:
         """
@@ -264,16 +286,7 @@ class Team:
         Returns:
             Synergy bonus value
         """
-        bonus = 0
-        
-        for i, slot1 in enumerate(self.members):
-            for slot2 in self.members[i+1:]:
-                if slot1.hero.element == slot2.hero.element:
-                    if slot1.position.is_adjacent(slot2.position):
-                        # Same element adjacent bonus
-                        bonus += 50
-        
-        return bonus
+        return self.evaluator.synergy_bonus
     
     def get_element_distribution(self) -> Dict[Element, int]:
         """
@@ -282,8 +295,7 @@ class Team:
         Returns:
             Dictionary mapping elements to count
         """
-        elements = [slot.hero.element for slot in self.members]
-        return dict(Counter(elements))
+        return self.evaluator.get_element_distribution()
     
     def get_heroes(self) -> List[Hero]:
         """
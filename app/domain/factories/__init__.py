@@ -1,7 +1,14 @@
 """
 Domain Factories Package
 """
-from app.domain.factories.hero_factory import HeroFactory, HeroTemplate
-from app.domain.factories.skill_factory import SkillFactory, SkillTemplate
+from app.domain.factories.hero_factory import HeroFactory, HeroTemplate, get_hero_factory
+from app.domain.factories.skill_factory import SkillFactory, SkillTemplate, get_skill_factory
 
-__all__ = ["HeroFactory", "HeroTemplate", "SkillFactory", "SkillTemplate"]
+__all__ = [
+    "HeroFactory",
+    "HeroTemplate",
+    "SkillFactory",
+    "SkillTemplate",
+    "get_hero_factory",
+    "get_skill_factory"
+]
@@ -2,6 +2,7 @@
 HeroFactory - Factory for creating Hero instances from predefined templates
 """
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 from uuid import uuid4
 
@@ -54,10 +55,22 @@ class HeroFactory:
     - Thổ (Earth): High DEF, low SPD
     """
     
+    # Templates built by the first instance of each class, copied by later ones
+    _template_cache: Optional[Dict[str, HeroTemplate]] = None
+    
     def __init__(self):
-        """Initialize factory with predefined templates"""
-        self._templates: Dict[str, HeroTemplate] = {}
-        self._initialize_templates()
+        """
+        Initialize factory with predefined templates.
+        
+        Templates are built once per process; later factories share the
+        template objects, which must be treated as read-only.
+        """
+        cls = type(self)
+        if cls.__dict__.get("_template_cache") is None:
+            self._templates: Dict[str, HeroTemplate] = {}
+            self._initialize_templates()
+            cls._template_cache = self._templates
+        self._templates = dict(cls._template_cache)
     
     def _initialize_templates(self) -> None:
         """Initialize all predefined hero templates"""
@@ -376,3 +389,9 @@ class HeroFactory:
         )
         
         return hero
+
+
+@lru_cache()
+def get_hero_factory() -> HeroFactory:
+    """Get the shared hero factory (templates are built on first use)"""
+    return HeroFactory()
@@ -2,6 +2,7 @@
 SkillFactory - Factory for creating Skill instances from predefined templates
 """
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from uuid import uuid4
 
@@ -59,10 +60,22 @@ class SkillFactory:
     - Ultimate skills
     """
     
+    # Templates built by the first instance of each class, copied by later ones
+    _template_cache: Optional[Dict[str, SkillTemplate]] = None
+    
     def __init__(self):
-        """Initialize factory with predefined templates"""
-        self._templates: Dict[str, SkillTemplate] = {}
-        self._initialize_templates()
+        """
+        Initialize factory with predefined templates.
+        
+        Templates are built once per process; later factories share the
+        template objects, which must be treated as read-only.
+        """
+        cls = type(self)
+        if cls.__dict__.get("_template_cache") is None:
+            self._templates: Dict[str, SkillTemplate] = {}
+            self._initialize_templates()
+            cls._template_cache = self._templates
+        self._templates = dict(cls._template_cache)
     
     def _initialize_templates(self) -> None:
         """Initialize all predefined skill templates"""
@@ -415,3 +428,9 @@ class SkillFactory:
         )
         
         return skill
+
+
+@lru_cache()
+def get_skill_factory() -> SkillFactory:
+    """Get the shared skill factory (templates are built on first use)"""
+    return SkillFactory()
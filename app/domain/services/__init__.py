@@ -0,0 +1,5 @@
+# Domain Services
+from app.domain.services.set_bonus_resolver import SetBonusResolver, set_bonus_resolver
+from app.domain.services.stat_calculator import StatCalculator, stat_calculator
+
+__all__ = ["SetBonusResolver", "set_bonus_resolver", "StatCalculator", "stat_calculator"]
@@ -0,0 +1,241 @@
+"""
+EquipmentFusion - Plans equipment fusions from their inputs
+
+Fusion consumes several pieces of the same slot and produces one new
+level 1 piece:
+
+    - Rarity: the lowest input rarity, one step higher when at least
+      FUSION_UPGRADE_COUNT inputs all share that rarity (capped at 6).
+    - Template: the first input's template if it already has that rarity,
+      otherwise a template of the same slot and rarity, preferring the
+      first input's set.
+    - Substats: per stat, the best input value plus half of the others,
+      keeping the FUSION_MAX_SUBSTATS highest.
+
+Locked or equipped pieces are never consumed.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from app.domain.static_data import EquipmentTemplateDefinition, StaticDataRegistry, static_data
+from app.domain.value_objects.hexagon_stats import normalize_stat_key
+
+
+# Inputs needed to raise the output rarity (also the "fuse duplicates" group size)
+FUSION_UPGRADE_COUNT = 3
+
+# Maximum inputs in one fusion
+FUSION_MAX_INPUTS = 5
+
+# Highest template rarity
+MAX_RARITY = 6
+
+# Substats kept on the fused piece
+FUSION_MAX_SUBSTATS = 4
+
+# Share of the non-best substat values carried over
+FUSION_SUBSTAT_RETENTION = 0.5
+
+
+@dataclass
+class FusionInput:
+    """
+    A piece offered for fusion.
+
+    Attributes:
+        id: Equipment ID
+        template_id: Equipment template ID
+        equipment_type: Slot type (weapon, armor, accessory, relic)
+        rarity: Template rarity (1-6)
+        set_id: Set of the template, if any
+        substats: Substats ([{"stat": "ATK", "value": 10}, ...])
+        is_locked: Whether the player locked the piece
+        is_equipped: Whether a hero wears the piece
+    """
+
+    id: str
+    template_id: str
+    equipment_type: str
+    rarity: int
+    set_id: Optional[str] = None
+    substats: List[Dict[str, Any]] = field(default_factory=list)
+    is_locked: bool = False
+    is_equipped: bool = False
+
+    @property
+    def is_consumable(self) -> bool:
+        """Whether the piece may be used up by a fusion"""
+        return not (self.is_locked or self.is_equipped)
+
+
+@dataclass
+class FusionPlan:
+    """
+    One fusion to apply.
+
+    Attributes:
+        consumed: IDs of the input pieces, in input order
+        template: Template of the resulting piece
+        rarity: Rarity of the resulting piece
+        substats: Substats of the resulting piece
+    """
+
+    consumed: List[str]
+    template: EquipmentTemplateDefinition
+    rarity: int
+    substats: List[Dict[str, Any]]
+
+
+class EquipmentFusion:
+    """
+    Computes fusion results without touching storage.
+    """
+
+    def __init__(self, registry: Optional[StaticDataRegistry] = None):
+        """
+        Initialize the planner.
+
+        Args:
+            registry: Static data registry (defaults to the shared one)
+        """
+        self.registry = registry or static_data
+        self._index_version = -1
+        self._index: Dict[Tuple[str, int], List[EquipmentTemplateDefinition]] = {}
+
+    def plan(self, inputs: Sequence[FusionInput]) -> FusionPlan:
+        """
+        Plan the fusion of the given pieces.
+
+        Args:
+            inputs: Pieces to fuse; the first one is the primary
+
+        Returns:
+            FusionPlan for the result
+
+        Raises:
+            ValueError: If the inputs cannot be fused
+        """
+        if len(inputs) < 2:
+            raise ValueError("At least 2 equipment pieces are required for fusion")
+        if len(inputs) > FUSION_MAX_INPUTS:
+            raise ValueError(f"At most {FUSION_MAX_INPUTS} equipment pieces can be fused at once")
+        if len({piece.id for piece in inputs}) != len(inputs):
+            raise ValueError("The same equipment cannot be fused twice")
+        for piece in inputs:
+            if piece.is_locked:
+                raise ValueError(f"Equipment {piece.id} is locked")
+            if piece.is_equipped:
+                raise ValueError(f"Equipment {piece.id} is equipped")
+        if len({piece.equipment_type for piece in inputs}) > 1:
+            raise ValueError("Only equipment of the same type can be fused")
+
+        primary = inputs[0]
+        rarity = min(piece.rarity for piece in inputs)
+        if len(inputs) >= FUSION_UPGRADE_COUNT and all(piece.rarity == rarity for piece in inputs):
+            rarity = min(rarity + 1, MAX_RARITY)
+
+        template = self._find_template(primary, rarity)
+        return FusionPlan(
+            consumed=[piece.id for piece in inputs],
+            template=template,
+            rarity=template.rarity,
+            substats=merge_substats(piece.substats for piece in inputs)
+        )
+
+    def plan_duplicates(
+        self,
+        inventory: Iterable[FusionInput],
+        group_size: int = FUSION_UPGRADE_COUNT
+    ) -> List[FusionPlan]:
+        """
+        Plan fusions for every group of duplicate pieces in an inventory.
+
+        Consumable pieces sharing a template are fused in groups of
+        group_size; leftovers are kept.
+
+        Args:
+            inventory: Player's pieces
+            group_size: Pieces per fusion
+
+        Returns:
+            Fusion plans, in template order
+        """
+        if not 2 <= group_size <= FUSION_MAX_INPUTS:
+            raise ValueError(f"Group size must be between 2 and {FUSION_MAX_INPUTS}")
+
+        by_template: Dict[str, List[FusionInput]] = {}
+        for piece in inventory:
+            if piece.is_consumable:
+                by_template.setdefault(piece.template_id, []).append(piece)
+
+        plans = []
+        for template_id in sorted(by_template):
+            pieces = by_template[template_id]
+            for start in range(0, len(pieces) - group_size + 1, group_size):
+                plans.append(self.plan(pieces[start:start + group_size]))
+        return plans
+
+    def _find_template(self, primary: FusionInput, rarity: int) -> EquipmentTemplateDefinition:
+        """Pick the result template for a rarity, falling back to the primary's."""
+        current = self.registry.get_equipment_template(primary.template_id)
+        if current is not None and current.rarity == rarity:
+            return current
+
+        options = self._templates_for(primary.equipment_type, rarity)
+        for template in options:
+            if primary.set_id and template.set_id == primary.set_id:
+                return template
+        if options:
+            return options[0]
+
+        if current is not None:
+            return current
+        return EquipmentTemplateDefinition(
+            id=primary.template_id,
+            name=primary.template_id,
+            equipment_type=primary.equipment_type,
+            rarity=primary.rarity,
+            set_id=primary.set_id
+        )
+
+    def _templates_for(self, equipment_type: str, rarity: int) -> List[EquipmentTemplateDefinition]:
+        """Templates of a slot and rarity, indexed per registry version."""
+        if self._index_version != self.registry.version:
+            index: Dict[Tuple[str, int], List[EquipmentTemplateDefinition]] = {}
+            for template in sorted(self.registry.get_equipment_templates(), key=lambda t: t.id):
+                index.setdefault((template.equipment_type, template.rarity), []).append(template)
+            self._index = index
+            self._index_version = self.registry.version
+        return self._index.get((equipment_type, rarity), [])
+
+
+def merge_substats(substat_lists: Iterable[Sequence[Mapping[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Merge the substats of several pieces.
+
+    Per stat, the best value is kept in full and the other values are
+    added at FUSION_SUBSTAT_RETENTION. Only the FUSION_MAX_SUBSTATS
+    highest stats remain.
+
+    Args:
+        substat_lists: Substats of each input piece
+
+    Returns:
+        Merged substats, highest value first
+    """
+    values: Dict[str, List[int]] = {}
+    for substats in substat_lists:
+        for substat in substats or ():
+            name = normalize_stat_key(str(substat.get("stat", "")))
+            if name is None:
+                continue
+            values.setdefault(name, []).append(int(substat.get("value", 0)))
+
+    merged = []
+    for name, stat_values in values.items():
+        stat_values.sort(reverse=True)
+        total = stat_values[0] + int(sum(stat_values[1:]) * FUSION_SUBSTAT_RETENTION)
+        merged.append({"stat": name.rstrip("_").upper(), "value": total})
+
+    merged.sort(key=lambda substat: (-substat["value"], substat["stat"]))
+    return merged[:FUSION_MAX_SUBSTATS]
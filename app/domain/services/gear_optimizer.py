@@ -0,0 +1,375 @@
+"""
+GearOptimizer - Best loadouts for a hero from an equipment inventory
+
+Searches one piece per slot with branch-and-bound:
+
+    1. Candidates are grouped per (slot, set) and Pareto-filtered on the
+       stats the objective cares about. A piece dominated by top_k other
+       pieces of the same slot and set can never appear in the top_k
+       loadouts, so it is dropped; of pieces with identical relevant
+       stats only one is kept.
+    2. Slots are searched depth-first with candidates in score order.
+       Leaving a slot empty is one of the candidates, so objectives with
+       negative weights can prefer no piece at all.
+       A branch is cut when even the best remaining pieces plus the best
+       possible set bonus cannot beat the current k-th loadout, or cannot
+       reach a minimum stat constraint.
+    3. The search stops at the time budget and returns the best loadouts
+       found so far.
+
+The objective is linear (weighted stats), so the score of a loadout is
+the score of the unequipped hero plus the score of each piece plus the
+score of the set bonus.
+"""
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.domain.entities.equipment import Equipment
+from app.domain.services.set_bonus_resolver import SetBonusResolver, set_bonus_resolver
+from app.domain.value_objects.hexagon_stats import STAT_FIELDS, HexagonStats, normalize_stat_key
+
+
+# Equipment slots, in search order
+SLOTS = ("weapon", "armor", "accessory", "relic")
+
+# How often (in search nodes) the time budget is checked
+_CLOCK_CHECK_INTERVAL = 256
+
+
+@dataclass
+class GearObjective:
+    """
+    What a loadout is optimized for.
+
+    Attributes:
+        weights: Weight per stat (e.g. {"ATK": 1.0}); negative to minimize
+        min_stats: Minimum final value per stat (e.g. {"SPD": 150})
+    """
+
+    weights: Dict[str, float]
+    min_stats: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Normalize stat keys, rejecting unknown stats"""
+        self.weights = self._normalize(self.weights)
+        self.min_stats = self._normalize(self.min_stats)
+        if not any(self.weights.values()):
+            raise ValueError("Objective needs at least one non-zero weight")
+
+    @staticmethod
+    def _normalize(values: Mapping[str, float]) -> Dict[str, float]:
+        normalized = {}
+        for key, value in values.items():
+            name = normalize_stat_key(key)
+            if name is None:
+                raise ValueError(f"Unknown stat: {key}")
+            normalized[name] = normalized.get(name, 0) + value
+        return normalized
+
+    def score(self, stats: HexagonStats) -> float:
+        """Weighted score of stats"""
+        return sum(getattr(stats, name) * weight for name, weight in self.weights.items())
+
+    def is_satisfied(self, stats: HexagonStats) -> bool:
+        """Check every minimum stat constraint"""
+        return all(getattr(stats, name) >= value for name, value in self.min_stats.items())
+
+
+@dataclass
+class Loadout:
+    """
+    One candidate loadout.
+
+    Attributes:
+        pieces: Equipment per slot (None for an empty slot)
+        stats: Final stats with the loadout equipped
+        set_bonus: Set bonus included in stats
+        score: Objective score
+    """
+
+    pieces: Dict[str, Optional[Equipment]]
+    stats: HexagonStats
+    set_bonus: HexagonStats
+    score: float
+
+    def to_dict(self) -> dict:
+        """Convert to a response dictionary"""
+        return {
+            "score": round(self.score, 2),
+            "equipment": {
+                slot: piece.id if piece is not None else None
+                for slot, piece in self.pieces.items()
+            },
+            "stats": {name: getattr(self.stats, name) for name in STAT_FIELDS},
+            "set_bonus": {name: getattr(self.set_bonus, name) for name in STAT_FIELDS}
+        }
+
+
+@dataclass
+class OptimizationResult:
+    """
+    Result of a gear search.
+
+    Attributes:
+        loadouts: Best loadouts, best first
+        candidates: Pieces left after Pareto pruning
+        explored: Search nodes visited
+        timed_out: Whether the time budget cut the search short
+        elapsed: Seconds spent
+    """
+
+    loadouts: List[Loadout]
+    candidates: int
+    explored: int
+    timed_out: bool
+    elapsed: float
+
+
+# Candidate: (score, stat vector, set_id, piece)
+_Candidate = Tuple[float, Tuple[int, ...], Optional[str], Optional[Equipment]]
+
+
+def _stat_vector(stats: HexagonStats) -> Tuple[int, ...]:
+    return tuple(getattr(stats, name) for name in STAT_FIELDS)
+
+
+def pareto_filter(
+    pieces: Sequence[Equipment],
+    objective: GearObjective,
+    keep: int = 1
+) -> List[Equipment]:
+    """
+    Drop pieces dominated by at least `keep` others on the objective's stats.
+
+    Only stats with a weight or a constraint are compared; higher is
+    better, except for stats with a negative weight and no constraint.
+    Pieces with identical compared stats are interchangeable, so only
+    the first of them is kept.
+    Callers group pieces by slot and set first so a dropped piece can
+    always be swapped for a dominating one without losing a set bonus.
+
+    Args:
+        pieces: Pieces of one slot and set
+        objective: Objective defining the relevant stats
+        keep: Dominators needed to drop a piece (top_k of the search)
+
+    Returns:
+        Pieces that may appear in the best `keep` loadouts
+    """
+    signs = []
+    for index, name in enumerate(STAT_FIELDS):
+        weight = objective.weights.get(name, 0)
+        constrained = name in objective.min_stats
+        if weight < 0 and constrained:
+            # Conflicting directions: no piece can be ruled out
+            return list(pieces)
+        if weight > 0 or constrained:
+            signs.append((index, 1))
+        elif weight < 0:
+            signs.append((index, -1))
+
+    keyed = {}
+    for piece in pieces:
+        vector = _stat_vector(piece.get_total_stats())
+        keyed.setdefault(tuple(sign * vector[index] for index, sign in signs), piece)
+    keyed = list(keyed.items())
+    # A dominator always has a larger key sum, so it is seen first
+    keyed.sort(key=lambda item: sum(item[0]), reverse=True)
+
+    kept: List[Tuple[Tuple[int, ...], Equipment]] = []
+    for key, piece in keyed:
+        dominators = 0
+        for other, _ in kept:
+            if all(a >= b for a, b in zip(other, key)):
+                dominators += 1
+                if dominators >= keep:
+                    break
+        if dominators < keep:
+            kept.append((key, piece))
+    return [piece for _, piece in kept]
+
+
+class GearOptimizer:
+    """
+    Branch-and-bound search for the best loadouts.
+    """
+
+    def __init__(
+        self,
+        set_resolver: Optional[SetBonusResolver] = None,
+        time_budget: float = 0.2,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize the optimizer.
+
+        Args:
+            set_resolver: Set bonus resolver (defaults to the shared one)
+            time_budget: Default search time budget in seconds
+            clock: Clock used for the time budget (overridable for tests)
+        """
+        self.set_resolver = set_resolver or set_bonus_resolver
+        self.time_budget = time_budget
+        self.clock = clock
+
+    def prepare_candidates(
+        self,
+        inventory: Sequence[Equipment],
+        objective: GearObjective,
+        top_k: int = 1,
+        hero_level: Optional[int] = None
+    ) -> Dict[str, List[Equipment]]:
+        """
+        Group an inventory by slot and drop dominated pieces.
+
+        Args:
+            inventory: Available pieces
+            objective: Objective to optimize
+            top_k: Number of loadouts wanted
+            hero_level: Skip pieces whose required level is higher
+
+        Returns:
+            Candidate pieces per slot
+        """
+        groups: Dict[Tuple[str, Optional[str]], List[Equipment]] = {}
+        for piece in inventory:
+            slot = piece.equipment_type.value
+            if slot not in SLOTS:
+                continue
+            if hero_level is not None and piece.required_level > hero_level:
+                continue
+            groups.setdefault((slot, piece.set_id), []).append(piece)
+
+        candidates: Dict[str, List[Equipment]] = {slot: [] for slot in SLOTS}
+        for (slot, _), pieces in groups.items():
+            candidates[slot].extend(pareto_filter(pieces, objective, keep=top_k))
+        return candidates
+
+    def optimize(
+        self,
+        base_stats: HexagonStats,
+        inventory: Sequence[Equipment],
+        objective: GearObjective,
+        top_k: int = 3,
+        time_budget: Optional[float] = None,
+        hero_level: Optional[int] = None
+    ) -> OptimizationResult:
+        """
+        Find the best loadouts.
+
+        Args:
+            base_stats: Hero stats with nothing equipped
+            inventory: Available pieces
+            objective: Objective to optimize
+            top_k: Number of loadouts to return
+            time_budget: Seconds allowed (defaults to the optimizer's)
+            hero_level: Skip pieces whose required level is higher
+
+        Returns:
+            OptimizationResult with the best loadouts found
+        """
+        started = self.clock()
+        deadline = started + (self.time_budget if time_budget is None else time_budget)
+
+        candidates = self.prepare_candidates(inventory, objective, top_k, hero_level)
+        empty: _Candidate = (0.0, (0,) * len(STAT_FIELDS), None, None)
+        slots: List[List[_Candidate]] = []
+        for slot in SLOTS:
+            options = [
+                (objective.score(stats), _stat_vector(stats), piece.set_id, piece)
+                for piece in candidates[slot]
+                for stats in (piece.get_total_stats(),)
+            ]
+            options.append(empty)
+            options.sort(key=lambda option: option[0], reverse=True)
+            slots.append(options)
+
+        # Optimistic bounds for the slots after each depth
+        constrained = [
+            (STAT_FIELDS.index(name), value) for name, value in objective.min_stats.items()
+        ]
+        combinations = list(self.set_resolver.get_combinations(len(SLOTS)).values())
+        set_score_bound = max(objective.score(bonus) for bonus in combinations)
+        set_stat_bound = [
+            max(_stat_vector(bonus)[index] for bonus in combinations)
+            for index in range(len(STAT_FIELDS))
+        ]
+        score_bound = [0.0] * (len(slots) + 1)
+        stat_bound = [[0] * len(STAT_FIELDS) for _ in range(len(slots) + 1)]
+        for depth in range(len(slots) - 1, -1, -1):
+            score_bound[depth] = score_bound[depth + 1] + slots[depth][0][0]
+            for index in range(len(STAT_FIELDS)):
+                stat_bound[depth][index] = stat_bound[depth + 1][index] + max(
+                    option[1][index] for option in slots[depth]
+                )
+
+        base_vector = _stat_vector(base_stats)
+        base_score = objective.score(base_stats)
+        heap: List[Tuple[float, int, Tuple[_Candidate, ...]]] = []
+        explored = 0
+        timed_out = False
+        chosen: List[_Candidate] = []
+
+        def search(depth: int, vector: Tuple[int, ...], score: float) -> None:
+            nonlocal explored, timed_out
+            explored += 1
+            if explored % _CLOCK_CHECK_INTERVAL == 0 and self.clock() > deadline:
+                timed_out = True
+            if timed_out:
+                return
+
+            if depth == len(slots):
+                bonus = self.set_resolver.resolve(option[2] for option in chosen)
+                final = tuple(a + b for a, b in zip(vector, _stat_vector(bonus)))
+                if any(final[index] < value for index, value in constrained):
+                    return
+                total = score + objective.score(bonus)
+                entry = (total, explored, tuple(chosen))
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif total > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+                return
+
+            for option in slots[depth]:
+                threshold = heap[0][0] if len(heap) == top_k else float("-inf")
+                if score + option[0] + score_bound[depth + 1] + set_score_bound <= threshold:
+                    break  # Options are sorted, none of the rest can do better
+                next_vector = tuple(a + b for a, b in zip(vector, option[1]))
+                if any(
+                    next_vector[index] + stat_bound[depth + 1][index] + set_stat_bound[index] < value
+                    for index, value in constrained
+                ):
+                    continue
+                chosen.append(option)
+                search(depth + 1, next_vector, score + option[0])
+                chosen.pop()
+                if timed_out:
+                    return
+
+        search(0, base_vector, base_score)
+
+        loadouts = []
+        for total, _, picked in sorted(heap, key=lambda entry: entry[0], reverse=True):
+            pieces = [option[3] for option in picked]
+            bonus = self.set_resolver.resolve(option[2] for option in picked)
+            stats = base_stats.add(bonus)
+            for piece in pieces:
+                if piece is not None:
+                    stats = stats.add(piece.get_total_stats())
+            loadouts.append(Loadout(
+                pieces=dict(zip(SLOTS, pieces)),
+                stats=stats,
+                set_bonus=bonus,
+                score=total
+            ))
+
+        return OptimizationResult(
+            loadouts=loadouts,
+            candidates=sum(len(pieces) for pieces in candidates.values()),
+            explored=explored,
+            timed_out=timed_out,
+            elapsed=self.clock() - started
+        )
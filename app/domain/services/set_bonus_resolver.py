@@ -0,0 +1,180 @@
+"""
+SetBonusResolver - Equipment set bonuses from piece counts
+
+Resolves the merged bonus of a group of equipped pieces, and precomputes
+the bonus of every set combination that fits in a hero's slots for the
+gear optimizer. Bonus values come from the static data registry; nothing
+here touches the database.
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.domain.static_data import StaticDataRegistry, static_data
+from app.domain.value_objects.hexagon_stats import HexagonStats, normalize_stat_key
+
+
+# Canonical set combination: sorted ((set_id, pieces), ...)
+SetCombination = Tuple[Tuple[str, int], ...]
+
+
+def weighted_score(stats: HexagonStats, weights: Mapping[str, float]) -> float:
+    """
+    Score stats with per-stat weights.
+
+    Args:
+        stats: Stats to score
+        weights: Weight per stat, any key style ("ATK", "atk", "def_")
+
+    Returns:
+        Weighted sum
+    """
+    score = 0.0
+    for key, weight in weights.items():
+        name = normalize_stat_key(key)
+        if name is not None:
+            score += getattr(stats, name) * weight
+    return score
+
+
+class SetBonusResolver:
+    """
+    Resolves merged set bonuses and set combination tables.
+    """
+
+    def __init__(self, registry: Optional[StaticDataRegistry] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            registry: Static data registry (defaults to the shared one)
+        """
+        self.registry = registry or static_data
+        self._registry_version = self.registry.version
+        self._combinations: Dict[int, Dict[SetCombination, HexagonStats]] = {}
+
+    # === Stateless resolution ===
+
+    def get_set_bonus(self, set_id: Optional[str], count: int) -> HexagonStats:
+        """
+        Get the bonus of one set for a number of pieces.
+
+        Args:
+            set_id: Set identifier
+            count: Pieces equipped
+
+        Returns:
+            Stat bonus (zero for unknown sets)
+        """
+        definition = self.registry.get_equipment_set(set_id)
+        if definition is None:
+            return HexagonStats.zero()
+        return definition.get_bonus(count)
+
+    def resolve(self, set_ids: Iterable[Optional[str]]) -> HexagonStats:
+        """
+        Resolve the merged bonus for a group of equipped pieces.
+
+        Args:
+            set_ids: Set ID of each equipped piece (None if not in a set)
+
+        Returns:
+            Merged stat delta
+        """
+        return self._bonus_from_counts(self._count(set_ids))
+
+    # === Bulk path ===
+
+    def get_combinations(self, slots: int = 4) -> Dict[SetCombination, HexagonStats]:
+        """
+        Get the bonus of every set combination that fits in the slots.
+
+        Only piece counts that reach a bonus threshold appear in a
+        combination; the empty combination maps to zero. The table is
+        built once per registry version.
+
+        Args:
+            slots: Number of equipment slots
+
+        Returns:
+            Mapping of combination to merged bonus
+        """
+        self._check_registry()
+        table = self._combinations.get(slots)
+        if table is not None:
+            return table
+
+        options = [
+            (definition.id, definition.thresholds)
+            for definition in self.registry.get_equipment_sets()
+            if definition.thresholds
+        ]
+        table = {}
+
+        def expand(index: int, free: int, chosen: List[Tuple[str, int]], bonus: HexagonStats) -> None:
+            if index == len(options):
+                table[tuple(sorted(chosen))] = bonus
+                return
+            expand(index + 1, free, chosen, bonus)
+            set_id, thresholds = options[index]
+            for pieces in thresholds:
+                if pieces <= free:
+                    chosen.append((set_id, pieces))
+                    expand(
+                        index + 1, free - pieces, chosen,
+                        bonus.add(self.get_set_bonus(set_id, pieces))
+                    )
+                    chosen.pop()
+
+        expand(0, slots, [], HexagonStats.zero())
+        self._combinations[slots] = table
+        return table
+
+    def score_combinations(
+        self,
+        weights: Mapping[str, float],
+        slots: int = 4
+    ) -> List[Tuple[SetCombination, HexagonStats, float]]:
+        """
+        Score every set combination, best first.
+
+        Args:
+            weights: Weight per stat
+            slots: Number of equipment slots
+
+        Returns:
+            List of (combination, bonus, score) sorted by score descending
+        """
+        scored = [
+            (combination, bonus, weighted_score(bonus, weights))
+            for combination, bonus in self.get_combinations(slots).items()
+        ]
+        scored.sort(key=lambda item: item[2], reverse=True)
+        return scored
+
+    # === Internals ===
+
+    @staticmethod
+    def _count(set_ids: Iterable[Optional[str]]) -> Dict[str, int]:
+        """Count pieces per set."""
+        counts: Dict[str, int] = {}
+        for set_id in set_ids:
+            if set_id:
+                counts[set_id] = counts.get(set_id, 0) + 1
+        return counts
+
+    def _bonus_from_counts(self, counts: Mapping[str, int]) -> HexagonStats:
+        """Merge the bonuses for a set count map."""
+        total = HexagonStats.zero()
+        for set_id, count in counts.items():
+            total = total.add(self.get_set_bonus(set_id, count))
+        return total
+
+    def _check_registry(self) -> None:
+        """Drop combination tables built before a registry reload."""
+        if self._registry_version == self.registry.version:
+            return
+        self._registry_version = self.registry.version
+        self._combinations.clear()
+
+
+# Shared resolver for this worker
+set_bonus_resolver = SetBonusResolver()
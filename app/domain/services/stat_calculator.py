@@ -0,0 +1,301 @@
+"""
+StatCalculator - Single pipeline for hero stats
+
+Stages, in order:
+    1. Template base + growth × (level - 1)
+    2. Ascension / awakening multiplier
+    3. Equipment total stats (base + enhancement bonus)
+    4. Equipment set bonuses (2/3/4 piece thresholds)
+    5. Mount stats and mount team bonus
+    6. Formation bonus (flat, then percent)
+
+Results are memoized per hero keyed by a version stamp of the inputs,
+so repeated reads (list views, battle start) reuse the last result and
+only recompute after one of the inputs changes.
+"""
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING, Any, Mapping, Optional, Sequence, Tuple
+)
+
+from app.domain.services.set_bonus_resolver import SetBonusResolver, set_bonus_resolver
+from app.domain.value_objects.hexagon_stats import STAT_FIELDS, HexagonStats, normalize_stat_key
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from app.domain.entities.equipment import Equipment
+    from app.domain.entities.hero import Hero
+    from app.domain.entities.mount import Mount
+    from app.domain.entities.team import Formation
+
+
+# Stat multiplier per ascension / awakening level
+ASCENSION_STAT_BONUS = 0.05
+AWAKENING_STAT_BONUS = 0.10
+
+
+def level_stats(
+    base: HexagonStats,
+    growth_rates: Optional[Mapping[str, float]],
+    level: int
+) -> HexagonStats:
+    """
+    Apply per-level growth to template base stats.
+
+    Args:
+        base: Level 1 stats
+        growth_rates: Stat gained per level, keyed like game data ("ATK")
+        level: Hero level
+
+    Returns:
+        Stats at the given level
+    """
+    if not growth_rates or level <= 1:
+        return base
+
+    values = {name: getattr(base, name) for name in STAT_FIELDS}
+    for key, rate in growth_rates.items():
+        name = normalize_stat_key(key)
+        if name is not None:
+            values[name] += int(rate * (level - 1))
+    return HexagonStats(**values)
+
+
+def apply_formation(stats: HexagonStats, formation: Optional["Formation"]) -> HexagonStats:
+    """
+    Apply formation bonuses.
+
+    Flat bonuses are added first, then percent bonuses scale the result.
+    A bonus on "all" applies to every stat.
+
+    Args:
+        stats: Stats before the formation
+        formation: Active formation, if any
+
+    Returns:
+        Stats with formation bonuses applied
+    """
+    if formation is None or not formation.bonuses:
+        return stats
+
+    flat = dict.fromkeys(STAT_FIELDS, 0.0)
+    percent = dict.fromkeys(STAT_FIELDS, 0.0)
+    for bonus in formation.bonuses:
+        names = STAT_FIELDS if bonus.stat == "all" else (normalize_stat_key(bonus.stat),)
+        target = flat if bonus.bonus_type == "flat" else percent
+        for name in names:
+            if name is not None:
+                target[name] += bonus.value
+
+    return HexagonStats(**{
+        name: int((getattr(stats, name) + flat[name]) * (1 + percent[name] / 100))
+        for name in STAT_FIELDS
+    })
+
+
+class StatCalculator:
+    """
+    Computes hero stats through one pipeline and memoizes the result.
+
+    The memo holds one entry per hero (bounded LRU). An entry is reused
+    while the version stamp of its inputs is unchanged.
+    """
+
+    def __init__(
+        self,
+        set_resolver: Optional[SetBonusResolver] = None,
+        max_entries: int = 4096
+    ):
+        """
+        Initialize the calculator.
+
+        Args:
+            set_resolver: Set bonus resolver (defaults to the shared one)
+            max_entries: Maximum number of memoized heroes
+        """
+        self.set_resolver = set_resolver or set_bonus_resolver
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Tuple[tuple, HexagonStats]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def calculate(
+        self,
+        base: HexagonStats,
+        growth_rates: Optional[Mapping[str, float]] = None,
+        level: int = 1,
+        ascension_level: int = 0,
+        awakening_level: int = 0,
+        equipment: Sequence["Equipment"] = (),
+        mount: Optional["Mount"] = None,
+        team_bonus: Optional[Mapping[str, Any]] = None,
+        formation: Optional["Formation"] = None,
+        set_bonus: Optional[HexagonStats] = None
+    ) -> HexagonStats:
+        """
+        Run the full pipeline without memoization.
+
+        Args:
+            base: Template level 1 stats
+            growth_rates: Template growth per level
+            level: Hero level
+            ascension_level: Ascension level (0-6)
+            awakening_level: Awakening level (0-6)
+            equipment: Equipped pieces
+            mount: Hero's mount
+            team_bonus: Team-wide flat bonus (e.g. from a mount)
+            formation: Active formation
+            set_bonus: Precomputed set bonus (e.g. tracked by the resolver);
+                resolved from the equipment when omitted
+
+        Returns:
+            Final stats
+        """
+        stats = level_stats(base, growth_rates, level)
+
+        multiplier = (
+            1
+            + ascension_level * ASCENSION_STAT_BONUS
+            + awakening_level * AWAKENING_STAT_BONUS
+        )
+        if multiplier != 1:
+            stats = stats.multiply(multiplier)
+
+        for piece in equipment:
+            stats = stats.add(piece.get_total_stats())
+        if set_bonus is None:
+            set_bonus = self.get_set_bonus(equipment)
+        stats = stats.add(set_bonus)
+
+        if mount is not None:
+            stats = stats.add(mount.get_stats())
+        if team_bonus:
+            stats = stats.add(HexagonStats.from_mapping(team_bonus))
+
+        return apply_formation(stats, formation)
+
+    def get_set_bonus(self, equipment: Sequence["Equipment"]) -> HexagonStats:
+        """
+        Sum the set bonuses reached by a group of equipped pieces.
+
+        Args:
+            equipment: Equipped pieces
+
+        Returns:
+            Merged stat bonus
+        """
+        return self.set_resolver.resolve(piece.set_id for piece in equipment)
+
+    def version_stamp(
+        self,
+        base: HexagonStats,
+        growth_rates: Optional[Mapping[str, float]] = None,
+        level: int = 1,
+        ascension_level: int = 0,
+        awakening_level: int = 0,
+        equipment: Sequence["Equipment"] = (),
+        mount: Optional["Mount"] = None,
+        team_bonus: Optional[Mapping[str, Any]] = None,
+        formation: Optional["Formation"] = None,
+        set_bonus: Optional[HexagonStats] = None
+    ) -> tuple:
+        """
+        Build a cheap, hashable stamp of the pipeline inputs.
+
+        Equipment is stamped by ID and enhancement level, mounts by ID,
+        level and bond level, formations by ID. The static data version
+        is included so a set data reload invalidates every entry.
+
+        Returns:
+            Version stamp tuple
+        """
+        return (
+            base,
+            tuple(sorted(growth_rates.items())) if growth_rates else (),
+            level,
+            ascension_level,
+            awakening_level,
+            tuple((piece.id, piece.level) for piece in equipment),
+            (mount.id, mount.level, mount.bond_level) if mount is not None else None,
+            tuple(sorted(
+                (key, value) for key, value in team_bonus.items()
+                if isinstance(value, (int, float))
+            )) if team_bonus else (),
+            formation.id if formation is not None else None,
+            set_bonus,
+            self.set_resolver.registry.version
+        )
+
+    def get_stats(self, hero_id: str, **inputs: Any) -> HexagonStats:
+        """
+        Get memoized stats for a hero.
+
+        Args:
+            hero_id: Memo key
+            **inputs: Pipeline inputs (see calculate)
+
+        Returns:
+            Final stats, recomputed only when the inputs changed
+        """
+        stamp = self.version_stamp(**inputs)
+        cached = self._cache.get(hero_id)
+        if cached is not None and cached[0] == stamp:
+            self._cache.move_to_end(hero_id)
+            return cached[1]
+
+        stats = self.calculate(**inputs)
+        self._cache[hero_id] = (stamp, stats)
+        self._cache.move_to_end(hero_id)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return stats
+
+    def get_hero_stats(
+        self,
+        hero: "Hero",
+        equipment: Sequence["Equipment"] = (),
+        mount: Optional["Mount"] = None,
+        team_bonus: Optional[Mapping[str, Any]] = None,
+        formation: Optional["Formation"] = None
+    ) -> HexagonStats:
+        """
+        Get memoized stats for a Hero entity.
+
+        Args:
+            hero: The hero
+            equipment: Pieces in the hero's slots
+            mount: Hero's mount
+            team_bonus: Team-wide flat bonus
+            formation: Active formation
+
+        Returns:
+            Final stats
+        """
+        return self.get_stats(
+            hero.id,
+            base=hero.base_stats,
+            growth_rates=hero.growth_rates,
+            level=hero.level,
+            ascension_level=hero.ascension_level,
+            awakening_level=hero.awakening_level,
+            equipment=tuple(equipment),
+            mount=mount,
+            team_bonus=team_bonus,
+            formation=formation
+        )
+
+    def invalidate(self, hero_id: Optional[str] = None) -> None:
+        """
+        Drop memoized stats.
+
+        Args:
+            hero_id: Hero to drop, or None to drop all
+        """
+        if hero_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(hero_id, None)
+
+
+# Shared calculator for this worker
+stat_calculator = StatCalculator()
@@ -0,0 +1,331 @@
+"""
+TeamBuilder - Best teams for a stage from a player's roster
+
+Searches hero subsets x grid placements x formations with beam search:
+
+    1. Each hero gets a stage score: its power plus an element bonus
+       against the stage's enemies (offense vs. their elements, minus the
+       damage their elements deal back).
+    2. The roster is pruned to the best team_size heroes per element plus
+       the best hero of every template a formation requires. Any other
+       hero can be swapped for a better one of the same element without
+       changing synergy or formation eligibility, so no best team is lost.
+    3. For every formation (and no formation), teams grow one hero at a
+       time. Every (hero, free cell) extension of a beam state is scored
+       in O(1) with TeamEvaluator.power_with; the best beam_width distinct
+       teams survive to the next depth.
+    4. The search stops at the time budget and returns the best teams
+       found so far.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from app.domain.entities.hero import Hero
+from app.domain.services.team_evaluator import GRID_CELLS, TeamEvaluator
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+
+
+# Cells in index order (cell = y * 3 + x)
+_CELL_POSITIONS = tuple(
+    GridPosition(cell % GridPosition.GRID_SIZE, cell // GridPosition.GRID_SIZE)
+    for cell in range(GRID_CELLS)
+)
+
+
+def element_advantage(element: Element, enemy_elements: Sequence[Element]) -> float:
+    """
+    Average element edge of a hero against a group of enemies.
+
+    Args:
+        element: Hero element
+        enemy_elements: Elements of the enemies
+
+    Returns:
+        Mean of (damage dealt multiplier - damage taken multiplier);
+        0 for neutral matchups or no enemies
+    """
+    if not enemy_elements:
+        return 0.0
+    total = 0.0
+    for enemy in enemy_elements:
+        total += element.calculate_multiplier(enemy) - enemy.calculate_multiplier(element)
+    return total / len(enemy_elements)
+
+
+@dataclass
+class TeamCandidate:
+    """
+    One candidate team.
+
+    Attributes:
+        members: (hero, position) pairs
+        formation: Formation the team was built for (None for no formation)
+        power: Team power from the evaluator
+        score: Power plus element bonus against the stage
+        formation_active: Whether the formation's requirements are met
+    """
+
+    members: List[Tuple[Hero, GridPosition]]
+    formation: Optional[object]
+    power: int
+    score: float
+    formation_active: bool = False
+
+
+@dataclass
+class TeamBuildResult:
+    """
+    Result of a team search.
+
+    Attributes:
+        teams: Best teams, best first
+        candidates: Heroes left after pruning
+        explored: Extensions scored
+        timed_out: Whether the time budget cut the search short
+        elapsed: Seconds spent
+    """
+
+    teams: List[TeamCandidate]
+    candidates: int
+    explored: int
+    timed_out: bool
+    elapsed: float
+
+
+@dataclass
+class _BeamState:
+    evaluator: TeamEvaluator
+    members: Tuple[Tuple[Hero, int], ...]
+    bonus: float
+    key: FrozenSet[Tuple[str, int]] = frozenset()
+
+
+class TeamBuilder:
+    """
+    Beam search for the best teams against a stage.
+    """
+
+    def __init__(
+        self,
+        beam_width: int = 24,
+        placements_per_team: int = 2,
+        time_budget: float = 0.3,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize the builder.
+
+        Args:
+            beam_width: Partial teams kept per depth and formation
+            placements_per_team: Placements kept per hero set in the beam
+            time_budget: Default search time budget in seconds
+            clock: Clock used for the time budget (overridable for tests)
+        """
+        self.beam_width = beam_width
+        self.placements_per_team = placements_per_team
+        self.time_budget = time_budget
+        self.clock = clock
+
+    def prune_roster(
+        self,
+        roster: Sequence[Hero],
+        scores: Dict[str, float],
+        formations: Sequence[object],
+        team_size: int
+    ) -> List[Hero]:
+        """
+        Keep the heroes that can appear in a best team.
+
+        Args:
+            roster: All heroes
+            scores: Stage score per hero ID
+            formations: Formations to search
+            team_size: Heroes per team
+
+        Returns:
+            Best team_size heroes per element plus the best hero of
+            every formation-required template
+        """
+        ranked = sorted(roster, key=lambda hero: scores[hero.id], reverse=True)
+        required = {
+            template_id
+            for formation in formations
+            for template_id in formation.required_heroes
+        }
+
+        kept: Dict[str, Hero] = {}
+        per_element: Dict[Element, int] = {}
+        seen_required = set()
+        for hero in ranked:
+            if per_element.get(hero.element, 0) < team_size:
+                per_element[hero.element] = per_element.get(hero.element, 0) + 1
+                kept[hero.id] = hero
+            if hero.template_id in required and hero.template_id not in seen_required:
+                seen_required.add(hero.template_id)
+                kept[hero.id] = hero
+        return list(kept.values())
+
+    def build(
+        self,
+        roster: Sequence[Hero],
+        enemy_elements: Sequence[Element],
+        formations: Sequence[object] = (),
+        team_size: int = 5,
+        top_k: int = 3,
+        time_budget: Optional[float] = None
+    ) -> TeamBuildResult:
+        """
+        Find the best teams.
+
+        Args:
+            roster: Player's heroes
+            enemy_elements: Elements of the stage's enemies
+            formations: Formations to try (no formation is always tried)
+            team_size: Heroes per team
+            top_k: Number of teams to return
+            time_budget: Seconds allowed (defaults to the builder's)
+
+        Returns:
+            TeamBuildResult with the best teams found
+        """
+        started = self.clock()
+        deadline = started + (self.time_budget if time_budget is None else time_budget)
+
+        powers = {hero.id: hero.get_total_power() for hero in roster}
+        edge = {element: element_advantage(element, enemy_elements) for element in Element}
+        bonuses = {hero.id: powers[hero.id] * edge[hero.element] for hero in roster}
+        scores = {hero.id: powers[hero.id] + bonuses[hero.id] for hero in roster}
+
+        pool = self.prune_roster(roster, scores, formations, team_size)
+        pool.sort(key=lambda hero: scores[hero.id], reverse=True)
+        size = min(team_size, len(pool))
+
+        best: Dict[FrozenSet[str], TeamCandidate] = {}
+        explored = 0
+        timed_out = False
+
+        for formation in [None, *formations]:
+            beam = [_BeamState(TeamEvaluator(formation), (), 0.0)]
+            for _ in range(size):
+                if self.clock() > deadline:
+                    timed_out = True
+                    break
+
+                scored: List[Tuple[float, int, _BeamState, Hero, int]] = []
+                seen = set()
+                for state in beam:
+                    free = state.evaluator.free_cells()
+                    for hero in pool:
+                        if state.evaluator.contains(hero.id):
+                            continue
+                        for cell in free:
+                            key = state.key | {(hero.id, cell)}
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            explored += 1
+                            score = state.evaluator.power_with(
+                                hero, _CELL_POSITIONS[cell], powers[hero.id]
+                            ) + state.bonus + bonuses[hero.id]
+                            scored.append((score, explored, state, hero, cell))
+
+                # Keep the best extensions, with few placements per hero set
+                # so symmetric layouts of one team do not fill the beam
+                beam = []
+                placements: Dict[FrozenSet[str], int] = {}
+                scored.sort(key=lambda entry: (-entry[0], entry[1]))
+                for score, _, state, hero, cell in scored:
+                    heroes = frozenset(member.id for member, _ in state.members) | {hero.id}
+                    if placements.get(heroes, 0) >= self.placements_per_team:
+                        continue
+                    placements[heroes] = placements.get(heroes, 0) + 1
+                    evaluator = state.evaluator.copy()
+                    evaluator.add(hero, _CELL_POSITIONS[cell], powers[hero.id])
+                    beam.append(_BeamState(
+                        evaluator,
+                        state.members + ((hero, cell),),
+                        state.bonus + bonuses[hero.id],
+                        state.key | {(hero.id, cell)}
+                    ))
+                    if len(beam) >= self.beam_width:
+                        break
+                if not beam:
+                    break
+
+            for state in beam:
+                # Out of time mid-search: fill the partial team greedily
+                # rather than report a short (or empty) one
+                if len(state.members) < size:
+                    state = self._complete(state, pool, powers, bonuses, size)
+                power = state.evaluator.get_total_power()
+                candidate = TeamCandidate(
+                    members=[(hero, _CELL_POSITIONS[cell]) for hero, cell in state.members],
+                    formation=formation,
+                    power=power,
+                    score=power + state.bonus,
+                    formation_active=state.evaluator.is_formation_active()
+                )
+                # One placement per hero set; an active formation wins ties
+                heroes = frozenset(hero.id for hero, _ in state.members)
+                current = best.get(heroes)
+                if current is None or (candidate.score, candidate.formation_active) > (
+                    current.score, current.formation_active
+                ):
+                    best[heroes] = candidate
+            if timed_out:
+                break
+
+        teams = sorted(best.values(), key=lambda team: team.score, reverse=True)[:top_k]
+        return TeamBuildResult(
+            teams=teams,
+            candidates=len(pool),
+            explored=explored,
+            timed_out=timed_out,
+            elapsed=self.clock() - started
+        )
+
+    def _complete(
+        self,
+        state: _BeamState,
+        pool: Sequence[Hero],
+        powers: Dict[str, int],
+        bonuses: Dict[str, float],
+        size: int
+    ) -> _BeamState:
+        """
+        Extend a partial team one hero at a time, each time with the best
+        (hero, cell) by score, until it has size heroes.
+
+        Args:
+            state: Partial beam state
+            pool: Heroes to choose from
+            powers: Total power per hero ID
+            bonuses: Stage element bonus per hero ID
+            size: Heroes per team
+
+        Returns:
+            A beam state with size members
+        """
+        while len(state.members) < size:
+            extension = None
+            for cell in state.evaluator.free_cells():
+                for hero in pool:
+                    if state.evaluator.contains(hero.id):
+                        continue
+                    score = state.evaluator.power_with(
+                        hero, _CELL_POSITIONS[cell], powers[hero.id]
+                    ) + bonuses[hero.id]
+                    if extension is None or score > extension[0]:
+                        extension = (score, hero, cell)
+            _, hero, cell = extension
+            evaluator = state.evaluator.copy()
+            evaluator.add(hero, _CELL_POSITIONS[cell], powers[hero.id])
+            state = _BeamState(
+                evaluator,
+                state.members + ((hero, cell),),
+                state.bonus + bonuses[hero.id],
+                state.key | {(hero.id, cell)}
+            )
+        return state
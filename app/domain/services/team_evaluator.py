@@ -0,0 +1,314 @@
+"""
+TeamEvaluator - Incremental team power, synergy and formation checks
+
+The 3x3 grid maps to bits 0-8 (cell = y * 3 + x). Adjacency for every
+cell is precomputed as a 9-bit mask, and the team keeps one occupancy
+bitboard per element. Adding a hero adds popcount(adjacent & board) to
+the synergy pair count, so every update and query is O(1) regardless
+of how the team was built.
+
+Formation eligibility is tracked the same way: a count of distinct
+elements and of required hero templates still missing.
+"""
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.entities.hero import Hero
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+
+
+# Synergy bonus per adjacent same-element pair
+SYNERGY_PAIR_BONUS = 50
+
+GRID_CELLS = GridPosition.GRID_SIZE * GridPosition.GRID_SIZE
+
+
+def cell_index(position: GridPosition) -> int:
+    """Bit index of a grid position."""
+    return position.y * GridPosition.GRID_SIZE + position.x
+
+
+def _build_adjacency() -> Tuple[int, ...]:
+    masks = [0] * GRID_CELLS
+    for position in GridPosition.ALL_POSITIONS:
+        for neighbor in position.get_neighbors():
+            masks[cell_index(position)] |= 1 << cell_index(neighbor)
+    return tuple(masks)
+
+
+# ADJACENCY_MASKS[cell]: bitmask of the cells adjacent to cell (including diagonals)
+ADJACENCY_MASKS = _build_adjacency()
+
+
+class TeamEvaluator:
+    """
+    Keeps team power, element synergy and formation eligibility current
+    as members are added, removed and moved.
+
+    Hero power is read once when a hero joins; call refresh_member after
+    a member levels up or changes equipment.
+    """
+
+    def __init__(self, formation=None):
+        """
+        Initialize an empty evaluator.
+
+        Args:
+            formation: Optional active Formation
+        """
+        self.formation = None
+        self._required: frozenset = frozenset()
+        self._cells: Dict[str, int] = {}
+        self._elements: Dict[str, Element] = {}
+        self._templates: Dict[str, str] = {}
+        self._powers: Dict[str, int] = {}
+        self._boards: Dict[Element, int] = {}
+        self._element_counts: Counter = Counter()
+        self._template_counts: Counter = Counter()
+        self._occupied = 0
+        self._base_power = 0
+        self._synergy_pairs = 0
+        self._missing_heroes = 0
+        self.set_formation(formation)
+
+    @classmethod
+    def from_members(cls, members, formation=None) -> "TeamEvaluator":
+        """
+        Build an evaluator for existing members.
+
+        Args:
+            members: TeamSlot-like objects with hero and position
+            formation: Optional active Formation
+
+        Returns:
+            TeamEvaluator
+        """
+        evaluator = cls(formation)
+        for slot in members:
+            evaluator.add(slot.hero, slot.position)
+        return evaluator
+
+    def copy(self) -> "TeamEvaluator":
+        """Independent copy, for search algorithms that branch on a team."""
+        clone = TeamEvaluator.__new__(TeamEvaluator)
+        clone.formation = self.formation
+        clone._required = self._required
+        clone._cells = dict(self._cells)
+        clone._elements = dict(self._elements)
+        clone._templates = dict(self._templates)
+        clone._powers = dict(self._powers)
+        clone._boards = dict(self._boards)
+        clone._element_counts = Counter(self._element_counts)
+        clone._template_counts = Counter(self._template_counts)
+        clone._occupied = self._occupied
+        clone._base_power = self._base_power
+        clone._synergy_pairs = self._synergy_pairs
+        clone._missing_heroes = self._missing_heroes
+        return clone
+
+    # Updates
+
+    def add(self, hero: Hero, position: GridPosition, power: Optional[int] = None) -> None:
+        """
+        Add a hero at a position.
+
+        Args:
+            hero: Hero to add
+            position: Grid position (must be free)
+            power: Hero power if already known
+        """
+        cell = cell_index(position)
+        self._cells[hero.id] = cell
+        self._elements[hero.id] = hero.element
+        self._templates[hero.id] = hero.template_id
+        self._powers[hero.id] = hero.get_total_power() if power is None else power
+        self._base_power += self._powers[hero.id]
+        self._occupied |= 1 << cell
+        self._place(hero.element, cell)
+
+        self._element_counts[hero.element] += 1
+        if self._template_counts[hero.template_id] == 0 and self._is_required(hero.template_id):
+            self._missing_heroes -= 1
+        self._template_counts[hero.template_id] += 1
+
+    def remove(self, hero_id: str) -> None:
+        """
+        Remove a hero.
+
+        Args:
+            hero_id: ID of the hero to remove
+        """
+        cell = self._cells.pop(hero_id)
+        element = self._elements.pop(hero_id)
+        template_id = self._templates.pop(hero_id)
+        self._base_power -= self._powers.pop(hero_id)
+        self._occupied &= ~(1 << cell)
+        self._unplace(element, cell)
+
+        self._element_counts[element] -= 1
+        if not self._element_counts[element]:
+            del self._element_counts[element]
+        self._template_counts[template_id] -= 1
+        if not self._template_counts[template_id]:
+            del self._template_counts[template_id]
+            if self._is_required(template_id):
+                self._missing_heroes += 1
+
+    def move(self, hero_id: str, position: GridPosition) -> None:
+        """
+        Move a hero to a free position.
+
+        Args:
+            hero_id: ID of the hero to move
+            position: New grid position
+        """
+        element = self._elements[hero_id]
+        old_cell = self._cells[hero_id]
+        new_cell = cell_index(position)
+        self._unplace(element, old_cell)
+        self._occupied = (self._occupied & ~(1 << old_cell)) | (1 << new_cell)
+        self._place(element, new_cell)
+        self._cells[hero_id] = new_cell
+
+    def refresh_member(self, hero: Hero) -> None:
+        """
+        Re-read a member's power after it changed.
+
+        Args:
+            hero: The member hero
+        """
+        power = hero.get_total_power()
+        self._base_power += power - self._powers[hero.id]
+        self._powers[hero.id] = power
+
+    def set_formation(self, formation) -> None:
+        """
+        Set the formation whose requirements are tracked.
+
+        Args:
+            formation: Formation, or None to clear
+        """
+        self.formation = formation
+        self._required = frozenset(formation.required_heroes) if formation else frozenset()
+        self._missing_heroes = sum(
+            1 for template_id in self._required if not self._template_counts[template_id]
+        )
+
+    # Queries
+
+    @property
+    def member_count(self) -> int:
+        """Number of members"""
+        return len(self._cells)
+
+    @property
+    def synergy_pairs(self) -> int:
+        """Adjacent same-element pairs"""
+        return self._synergy_pairs
+
+    @property
+    def synergy_bonus(self) -> int:
+        """Power bonus from adjacent same-element pairs"""
+        return self._synergy_pairs * SYNERGY_PAIR_BONUS
+
+    @property
+    def base_power(self) -> int:
+        """Sum of member power"""
+        return self._base_power
+
+    def is_occupied(self, position: GridPosition) -> bool:
+        """Check if a position holds a member"""
+        return bool(self._occupied >> cell_index(position) & 1)
+
+    def contains(self, hero_id: str) -> bool:
+        """Check if a hero is a member"""
+        return hero_id in self._cells
+
+    def get_element_distribution(self) -> Dict[Element, int]:
+        """Members per element"""
+        return dict(self._element_counts)
+
+    def is_formation_active(self) -> bool:
+        """Check the formation's member, element and hero requirements"""
+        return self._formation_met(
+            self.member_count, len(self._element_counts), self._missing_heroes
+        )
+
+    def get_total_power(self, include_formation: bool = True) -> int:
+        """
+        Total team power.
+
+        Args:
+            include_formation: Whether to include formation bonuses
+
+        Returns:
+            Member power (with formation bonus if active) plus synergy bonus
+        """
+        power = self._base_power
+        if include_formation and self.is_formation_active():
+            power = int(power * (1 + self.formation.get_bonus_value("all") / 100))
+        return power + self.synergy_bonus
+
+    def power_with(self, hero: Hero, position: GridPosition, power: Optional[int] = None) -> int:
+        """
+        Total power if a hero were added at a position, without adding it.
+
+        Args:
+            hero: Candidate hero (not yet a member)
+            position: Free grid position
+            power: Hero power if already known
+
+        Returns:
+            Total team power including the candidate
+        """
+        if power is None:
+            power = hero.get_total_power()
+        cell = cell_index(position)
+        pairs = self._synergy_pairs + bin(ADJACENCY_MASKS[cell] & self._boards.get(hero.element, 0)).count("1")
+
+        element_count = len(self._element_counts) + (hero.element not in self._element_counts)
+        missing = self._missing_heroes
+        if not self._template_counts[hero.template_id] and self._is_required(hero.template_id):
+            missing -= 1
+
+        total = self._base_power + power
+        if self._formation_met(self.member_count + 1, element_count, missing):
+            total = int(total * (1 + self.formation.get_bonus_value("all") / 100))
+        return total + pairs * SYNERGY_PAIR_BONUS
+
+    def free_positions(self) -> List[GridPosition]:
+        """Positions with no member"""
+        return [
+            position for position in GridPosition.ALL_POSITIONS
+            if not self._occupied >> cell_index(position) & 1
+        ]
+
+    def free_cells(self) -> List[int]:
+        """Cell indices with no member"""
+        return [cell for cell in range(GRID_CELLS) if not self._occupied >> cell & 1]
+
+    # Internals
+
+    def _place(self, element: Element, cell: int) -> None:
+        board = self._boards.get(element, 0)
+        self._synergy_pairs += bin(ADJACENCY_MASKS[cell] & board).count("1")
+        self._boards[element] = board | (1 << cell)
+
+    def _unplace(self, element: Element, cell: int) -> None:
+        board = self._boards[element] & ~(1 << cell)
+        self._synergy_pairs -= bin(ADJACENCY_MASKS[cell] & board).count("1")
+        self._boards[element] = board
+
+    def _is_required(self, template_id: str) -> bool:
+        return template_id in self._required
+
+    def _formation_met(self, members: int, elements: int, missing_heroes: int) -> bool:
+        formation = self.formation
+        if formation is None:
+            return False
+        return (
+            members >= formation.min_members
+            and elements >= formation.required_elements
+            and missing_heroes <= 0
+        )
@@ -0,0 +1,418 @@
+"""
+Static Data Registry - In-memory game data that rarely changes
+
+Holds definitions that every request needs but that only change with a
+data deploy, loaded once per worker so lookups never hit the database:
+
+- equipment sets: the built-in DEFAULT_EQUIPMENT_SETS
+- equipment templates: EquipmentTemplate rows, read from the DB at
+  startup (the equipment_templates warm-up step)
+- story chapters: the story service's chapter data
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+# EquipmentSet columns holding the bonus for each piece count
+SET_PIECE_FIELDS = {
+    2: "two_piece_bonus",
+    3: "three_piece_bonus",
+    4: "four_piece_bonus"
+}
+
+# Largest set bonus threshold (one piece per equipment slot)
+MAX_SET_PIECES = 4
+
+
+def _read(row: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dict or an ORM row."""
+    if isinstance(row, Mapping):
+        return row.get(name, default)
+    return getattr(row, name, default)
+
+
+@dataclass
+class EquipmentSetDefinition:
+    """
+    An equipment set and its piece bonuses.
+
+    Attributes:
+        id: Set identifier
+        name: Display name
+        description: Set description
+        piece_bonuses: Raw bonus per piece count ({2: {"atk": 15}, ...});
+            non-stat keys such as "unique_effect" are kept for display
+        pieces: Equipment template IDs belonging to the set
+    """
+
+    id: str
+    name: str
+    description: str = ""
+    piece_bonuses: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    pieces: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Precompute the cumulative stat bonus for each piece count"""
+        cumulative = [HexagonStats.zero()]
+        for count in range(1, MAX_SET_PIECES + 1):
+            bonus = HexagonStats.from_mapping(self.piece_bonuses.get(count))
+            cumulative.append(cumulative[-1].add(bonus))
+        self._cumulative: Tuple[HexagonStats, ...] = tuple(cumulative)
+
+    @property
+    def thresholds(self) -> List[int]:
+        """Piece counts that grant a bonus, ascending"""
+        return sorted(self.piece_bonuses)
+
+    def get_bonus(self, count: int) -> HexagonStats:
+        """
+        Get the total stat bonus for a number of equipped pieces.
+
+        Args:
+            count: Pieces of this set equipped
+
+        Returns:
+            Sum of every reached threshold's stat bonus
+        """
+        return self._cumulative[max(0, min(count, MAX_SET_PIECES))]
+
+    @classmethod
+    def from_row(cls, row: Any) -> "EquipmentSetDefinition":
+        """
+        Build a definition from an EquipmentSet row or dict.
+
+        Args:
+            row: Object or dict with id, name and *_piece_bonus fields
+
+        Returns:
+            EquipmentSetDefinition
+        """
+        piece_bonuses = {}
+        for count, field_name in SET_PIECE_FIELDS.items():
+            bonus = _read(row, field_name)
+            if bonus:
+                piece_bonuses[count] = dict(bonus)
+
+        return cls(
+            id=str(_read(row, "id")),
+            name=_read(row, "name", ""),
+            description=_read(row, "description") or "",
+            piece_bonuses=piece_bonuses,
+            pieces=tuple(_read(row, "pieces") or ())
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the API/EquipmentSet row format"""
+        data = {"id": self.id, "name": self.name, "description": self.description}
+        for count, field_name in SET_PIECE_FIELDS.items():
+            data[field_name] = self.piece_bonuses.get(count)
+        data["pieces"] = list(self.pieces)
+        return data
+
+
+@dataclass
+class EquipmentTemplateDefinition:
+    """
+    Static data for an equipment template.
+
+    Attributes:
+        id: Template identifier
+        name: Display name
+        equipment_type: Slot type (weapon, armor, accessory, relic)
+        rarity: Base rarity (1-6)
+        set_id: Set the template belongs to, if any
+        base_stats: Base stats of a level 1 piece
+        required_level: Minimum hero level to equip
+    """
+
+    id: str
+    name: str
+    equipment_type: str
+    rarity: int = 1
+    set_id: Optional[str] = None
+    base_stats: HexagonStats = field(default_factory=HexagonStats.zero)
+    required_level: int = 1
+
+    @classmethod
+    def from_row(cls, row: Any) -> "EquipmentTemplateDefinition":
+        """
+        Build a definition from an EquipmentTemplate row or dict.
+
+        Args:
+            row: Object or dict with the EquipmentTemplate columns
+
+        Returns:
+            EquipmentTemplateDefinition
+        """
+        return cls(
+            id=str(_read(row, "id")),
+            name=_read(row, "name", ""),
+            equipment_type=str(_read(row, "equipment_type", "")).lower(),
+            rarity=_read(row, "base_rarity") or _read(row, "rarity") or 1,
+            set_id=_read(row, "set_id"),
+            base_stats=HexagonStats(
+                hp=_read(row, "base_hp") or 0,
+                atk=_read(row, "base_atk") or 0,
+                def_=_read(row, "base_def") or 0,
+                spd=_read(row, "base_spd") or 0,
+                crit=_read(row, "base_crit") or 0,
+                dex=_read(row, "base_dex") or 0
+            ),
+            required_level=_read(row, "required_level") or 1
+        )
+
+
+@dataclass
+class StoryLayout:
+    """
+    Global stage ordinals for compact story progress.
+
+    Every stage gets an ordinal, an index into per-player progress
+    bitsets. Ordinals follow chapter and stage order unless a stage
+    definition pins one with an "ordinal" key; pin ordinals before
+    inserting stages in the middle of existing content, or saved
+    progress would shift onto the wrong stages.
+
+    Attributes:
+        chapter_ids: Chapter IDs in chapter order
+        chapter_sizes: Stage count per chapter
+        chapter_indexes: Chapter ID -> chapter index
+        stage_ordinals: Stage ID -> ordinal
+        stage_chapters: Ordinal -> chapter index (-1 for unused ordinals)
+        previous_stages: Ordinal -> ordinal of the stage before it in its
+            chapter (-1 for a chapter's first stage)
+    """
+
+    chapter_ids: List[str] = field(default_factory=list)
+    chapter_sizes: List[int] = field(default_factory=list)
+    chapter_indexes: Dict[str, int] = field(default_factory=dict)
+    stage_ordinals: Dict[str, int] = field(default_factory=dict)
+    stage_chapters: List[int] = field(default_factory=list)
+    previous_stages: List[int] = field(default_factory=list)
+
+    @property
+    def stage_count(self) -> int:
+        """Number of ordinals (including unused ones)"""
+        return len(self.stage_chapters)
+
+    @property
+    def total_stages(self) -> int:
+        """Number of stages"""
+        return len(self.stage_ordinals)
+
+    def get_chapter_index(self, chapter_id: str) -> int:
+        """Index of a chapter, or -1 if unknown"""
+        return self.chapter_indexes.get(chapter_id, -1)
+
+    @classmethod
+    def from_chapters(cls, chapters: Iterable[Any]) -> "StoryLayout":
+        """
+        Build the layout from chapter definitions.
+
+        Args:
+            chapters: Chapter rows or dicts with their stages, in chapter order
+
+        Returns:
+            StoryLayout
+        """
+        layout = cls()
+        placed: List[Tuple[int, int, int]] = []  # (ordinal, chapter index, previous)
+        next_ordinal = 0
+        for chapter_index, chapter in enumerate(chapters):
+            layout.chapter_ids.append(str(_read(chapter, "id")))
+            layout.chapter_indexes[layout.chapter_ids[-1]] = chapter_index
+            stages = sorted(_read(chapter, "stages") or [], key=lambda s: _read(s, "stage_number", 0))
+            layout.chapter_sizes.append(len(stages))
+
+            previous = -1
+            for stage in stages:
+                ordinal = _read(stage, "ordinal")
+                if ordinal is None:
+                    ordinal = next_ordinal
+                next_ordinal = max(next_ordinal, ordinal + 1)
+                layout.stage_ordinals[str(_read(stage, "id"))] = ordinal
+                placed.append((ordinal, chapter_index, previous))
+                previous = ordinal
+
+        layout.stage_chapters = [-1] * next_ordinal
+        layout.previous_stages = [-1] * next_ordinal
+        for ordinal, chapter_index, previous in placed:
+            layout.stage_chapters[ordinal] = chapter_index
+            layout.previous_stages[ordinal] = previous
+        return layout
+
+
+# Built-in equipment sets
+DEFAULT_EQUIPMENT_SETS: List[Dict[str, Any]] = [
+    {
+        "id": "thanh_long",
+        "name": "Thanh Long Yểm Nguyệt",
+        "description": "Set trang bị của Quan Vũ",
+        "two_piece_bonus": {"atk": 15, "crit": 10},
+        "three_piece_bonus": {"unique_effect": "Giảm 20% sát thương"},
+        "four_piece_bonus": None,
+        "pieces": ["thanh_long_dao", "thanh_long_giap", "thanh_long_phu"]
+    },
+    {
+        "id": "bat_quai",
+        "name": "Bát Quái Trận Đồ",
+        "description": "Set trang bị của Gia Cát Lượng",
+        "two_piece_bonus": {"dex": 10, "spd": 5},
+        "three_piece_bonus": None,
+        "four_piece_bonus": {"spd": 15, "dex": 20},
+        "pieces": ["bat_quai_phien", "bat_quai_bao", "bat_quai_ngoc", "bat_quai_do"]
+    },
+    {
+        "id": "ho_giap",
+        "name": "Hổ Giáp Tướng Quân",
+        "description": "Set phòng thủ của Ngũ Hổ Tướng",
+        "two_piece_bonus": {"def": 20},
+        "three_piece_bonus": None,
+        "four_piece_bonus": {"hp": 300, "def": 30},
+        "pieces": ["ho_giap_thuong", "ho_giap_giap", "ho_giap_hoan", "ho_giap_an"]
+    }
+]
+
+
+class StaticDataRegistry:
+    """
+    Per-worker registry of static game data.
+
+    The version counter increases on every equipment set or template
+    reload so that caches built from the registry can tell when they
+    are stale. Story chapters count reloads in story_version instead;
+    no stat or set cache depends on them.
+    """
+
+    def __init__(self, equipment_sets: Iterable[Any] = ()):
+        """
+        Initialize the registry.
+
+        Args:
+            equipment_sets: Initial EquipmentSet rows or dicts
+        """
+        self.version = 0
+        self.story_version = 0
+        self._equipment_sets: Dict[str, EquipmentSetDefinition] = {}
+        self._template_sets: Dict[str, str] = {}
+        self._equipment_templates: Dict[str, EquipmentTemplateDefinition] = {}
+        self._story_layout: Optional[StoryLayout] = None
+        self.load_equipment_sets(equipment_sets)
+
+    def load_equipment_sets(self, equipment_sets: Iterable[Any]) -> None:
+        """
+        Replace the equipment set definitions.
+
+        Args:
+            equipment_sets: EquipmentSet rows or dicts
+        """
+        definitions = {}
+        for row in equipment_sets:
+            definition = EquipmentSetDefinition.from_row(row)
+            definitions[definition.id] = definition
+
+        template_sets = {
+            piece: definition.id
+            for definition in definitions.values()
+            for piece in definition.pieces
+        }
+        for template in self._equipment_templates.values():
+            if template.set_id:
+                template_sets[template.id] = template.set_id
+
+        self._equipment_sets = definitions
+        self._template_sets = template_sets
+        self.version += 1
+
+    def get_equipment_set(self, set_id: Optional[str]) -> Optional[EquipmentSetDefinition]:
+        """
+        Get an equipment set definition.
+
+        Args:
+            set_id: Set identifier
+
+        Returns:
+            The definition, or None if unknown
+        """
+        if set_id is None:
+            return None
+        return self._equipment_sets.get(set_id)
+
+    def get_equipment_sets(self) -> List[EquipmentSetDefinition]:
+        """Get all equipment set definitions"""
+        return list(self._equipment_sets.values())
+
+    def load_equipment_templates(self, templates: Iterable[Any]) -> None:
+        """
+        Replace the equipment template definitions.
+
+        Args:
+            templates: EquipmentTemplate rows or dicts
+        """
+        definitions = {}
+        for row in templates:
+            definition = EquipmentTemplateDefinition.from_row(row)
+            definitions[definition.id] = definition
+
+        self._equipment_templates = definitions
+        self._template_sets.update(
+            (definition.id, definition.set_id)
+            for definition in definitions.values()
+            if definition.set_id
+        )
+        self.version += 1
+
+    def get_equipment_templates(self) -> List[EquipmentTemplateDefinition]:
+        """Get all equipment template definitions"""
+        return list(self._equipment_templates.values())
+
+    def get_equipment_template(
+        self,
+        template_id: Optional[str]
+    ) -> Optional[EquipmentTemplateDefinition]:
+        """
+        Get an equipment template definition.
+
+        Args:
+            template_id: Template identifier
+
+        Returns:
+            The definition, or None if unknown
+        """
+        if template_id is None:
+            return None
+        return self._equipment_templates.get(template_id)
+
+    def load_story_chapters(self, chapters: Iterable[Any]) -> None:
+        """
+        Replace the story layout.
+
+        Args:
+            chapters: Chapter rows or dicts with their stages
+        """
+        self._story_layout = StoryLayout.from_chapters(chapters)
+        self.story_version += 1
+
+    def get_story_layout(self) -> Optional[StoryLayout]:
+        """Get the story layout, or None if no chapters were loaded"""
+        return self._story_layout
+
+    def get_set_id_for_template(self, template_id: Optional[str]) -> Optional[str]:
+        """
+        Get the set an equipment template belongs to.
+
+        Args:
+            template_id: Equipment template ID
+
+        Returns:
+            Set ID, or None if the template is not part of a set
+        """
+        if template_id is None:
+            return None
+        return self._template_sets.get(template_id)
+
+
+# Shared registry for this worker
+static_data = StaticDataRegistry(DEFAULT_EQUIPMENT_SETS)
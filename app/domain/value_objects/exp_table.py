@@ -0,0 +1,69 @@
+"""
+ExpTable Value Object - Cumulative EXP curve for closed-form level-ups
+"""
+from bisect import bisect_right
+from typing import Callable, List, Tuple
+
+
+class ExpTable:
+    """
+    Cumulative EXP table built from a per-level requirement.
+
+    Stores prefix sums so that cumulative[L] is the total EXP needed to
+    go from level 1 to level L. Applying any amount of EXP is then a
+    single bisect (O(log L)) instead of a loop over every level gained.
+    The table grows on demand, so curves without a level cap work too.
+    """
+
+    def __init__(self, required_exp: Callable[[int], int], initial_levels: int = 100):
+        """
+        Initialize the table.
+
+        Args:
+            required_exp: EXP needed to go from a level to the next one
+                (must be positive for every level)
+            initial_levels: Number of levels to precompute
+        """
+        self.required_exp = required_exp
+        # Index 0 is a sentinel so that index == level
+        self._cumulative: List[int] = [0, 0]
+        self._extend_to(initial_levels)
+
+    def _extend_to(self, level: int) -> None:
+        """Precompute prefix sums up to a level."""
+        cumulative = self._cumulative
+        while len(cumulative) <= level:
+            previous = len(cumulative) - 1
+            cumulative.append(cumulative[-1] + self.required_exp(previous))
+
+    def total_exp_for_level(self, level: int) -> int:
+        """
+        Get the total EXP needed to reach a level from level 1.
+
+        Args:
+            level: Target level
+
+        Returns:
+            Cumulative EXP
+        """
+        self._extend_to(level)
+        return self._cumulative[level]
+
+    def apply(self, level: int, exp: int, amount: int) -> Tuple[int, int]:
+        """
+        Apply EXP to a level/exp pair.
+
+        Args:
+            level: Current level
+            exp: EXP already progressed into the current level
+            amount: EXP to add
+
+        Returns:
+            Tuple of (new_level, exp_into_new_level)
+        """
+        total = self.total_exp_for_level(level) + exp + amount
+        while self._cumulative[-1] <= total:
+            self._extend_to(2 * len(self._cumulative))
+
+        new_level = bisect_right(self._cumulative, total) - 1
+        return new_level, total - self._cumulative[new_level]
@@ -3,7 +3,33 @@ HexagonStats Value Object
 Represents the six-dimensional stats (Lục Giác) for characters.
 """
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Optional
+
+
+# Field names, in order
+STAT_FIELDS = ("hp", "atk", "def_", "spd", "crit", "dex")
+
+# Weight of each stat in a power rating (heroes, equipment, leaderboards)
+POWER_WEIGHTS = {"hp": 1, "atk": 5, "def_": 3, "spd": 2, "crit": 10, "dex": 2}
+
+
+def normalize_stat_key(key: str) -> Optional[str]:
+    """
+    Map a stat key from any data source to a HexagonStats field name.
+    
+    Accepts game data keys ("ATK", "DEF") as well as field names
+    ("atk", "def_").
+    
+    Args:
+        key: Raw stat key
+        
+    Returns:
+        Field name, or None if the key is not a hexagon stat
+    """
+    name = key.lower()
+    if name == "def":
+        name = "def_"
+    return name if name in STAT_FIELDS else None
 
 
 @dataclass(frozen=True)
@@ -56,6 +82,27 @@ class HexagonStats:
             dex=data.get("DEX", defaults.dex)
         )
     
+    @classmethod
+    def zero(cls) -> "HexagonStats":
+        """Create stats with every value at zero (an empty delta)"""
+        return cls(hp=0, atk=0, def_=0, spd=0, crit=0, dex=0)
+    
+    @classmethod
+    def from_mapping(cls, data: Optional[Mapping[str, Any]]) -> "HexagonStats":
+        """
+        Create a stat delta from a loose mapping.
+        
+        Accepts any key style (see normalize_stat_key). Missing stats are
+        zero; non-stat keys (e.g. "unique_effect") and non-numeric values
+        are ignored.
+        """
+        values = dict.fromkeys(STAT_FIELDS, 0)
+        for key, value in (data or {}).items():
+            name = normalize_stat_key(key)
+            if name is not None and isinstance(value, (int, float)):
+                values[name] += int(value)
+        return cls(**values)
+    
     def get_total_power(self) -> int:
         """Calculate the sum of all stats (total power)"""
         return self.hp + self.atk + self.def_ + self.spd + self.crit + self.dex
@@ -79,6 +126,25 @@ class HexagonStats:
             dex=self.dex + other.dex
         )
     
+    def subtract(self, other: "HexagonStats") -> "HexagonStats":
+        """
+        Subtract another stats from this one, returning a new HexagonStats instance.
+        
+        Args:
+            other: Stats to subtract
+            
+        Returns:
+            New HexagonStats with the difference
+        """
+        return HexagonStats(
+            hp=self.hp - other.hp,
+            atk=self.atk - other.atk,
+            def_=self.def_ - other.def_,
+            spd=self.spd - other.spd,
+            crit=self.crit - other.crit,
+            dex=self.dex - other.dex
+        )
+    
     def multiply(self, factor: float) -> "HexagonStats":
         """
         Multiply all stats by a factor, returning a new HexagonStats instance.
@@ -1,11 +1,21 @@
 """
 FastAPI Main Application
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.config.settings import get_settings
+from app.api.lifespan import lifespan, readiness_report
+from app.api.deps import get_profile_store
+from app.api.metrics import MetricsMiddleware, instrument_routes
+from app.api.profiling import ProfilingMiddleware
+from app.api.query_budget import QueryBudgetMiddleware
 from app.api.v1.router import api_router
+from app.core.exceptions import BaseAppException
+from app.utils.metrics import metrics, render_prometheus
+from app.utils.profiling import sampler
+from app.utils.query_budget import query_tracker
 
 settings = get_settings()
 
@@ -15,7 +25,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Backend API for Ngọa Long Tam Quốc - Turn-based Strategy RPG",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -27,10 +38,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Query budgets and N+1 detection (development/test)
+if settings.QUERY_TRACKING_ENABLED:
+    query_tracker.default_budget = settings.QUERY_BUDGET_DEFAULT
+    query_tracker.repeat_threshold = settings.QUERY_REPEAT_THRESHOLD
+    query_tracker.strict = settings.QUERY_BUDGET_STRICT
+    app.add_middleware(QueryBudgetMiddleware)
+
+# Opt-in stack profiles of sampled and slow requests
+if settings.PROFILING_ENABLED:
+    sampler.interval = settings.PROFILING_INTERVAL_MS / 1000
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=get_profile_store(),
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        slow_seconds=settings.PROFILING_SLOW_MS / 1000
+    )
+
+# Request metrics (outermost, so it times everything below)
+if settings.METRICS_ENABLED:
+    app.add_middleware(
+        MetricsMiddleware,
+        allow_breakdown=settings.METRICS_TIMING_BREAKDOWN
+    )
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.exception_handler(BaseAppException)
+async def app_exception_handler(request: Request, exc: BaseAppException):
+    """Render application exceptions in the standard error response format"""
+    headers = None
+    if "retry_after" in exc.details:
+        headers = {"Retry-After": str(exc.details["retry_after"])}
+    
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"success": False, "error": exc.to_dict()},
+        headers=headers
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -43,5 +92,29 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness: the process is up (does not wait for warm-up)"""
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def readiness_check(request: Request):
+    """Readiness: warm-up finished; 503 while starting or if a step failed"""
+    report = readiness_report(getattr(request.app.state, "warmup", None))
+    return JSONResponse(
+        status_code=200 if report["status"] == "ready" else 503,
+        content=report
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Request metrics in the Prometheus text format"""
+    return PlainTextResponse(
+        render_prometheus(metrics),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+# Time endpoint bodies for the db/service/serialization breakdown
+if settings.METRICS_ENABLED:
+    instrument_routes(app)
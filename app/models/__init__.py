@@ -4,11 +4,13 @@ from app.models.hero import HeroTemplate, Hero, HeroSkill
 from app.models.equipment import EquipmentTemplate, Equipment, EquipmentSet
 from app.models.skill import SkillTemplate
 from app.models.story import Chapter, Stage, Boss
+from app.models.team import Team
 
 __all__ = [
     "Player",
     "HeroTemplate", "Hero", "HeroSkill",
     "EquipmentTemplate", "Equipment", "EquipmentSet",
     "SkillTemplate",
-    "Chapter", "Stage", "Boss"
+    "Chapter", "Stage", "Boss",
+    "Team"
 ]
@@ -3,7 +3,7 @@ Player SQLAlchemy Model
 """
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -40,6 +40,9 @@ class Player(Base):
     # VIP
     vip_level = Column(Integer, default=0)
     
+    # Story progress (cleared bitset + 2-bit stars, see StoryProgress)
+    story_progress = Column(LargeBinary)
+    
     # Status
     is_active = Column(Boolean, default=True)
     
@@ -51,6 +54,7 @@ class Player(Base):
     # Relationships
     heroes = relationship("Hero", back_populates="player", cascade="all, delete-orphan")
     equipment = relationship("Equipment", back_populates="player", cascade="all, delete-orphan")
+    teams = relationship("Team", back_populates="player", cascade="all, delete-orphan")
     
     def __repr__(self) -> str:
         return f"<Player {self.username}>"
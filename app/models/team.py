@@ -0,0 +1,44 @@
+"""
+Team SQLAlchemy Model
+"""
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+
+from app.config.database import Base
+
+
+class Team(Base):
+    """Player's team model"""
+
+    __tablename__ = "teams"
+    __table_args__ = (
+        UniqueConstraint("player_id", "slot_number", name="unique_player_slot"),
+    )
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Foreign keys
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id", ondelete="CASCADE"), nullable=False)
+
+    # Basic info
+    name = Column(String(100), nullable=False)
+    slot_number = Column(Integer, nullable=False)  # 1-10
+    formation_id = Column(String(50))
+    is_default = Column(Boolean, default=False)
+
+    # Members as a compact array (JSONB)
+    members = Column(JSONB, default=list)  # [[hero_id, x, y], ...]
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    player = relationship("Player", back_populates="teams")
+
+    def __repr__(self) -> str:
+        return f"<Team {self.name} (Player: {self.player_id}, Slot: {self.slot_number})>"
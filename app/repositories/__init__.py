@@ -1,13 +1,31 @@
 # Repositories
-from app.repositories.base import BaseRepository
-from app.repositories.player_repository import PlayerRepository
-from app.repositories.hero_repository import HeroRepository, HeroTemplateRepository
-from app.repositories.equipment_repository import (
-    EquipmentRepository,
-    EquipmentTemplateRepository,
-    EquipmentSetRepository
-)
-from app.repositories.battle_repository import BattleRepository
+from app.utils.lazy import lazy_exports
+
+# Submodules load on first use, so the in-memory repositories can be
+# imported without SQLAlchemy and the database engine
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "base": ["BaseRepository"],
+    "player_repository": ["PlayerRepository"],
+    "hero_repository": [
+        "HeroRepository",
+        "HeroTemplateRepository"
+    ],
+    "equipment_repository": [
+        "EquipmentRepository",
+        "EquipmentTemplateRepository",
+        "EquipmentSetRepository"
+    ],
+    "battle_repository": [
+        "BattleRepository",
+        "RedisBattleRepository"
+    ],
+    "team_repository": ["TeamRepository"],
+    "memory_team_repository": ["InMemoryTeamRepository"],
+    "leaderboard_repository": [
+        "InMemoryLeaderboardRepository",
+        "RedisLeaderboardRepository"
+    ]
+})
 
 __all__ = [
     "BaseRepository",
@@ -17,5 +35,10 @@ __all__ = [
     "EquipmentRepository",
     "EquipmentTemplateRepository",
     "EquipmentSetRepository",
-    "BattleRepository"
+    "BattleRepository",
+    "RedisBattleRepository",
+    "TeamRepository",
+    "InMemoryTeamRepository",
+    "InMemoryLeaderboardRepository",
+    "RedisLeaderboardRepository"
 ]
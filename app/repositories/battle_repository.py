@@ -1,24 +1,30 @@
 """
-Battle Repository - Data access for battle state (Redis-based)
+Battle Repository - Data access for battle state
+
+Active battle checkpoints, replay logs and battle history.
+RedisBattleRepository keeps them in Redis so every worker sees the same
+battles; BattleRepository keeps them in process for development and
+tests.
 """
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 import json
 from datetime import datetime
 
-# Note: This is a simplified in-memory implementation.
-# In production, this would use Redis for real-time battle state management.
+
+# Redis key prefix for battle state
+BATTLE_KEY_PREFIX = "battle:"
+
+# Battles kept in a player's history
+BATTLE_HISTORY_LIMIT = 100
 
 
 class BattleRepository:
     """
     Repository for battle state management.
     
-    Uses in-memory storage for development.
-    In production, this would use Redis for:
-    - Real-time battle state
-    - Session management
-    - Leaderboards
+    Uses in-memory storage for development and tests; see
+    RedisBattleRepository for the shared store.
     """
     
     def __init__(self):
@@ -26,6 +32,7 @@ class BattleRepository:
         # In-memory storage (would be Redis in production)
         self._active_battles: Dict[str, Dict[str, Any]] = {}
         self._battle_history: Dict[str, List[Dict[str, Any]]] = {}  # player_id -> battles
+        self._battle_logs: Dict[str, List[Dict[str, Any]]] = {}  # battle_id -> replay log
     
     async def save_active_battle(
         self,
@@ -59,6 +66,21 @@ class BattleRepository:
         """
         return self._active_battles.get(battle_id)
     
+    async def get_battle_claim(self, battle_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the worker owning an active battle and its checkpoint sequence.
+        
+        Args:
+            battle_id: The battle ID
+            
+        Returns:
+            Dictionary with worker_id and seq, or None if not found
+        """
+        record = self._active_battles.get(battle_id)
+        if record is None:
+            return None
+        return {"worker_id": record.get("worker_id"), "seq": record.get("seq", 0)}
+    
     async def delete_active_battle(self, battle_id: str) -> bool:
         """
         Delete an active battle (when it ends).
@@ -69,11 +91,49 @@ class BattleRepository:
         Returns:
             True if deleted, False if not found
         """
+        self._battle_logs.pop(battle_id, None)
         if battle_id in self._active_battles:
             del self._active_battles[battle_id]
             return True
         return False
     
+    async def append_battle_log(
+        self,
+        battle_id: str,
+        entry: Dict[str, Any]
+    ) -> None:
+        """
+        Append an entry to a battle's replay log.
+        
+        The log is stored separately from the checkpoint so appends
+        stay cheap (RPUSH in Redis).
+        
+        Args:
+            battle_id: The battle ID
+            entry: The replay log entry
+        """
+        self._battle_logs.setdefault(battle_id, []).append(entry)
+    
+    async def get_battle_log(
+        self,
+        battle_id: str,
+        after_seq: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get replay log entries recorded after a sequence number.
+        
+        Args:
+            battle_id: The battle ID
+            after_seq: Only return entries with a greater sequence number
+            
+        Returns:
+            List of log entries in order
+        """
+        return [
+            entry for entry in self._battle_logs.get(battle_id, [])
+            if entry["seq"] > after_seq
+        ]
+    
     async def get_player_active_battle(
         self,
         player_id: str
@@ -112,9 +172,9 @@ class BattleRepository:
             "completed_at": datetime.utcnow().isoformat()
         })
         
-        # Keep only last 100 battles per player
-        if len(self._battle_history[player_id]) > 100:
-            self._battle_history[player_id] = self._battle_history[player_id][-100:]
+        # Keep only the last battles per player
+        if len(self._battle_history[player_id]) > BATTLE_HISTORY_LIMIT:
+            self._battle_history[player_id] = self._battle_history[player_id][-BATTLE_HISTORY_LIMIT:]
     
     async def get_battle_history(
         self,
@@ -189,6 +249,7 @@ class BattleRepository:
         ]
         for battle_id in battles_to_remove:
             del self._active_battles[battle_id]
+            self._battle_logs.pop(battle_id, None)
         
         # Clear history
         if player_id in self._battle_history:
@@ -223,3 +284,184 @@ class BattleRepository:
         self._active_battles[battle_id]["updated_at"] = datetime.utcnow().isoformat()
         
         return True
+
+
+class RedisBattleRepository:
+    """
+    Battle state stored in Redis, shared by every worker.
+    
+    Keys (under BATTLE_KEY_PREFIX):
+    - active:{battle_id}: hash with the owning worker_id, the checkpoint
+      seq and the JSON record, so the claim can be read without the
+      checkpoint
+    - log:{battle_id}: list of JSON replay log entries (RPUSH)
+    - player:{player_id}: set of the player's active battle IDs
+    - history:{player_id}: list of JSON results, newest first
+    """
+    
+    def __init__(self, client=None, url: Optional[str] = None):
+        """
+        Initialize the Redis battle store.
+        
+        Args:
+            client: Optional redis.asyncio client
+            url: Redis URL used when no client is given
+            
+        Raises:
+            RuntimeError: If no client is given and redis is not installed
+        """
+        if client is None:
+            # Imported here so the in-memory backend never loads redis
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError:  # pragma: no cover - optional dependency
+                raise RuntimeError("The redis package is required for the Redis battle store")
+            client = redis_asyncio.from_url(url, decode_responses=True)
+        self.client = client
+    
+    async def save_active_battle(
+        self,
+        battle_id: str,
+        battle_state: Dict[str, Any]
+    ) -> None:
+        """Save an active battle state."""
+        record = {**battle_state, "updated_at": datetime.utcnow().isoformat()}
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key("active", battle_id), mapping={
+                "worker_id": record.get("worker_id") or "",
+                "seq": record.get("seq", 0),
+                "record": json.dumps(record)
+            })
+            if record.get("player_id"):
+                pipe.sadd(self._key("player", record["player_id"]), battle_id)
+            await pipe.execute()
+    
+    async def get_active_battle(
+        self,
+        battle_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get an active battle state, or None if not found."""
+        data = await self.client.hget(self._key("active", battle_id), "record")
+        return json.loads(data) if data else None
+    
+    async def get_battle_claim(self, battle_id: str) -> Optional[Dict[str, Any]]:
+        """Get the worker owning an active battle and its checkpoint sequence."""
+        worker_id, seq = await self.client.hmget(self._key("active", battle_id), ["worker_id", "seq"])
+        if seq is None:
+            return None
+        return {"worker_id": worker_id or None, "seq": int(seq)}
+    
+    async def delete_active_battle(self, battle_id: str) -> bool:
+        """Delete an active battle and its replay log."""
+        record = await self.get_active_battle(battle_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key("active", battle_id))
+            pipe.delete(self._key("log", battle_id))
+            if record and record.get("player_id"):
+                pipe.srem(self._key("player", record["player_id"]), battle_id)
+            deleted = (await pipe.execute())[0]
+        return bool(deleted)
+    
+    async def append_battle_log(
+        self,
+        battle_id: str,
+        entry: Dict[str, Any]
+    ) -> None:
+        """Append an entry to a battle's replay log."""
+        await self.client.rpush(self._key("log", battle_id), json.dumps(entry))
+    
+    async def get_battle_log(
+        self,
+        battle_id: str,
+        after_seq: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Get replay log entries recorded after a sequence number."""
+        # Entries are numbered from 1 in append order
+        rows = await self.client.lrange(self._key("log", battle_id), max(after_seq, 0), -1)
+        entries = [json.loads(row) for row in rows]
+        return [entry for entry in entries if entry["seq"] > after_seq]
+    
+    async def get_player_active_battle(
+        self,
+        player_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get a player's current active battle, or None."""
+        for battle_id in await self.client.smembers(self._key("player", player_id)):
+            battle_state = await self.get_active_battle(battle_id)
+            if battle_state is not None:
+                return battle_state
+        return None
+    
+    async def save_battle_result(
+        self,
+        player_id: str,
+        battle_result: Dict[str, Any]
+    ) -> None:
+        """Save a completed battle to history, keeping the last BATTLE_HISTORY_LIMIT."""
+        entry = {**battle_result, "completed_at": datetime.utcnow().isoformat()}
+        key = self._key("history", player_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.lpush(key, json.dumps(entry))
+            pipe.ltrim(key, 0, BATTLE_HISTORY_LIMIT - 1)
+            await pipe.execute()
+    
+    async def get_battle_history(
+        self,
+        player_id: str,
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Get player's battle history, newest first."""
+        if limit <= 0:
+            return []
+        rows = await self.client.lrange(self._key("history", player_id), skip, skip + limit - 1)
+        return [json.loads(row) for row in rows]
+    
+    async def count_battle_history(self, player_id: str) -> int:
+        """Count player's battle history."""
+        return await self.client.llen(self._key("history", player_id))
+    
+    async def get_battle_stats(
+        self,
+        player_id: str
+    ) -> Dict[str, int]:
+        """Get player's battle statistics over the kept history."""
+        history = await self.get_battle_history(player_id, limit=BATTLE_HISTORY_LIMIT)
+        wins = sum(1 for b in history if b.get("victory", False))
+        return {
+            "total_battles": len(history),
+            "wins": wins,
+            "losses": len(history) - wins,
+            "win_rate": wins / len(history) if history else 0
+        }
+    
+    async def clear_player_battles(self, player_id: str) -> None:
+        """Clear all battle data for a player."""
+        player_key = self._key("player", player_id)
+        battle_ids = await self.client.smembers(player_key)
+        async with self.client.pipeline(transaction=True) as pipe:
+            for battle_id in battle_ids:
+                pipe.delete(self._key("active", battle_id))
+                pipe.delete(self._key("log", battle_id))
+            pipe.delete(player_key)
+            pipe.delete(self._key("history", player_id))
+            await pipe.execute()
+    
+    async def update_battle_turn(
+        self,
+        battle_id: str,
+        turn_number: int,
+        action_log: Dict[str, Any]
+    ) -> bool:
+        """Update battle state with a new turn."""
+        battle_state = await self.get_active_battle(battle_id)
+        if battle_state is None:
+            return False
+        battle_state["turn_number"] = turn_number
+        battle_state.setdefault("action_log", []).append(action_log)
+        await self.save_active_battle(battle_id, battle_state)
+        return True
+    
+    @staticmethod
+    def _key(kind: str, key: str) -> str:
+        return f"{BATTLE_KEY_PREFIX}{kind}:{key}"
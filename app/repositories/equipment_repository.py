@@ -1,10 +1,10 @@
 """
 Equipment Repository - Data access for Equipment model
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.orm import selectinload
 
 from app.repositories.base import BaseRepository
@@ -102,6 +102,30 @@ class EquipmentRepository(BaseRepository[Equipment]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def get_many_for_player(
+        self,
+        equipment_ids: List[UUID],
+        player_id: UUID
+    ) -> List[Equipment]:
+        """
+        Get several equipment items belonging to a player in one query.
+        
+        Args:
+            equipment_ids: The equipment IDs
+            player_id: The player ID
+            
+        Returns:
+            Equipment found (missing or foreign IDs are skipped)
+        """
+        query = select(Equipment).where(
+            and_(
+                Equipment.id.in_(equipment_ids),
+                Equipment.player_id == player_id
+            )
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
     async def update_level(
         self,
         equipment_id: UUID,
@@ -136,6 +160,20 @@ class EquipmentRepository(BaseRepository[Equipment]):
         
         return await self.update(equipment_id, update_data)
     
+    async def bulk_update_levels(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Write level and bonus stats for many equipment items in a single statement.
+        
+        Args:
+            updates: One dict per item with "id", "level" and any bonus_*
+                columns to set
+        """
+        if not updates:
+            return
+        # ORM bulk UPDATE by primary key (executemany)
+        await self.db.execute(update(Equipment), updates)
+        await self.db.flush()
+    
     async def get_unequipped(
         self,
         player_id: UUID,
@@ -151,22 +189,10 @@ class EquipmentRepository(BaseRepository[Equipment]):
         Returns:
             List of unequipped equipment
         """
-        # Get equipment IDs that are equipped to heroes
-        from app.models.hero import Hero
-        
-        equipped_ids_query = select(Hero.weapon_id).where(Hero.player_id == player_id)
-        equipped_ids_query = equipped_ids_query.union_all(
-            select(Hero.armor_id).where(Hero.player_id == player_id)
-        ).union_all(
-            select(Hero.accessory_id).where(Hero.player_id == player_id)
-        ).union_all(
-            select(Hero.relic_id).where(Hero.player_id == player_id)
-        )
-        
         query = select(Equipment).where(
             and_(
                 Equipment.player_id == player_id,
-                ~Equipment.id.in_(equipped_ids_query)
+                ~Equipment.id.in_(self._equipped_ids_query(player_id))
             )
         )
         
@@ -178,6 +204,84 @@ class EquipmentRepository(BaseRepository[Equipment]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_with_equipped_flag(
+        self,
+        player_id: UUID,
+        equipment_ids: Optional[List[UUID]] = None
+    ) -> List[Tuple[Equipment, bool]]:
+        """
+        Get a player's equipment with whether a hero wears it, in one query.
+        
+        Args:
+            player_id: The player ID
+            equipment_ids: Optional IDs to restrict to (whole inventory if None)
+            
+        Returns:
+            (equipment, is_equipped) pairs
+        """
+        is_equipped = Equipment.id.in_(self._equipped_ids_query(player_id)).label("is_equipped")
+        query = select(Equipment, is_equipped).where(Equipment.player_id == player_id)
+        if equipment_ids is not None:
+            query = query.where(Equipment.id.in_(equipment_ids))
+        
+        result = await self.db.execute(query)
+        return [(equipment, bool(equipped)) for equipment, equipped in result.all()]
+    
+    async def replace_many(
+        self,
+        player_id: UUID,
+        created: List[Dict[str, Any]],
+        consumed_ids: List[UUID]
+    ) -> int:
+        """
+        Insert new equipment and delete consumed equipment in one transaction.
+        
+        Args:
+            player_id: The player ID (for ownership verification)
+            created: Column values for each new item (including "id")
+            consumed_ids: IDs of the items to delete
+            
+        Returns:
+            Number of deleted items
+        """
+        from sqlalchemy import delete as sql_delete, insert
+        
+        async with self.db.begin_nested():
+            if created:
+                await self.db.execute(
+                    insert(Equipment),
+                    [{**values, "player_id": player_id} for values in created]
+                )
+            result = await self.db.execute(
+                sql_delete(Equipment).where(
+                    and_(
+                        Equipment.id.in_(consumed_ids),
+                        Equipment.player_id == player_id
+                    )
+                )
+            )
+            if result.rowcount != len(consumed_ids):
+                raise ValueError("Consumed equipment changed during fusion")
+        await self.db.flush()
+        return result.rowcount
+    
+    def _equipped_ids_query(self, player_id: UUID):
+        """
+        Subquery of equipment IDs worn by the player's heroes.
+        
+        Empty slots are left out: a NULL in the list would make
+        NOT IN unknown for every row, so get_unequipped would return
+        nothing as soon as any hero had an empty slot.
+        """
+        from app.models.hero import Hero
+        
+        slots = (Hero.weapon_id, Hero.armor_id, Hero.accessory_id, Hero.relic_id)
+        branches = [
+            select(slot).where(and_(Hero.player_id == player_id, slot.isnot(None)))
+            for slot in slots
+        ]
+        return branches[0].union_all(*branches[1:])
+    
     async def delete_multiple(
         self,
         equipment_ids: List[UUID],
@@ -218,6 +322,17 @@ class EquipmentTemplateRepository(BaseRepository[EquipmentTemplate]):
         """
         super().__init__(EquipmentTemplate, db)
     
+    async def get_all(self) -> List[EquipmentTemplate]:
+        """
+        Get all equipment templates.
+        
+        Returns:
+            List of all equipment templates
+        """
+        query = select(EquipmentTemplate)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
     async def get_by_type(self, equipment_type: str) -> List[EquipmentTemplate]:
         """
         Get all equipment templates by type.
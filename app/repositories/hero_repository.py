@@ -1,14 +1,18 @@
 """
 Hero Repository - Data access for Hero model
 """
+from functools import reduce
+from operator import add
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_, update, func, union_all
 from sqlalchemy.orm import selectinload
 
 from app.repositories.base import BaseRepository
 from app.models.hero import Hero, HeroTemplate, HeroSkill
+from app.models.equipment import Equipment, EquipmentTemplate
+from app.domain.value_objects.hexagon_stats import POWER_WEIGHTS
 
 
 class HeroRepository(BaseRepository[Hero]):
@@ -131,6 +135,89 @@ class HeroRepository(BaseRepository[Hero]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def get_heroes_for_player(
+        self,
+        hero_ids: List[UUID],
+        player_id: UUID
+    ) -> List[Hero]:
+        """
+        Get several heroes belonging to a player in one query.
+        
+        Args:
+            hero_ids: The hero IDs
+            player_id: The player ID
+            
+        Returns:
+            Heroes found (missing or foreign IDs are skipped)
+        """
+        query = (
+            select(Hero)
+            .where(and_(Hero.id.in_(hero_ids), Hero.player_id == player_id))
+            .options(selectinload(Hero.template))
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def get_power_totals(self, player_id: Optional[UUID] = None) -> Dict[str, int]:
+        """
+        Sum each player's hero power in one aggregate query.
+        
+        A player's total is the power of every hero's stored stats plus
+        the base and bonus stats of the pieces those heroes wear, using
+        POWER_WEIGHTS. Set bonuses are not included.
+        
+        Args:
+            player_id: Only total this player (defaults to every player)
+            
+        Returns:
+            Total power per player ID (players without heroes are absent)
+        """
+        def power(columns):
+            return reduce(add, (columns(name) * weight for name, weight in POWER_WEIGHTS.items()))
+        
+        heroes = select(
+            Hero.player_id.label("player_id"),
+            power(lambda name: getattr(Hero, f"current_{name.rstrip('_')}")).label("power")
+        )
+        worn = (
+            select(
+                Hero.player_id.label("player_id"),
+                power(lambda name: (
+                    func.coalesce(getattr(Equipment, f"bonus_{name.rstrip('_')}"), 0) +
+                    func.coalesce(getattr(EquipmentTemplate, f"base_{name.rstrip('_')}"), 0)
+                )).label("power")
+            )
+            .join(Equipment, or_(
+                Hero.weapon_id == Equipment.id,
+                Hero.armor_id == Equipment.id,
+                Hero.accessory_id == Equipment.id,
+                Hero.relic_id == Equipment.id
+            ))
+            .join(EquipmentTemplate, Equipment.template_id == EquipmentTemplate.id)
+        )
+        if player_id is not None:
+            heroes = heroes.where(Hero.player_id == player_id)
+            worn = worn.where(Hero.player_id == player_id)
+        
+        rows = union_all(heroes, worn).subquery()
+        query = select(rows.c.player_id, func.sum(rows.c.power)).group_by(rows.c.player_id)
+        result = await self.db.execute(query)
+        return {str(owner): int(total) for owner, total in result.all()}
+    
+    async def bulk_update_levels(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Write level, EXP and stats for many heroes in a single statement.
+        
+        Args:
+            updates: One dict per hero with "id", "level", "exp" and
+                any current_* stat columns to set
+        """
+        if not updates:
+            return
+        # ORM bulk UPDATE by primary key (executemany)
+        await self.db.execute(update(Hero), updates)
+        await self.db.flush()
+    
     async def update_stats(
         self,
         hero_id: UUID,
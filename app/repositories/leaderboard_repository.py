@@ -0,0 +1,163 @@
+"""
+Leaderboard Repository - Sorted-set storage for leaderboards
+
+Each board is a sorted set of (score, player_id). RedisLeaderboardRepository
+stores boards as Redis ZSETs; InMemoryLeaderboardRepository keeps a sorted
+list per board for development and tests.
+
+Both order exactly like ZREVRANGE: higher scores first, and players with
+equal scores in reverse player ID order. Ranks are 0-based.
+"""
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+
+# Redis key prefix for leaderboard sorted sets
+LEADERBOARD_KEY_PREFIX = "leaderboard:"
+
+
+class InMemoryLeaderboardRepository:
+    """
+    Leaderboards kept in process, for development and tests.
+
+    Entries are held in an ascending list of (score, player_id) plus a
+    score index per board. Rank lookups and page slices use bisection;
+    updates move one entry.
+    """
+
+    def __init__(self):
+        """Initialize the in-memory leaderboards."""
+        # board -> ascending [(score, player_id), ...]
+        self._entries: Dict[str, List[Tuple[int, str]]] = {}
+        # board -> player_id -> score
+        self._scores: Dict[str, Dict[str, int]] = {}
+
+    async def set_score(self, board: str, player_id: str, score: int) -> None:
+        """Set a player's score on a board."""
+        self._place(board, player_id, score)
+
+    async def set_scores(self, board: str, scores: Dict[str, int]) -> None:
+        """Set many players' scores on a board."""
+        for player_id, score in scores.items():
+            self._place(board, player_id, score)
+
+    async def increment(self, board: str, player_id: str, delta: int) -> int:
+        """Add to a player's score and return the new score."""
+        score = self._scores.get(board, {}).get(player_id, 0) + delta
+        self._place(board, player_id, score)
+        return score
+
+    async def get_score(self, board: str, player_id: str) -> Optional[int]:
+        """Get a player's score, or None if not ranked."""
+        return self._scores.get(board, {}).get(player_id)
+
+    async def get_rank(self, board: str, player_id: str) -> Optional[int]:
+        """Get a player's 0-based rank (highest score first), or None if not ranked."""
+        score = self._scores.get(board, {}).get(player_id)
+        if score is None:
+            return None
+        entries = self._entries[board]
+        return len(entries) - 1 - bisect_left(entries, (score, player_id))
+
+    async def get_range(self, board: str, start: int, stop: int) -> List[Tuple[str, int]]:
+        """Get (player_id, score) for ranks start..stop inclusive."""
+        entries = self._entries.get(board, [])
+        count = len(entries)
+        start = max(start, 0)
+        stop = min(stop, count - 1)
+        return [
+            (entries[count - 1 - rank][1], entries[count - 1 - rank][0])
+            for rank in range(start, stop + 1)
+        ]
+
+    async def count(self, board: str) -> int:
+        """Number of ranked players on a board."""
+        return len(self._entries.get(board, []))
+
+    async def remove(self, board: str, player_id: str) -> bool:
+        """Remove a player from a board."""
+        score = self._scores.get(board, {}).pop(player_id, None)
+        if score is None:
+            return False
+        entries = self._entries[board]
+        del entries[bisect_left(entries, (score, player_id))]
+        return True
+
+    def _place(self, board: str, player_id: str, score: int) -> None:
+        """Insert or move a player's entry."""
+        entries = self._entries.setdefault(board, [])
+        scores = self._scores.setdefault(board, {})
+        old = scores.get(player_id)
+        if old == score:
+            return
+        if old is not None:
+            del entries[bisect_left(entries, (old, player_id))]
+        insort(entries, (score, player_id))
+        scores[player_id] = score
+
+
+class RedisLeaderboardRepository:
+    """
+    Leaderboards stored as Redis sorted sets.
+
+    Every operation is a single O(log n) ZSET command.
+    """
+
+    def __init__(self, client=None, url: Optional[str] = None):
+        """
+        Initialize the Redis leaderboards.
+
+        Args:
+            client: Optional redis.asyncio client
+            url: Redis URL used when no client is given
+
+        Raises:
+            RuntimeError: If no client is given and redis is not installed
+        """
+        if client is None:
+            # Imported here so the in-memory backend never loads redis
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError:  # pragma: no cover - optional dependency
+                raise RuntimeError("The redis package is required for Redis leaderboards")
+            client = redis_asyncio.from_url(url, decode_responses=True)
+        self.client = client
+
+    async def set_score(self, board: str, player_id: str, score: int) -> None:
+        """Set a player's score on a board."""
+        await self.client.zadd(self._key(board), {player_id: score})
+
+    async def set_scores(self, board: str, scores: Dict[str, int]) -> None:
+        """Set many players' scores on a board in one ZADD."""
+        if scores:
+            await self.client.zadd(self._key(board), scores)
+
+    async def increment(self, board: str, player_id: str, delta: int) -> int:
+        """Add to a player's score and return the new score."""
+        return int(await self.client.zincrby(self._key(board), delta, player_id))
+
+    async def get_score(self, board: str, player_id: str) -> Optional[int]:
+        """Get a player's score, or None if not ranked."""
+        score = await self.client.zscore(self._key(board), player_id)
+        return None if score is None else int(score)
+
+    async def get_rank(self, board: str, player_id: str) -> Optional[int]:
+        """Get a player's 0-based rank (highest score first), or None if not ranked."""
+        return await self.client.zrevrank(self._key(board), player_id)
+
+    async def get_range(self, board: str, start: int, stop: int) -> List[Tuple[str, int]]:
+        """Get (player_id, score) for ranks start..stop inclusive."""
+        rows = await self.client.zrevrange(self._key(board), max(start, 0), stop, withscores=True)
+        return [(player_id, int(score)) for player_id, score in rows]
+
+    async def count(self, board: str) -> int:
+        """Number of ranked players on a board."""
+        return await self.client.zcard(self._key(board))
+
+    async def remove(self, board: str, player_id: str) -> bool:
+        """Remove a player from a board."""
+        return bool(await self.client.zrem(self._key(board), player_id))
+
+    @staticmethod
+    def _key(board: str) -> str:
+        return f"{LEADERBOARD_KEY_PREFIX}{board}"
@@ -0,0 +1,99 @@
+"""
+In-Memory Team Repository - Team records without a database
+
+Stores the same plain records as TeamRepository (see team_repository)
+and enforces one team per (player_id, slot_number). Kept apart from the
+SQL repository so development and tests do not import SQLAlchemy.
+"""
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+
+TEAM_FIELDS = ("name", "slot_number", "formation_id", "is_default", "members")
+
+
+class InMemoryTeamRepository:
+    """
+    Team storage indexed by player, for development and tests.
+
+    Lookups touch only the requesting player's teams.
+    """
+
+    def __init__(self):
+        """Initialize the in-memory team repository."""
+        # player_id -> slot_number -> team record
+        self._by_player: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        # team_id -> player_id
+        self._owners: Dict[str, str] = {}
+
+    async def get_by_player(self, player_id: str) -> List[Dict[str, Any]]:
+        """Get a player's team records ordered by slot number."""
+        slots = self._by_player.get(str(player_id), {})
+        return [self._copy(slots[slot]) for slot in sorted(slots)]
+
+    async def get_for_player(self, team_id: str, player_id: str) -> Optional[Dict[str, Any]]:
+        """Get a team record if it belongs to the player."""
+        team = self._find(team_id, player_id)
+        return self._copy(team) if team else None
+
+    async def create_team(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert a team record.
+
+        Raises:
+            ValueError: If the player already has a team in that slot
+        """
+        player_id = str(record["player_id"])
+        slots = self._by_player.setdefault(player_id, {})
+        if record["slot_number"] in slots:
+            raise ValueError(f"Team slot {record['slot_number']} is already in use")
+
+        team = {"id": str(uuid4()), "player_id": player_id, **{f: record[f] for f in TEAM_FIELDS}}
+        team["members"] = [list(member) for member in team["members"]]
+        slots[team["slot_number"]] = team
+        self._owners[team["id"]] = player_id
+        return self._copy(team)
+
+    async def update_team(self, team_id: str, player_id: str, values: Dict[str, Any]) -> bool:
+        """Update a team's fields."""
+        team = self._find(team_id, player_id)
+        if not team:
+            return False
+        if "slot_number" in values and values["slot_number"] != team["slot_number"]:
+            slots = self._by_player[team["player_id"]]
+            if values["slot_number"] in slots:
+                raise ValueError(f"Team slot {values['slot_number']} is already in use")
+            slots[values["slot_number"]] = slots.pop(team["slot_number"])
+        team.update(values)
+        if "members" in values:
+            team["members"] = [list(member) for member in values["members"]]
+        return True
+
+    async def delete_team(self, team_id: str, player_id: str) -> bool:
+        """Delete a team."""
+        team = self._find(team_id, player_id)
+        if not team:
+            return False
+        del self._by_player[team["player_id"]][team["slot_number"]]
+        del self._owners[team["id"]]
+        return True
+
+    async def clear_default(self, player_id: str) -> None:
+        """Unset the default flag on all of a player's teams."""
+        for team in self._by_player.get(str(player_id), {}).values():
+            team["is_default"] = False
+
+    def _find(self, team_id: str, player_id: str) -> Optional[Dict[str, Any]]:
+        """Stored record of a player's team, or None."""
+        player_id = str(player_id)
+        if self._owners.get(str(team_id)) != player_id:
+            return None
+        for team in self._by_player[player_id].values():
+            if team["id"] == str(team_id):
+                return team
+        return None
+
+    @staticmethod
+    def _copy(team: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a record so callers cannot change stored data."""
+        return {**team, "members": [list(member) for member in team["members"]]}
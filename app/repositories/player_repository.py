@@ -1,13 +1,18 @@
 """
 Player Repository - Data access for Player model
 """
-from typing import Optional, List
+from typing import Dict, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, and_
 
 from app.repositories.base import BaseRepository
 from app.models.player import Player
+from app.domain.value_objects.exp_table import ExpTable
+
+
+# Player level curve: level * 100 EXP to reach the next level
+PLAYER_EXP_TABLE = ExpTable(lambda level: level * 100)
 
 
 class PlayerRepository(BaseRepository[Player]):
@@ -126,6 +131,29 @@ class PlayerRepository(BaseRepository[Player]):
         await self.db.refresh(player)
         return player
     
+    async def spend_gold(self, player_id: UUID, amount: int) -> Optional[int]:
+        """
+        Debit gold in one conditional UPDATE.
+        
+        The balance check and the debit happen in the same statement, so
+        concurrent spends can never take the balance below zero.
+        
+        Args:
+            player_id: The player ID
+            amount: Gold to spend
+            
+        Returns:
+            Remaining gold, or None if the player has too little gold
+        """
+        query = (
+            update(Player)
+            .where(and_(Player.id == player_id, Player.gold >= amount))
+            .values(gold=Player.gold - amount)
+            .returning(Player.gold)
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+    
     async def add_experience(
         self,
         player_id: UUID,
@@ -145,12 +173,9 @@ class PlayerRepository(BaseRepository[Player]):
         if not player:
             return None
         
-        player.exp += exp_amount
-        
-        # Simple level up formula
-        while player.exp >= player.level * 100:
-            player.exp -= player.level * 100
-            player.level += 1
+        player.level, player.exp = PLAYER_EXP_TABLE.apply(
+            player.level, player.exp, exp_amount
+        )
         
         await self.db.flush()
         await self.db.refresh(player)
@@ -170,24 +195,50 @@ class PlayerRepository(BaseRepository[Player]):
         
         return await self.update(player_id, {"last_login": datetime.utcnow()})
     
-    async def get_leaderboard(
-        self,
-        limit: int = 100,
-        order_by: str = "level"
-    ) -> List[Player]:
+    async def get_levels(self) -> Dict[str, int]:
         """
-        Get players sorted by a field for leaderboard.
+        Get every player's level in one query (leaderboard rebuilds).
+        
+        Returns:
+            Level per player ID
+        """
+        result = await self.db.execute(select(Player.id, Player.level))
+        return {str(player_id): level for player_id, level in result.all()}
+    
+    async def get_all_story_progress(self) -> Dict[str, bytes]:
+        """
+        Get every player's serialized story progress in one query.
         
-        Args:
-            limit: Maximum number of players to return
-            order_by: Field to order by (level, gold, etc.)
-            
         Returns:
-            List of players sorted by the specified field
+            Progress bytes per player ID (players without progress are absent)
         """
-        from sqlalchemy import desc
+        query = select(Player.id, Player.story_progress).where(Player.story_progress.is_not(None))
+        result = await self.db.execute(query)
+        return {str(player_id): data for player_id, data in result.all()}
+    
+    async def get_story_progress(self, player_id: UUID) -> Optional[bytes]:
+        """
+        Get a player's serialized story progress.
         
-        column = getattr(Player, order_by, Player.level)
-        query = select(Player).order_by(desc(column)).limit(limit)
+        Args:
+            player_id: The player ID
+        
+        Returns:
+            Progress bytes, or None if the player has none yet
+        """
+        query = select(Player.story_progress).where(Player.id == player_id)
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return result.scalar_one_or_none()
+    
+    async def save_story_progress(self, player_id: UUID, data: bytes) -> None:
+        """
+        Save a player's serialized story progress.
+        
+        Args:
+            player_id: The player ID
+            data: Progress bytes
+        """
+        await self.db.execute(
+            update(Player).where(Player.id == player_id).values(story_progress=data)
+        )
+        await self.db.flush()
@@ -0,0 +1,160 @@
+"""
+Team Repository - Data access for Team model
+
+Teams are passed around as plain records:
+
+    {"id", "player_id", "name", "slot_number", "formation_id",
+     "is_default", "members": [[hero_id, x, y], ...]}
+
+TeamRepository stores them in PostgreSQL (the API builds one per request
+on the request's session); InMemoryTeamRepository, in
+memory_team_repository so it can be used without SQLAlchemy, keeps them
+in a per-player index for tests. Both enforce one team per (player_id,
+slot_number).
+"""
+from typing import Optional, List, Dict, Any
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, update, delete
+from sqlalchemy.exc import IntegrityError
+
+from app.repositories.base import BaseRepository
+from app.repositories.memory_team_repository import TEAM_FIELDS
+from app.models.team import Team
+
+
+class TeamRepository(BaseRepository[Team]):
+    """Repository for Team model operations"""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the team repository.
+
+        Args:
+            db: The async database session
+        """
+        super().__init__(Team, db)
+
+    async def get_by_player(self, player_id: UUID) -> List[Dict[str, Any]]:
+        """
+        Get all teams belonging to a player.
+
+        Args:
+            player_id: The player ID
+
+        Returns:
+            Team records ordered by slot number
+        """
+        query = (
+            select(Team)
+            .where(Team.player_id == player_id)
+            .order_by(Team.slot_number)
+        )
+        result = await self.db.execute(query)
+        return [self._to_record(team) for team in result.scalars().all()]
+
+    async def get_for_player(self, team_id: UUID, player_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Get a team that belongs to a specific player.
+
+        Args:
+            team_id: The team ID
+            player_id: The player ID
+
+        Returns:
+            Team record if found and owned by the player, None otherwise
+        """
+        query = select(Team).where(and_(Team.id == team_id, Team.player_id == player_id))
+        result = await self.db.execute(query)
+        team = result.scalar_one_or_none()
+        return self._to_record(team) if team else None
+
+    async def create_team(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert a team.
+
+        Args:
+            record: Team record (without "id")
+
+        Returns:
+            The created team record
+
+        Raises:
+            ValueError: If the player already has a team in that slot
+        """
+        team = Team(player_id=record["player_id"], **{f: record[f] for f in TEAM_FIELDS})
+        try:
+            async with self.db.begin_nested():
+                self.db.add(team)
+                await self.db.flush()
+        except IntegrityError:
+            raise ValueError(f"Team slot {record['slot_number']} is already in use")
+        return self._to_record(team)
+
+    async def update_team(
+        self,
+        team_id: UUID,
+        player_id: UUID,
+        values: Dict[str, Any]
+    ) -> bool:
+        """
+        Update a team's fields.
+
+        Args:
+            team_id: The team ID
+            player_id: The player ID
+            values: Fields to change
+
+        Returns:
+            True if the team was updated
+        """
+        result = await self.db.execute(
+            update(Team)
+            .where(and_(Team.id == team_id, Team.player_id == player_id))
+            .values(**values)
+        )
+        await self.db.flush()
+        return result.rowcount > 0
+
+    async def delete_team(self, team_id: UUID, player_id: UUID) -> bool:
+        """
+        Delete a team.
+
+        Args:
+            team_id: The team ID
+            player_id: The player ID
+
+        Returns:
+            True if the team was deleted
+        """
+        result = await self.db.execute(
+            delete(Team).where(and_(Team.id == team_id, Team.player_id == player_id))
+        )
+        await self.db.flush()
+        return result.rowcount > 0
+
+    async def clear_default(self, player_id: UUID) -> None:
+        """
+        Unset the default flag on all of a player's teams.
+
+        Args:
+            player_id: The player ID
+        """
+        await self.db.execute(
+            update(Team)
+            .where(and_(Team.player_id == player_id, Team.is_default.is_(True)))
+            .values(is_default=False)
+        )
+        await self.db.flush()
+
+    def _to_record(self, team: Team) -> Dict[str, Any]:
+        """Convert a team model to a record."""
+        return {
+            "id": str(team.id),
+            "player_id": str(team.player_id),
+            "name": team.name,
+            "slot_number": team.slot_number,
+            "formation_id": team.formation_id,
+            "is_default": bool(team.is_default),
+            "members": [list(member) for member in team.members or []]
+        }
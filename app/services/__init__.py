@@ -1,20 +1,34 @@
 # Services
-from app.services.battle_service import BattleService
-from app.services.auth_service import AuthService
-from app.services.player_service import PlayerService
-from app.services.hero_service import HeroService
-from app.services.equipment_service import EquipmentService
-from app.services.gacha_service import GachaService
-from app.services.story_service import StoryService
-from app.services.team_service import TeamService
+from app.utils.lazy import lazy_exports
+
+# Submodules load on first use, so importing one service does not
+# import all of them
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "battle_service": ["BattleService"],
+    "battle_session_service": ["BattleSessionService"],
+    "auth_service": ["AuthService"],
+    "player_service": ["PlayerService"],
+    "hero_service": ["HeroService"],
+    "equipment_service": ["EquipmentService"],
+    "gacha_service": ["GachaService"],
+    "gear_optimizer_service": ["GearOptimizerService"],
+    "story_service": ["StoryService"],
+    "team_service": ["TeamService"],
+    "team_builder_service": ["TeamBuilderService"],
+    "leaderboard_service": ["LeaderboardService"]
+})
 
 __all__ = [
     "BattleService",
+    "BattleSessionService",
     "AuthService",
     "PlayerService",
     "HeroService",
     "EquipmentService",
     "GachaService",
+    "GearOptimizerService",
     "StoryService",
-    "TeamService"
+    "TeamService",
+    "TeamBuilderService",
+    "LeaderboardService"
 ]
@@ -6,12 +6,11 @@ from typing import Optional, Tuple
 from uuid import uuid4
 
 from app.core.security import (
-    verify_password,
-    get_password_hash,
     create_access_token,
     create_refresh_token,
     verify_refresh_token
 )
+from app.core.password_hasher import get_password_hasher
 from app.core.exceptions import (
     InvalidCredentialsException,
     DuplicateResourceException,
@@ -34,14 +33,16 @@ class AuthService:
     - Password operations
     """
     
-    def __init__(self, player_repository=None):
+    def __init__(self, player_repository=None, password_hasher=None):
         """
         Initialize the auth service.
         
         Args:
             player_repository: Optional PlayerRepository for database operations
+            password_hasher: Optional PasswordHasher (defaults to the shared pool)
         """
         self.player_repository = player_repository
+        self.password_hasher = password_hasher or get_password_hasher()
     
     async def register(
         self,
@@ -64,6 +65,7 @@ class AuthService:
             
         Raises:
             DuplicateResourceException: If username or email exists
+            ServerBusyException: If the password hashing pool is saturated
         """
         # Check for existing username
         if self.player_repository:
@@ -73,8 +75,8 @@ class AuthService:
             if await self.player_repository.email_exists(email):
                 raise DuplicateResourceException("Player", "email", email)
         
-        # Hash password
-        password_hash = get_password_hash(password)
+        # Hash password (off the event loop)
+        password_hash = await self.password_hasher.hash(password)
         
         # Create player data
         player_data = {
@@ -135,6 +137,7 @@ class AuthService:
             
         Raises:
             InvalidCredentialsException: If credentials are invalid
+            ServerBusyException: If the password hashing pool is saturated
         """
         player = None
         
@@ -144,9 +147,16 @@ class AuthService:
             if not player:
                 raise InvalidCredentialsException()
             
-            if not verify_password(password, player.password_hash):
+            is_valid, new_hash = await self.password_hasher.verify_and_update(
+                password, player.password_hash
+            )
+            if not is_valid:
                 raise InvalidCredentialsException()
             
+            # Bcrypt cost changed since this hash was created - upgrade it
+            if new_hash:
+                await self.player_repository.update(player.id, {"password_hash": new_hash})
+            
             # Update last login
             await self.player_repository.update_last_login(player.id)
             
@@ -229,6 +239,7 @@ class AuthService:
             
         Raises:
             InvalidCredentialsException: If current password is wrong
+            ServerBusyException: If the password hashing pool is saturated
         """
         if not self.player_repository:
             return True
@@ -238,10 +249,10 @@ class AuthService:
         if not player:
             raise InvalidCredentialsException()
         
-        if not verify_password(current_password, player.password_hash):
+        if not await self.password_hasher.verify(current_password, player.password_hash):
             raise InvalidCredentialsException()
         
-        new_hash = get_password_hash(new_password)
+        new_hash = await self.password_hasher.hash(new_password)
         await self.player_repository.update(player_id, {"password_hash": new_hash})
         
         return True
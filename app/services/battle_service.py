@@ -9,6 +9,7 @@ from app.domain.entities.character import Character
 from app.domain.entities.hero import Hero
 from app.domain.entities.enemy import Enemy
 from app.utils.damage_calculator import DamageCalculator
+from app.core.exceptions import InvalidActionException, NotPlayerTurnException
 
 
 class BattleService:
@@ -22,6 +23,8 @@ class BattleService:
     - Calculating rewards
     """
     
+    AUTO_SKILL_MANA_COST = 50
+    
     def __init__(self, damage_calculator: Optional[DamageCalculator] = None):
         """
         Initialize BattleService.
@@ -278,6 +281,225 @@ class BattleService:
             "targets": results
         }
     
+    def execute_action(
+        self,
+        battle: Battle,
+        action_type: str,
+        target_ids: Optional[List[str]] = None,
+        skill_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the current hero's action and play out enemy turns.
+        
+        After the hero acts, turns advance (skipping fallen characters)
+        and enemies act through the AI until it is the player's turn
+        again or the battle is over.
+        
+        Args:
+            battle: Current battle instance
+            action_type: "attack", "skill" or "defend"
+            target_ids: IDs of targets
+            skill_id: Skill ID if using a skill
+            
+        Returns:
+            Dictionary with the hero action, enemy actions and end result
+            
+        Raises:
+            InvalidActionException: If the battle is over or the action is invalid
+            NotPlayerTurnException: If it is not a hero's turn
+        """
+        if battle.is_ended():
+            raise InvalidActionException("Battle has already ended")
+        if not battle.is_player_turn():
+            raise NotPlayerTurnException()
+        
+        actor = battle.get_current_actor()
+        target_ids = target_ids or []
+        
+        if action_type == "attack":
+            if not target_ids:
+                raise InvalidActionException("Attack requires a target")
+            result = self.execute_attack(battle, actor.id, target_ids[0])
+        elif action_type == "skill":
+            result = self.execute_skill(battle, actor.id, skill_id, target_ids)
+        elif action_type == "defend":
+            battle.log_action({"type": "defend", "actor_id": actor.id})
+            result = {"success": True}
+        else:
+            raise InvalidActionException(f"Unknown action type '{action_type}'")
+        
+        if not result["success"]:
+            raise InvalidActionException(result["error"])
+        
+        action = {
+            "action_type": action_type,
+            "actor_id": actor.id,
+            "target_ids": target_ids,
+            **result
+        }
+        enemy_actions = self._finish_turn(battle)
+        
+        end_result = battle.check_battle_end()
+        return {
+            "action": action,
+            "enemy_actions": enemy_actions,
+            "battle_ended": battle.is_ended(),
+            "result": end_result.value if end_result else None
+        }
+    
+    def choose_auto_action(self, battle: Battle, hero: Character) -> Dict[str, Any]:
+        """
+        Choose the default action for a hero (auto-battle).
+        
+        Targets the weakest enemy, preferring ones the hero's element
+        counters, and uses a skill when there is enough mana.
+        
+        Args:
+            battle: Current battle instance
+            hero: Hero whose turn it is
+            
+        Returns:
+            Action with action_type, target_ids and skill_id
+        """
+        living_enemies = battle.get_living_enemies()
+        if not living_enemies:
+            return {"action_type": "defend", "target_ids": [], "skill_id": None}
+        
+        strong_against = hero.element.get_strong_against()
+        target = min(
+            living_enemies,
+            key=lambda e: (e.element != strong_against, e.current_hp)
+        )
+        
+        if hero.skills and hero.current_mana >= self.AUTO_SKILL_MANA_COST:
+            return {
+                "action_type": "skill",
+                "target_ids": [target.id],
+                "skill_id": hero.skills[0]
+            }
+        return {"action_type": "attack", "target_ids": [target.id], "skill_id": None}
+    
+    def auto_battle(self, battle: Battle, max_turns: int) -> int:
+        """
+        Play a battle out with auto actions for every hero.
+        
+        Enemy turns run through the AI as usual. Stops when the battle
+        ends or after max_turns hero actions, whichever comes first.
+        
+        Args:
+            battle: Current battle instance
+            max_turns: Most hero actions to play
+            
+        Returns:
+            Number of hero actions taken
+        """
+        turns = 0
+        while not battle.is_ended() and turns < max_turns:
+            if not battle.is_player_turn():
+                self._finish_turn(battle)
+                continue
+            action = self.choose_auto_action(battle, battle.get_current_actor())
+            self.execute_action(
+                battle,
+                action["action_type"],
+                action["target_ids"],
+                action["skill_id"]
+            )
+            turns += 1
+        return turns
+    
+    def repeat_action(
+        self,
+        battle: Battle,
+        hero: Character,
+        last_action: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Repeat the player's last action for the current hero.
+        
+        Dead targets are replaced with the auto-battle target and a skill
+        the hero cannot afford falls back to a basic attack.
+        
+        Args:
+            battle: Current battle instance
+            hero: Hero whose turn it is
+            last_action: The last action the player chose
+            
+        Returns:
+            Action with action_type, target_ids and skill_id
+        """
+        auto = self.choose_auto_action(battle, hero)
+        if not last_action:
+            return auto
+        
+        action_type = last_action["action_type"]
+        if action_type == "defend":
+            return {"action_type": "defend", "target_ids": [], "skill_id": None}
+        
+        target_ids = []
+        for target_id in last_action.get("target_ids") or []:
+            target = battle.get_character_by_id(target_id)
+            if target and target.is_alive:
+                target_ids.append(target_id)
+        target_ids = target_ids or auto["target_ids"]
+        
+        if action_type == "skill" and hero.current_mana >= self.AUTO_SKILL_MANA_COST:
+            return {
+                "action_type": "skill",
+                "target_ids": target_ids,
+                "skill_id": last_action.get("skill_id")
+            }
+        return {"action_type": "attack", "target_ids": target_ids[:1], "skill_id": None}
+    
+    def _finish_turn(self, battle: Battle) -> List[Dict[str, Any]]:
+        """
+        Advance past the acting hero and run enemy turns.
+        
+        Args:
+            battle: Current battle instance
+            
+        Returns:
+            List of enemy action results
+        """
+        enemy_actions = []
+        
+        while True:
+            end_result = battle.check_battle_end()
+            if end_result:
+                battle.end_battle(end_result)
+                return enemy_actions
+            
+            self._advance_to_living_actor(battle)
+            if battle.is_player_turn():
+                return enemy_actions
+            
+            enemy = battle.get_current_actor()
+            ai_action = self.get_ai_action(battle, enemy)
+            if ai_action["action"] == "skill":
+                result = self.execute_skill(
+                    battle, enemy.id, ai_action["skill_id"], ai_action["target_ids"]
+                )
+            elif ai_action["action"] == "attack":
+                result = self.execute_attack(battle, enemy.id, ai_action["target_id"])
+            else:
+                result = {"success": True}
+            
+            enemy_actions.append({
+                "action_type": ai_action["action"],
+                "actor_id": enemy.id,
+                "target_ids": ai_action.get("target_ids") or [ai_action.get("target_id")],
+                **result
+            })
+    
+    def _advance_to_living_actor(self, battle: Battle) -> None:
+        """Advance the turn pointer, skipping fallen characters."""
+        battle.next_turn()
+        current = battle.get_current_actor()
+        while current and not current.is_alive:
+            battle.next_turn()
+            current = battle.get_current_actor()
+        battle.process_turn_start()
+    
     def advance_turn(self, battle: Battle) -> Dict[str, Any]:
         """
         Advance to the next turn.
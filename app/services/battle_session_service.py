@@ -0,0 +1,576 @@
+"""
+Battle Session Service - Per-worker cache of live battles
+
+Live Battle objects stay in memory on the worker that started them.
+An action is an in-memory mutation plus an append to the replay log;
+full checkpoints are written behind every N actions and when the
+battle ends.
+
+Failover:
+    Each battle record carries the ID of the worker that owns it and
+    responses include it as the ``X-Battle-Worker`` header so a load
+    balancer can route follow-up requests back to the same process.
+    If a request lands elsewhere (worker restart, eviction, rebalance),
+    the battle is rebuilt from the last checkpoint and the log entries
+    recorded after it. Log entries hold the resulting character state
+    and turn pointer rather than the inputs, so replay does not depend
+    on damage rolls or AI randomness.
+
+    Rebuilding claims the battle for the new worker. A worker that still
+    caches the battle reads the claim before using its copy and rebuilds
+    if another worker took over, and never checkpoints a battle it no
+    longer owns. This needs a store shared by the workers (Redis).
+"""
+import asyncio
+import os
+import socket
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.exceptions import (
+    BattleException,
+    BattleNotFoundException,
+    ValidationException
+)
+from app.domain.entities.battle import Battle, BattleResult, BattleState
+from app.domain.entities.character import Character
+from app.domain.entities.enemy import Enemy
+from app.domain.entities.hero import Hero
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+from app.repositories.battle_repository import BattleRepository
+from app.services.battle_service import BattleService
+from app.utils.battle_frames import (
+    capture_battle_state,
+    compact_action,
+    diff_battle_state
+)
+
+
+# Player policies for batched turns
+BATCH_POLICIES = ("auto", "repeat_last", "actions")
+
+
+def _character_to_dict(character: Character) -> Dict[str, Any]:
+    """Serialize a character with everything needed to rebuild it."""
+    data = {
+        "id": character.id,
+        "name": character.name,
+        "element": character.element.name,
+        "position": {"x": character.position.x, "y": character.position.y},
+        "stats": {
+            "hp": character.stats.hp,
+            "atk": character.stats.atk,
+            "def_": character.stats.def_,
+            "spd": character.stats.spd,
+            "crit": character.stats.crit,
+            "dex": character.stats.dex
+        },
+        "current_hp": character.current_hp,
+        "current_mana": character.current_mana,
+        "max_mana": character.max_mana,
+        "skills": list(character.skills),
+        "status_effects": list(character.status_effects),
+        "template_id": character.template_id
+    }
+    if isinstance(character, Hero):
+        data["level"] = character.level
+    if isinstance(character, Enemy):
+        data["difficulty"] = character.difficulty
+        data["exp_reward"] = character.exp_reward
+        data["gold_reward"] = character.gold_reward
+    return data
+
+
+def _character_from_dict(data: Dict[str, Any], cls: type) -> Character:
+    """Rebuild a hero or enemy from its serialized form."""
+    extra = {"template_id": data.get("template_id", "")}
+    if cls is Hero:
+        extra["level"] = data.get("level", 1)
+    else:
+        extra["difficulty"] = data.get("difficulty", 1)
+        extra["exp_reward"] = data.get("exp_reward", 0)
+        extra["gold_reward"] = data.get("gold_reward", 0)
+
+    character = cls(
+        id=data["id"],
+        name=data["name"],
+        element=Element[data["element"]],
+        position=GridPosition(data["position"]["x"], data["position"]["y"]),
+        stats=HexagonStats(**data["stats"]),
+        current_mana=data["current_mana"],
+        max_mana=data["max_mana"],
+        skills=list(data["skills"]),
+        status_effects=list(data["status_effects"]),
+        **extra
+    )
+    character.current_hp = data["current_hp"]
+    return character
+
+
+def serialize_battle(battle: Battle) -> Dict[str, Any]:
+    """
+    Serialize a battle into a checkpoint.
+
+    Args:
+        battle: The battle to serialize
+
+    Returns:
+        Checkpoint dictionary
+    """
+    return {
+        "battle_id": battle.id,
+        "player_id": battle.player_id,
+        "stage_id": battle.stage_id,
+        "state": battle.state.value,
+        "mana_per_turn": battle.mana_per_turn,
+        "weather": battle.weather,
+        "turn": battle.get_turn_pointer(),
+        "player_team": [_character_to_dict(h) for h in battle.player_team],
+        "enemy_team": [_character_to_dict(e) for e in battle.enemy_team]
+    }
+
+
+def deserialize_battle(data: Dict[str, Any]) -> Battle:
+    """
+    Rebuild a battle from a checkpoint.
+
+    Args:
+        data: Checkpoint produced by serialize_battle
+
+    Returns:
+        Battle instance
+    """
+    battle = Battle(
+        id=data["battle_id"],
+        player_id=data["player_id"],
+        stage_id=data["stage_id"],
+        player_team=[_character_from_dict(h, Hero) for h in data["player_team"]],
+        enemy_team=[_character_from_dict(e, Enemy) for e in data["enemy_team"]],
+        state=BattleState(data["state"]),
+        mana_per_turn=data["mana_per_turn"],
+        weather=data.get("weather")
+    )
+    battle.restore_turn_pointer(data["turn"])
+    return battle
+
+
+def apply_battle_log_entry(battle: Battle, entry: Dict[str, Any]) -> None:
+    """
+    Apply one replay log entry to a battle.
+
+    Args:
+        battle: The battle being rebuilt
+        entry: Log entry produced by BattleSessionService.execute_action
+    """
+    for character_id, changed in entry["changes"].items():
+        character = battle.get_character_by_id(character_id)
+        if character:
+            for key, value in changed.items():
+                setattr(character, key, value)
+    battle.restore_turn_pointer(entry["turn"])
+    battle.state = BattleState(entry["state"])
+
+
+def get_worker_id() -> str:
+    """Identify this worker process for sticky routing."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass
+class BattleSession:
+    """
+    A live battle held in the worker cache.
+
+    Attributes:
+        battle: The live battle
+        seq: Sequence number of the last logged action
+        checkpoint_seq: Sequence number covered by the last checkpoint
+        last_action: Last action chosen by the player (for "repeat last")
+        lock: Serializes actions on this battle
+    """
+
+    battle: Battle
+    seq: int = 0
+    checkpoint_seq: int = 0
+    last_action: Optional[Dict[str, Any]] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether actions have been applied since the last checkpoint"""
+        return self.seq > self.checkpoint_seq
+
+
+class BattleSessionService:
+    """
+    Service holding live battles in a per-worker LRU cache.
+
+    Handles:
+    - Starting battles and persisting the initial checkpoint
+    - In-memory action execution with replay log appends
+    - Write-behind checkpoints every N actions, on eviction and on end
+    - Rehydration from checkpoint plus replay log on a cache miss
+    """
+
+    def __init__(
+        self,
+        battle_repository: Optional[BattleRepository] = None,
+        battle_service: Optional[BattleService] = None,
+        capacity: int = 1024,
+        flush_every: int = 10,
+        worker_id: Optional[str] = None,
+        leaderboard_service=None
+    ):
+        """
+        Initialize the battle session service.
+
+        Args:
+            battle_repository: Store for checkpoints, logs and history
+            battle_service: BattleService for battle mechanics
+            capacity: Maximum number of live battles kept in memory
+            flush_every: Actions between write-behind checkpoints
+            worker_id: ID of this worker (defaults to host:pid)
+            leaderboard_service: Optional LeaderboardService counting wins
+        """
+        self.battle_repository = battle_repository or BattleRepository()
+        self.battle_service = battle_service or BattleService()
+        self.capacity = capacity
+        self.flush_every = flush_every
+        self.worker_id = worker_id or get_worker_id()
+        self.leaderboard_service = leaderboard_service
+        self._sessions: "OrderedDict[str, BattleSession]" = OrderedDict()
+
+    async def start_battle(
+        self,
+        player_id: str,
+        stage_id: str,
+        player_team: List[Hero],
+        enemy_team: List[Enemy]
+    ) -> Battle:
+        """
+        Start a battle and cache it on this worker.
+
+        Args:
+            player_id: ID of the player
+            stage_id: ID of the stage
+            player_team: List of player heroes
+            enemy_team: List of enemies
+
+        Returns:
+            The started battle
+        """
+        battle = self.battle_service.start_battle(
+            player_id=player_id,
+            stage_id=stage_id,
+            player_team=player_team,
+            enemy_team=enemy_team
+        )
+        session = BattleSession(battle=battle)
+        await self._checkpoint(session)
+        await self._cache(session)
+        return battle
+
+    async def get_battle(self, battle_id: str, player_id: str) -> Battle:
+        """
+        Get a live battle, rehydrating it on a cache miss.
+
+        Args:
+            battle_id: The battle ID
+            player_id: The player ID for ownership verification
+
+        Returns:
+            The live battle
+
+        Raises:
+            BattleNotFoundException: If battle not found
+        """
+        session = await self._get_session(battle_id, player_id)
+        return session.battle
+
+    async def execute_action(
+        self,
+        battle_id: str,
+        player_id: str,
+        action_type: str,
+        target_ids: Optional[List[str]] = None,
+        skill_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a player action on a live battle.
+
+        Args:
+            battle_id: The battle ID
+            player_id: The player ID for ownership verification
+            action_type: "attack", "skill" or "defend"
+            target_ids: IDs of targets
+            skill_id: Skill ID if using a skill
+
+        Returns:
+            Action results from BattleService.execute_action
+
+        Raises:
+            BattleNotFoundException: If battle not found
+        """
+        session = await self._get_session(battle_id, player_id)
+
+        async with session.lock:
+            result = await self._apply_action(session, action_type, target_ids, skill_id)
+            await self._maybe_checkpoint(session)
+
+        return result
+
+    async def execute_batch(
+        self,
+        battle_id: str,
+        player_id: str,
+        policy: str,
+        actions: Optional[List[Dict[str, Any]]] = None,
+        max_turns: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Play several player turns in one call (auto-battle / skip).
+
+        Runs until max_turns player actions have been taken, the battle
+        ends, or an explicit action list is exhausted. Each action is
+        logged exactly as if it had been sent on its own.
+
+        Args:
+            battle_id: The battle ID
+            player_id: The player ID for ownership verification
+            policy: "auto", "repeat_last" or "actions"
+            actions: Explicit actions for the "actions" policy
+            max_turns: Maximum number of player actions to take
+
+        Returns:
+            Dictionary with compact action rows, turns played, end
+            result and the reason the batch stopped
+
+        Raises:
+            BattleNotFoundException: If battle not found
+            ValidationException: If the policy is unknown
+        """
+        if policy not in BATCH_POLICIES:
+            raise ValidationException(
+                f"Unknown policy '{policy}'",
+                details={"allowed": list(BATCH_POLICIES)}
+            )
+
+        session = await self._get_session(battle_id, player_id)
+        planned = list(actions or [])
+        rows = []
+        turns_played = 0
+        stop_reason = "max_turns"
+
+        async with session.lock:
+            battle = session.battle
+            while turns_played < max_turns:
+                if battle.is_ended():
+                    stop_reason = "battle_ended"
+                    break
+
+                hero = battle.get_current_actor()
+                if policy == "actions":
+                    if turns_played >= len(planned):
+                        stop_reason = "actions_exhausted"
+                        break
+                    action = planned[turns_played]
+                elif policy == "repeat_last":
+                    action = self.battle_service.repeat_action(battle, hero, session.last_action)
+                else:
+                    action = self.battle_service.choose_auto_action(battle, hero)
+
+                try:
+                    result = await self._apply_action(
+                        session,
+                        action.get("action_type", ""),
+                        action.get("target_ids"),
+                        action.get("skill_id")
+                    )
+                except BattleException as exc:
+                    stop_reason = exc.error_code
+                    break
+
+                turns_played += 1
+                rows.append(compact_action(result["action"]))
+                rows.extend(compact_action(a) for a in result["enemy_actions"])
+            else:
+                if battle.is_ended():
+                    stop_reason = "battle_ended"
+
+            await self._maybe_checkpoint(session)
+
+        end_result = battle.check_battle_end()
+        return {
+            "turns_played": turns_played,
+            "actions": rows,
+            "stop_reason": stop_reason,
+            "battle_ended": battle.is_ended(),
+            "result": end_result.value if end_result else None
+        }
+
+    async def end_battle(self, battle_id: str, player_id: str) -> Dict[str, Any]:
+        """
+        Finish a battle, record the result and drop it from the cache.
+
+        A battle still in progress is ended as a retreat.
+
+        Args:
+            battle_id: The battle ID
+            player_id: The player ID for ownership verification
+
+        Returns:
+            Battle result with rewards
+
+        Raises:
+            BattleNotFoundException: If battle not found
+        """
+        session = await self._get_session(battle_id, player_id)
+
+        async with session.lock:
+            battle = session.battle
+            if not battle.is_ended():
+                battle.end_battle(BattleResult.RETREAT)
+
+            rewards = self.battle_service.calculate_rewards(battle)
+            victory = battle.state == BattleState.VICTORY
+            if not victory:
+                rewards.update({"exp": 0, "gold": 0, "drops": []})
+
+            result = {
+                "battle_id": battle.id,
+                "stage_id": battle.stage_id,
+                "victory": victory,
+                "stars": rewards["stars"],
+                "exp_gained": rewards["exp"],
+                "gold_gained": rewards["gold"],
+                "drops": rewards["drops"]
+            }
+
+            await self.battle_repository.save_battle_result(player_id, result)
+            await self.battle_repository.delete_active_battle(battle_id)
+            self._sessions.pop(battle_id, None)
+
+        if victory and self.leaderboard_service:
+            await self.leaderboard_service.record_win(player_id)
+
+        return result
+
+    async def flush_all(self) -> None:
+        """Checkpoint every dirty battle still owned here (e.g. on graceful shutdown)."""
+        for session in list(self._sessions.values()):
+            if session.is_dirty and await self._owns(session):
+                await self._checkpoint(session)
+
+    async def _apply_action(
+        self,
+        session: BattleSession,
+        action_type: str,
+        target_ids: Optional[List[str]],
+        skill_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run one player action in memory and append it to the replay log."""
+        battle = session.battle
+        before = capture_battle_state(battle)
+        result = self.battle_service.execute_action(
+            battle, action_type, target_ids=target_ids, skill_id=skill_id
+        )
+
+        action = {
+            "action_type": action_type,
+            "target_ids": target_ids or [],
+            "skill_id": skill_id
+        }
+        session.last_action = action
+        session.seq += 1
+        await self.battle_repository.append_battle_log(battle.id, {
+            "seq": session.seq,
+            "action": action,
+            "changes": diff_battle_state(before, capture_battle_state(battle)),
+            "turn": battle.get_turn_pointer(),
+            "state": battle.state.value
+        })
+        return result
+
+    async def _maybe_checkpoint(self, session: BattleSession) -> None:
+        """Write behind once enough actions have piled up or the battle ended."""
+        if session.battle.is_ended() or session.seq - session.checkpoint_seq >= self.flush_every:
+            await self._checkpoint(session)
+
+    async def _get_session(self, battle_id: str, player_id: str) -> BattleSession:
+        """Return the cached session or rebuild it from the store."""
+        session = self._sessions.get(battle_id)
+        if session is not None and not await self._owns(session):
+            # Another worker took the battle over; our copy is stale
+            self._sessions.pop(battle_id, None)
+            session = None
+
+        if session is not None:
+            self._sessions.move_to_end(battle_id)
+        else:
+            session = await self._rehydrate(battle_id)
+            await self._cache(session)
+
+        if session.battle.player_id != player_id:
+            raise BattleNotFoundException(battle_id)
+        return session
+
+    async def _rehydrate(self, battle_id: str) -> BattleSession:
+        """Rebuild a battle from its checkpoint and replay log."""
+        record = await self.battle_repository.get_active_battle(battle_id)
+        if not record:
+            raise BattleNotFoundException(battle_id)
+
+        battle = deserialize_battle(record["checkpoint"])
+        seq = record["seq"]
+        last_action = record.get("last_action")
+        for entry in await self.battle_repository.get_battle_log(battle_id, after_seq=seq):
+            apply_battle_log_entry(battle, entry)
+            seq = entry["seq"]
+            last_action = entry["action"]
+
+        session = BattleSession(
+            battle=battle,
+            seq=seq,
+            checkpoint_seq=record["seq"],
+            last_action=last_action
+        )
+        # Claim the battle so follow-up requests are routed here
+        await self._checkpoint(session)
+        return session
+
+    async def _cache(self, session: BattleSession) -> None:
+        """Insert a session, checkpointing any evicted battle first."""
+        self._sessions[session.battle.id] = session
+        self._sessions.move_to_end(session.battle.id)
+
+        while len(self._sessions) > self.capacity:
+            _, evicted = self._sessions.popitem(last=False)
+            if evicted.is_dirty and await self._owns(evicted):
+                await self._checkpoint(evicted)
+
+    async def _owns(self, session: BattleSession) -> bool:
+        """
+        Check the stored claim: this worker still owns the battle and
+        no checkpoint newer than our copy was written.
+        """
+        claim = await self.battle_repository.get_battle_claim(session.battle.id)
+        return (
+            claim is not None
+            and claim["worker_id"] == self.worker_id
+            and claim["seq"] <= session.seq
+        )
+
+    async def _checkpoint(self, session: BattleSession) -> None:
+        """Write a full checkpoint for a session."""
+        battle = session.battle
+        await self.battle_repository.save_active_battle(battle.id, {
+            "player_id": battle.player_id,
+            "worker_id": self.worker_id,
+            "seq": session.seq,
+            "last_action": session.last_action,
+            "checkpoint": serialize_battle(battle)
+        })
+        session.checkpoint_seq = session.seq
@@ -2,12 +2,32 @@
 Equipment Service - Business logic for equipment operations
 """
 from typing import Optional, Dict, Any, List
+from uuid import uuid4
 
 from app.core.exceptions import (
     EquipmentNotFoundException,
     ValidationException,
     InsufficientGoldException
 )
+from app.domain.entities.equipment import (
+    ENHANCE_STAT_GAIN,
+    MAX_ENHANCE_LEVELS,
+    RARITY_BY_STARS,
+    Rarity,
+    enhance_gold_cost
+)
+from app.domain.services.equipment_fusion import (
+    FUSION_UPGRADE_COUNT,
+    EquipmentFusion,
+    FusionInput,
+    FusionPlan
+)
+from app.domain.static_data import EquipmentTemplateDefinition
+from app.domain.value_objects.hexagon_stats import POWER_WEIGHTS, STAT_FIELDS, normalize_stat_key
+
+
+# Equipment bonus column per stat
+BONUS_COLUMNS = {name: f"bonus_{name.rstrip('_')}" for name in STAT_FIELDS}
 
 
 class EquipmentService:
@@ -23,7 +43,9 @@ class EquipmentService:
     def __init__(
         self,
         equipment_repository=None,
-        player_service=None
+        player_service=None,
+        fusion: Optional[EquipmentFusion] = None,
+        hero_service=None
     ):
         """
         Initialize the equipment service.
@@ -31,9 +53,14 @@ class EquipmentService:
         Args:
             equipment_repository: Optional EquipmentRepository
             player_service: Optional PlayerService for resource management
+            fusion: Optional fusion planner (defaults to the shared static data)
+            hero_service: Optional HeroService; refreshes the player's power
+                total after enhancement and fusion
         """
         self.equipment_repository = equipment_repository
         self.player_service = player_service
+        self.fusion = fusion or EquipmentFusion()
+        self.hero_service = hero_service
     
     async def get_equipment_list(
         self,
@@ -133,71 +160,177 @@ class EquipmentService:
             Dictionary with enhancement result
         """
         equipment_data = await self.get_equipment(equipment_id, player_id)
-        old_level = equipment_data.get("level", 1)
+        plan = self._plan_enhance(
+            equipment_id, equipment_data, equipment_data.get("level", 1) + 1
+        )
+        await self._apply_enhancements(player_id, [plan])
+        return plan
+    
+    async def enhance_to_level(
+        self,
+        equipment_id: str,
+        player_id: str,
+        target_level: int
+    ) -> dict:
+        """
+        Enhance equipment straight to a target level.
         
-        # Calculate max level based on rarity
-        max_levels = {
-            "common": 10,
-            "rare": 15,
-            "epic": 20,
-            "legendary": 25,
-            "mythic": 30
-        }
-        max_level = max_levels.get(equipment_data.get("rarity", "common"), 10)
+        Args:
+            equipment_id: The equipment ID
+            player_id: The player ID
+            target_level: Level to reach (capped at the rarity's max level)
+            
+        Returns:
+            Dictionary with enhancement result
+            
+        Raises:
+            EquipmentNotFoundException: If equipment not found
+            ValidationException: If the equipment cannot be enhanced further
+            InsufficientGoldException: If not enough gold
+        """
+        equipment_data = await self.get_equipment(equipment_id, player_id)
+        plan = self._plan_enhance(equipment_id, equipment_data, target_level)
+        await self._apply_enhancements(player_id, [plan])
+        return plan
+    
+    async def enhance_many(
+        self,
+        player_id: str,
+        targets: Dict[str, int]
+    ) -> dict:
+        """
+        Enhance several equipment items with one gold debit and one update.
         
-        if old_level >= max_level:
-            raise ValidationException("Equipment is already at max level")
+        All or nothing: if any item is invalid or the total cost is not
+        affordable, nothing is enhanced.
         
-        # Calculate gold cost
-        gold_cost = old_level * 100
+        Args:
+            player_id: The player ID
+            targets: Target level per equipment ID
+            
+        Returns:
+            Dictionary with per-item results and total gold spent
+            
+        Raises:
+            EquipmentNotFoundException: If any equipment is not found
+            ValidationException: If any item cannot be enhanced further
+            InsufficientGoldException: If not enough gold
+        """
+        if not targets:
+            raise ValidationException("At least 1 equipment piece is required")
         
-        # Verify and spend gold
-        if self.player_service:
-            await self.player_service.spend_resources(
-                player_id,
-                gold=gold_cost
+        if self.equipment_repository:
+            rows = await self.equipment_repository.get_many_for_player(
+                list(targets), player_id
             )
+            found = {str(row.id): self._equipment_to_response(row) for row in rows}
+        else:
+            found = {equipment_id: self._mock_equipment() for equipment_id in targets}
         
-        new_level = old_level + 1
+        plans = []
+        for equipment_id, target_level in targets.items():
+            equipment_data = found.get(equipment_id)
+            if equipment_data is None:
+                raise EquipmentNotFoundException(equipment_id)
+            plans.append(self._plan_enhance(equipment_id, equipment_data, target_level))
         
-        # Calculate stats gained
-        base_stats = equipment_data.get("base_stats", {})
-        stats_gained = {
-            "hp": int(base_stats.get("hp", 0) * 0.1),
-            "atk": int(base_stats.get("atk", 0) * 0.1),
-            "def_": int(base_stats.get("def_", 0) * 0.1),
-            "spd": int(base_stats.get("spd", 0) * 0.1),
-            "crit": int(base_stats.get("crit", 0) * 0.1),
-            "dex": int(base_stats.get("dex", 0) * 0.1)
-        }
+        gold_spent = await self._apply_enhancements(player_id, plans)
         
-        # Calculate new bonus stats
-        bonus_stats = equipment_data.get("bonus_stats", {})
-        new_bonus = {
-            "hp": bonus_stats.get("hp", 0) + stats_gained["hp"],
-            "atk": bonus_stats.get("atk", 0) + stats_gained["atk"],
-            "def_": bonus_stats.get("def_", 0) + stats_gained["def_"],
-            "spd": bonus_stats.get("spd", 0) + stats_gained["spd"],
-            "crit": bonus_stats.get("crit", 0) + stats_gained["crit"],
-            "dex": bonus_stats.get("dex", 0) + stats_gained["dex"]
+        return {
+            "results": plans,
+            "gold_spent": gold_spent
         }
+    
+    def _plan_enhance(
+        self,
+        equipment_id: str,
+        equipment_data: dict,
+        target_level: int
+    ) -> dict:
+        """
+        Compute level, gold cost and bonus stats for an enhancement.
         
-        if self.equipment_repository:
-            await self.equipment_repository.update_level(
-                equipment_id,
-                new_level,
-                new_bonus
+        Every level grants 10% of base stats and costs level * 100 gold,
+        so the whole range is computed in closed form.
+        
+        Args:
+            equipment_id: The equipment ID
+            equipment_data: Equipment response dictionary
+            target_level: Level to reach (capped at the rarity's max level)
+            
+        Returns:
+            Enhancement result with a "bonus_stats" entry to persist
+            
+        Raises:
+            ValidationException: If the equipment cannot be enhanced further
+        """
+        old_level = equipment_data.get("level", 1)
+        max_level = MAX_ENHANCE_LEVELS.get(
+            Rarity(equipment_data.get("rarity", "common")), 10
+        )
+        
+        if old_level >= max_level:
+            raise ValidationException("Equipment is already at max level")
+        
+        new_level = min(target_level, max_level)
+        if new_level <= old_level:
+            raise ValidationException(
+                f"Target level must be above current level {old_level}"
             )
         
+        levels = new_level - old_level
+        base_stats = equipment_data.get("base_stats", {})
+        bonus_stats = equipment_data.get("bonus_stats", {})
+        stats_gained = {
+            name: int(base_stats.get(name, 0) * ENHANCE_STAT_GAIN) * levels
+            for name in STAT_FIELDS
+        }
+        
         return {
             "equipment_id": equipment_id,
             "old_level": old_level,
             "new_level": new_level,
             "success": True,
             "stats_gained": stats_gained,
-            "gold_spent": gold_cost
+            "bonus_stats": {
+                name: bonus_stats.get(name, 0) + stats_gained[name]
+                for name in STAT_FIELDS
+            },
+            "gold_spent": enhance_gold_cost(old_level, new_level)
         }
     
+    async def _apply_enhancements(self, player_id: str, plans: List[dict]) -> int:
+        """
+        Debit the total gold once and write every new level in one update.
+        
+        Args:
+            player_id: The player ID
+            plans: Results from _plan_enhance
+            
+        Returns:
+            Total gold spent
+        """
+        gold_cost = sum(plan["gold_spent"] for plan in plans)
+        
+        if self.player_service and gold_cost > 0:
+            await self.player_service.spend_gold(player_id, gold_cost)
+        
+        if self.equipment_repository:
+            await self.equipment_repository.bulk_update_levels([
+                {
+                    "id": plan["equipment_id"],
+                    "level": plan["new_level"],
+                    **{
+                        BONUS_COLUMNS[name]: value
+                        for name, value in plan["bonus_stats"].items()
+                    }
+                }
+                for plan in plans
+            ])
+            await self._refresh_power(player_id)
+        
+        return gold_cost
+    
     async def fuse(
         self,
         player_id: str,
@@ -208,34 +341,161 @@ class EquipmentService:
         
         Args:
             player_id: The player ID
-            equipment_ids: List of equipment IDs to fuse
+            equipment_ids: List of equipment IDs to fuse; the first is the primary
             
         Returns:
             Dictionary with fusion result
+            
+        Raises:
+            EquipmentNotFoundException: If any equipment is not found
+            ValidationException: If the pieces cannot be fused
         """
         if len(equipment_ids) < 2:
             raise ValidationException("At least 2 equipment pieces are required for fusion")
         
-        # Get all equipment
-        equipment_list = []
+        if self.equipment_repository:
+            rows = await self.equipment_repository.get_with_equipped_flag(
+                player_id, list(equipment_ids)
+            )
+            found = {str(row.id): self._to_fusion_input(row, equipped) for row, equipped in rows}
+        else:
+            found = {eq_id: self._mock_fusion_input(eq_id) for eq_id in equipment_ids}
+        
+        inputs = []
         for eq_id in equipment_ids:
-            eq = await self.get_equipment(eq_id, player_id)
-            equipment_list.append(eq)
+            if eq_id not in found:
+                raise EquipmentNotFoundException(eq_id)
+            inputs.append(found[eq_id])
         
-        # Create result equipment (simplified)
-        result_equipment = self._mock_equipment()
-        result_equipment["id"] = f"fused-{equipment_ids[0]}"
-        result_equipment["level"] = 1
+        try:
+            plan = self.fusion.plan(inputs)
+        except ValueError as e:
+            raise ValidationException(str(e))
         
-        # Delete consumed equipment
+        results = await self._apply_fusions(player_id, [plan])
+        return results[0]
+    
+    async def fuse_all_duplicates(
+        self,
+        player_id: str,
+        group_size: int = FUSION_UPGRADE_COUNT
+    ) -> dict:
+        """
+        Fuse every group of duplicate pieces in the player's inventory.
+        
+        Unlocked, unequipped pieces of the same template are fused in
+        groups of group_size. All fusions are applied in one transaction.
+        
+        Args:
+            player_id: The player ID
+            group_size: Pieces per fusion
+            
+        Returns:
+            Dictionary with every fusion result
+            
+        Raises:
+            ValidationException: If the group size is invalid
+        """
         if self.equipment_repository:
-            await self.equipment_repository.delete_multiple(equipment_ids, player_id)
+            rows = await self.equipment_repository.get_with_equipped_flag(player_id)
+            inventory = [self._to_fusion_input(row, equipped) for row, equipped in rows]
+        else:
+            inventory = [self._mock_fusion_input(f"sample-equipment-{i}") for i in range(group_size)]
+        
+        try:
+            plans = self.fusion.plan_duplicates(inventory, group_size)
+        except ValueError as e:
+            raise ValidationException(str(e))
         
+        fusions = await self._apply_fusions(player_id, plans)
         return {
-            "result_equipment": result_equipment,
-            "consumed_equipment": equipment_ids
+            "fusions": fusions,
+            "consumed_count": sum(len(plan.consumed) for plan in plans)
         }
     
+    async def _apply_fusions(self, player_id: str, plans: List[FusionPlan]) -> List[dict]:
+        """
+        Create the fused pieces and delete the consumed ones in one transaction.
+        
+        Args:
+            player_id: The player ID
+            plans: Fusion plans to apply
+            
+        Returns:
+            One fusion result per plan
+        """
+        created = [
+            {
+                "id": uuid4(),
+                "template_id": plan.template.id,
+                "level": 1,
+                "substats": plan.substats,
+                "is_locked": False
+            }
+            for plan in plans
+        ]
+        
+        if self.equipment_repository and plans:
+            try:
+                await self.equipment_repository.replace_many(
+                    player_id,
+                    created,
+                    [eq_id for plan in plans for eq_id in plan.consumed]
+                )
+            except ValueError as e:
+                raise ValidationException(str(e))
+            await self._refresh_power(player_id)
+        
+        return [
+            {
+                "result_equipment": {
+                    "id": str(values["id"]),
+                    "template_id": plan.template.id,
+                    "name": plan.template.name,
+                    "equipment_type": plan.template.equipment_type,
+                    "rarity": RARITY_BY_STARS.get(plan.rarity, Rarity.COMMON).value,
+                    "level": 1,
+                    "substats": plan.substats,
+                    "power": self._power(plan.template, {}, plan.substats),
+                    "equipped_by": None
+                },
+                "consumed_equipment": plan.consumed
+            }
+            for plan, values in zip(plans, created)
+        ]
+    
+    async def _refresh_power(self, player_id: str) -> None:
+        """Rewrite the player's power total (worn pieces count towards it)."""
+        if self.hero_service:
+            await self.hero_service.refresh_power(player_id)
+    
+    def _to_fusion_input(self, equipment, is_equipped: bool) -> FusionInput:
+        """Convert an equipment model to a fusion input using static template data."""
+        template = self.fusion.registry.get_equipment_template(equipment.template_id)
+        if template is None:
+            raise ValidationException(f"Unknown equipment template: {equipment.template_id}")
+        return FusionInput(
+            id=str(equipment.id),
+            template_id=equipment.template_id,
+            equipment_type=template.equipment_type,
+            rarity=template.rarity,
+            set_id=template.set_id,
+            substats=list(equipment.substats or []),
+            is_locked=bool(equipment.is_locked),
+            is_equipped=is_equipped
+        )
+    
+    def _mock_fusion_input(self, equipment_id: str) -> FusionInput:
+        """Return mock fusion input."""
+        data = self._mock_equipment()
+        return FusionInput(
+            id=equipment_id,
+            template_id=data["template_id"],
+            equipment_type=data["equipment_type"],
+            rarity=5,
+            substats=[{"stat": "ATK", "value": 10}]
+        )
+    
     def _mock_equipment(self) -> dict:
         """Return mock equipment data."""
         return {
@@ -256,58 +516,51 @@ class EquipmentService:
             "power": 120
         }
     
+    def _template(self, template_id: str) -> EquipmentTemplateDefinition:
+        """
+        Static template of a piece, from the registry.
+        
+        Unknown templates get a placeholder with no base stats, so an
+        orphaned row still lists (and enhances for bonus stats only).
+        """
+        template = self.fusion.registry.get_equipment_template(template_id)
+        return template or EquipmentTemplateDefinition(
+            id=template_id, name=template_id, equipment_type=""
+        )
+    
     def _equipment_to_brief(self, equipment) -> dict:
         """Convert equipment model to brief response."""
+        template = self._template(equipment.template_id)
         return {
             "id": str(equipment.id),
             "template_id": equipment.template_id,
-            "name": equipment.template_id,  # Would be template name
-            "equipment_type": "weapon",  # Would be from template
-            "rarity": "legendary",  # Would be from template
+            "name": template.name,
+            "equipment_type": template.equipment_type,
+            "rarity": RARITY_BY_STARS.get(template.rarity, Rarity.COMMON).value,
             "level": equipment.level,
             "power": self._calculate_power(equipment),
             "equipped_by": None
         }
     
     def _equipment_to_response(self, equipment) -> dict:
-        """Convert equipment model to full response."""
-        base_stats = {
-            "hp": 0,
-            "atk": 50,
-            "def_": 0,
-            "spd": 10,
-            "crit": 5,
-            "dex": 5
-        }
-        bonus_stats = {
-            "hp": equipment.bonus_hp,
-            "atk": equipment.bonus_atk,
-            "def_": equipment.bonus_def,
-            "spd": equipment.bonus_spd,
-            "crit": equipment.bonus_crit,
-            "dex": equipment.bonus_dex
-        }
-        total_stats = {
-            "hp": base_stats["hp"] + bonus_stats["hp"],
-            "atk": base_stats["atk"] + bonus_stats["atk"],
-            "def_": base_stats["def_"] + bonus_stats["def_"],
-            "spd": base_stats["spd"] + bonus_stats["spd"],
-            "crit": base_stats["crit"] + bonus_stats["crit"],
-            "dex": base_stats["dex"] + bonus_stats["dex"]
-        }
+        """Convert equipment model to full response (template data from the registry)."""
+        template = self._template(equipment.template_id)
+        base_stats = {name: getattr(template.base_stats, name) for name in STAT_FIELDS}
+        bonus_stats = {name: getattr(equipment, BONUS_COLUMNS[name]) for name in STAT_FIELDS}
+        total_stats = {name: base_stats[name] + bonus_stats[name] for name in STAT_FIELDS}
         
         return {
             "id": str(equipment.id),
             "template_id": equipment.template_id,
-            "name": equipment.template_id,
-            "equipment_type": "weapon",
-            "rarity": "legendary",
+            "name": template.name,
+            "equipment_type": template.equipment_type,
+            "rarity": RARITY_BY_STARS.get(template.rarity, Rarity.COMMON).value,
             "level": equipment.level,
             "base_stats": base_stats,
             "bonus_stats": bonus_stats,
             "total_stats": total_stats,
             "substats": equipment.substats or [],
-            "set_id": None,
+            "set_id": template.set_id,
             "unique_effect": None,
             "equipped_by": None,
             "is_locked": equipment.is_locked,
@@ -316,11 +569,36 @@ class EquipmentService:
     
     def _calculate_power(self, equipment) -> int:
         """Calculate equipment power rating."""
-        return (
-            equipment.bonus_hp +
-            equipment.bonus_atk * 5 +
-            equipment.bonus_def * 3 +
-            equipment.bonus_spd * 2 +
-            equipment.bonus_crit * 10 +
-            equipment.bonus_dex * 2
+        return self._power(
+            self._template(equipment.template_id),
+            {name: getattr(equipment, BONUS_COLUMNS[name]) or 0 for name in STAT_FIELDS},
+            equipment.substats
         )
+    
+    def _power(
+        self,
+        template: EquipmentTemplateDefinition,
+        bonus_stats: Dict[str, int],
+        substats: Optional[List[Dict[str, Any]]]
+    ) -> int:
+        """
+        Power of a piece: its base, enhancement and substat values
+        weighted with POWER_WEIGHTS, as hero power is.
+        
+        Args:
+            template: The piece's template
+            bonus_stats: Enhancement bonus per stat field
+            substats: Substats ([{"stat": "ATK", "value": 10}, ...])
+            
+        Returns:
+            Power rating
+        """
+        totals = {
+            name: getattr(template.base_stats, name) + bonus_stats.get(name, 0)
+            for name in STAT_FIELDS
+        }
+        for substat in substats or ():
+            name = normalize_stat_key(str(substat.get("stat", "")))
+            if name:
+                totals[name] += int(substat.get("value", 0))
+        return sum(totals[name] * weight for name, weight in POWER_WEIGHTS.items())
@@ -2,6 +2,7 @@
 Gacha Service - Business logic for gacha system
 """
 import random
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 from uuid import uuid4
 
@@ -9,6 +10,7 @@ from app.core.exceptions import (
     InsufficientGemsException,
     GachaException
 )
+from app.utils.cache import CACHE_TAG_GACHA_BANNERS, invalidate_cached_responses
 
 
 # Hero pool by rarity
@@ -42,6 +44,55 @@ BANNERS = {
 }
 
 
+@dataclass(frozen=True)
+class BannerTable:
+    """
+    Precomputed roll table for one banner.
+    
+    Attributes:
+        five_star_below: Roll (0-100) under which a pull is 5-star
+        four_star_below: Roll under which a pull is 4-star or better
+        pity_threshold: Pulls without a 5-star that guarantee one
+        featured: Featured hero ID, if any
+        featured_rate: Chance (0-100) that a 5-star is the featured hero
+    """
+    
+    five_star_below: float
+    four_star_below: float
+    pity_threshold: int
+    featured: Optional[str]
+    featured_rate: float
+    
+    @classmethod
+    def from_banner(cls, banner: dict) -> "BannerTable":
+        """Compile a banner configuration."""
+        rates = banner["rates"]
+        return cls(
+            five_star_below=rates[5],
+            four_star_below=rates[5] + rates[4],
+            pity_threshold=banner.get("pity_counter", 90),
+            featured=banner.get("featured"),
+            featured_rate=banner.get("featured_rate_up", 50)
+        )
+
+
+# Compiled roll tables by banner ID (rebuilt after a banner swap)
+_BANNER_TABLES: Dict[str, BannerTable] = {}
+
+
+def compile_banner_tables() -> Dict[str, BannerTable]:
+    """
+    Compile the roll tables of every active banner, once.
+    
+    Returns:
+        Roll tables keyed by banner ID
+    """
+    if not _BANNER_TABLES:
+        for banner in BANNERS.values():
+            _BANNER_TABLES[banner["id"]] = BannerTable.from_banner(banner)
+    return _BANNER_TABLES
+
+
 class GachaService:
     """
     Service for gacha operations.
@@ -90,6 +141,18 @@ class GachaService:
             for banner in BANNERS.values()
         ]
     
+    async def set_banners(self, banners: Dict[str, dict]) -> None:
+        """
+        Replace the active banners (banner swap).
+        
+        Args:
+            banners: Banner configurations keyed by slot
+        """
+        BANNERS.clear()
+        BANNERS.update(banners)
+        _BANNER_TABLES.clear()
+        invalidate_cached_responses(CACHE_TAG_GACHA_BANNERS)
+    
     async def get_banner(self, banner_id: str) -> dict:
         """
         Get specific banner details.
@@ -236,20 +299,20 @@ class GachaService:
             Pull result
         """
         banner_id = banner["id"]
+        table = compile_banner_tables().get(banner_id) or BannerTable.from_banner(banner)
         pity = self._get_pity_counter(player_id, banner_id)
         
         # Determine rarity
         roll = random.random() * 100
         
         # Check pity
-        pity_threshold = banner.get("pity_counter", 90)
-        if pity >= pity_threshold - 1:
+        if pity >= table.pity_threshold - 1:
             rarity = 5
             self._reset_pity_counter(player_id, banner_id)
-        elif roll < banner["rates"][5]:
+        elif roll < table.five_star_below:
             rarity = 5
             self._reset_pity_counter(player_id, banner_id)
-        elif roll < banner["rates"][5] + banner["rates"][4]:
+        elif roll < table.four_star_below:
             rarity = 4
             self._increment_pity_counter(player_id, banner_id)
         else:
@@ -260,10 +323,9 @@ class GachaService:
         hero_pool = HERO_POOL[rarity]
         
         # Check for featured hero
-        if rarity == 5 and banner.get("featured"):
-            featured_rate = banner.get("featured_rate_up", 50)
-            if random.random() * 100 < featured_rate:
-                hero_id = banner["featured"]
+        if rarity == 5 and table.featured:
+            if random.random() * 100 < table.featured_rate:
+                hero_id = table.featured
             else:
                 hero_id = random.choice(hero_pool)
         else:
@@ -273,7 +335,7 @@ class GachaService:
             "hero_id": hero_id,
             "rarity": rarity,
             "is_new": True,  # Would check against existing heroes
-            "is_featured": hero_id == banner.get("featured")
+            "is_featured": hero_id == table.featured
         }
     
     def _get_pity_counter(self, player_id: str, banner_id: str) -> int:
@@ -0,0 +1,202 @@
+"""
+Gear Optimizer Service - Best loadouts for a hero from the player's inventory
+"""
+import logging
+from typing import Dict, List, Optional
+
+from app.core.exceptions import ValidationException
+from app.domain.entities.equipment import RARITY_BY_STARS, Equipment, EquipmentType, Rarity
+from app.domain.services.gear_optimizer import SLOTS, GearObjective, GearOptimizer
+from app.domain.static_data import StaticDataRegistry, static_data
+from app.services.hero_service import HeroService
+
+
+logger = logging.getLogger(__name__)
+
+
+class GearOptimizerService:
+    """
+    Service that searches a player's equipment for the best loadouts.
+
+    Candidates are the player's unequipped pieces plus whatever the hero
+    already wears. Template data (base stats, slot, set) comes from the
+    static data registry, so only the equipment rows are loaded.
+    """
+
+    def __init__(
+        self,
+        equipment_repository=None,
+        hero_service: Optional[HeroService] = None,
+        optimizer: Optional[GearOptimizer] = None,
+        registry: Optional[StaticDataRegistry] = None
+    ):
+        """
+        Initialize the gear optimizer service.
+
+        Args:
+            equipment_repository: Optional EquipmentRepository
+            hero_service: Optional HeroService for hero data and base stats
+            optimizer: Optional GearOptimizer
+            registry: Static data registry (defaults to the shared one)
+        """
+        self.equipment_repository = equipment_repository
+        self.hero_service = hero_service or HeroService()
+        self.optimizer = optimizer or GearOptimizer()
+        self.registry = registry or static_data
+
+    async def optimize(
+        self,
+        hero_id: str,
+        player_id: str,
+        weights: Dict[str, float],
+        min_stats: Optional[Dict[str, int]] = None,
+        top_k: int = 3,
+        time_budget_ms: int = 200
+    ) -> dict:
+        """
+        Find the best loadouts for a hero.
+
+        Args:
+            hero_id: The hero ID
+            player_id: The player ID
+            weights: Weight per stat to maximize (e.g. {"atk": 1})
+            min_stats: Minimum final stats (e.g. {"spd": 150})
+            top_k: Number of loadouts to return
+            time_budget_ms: Search time budget in milliseconds
+
+        Returns:
+            Dictionary with the best loadouts and search statistics
+
+        Raises:
+            ValidationException: If the objective is invalid
+            HeroNotFoundException: If hero not found
+        """
+        try:
+            objective = GearObjective(weights=dict(weights), min_stats=dict(min_stats or {}))
+        except ValueError as e:
+            raise ValidationException(str(e))
+
+        hero_data = await self.hero_service.get_hero(hero_id, player_id)
+        base_stats = self.hero_service.get_base_stats(hero_data)
+        inventory = await self._load_inventory(player_id, hero_data)
+
+        result = self.optimizer.optimize(
+            base_stats,
+            inventory,
+            objective,
+            top_k=top_k,
+            time_budget=time_budget_ms / 1000,
+            hero_level=hero_data.get("level", 1)
+        )
+
+        return {
+            "hero_id": hero_id,
+            "loadouts": [loadout.to_dict() for loadout in result.loadouts],
+            "inventory_size": len(inventory),
+            "candidates": result.candidates,
+            "explored": result.explored,
+            "timed_out": result.timed_out,
+            "elapsed_ms": round(result.elapsed * 1000, 2)
+        }
+
+    async def _load_inventory(self, player_id: str, hero_data: dict) -> List[Equipment]:
+        """Load unequipped pieces plus the hero's own pieces as domain entities."""
+        if not self.equipment_repository:
+            return self._mock_inventory()
+
+        rows = await self.equipment_repository.get_unequipped(player_id)
+        equipped_ids = [
+            equipment_id
+            for equipment_id in hero_data.get("equipment", {}).values()
+            if equipment_id
+        ]
+        if equipped_ids:
+            rows += await self.equipment_repository.get_many_for_player(equipped_ids, player_id)
+
+        inventory = []
+        for row in rows:
+            piece = self._to_domain(row)
+            if piece is not None:
+                inventory.append(piece)
+        return inventory
+
+    def _to_domain(self, row) -> Optional[Equipment]:
+        """
+        Convert an equipment row to a domain entity using static template data.
+
+        Returns None for pieces that cannot be worn in a gear slot; an
+        unknown template (registry not loaded or out of date) is logged.
+        """
+        template = self.registry.get_equipment_template(row.template_id)
+        if template is None:
+            logger.warning(
+                "Equipment %s has unknown template %s; skipped by the gear optimizer",
+                row.id, row.template_id
+            )
+            return None
+        if template.equipment_type not in SLOTS:
+            return None
+
+        base = template.base_stats
+        return Equipment(
+            id=str(row.id),
+            name=template.name,
+            equipment_type=EquipmentType(template.equipment_type),
+            rarity=RARITY_BY_STARS.get(template.rarity, Rarity.COMMON),
+            base_hp=base.hp,
+            base_atk=base.atk,
+            base_def=base.def_,
+            base_spd=base.spd,
+            base_crit=base.crit,
+            base_dex=base.dex,
+            bonus_hp=row.bonus_hp or 0,
+            bonus_atk=row.bonus_atk or 0,
+            bonus_def=row.bonus_def or 0,
+            bonus_spd=row.bonus_spd or 0,
+            bonus_crit=row.bonus_crit or 0,
+            bonus_dex=row.bonus_dex or 0,
+            level=row.level or 1,
+            set_id=template.set_id,
+            required_level=template.required_level,
+            is_locked=bool(row.is_locked)
+        )
+
+    def _mock_inventory(self) -> List[Equipment]:
+        """Return mock inventory."""
+        return [
+            Equipment(
+                id="thanh-long-dao-uuid",
+                name="Thanh Long Đao",
+                equipment_type=EquipmentType.WEAPON,
+                rarity=Rarity.LEGENDARY,
+                base_atk=50,
+                base_spd=10,
+                base_crit=5,
+                base_dex=5,
+                set_id="thanh_long"
+            ),
+            Equipment(
+                id="thanh-long-giap-uuid",
+                name="Thanh Long Giáp",
+                equipment_type=EquipmentType.ARMOR,
+                rarity=Rarity.LEGENDARY,
+                base_hp=200,
+                base_def=30,
+                set_id="thanh_long"
+            ),
+            Equipment(
+                id="iron-sword-uuid",
+                name="Thiết Kiếm",
+                equipment_type=EquipmentType.WEAPON,
+                rarity=Rarity.RARE,
+                base_atk=60
+            ),
+            Equipment(
+                id="jade-pendant-uuid",
+                name="Ngọc Bội",
+                equipment_type=EquipmentType.ACCESSORY,
+                rarity=Rarity.EPIC,
+                base_spd=15,
+                base_crit=8
+            )
+        ]
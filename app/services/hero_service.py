@@ -10,6 +10,22 @@ from app.core.exceptions import (
     EquipmentNotFoundException,
     ValidationException
 )
+from app.domain.factories.hero_factory import get_hero_factory
+from app.domain.services.set_bonus_resolver import SetBonusResolver, set_bonus_resolver
+from app.domain.services.stat_calculator import stat_calculator
+from app.domain.value_objects.exp_table import ExpTable
+from app.domain.value_objects.hexagon_stats import POWER_WEIGHTS, STAT_FIELDS, HexagonStats
+
+
+# Hero level curve: 100 + level * 50 EXP to reach the next level
+HERO_EXP_TABLE = ExpTable(lambda level: 100 + level * 50)
+
+# EXP granted per exp book
+EXP_PER_BOOK = 100
+
+# Fallback curve for heroes whose template is unknown
+DEFAULT_BASE_STATS = HexagonStats(hp=1000, atk=100, def_=50, spd=100, crit=10, dex=10)
+DEFAULT_GROWTH_RATES = {"HP": 50, "ATK": 5, "DEF": 3, "SPD": 0, "CRIT": 1, "DEX": 1}
 
 
 class HeroService:
@@ -23,13 +39,24 @@ class HeroService:
     - Awakening
     - Equipment management
     - Skill upgrades
+    
+    The stats stored on a hero (current_*) come from its template,
+    level, ascension and awakening only. Equipped pieces and set
+    bonuses are added when stats are read, from the pieces the hero
+    wears in the database.
+    
+    The leaderboard's power board holds each player's absolute total
+    (see refresh_power); it is recomputed after every change to hero
+    stats or worn equipment, never moved by deltas.
     """
     
     def __init__(
         self,
         hero_repository=None,
         equipment_repository=None,
-        player_service=None
+        player_service=None,
+        leaderboard_service=None,
+        set_resolver: Optional[SetBonusResolver] = None
     ):
         """
         Initialize the hero service.
@@ -38,10 +65,15 @@ class HeroService:
             hero_repository: Optional HeroRepository
             equipment_repository: Optional EquipmentRepository
             player_service: Optional PlayerService for resource management
+            leaderboard_service: Optional LeaderboardService kept in step with hero power
+            set_resolver: Set bonus resolver (defaults to the shared one); its
+                registry provides equipment templates
         """
         self.hero_repository = hero_repository
         self.equipment_repository = equipment_repository
         self.player_service = player_service
+        self.leaderboard_service = leaderboard_service
+        self.set_resolver = set_resolver or set_bonus_resolver
     
     async def get_heroes(
         self,
@@ -54,6 +86,9 @@ class HeroService:
         """
         Get player's heroes with filtering and pagination.
         
+        Stats include equipped pieces and set bonuses, as in
+        get_hero_details (one query loads the pieces of the page).
+        
         Args:
             player_id: The player ID
             page: Page number
@@ -87,8 +122,12 @@ class HeroService:
             heroes = [self._mock_hero()]
             total = 1
         
+        if self.hero_repository:
+            heroes = [self._hero_to_response(hero) for hero in heroes]
+            await self._apply_equipment(heroes, player_id)
+        
         return {
-            "heroes": [self._hero_to_brief(h) for h in heroes] if self.hero_repository else heroes,
+            "heroes": heroes,
             "total": total,
             "page": page,
             "per_page": per_page
@@ -121,6 +160,67 @@ class HeroService:
         # Mock data
         return self._mock_hero()
     
+    async def get_hero_briefs(
+        self,
+        hero_ids: List[str],
+        player_id: str
+    ) -> Dict[str, dict]:
+        """
+        Get brief data for several heroes in one query.
+    
+        Args:
+            hero_ids: The hero IDs
+            player_id: The player ID for ownership verification
+    
+        Returns:
+            Brief hero data keyed by hero ID (missing or foreign IDs are skipped)
+        """
+        if not hero_ids:
+            return {}
+    
+        if self.hero_repository:
+            heroes = await self.hero_repository.get_heroes_for_player(hero_ids, player_id)
+            return {str(hero.id): self._hero_to_brief(hero) for hero in heroes}
+    
+        # Mock data
+        return {hero_id: {**self._mock_hero(), "id": hero_id} for hero_id in hero_ids}
+    
+    async def get_hero_details(
+        self,
+        hero_ids: List[str],
+        player_id: str
+    ) -> Dict[str, dict]:
+        """
+        Get full data for several heroes in one query.
+    
+        Stats include equipped pieces and set bonuses (one more query
+        loads the pieces of all heroes).
+    
+        Args:
+            hero_ids: The hero IDs
+            player_id: The player ID for ownership verification
+    
+        Returns:
+            Hero data keyed by hero ID
+    
+        Raises:
+            HeroNotFoundException: If a hero does not belong to the player
+        """
+        if not hero_ids:
+            return {}
+    
+        if self.hero_repository:
+            heroes = await self.hero_repository.get_heroes_for_player(hero_ids, player_id)
+            details = {str(hero.id): self._hero_to_response(hero) for hero in heroes}
+            for hero_id in hero_ids:
+                if hero_id not in details:
+                    raise HeroNotFoundException(hero_id)
+            await self._apply_equipment(list(details.values()), player_id)
+            return details
+    
+        # Mock data
+        return {hero_id: {**self._mock_hero(), "id": hero_id} for hero_id in hero_ids}
+    
     async def level_up(
         self,
         hero_id: str,
@@ -141,20 +241,12 @@ class HeroService:
         hero_data = await self.get_hero(hero_id, player_id)
         old_level = hero_data.get("level", 1)
         
-        # Calculate total EXP from items
-        total_exp = 0
-        for item in exp_items:
-            # Each exp book gives 100 EXP per quantity
-            total_exp += item.get("quantity", 0) * 100
-        
-        # Simple level up calculation
-        new_level = old_level
-        remaining_exp = hero_data.get("exp", 0) + total_exp
+        # Each exp book gives EXP_PER_BOOK EXP per quantity
+        total_exp = sum(item.get("quantity", 0) for item in exp_items) * EXP_PER_BOOK
         
-        # Level up formula: 100 + level * 50 EXP per level
-        while remaining_exp >= 100 + new_level * 50:
-            remaining_exp -= 100 + new_level * 50
-            new_level += 1
+        new_level, remaining_exp = HERO_EXP_TABLE.apply(
+            old_level, hero_data.get("exp", 0), total_exp
+        )
         
         # Update stats based on new level
         new_stats = self._calculate_stats(hero_data, new_level)
@@ -170,6 +262,7 @@ class HeroService:
                 crit=new_stats["crit"],
                 dex=new_stats["dex"]
             )
+            await self.refresh_power(player_id)
         
         return {
             "hero_id": hero_id,
@@ -179,6 +272,90 @@ class HeroService:
             "stats": new_stats
         }
     
+    async def level_up_bulk(
+        self,
+        player_id: str,
+        hero_ids: List[str],
+        exp_pool: int
+    ) -> dict:
+        """
+        Split an EXP pool evenly across several heroes.
+        
+        Heroes are loaded in one query and written back in one
+        statement. Any remainder of the split goes to the first heroes.
+        
+        Args:
+            player_id: The player ID
+            hero_ids: The hero IDs to level
+            exp_pool: Total EXP to distribute
+            
+        Returns:
+            Dictionary with per-hero results
+            
+        Raises:
+            ValidationException: If no heroes are given or the pool is negative
+            HeroNotFoundException: If a hero does not belong to the player
+        """
+        if not hero_ids:
+            raise ValidationException("No heroes selected")
+        if exp_pool < 0:
+            raise ValidationException("EXP pool cannot be negative")
+        
+        if self.hero_repository:
+            heroes = await self.hero_repository.get_heroes_for_player(hero_ids, player_id)
+            found = {str(h.id): h for h in heroes}
+            hero_states = []
+            for hero_id in hero_ids:
+                if hero_id not in found:
+                    raise HeroNotFoundException(hero_id)
+                hero = found[hero_id]
+                hero_states.append((hero.id, hero.level, hero.exp, hero))
+        else:
+            hero_states = [(hero_id, 1, 0, None) for hero_id in hero_ids]
+        
+        share, remainder = divmod(exp_pool, len(hero_states))
+        results = []
+        updates = []
+        for index, (hero_id, old_level, old_exp, hero) in enumerate(hero_states):
+            amount = share + (1 if index < remainder else 0)
+            new_level, remaining_exp = HERO_EXP_TABLE.apply(old_level, old_exp, amount)
+            hero_data = {
+                "id": str(hero_id),
+                "template_id": getattr(hero, "template_id", None),
+                "ascension_level": getattr(hero, "ascension_level", 0),
+                "awakening_level": getattr(hero, "awakening_level", 0)
+            }
+            new_stats = self._calculate_stats(
+                hero_data, new_level, getattr(hero, "template", None)
+            )
+            
+            updates.append({
+                "id": hero_id,
+                "level": new_level,
+                "exp": remaining_exp,
+                "current_hp": new_stats["hp"],
+                "current_atk": new_stats["atk"],
+                "current_def": new_stats["def_"],
+                "current_spd": new_stats["spd"],
+                "current_crit": new_stats["crit"],
+                "current_dex": new_stats["dex"]
+            })
+            results.append({
+                "hero_id": str(hero_id),
+                "old_level": old_level,
+                "new_level": new_level,
+                "exp": remaining_exp,
+                "exp_gained": amount,
+                "leveled_up": new_level > old_level,
+                "stats": new_stats
+            })
+        
+        if self.hero_repository:
+            await self.hero_repository.bulk_update_levels(updates)
+        await self.refresh_power(player_id)
+        
+        return {"heroes": results, "exp_spent": exp_pool}
+    
     async def ascend(
         self,
         hero_id: str,
@@ -280,7 +457,7 @@ class HeroService:
             slot: Equipment slot (weapon, armor, accessory, relic)
             
         Returns:
-            Dictionary with equip result
+            Dictionary with equip result; new_stats include equipment and set bonuses
         """
         hero_data = await self.get_hero(hero_id, player_id)
         
@@ -298,16 +475,21 @@ class HeroService:
         
         if self.hero_repository:
             await self.hero_repository.update_equipment(hero_id, slot, equipment_id)
+            await self.refresh_power(player_id)
         
-        # Recalculate stats
-        new_stats = self._calculate_stats(hero_data, hero_data.get("level", 1))
+        # Stored stats are unchanged; equipment is applied on read
+        equipped = {
+            **hero_data,
+            "equipment": {**hero_data.get("equipment", {}), slot_key: equipment_id}
+        }
+        await self._apply_equipment([equipped], player_id)
         
         return {
             "hero_id": hero_id,
             "slot": slot,
             "equipped_id": equipment_id,
             "unequipped_id": current_equipment_id,
-            "new_stats": new_stats
+            "new_stats": equipped["stats"]
         }
     
     async def unequip_item(
@@ -334,6 +516,7 @@ class HeroService:
         
         if self.hero_repository:
             await self.hero_repository.update_equipment(hero_id, slot, None)
+            await self.refresh_power(player_id)
         
         return {
             "hero_id": hero_id,
@@ -341,24 +524,136 @@ class HeroService:
             "unequipped_id": current_equipment_id
         }
     
-    def _calculate_stats(self, hero_data: dict, level: int) -> dict:
-        """Calculate hero stats based on level."""
-        # Base stats with level scaling
-        base_hp = 1000 + (level - 1) * 50
-        base_atk = 100 + (level - 1) * 5
-        base_def = 50 + (level - 1) * 3
-        base_spd = 100
-        base_crit = 10 + (level - 1)
-        base_dex = 10 + (level - 1)
+    def _calculate_stats(self, hero_data: dict, level: int, template=None) -> dict:
+        """
+        Calculate the stored hero stats through the shared stat pipeline.
         
-        return {
-            "hp": base_hp,
-            "atk": base_atk,
-            "def_": base_def,
-            "spd": base_spd,
-            "crit": base_crit,
-            "dex": base_dex
-        }
+        Only template, level, ascension and awakening count; equipment
+        and set bonuses are applied on read (see _apply_equipment).
+        
+        Args:
+            hero_data: Hero data (id, template_id, ascension/awakening levels)
+            level: Level to calculate stats for
+            template: Optional HeroTemplate row; falls back to static templates
+            
+        Returns:
+            Dictionary of stats
+        """
+        base, growth_rates = self._get_template_stats(hero_data.get("template_id"), template)
+        stats = stat_calculator.get_stats(
+            hero_data.get("id") or hero_data.get("template_id") or "",
+            base=base,
+            growth_rates=growth_rates,
+            level=level,
+            ascension_level=hero_data.get("ascension_level", 0),
+            awakening_level=hero_data.get("awakening_level", 0)
+        )
+        return {name: getattr(stats, name) for name in STAT_FIELDS}
+    
+    def get_base_stats(self, hero_data: dict) -> HexagonStats:
+        """
+        Get hero stats with nothing equipped.
+        
+        Args:
+            hero_data: Hero data (template_id, level, ascension/awakening levels)
+            
+        Returns:
+            Stats from template, level, ascension and awakening only
+        """
+        base, growth_rates = self._get_template_stats(hero_data.get("template_id"))
+        return stat_calculator.calculate(
+            base,
+            growth_rates,
+            hero_data.get("level", 1),
+            hero_data.get("ascension_level", 0),
+            hero_data.get("awakening_level", 0)
+        )
+    
+    async def _apply_equipment(self, heroes: List[dict], player_id: str) -> None:
+        """
+        Add equipped pieces and set bonuses to hero data stats, in place.
+        
+        The pieces of every hero are loaded in one query; set counts come
+        from those rows, so nothing is tracked between requests.
+        
+        Args:
+            heroes: Hero data with stored "stats" and "equipment" slot IDs
+            player_id: The player ID for ownership verification
+        """
+        equipment_ids = [
+            equipment_id
+            for hero in heroes
+            for equipment_id in hero.get("equipment", {}).values()
+            if equipment_id
+        ]
+        if not equipment_ids or not self.equipment_repository:
+            return
+        
+        rows = await self.equipment_repository.get_many_for_player(equipment_ids, player_id)
+        pieces = {str(row.id): row for row in rows}
+        for hero in heroes:
+            worn = [
+                pieces[str(equipment_id)]
+                for equipment_id in hero.get("equipment", {}).values()
+                if equipment_id and str(equipment_id) in pieces
+            ]
+            hero["stats"] = self._with_equipment(hero["stats"], worn)
+    
+    def _with_equipment(self, stats: dict, pieces: list) -> dict:
+        """Stats dictionary plus the pieces' base and bonus stats and their set bonus."""
+        registry = self.set_resolver.registry
+        total = HexagonStats(**stats)
+        set_ids = []
+        for piece in pieces:
+            template = registry.get_equipment_template(piece.template_id)
+            if template is not None:
+                total = total.add(template.base_stats)
+            total = total.add(HexagonStats(
+                hp=piece.bonus_hp or 0,
+                atk=piece.bonus_atk or 0,
+                def_=piece.bonus_def or 0,
+                spd=piece.bonus_spd or 0,
+                crit=piece.bonus_crit or 0,
+                dex=piece.bonus_dex or 0
+            ))
+            set_ids.append(registry.get_set_id_for_template(piece.template_id))
+        total = total.add(self.set_resolver.resolve(set_ids))
+        return {name: getattr(total, name) for name in STAT_FIELDS}
+    
+    def _get_template_stats(self, template_id: Optional[str], template=None) -> tuple:
+        """Get (base stats, growth rates) from a template row, static data or defaults."""
+        if template is not None:
+            base = HexagonStats(
+                hp=template.base_hp,
+                atk=template.base_atk,
+                def_=template.base_def,
+                spd=template.base_spd,
+                crit=template.base_crit,
+                dex=template.base_dex
+            )
+            growth_rates = {
+                "HP": float(template.growth_hp),
+                "ATK": float(template.growth_atk),
+                "DEF": float(template.growth_def),
+                "SPD": float(template.growth_spd),
+                "CRIT": float(template.growth_crit),
+                "DEX": float(template.growth_dex)
+            }
+            return base, growth_rates
+        
+        static = get_hero_factory().get_template(template_id) if template_id else None
+        if static is not None:
+            base = HexagonStats(
+                hp=static.base_hp,
+                atk=static.base_atk,
+                def_=static.base_def,
+                spd=static.base_spd,
+                crit=static.base_crit,
+                dex=static.base_dex
+            )
+            return base, static.growth_rates
+        
+        return DEFAULT_BASE_STATS, DEFAULT_GROWTH_RATES
     
     def _mock_hero(self) -> dict:
         """Return mock hero data."""
@@ -434,12 +729,43 @@ class HeroService:
     
     def _calculate_power(self, hero) -> int:
         """Calculate hero power rating."""
-        base_power = (
-            hero.current_hp +
-            hero.current_atk * 5 +
-            hero.current_def * 3 +
-            hero.current_spd * 2 +
-            hero.current_crit * 10 +
-            hero.current_dex * 2
+        return sum(
+            getattr(hero, f"current_{name.rstrip('_')}") * weight
+            for name, weight in POWER_WEIGHTS.items()
         )
-        return base_power
+    
+    async def refresh_power(self, player_id: str) -> Optional[int]:
+        """
+        Write the player's absolute power total to the leaderboard.
+        
+        Called after anything that changes hero stats or worn equipment;
+        the total comes from one aggregate query.
+        
+        Args:
+            player_id: The player ID
+            
+        Returns:
+            The player's total power, or None without a repository or leaderboard
+        """
+        if not (self.hero_repository and self.leaderboard_service):
+            return None
+        totals = await self.hero_repository.get_power_totals(player_id)
+        total = totals.get(str(player_id), 0)
+        await self.leaderboard_service.record_power(str(player_id), total)
+        return total
+    
+    async def rebuild_power_board(self) -> int:
+        """
+        Seed the power board with every player's total.
+        
+        Runs one aggregate query over all heroes; used at startup, when
+        an in-process board starts empty, and to repair a drifted board.
+        
+        Returns:
+            Number of players written (0 without a repository or leaderboard)
+        """
+        if not (self.hero_repository and self.leaderboard_service):
+            return 0
+        totals = await self.hero_repository.get_power_totals()
+        await self.leaderboard_service.load_power(totals)
+        return len(totals)
@@ -0,0 +1,176 @@
+"""
+Leaderboard Service - Incremental player rankings
+"""
+from typing import Dict, List, Optional
+
+from app.core.exceptions import ValidationException
+from app.repositories.leaderboard_repository import InMemoryLeaderboardRepository
+
+
+# Board names
+BOARD_LEVEL = "level"
+BOARD_POWER = "power"
+BOARD_STARS = "stars"
+BOARD_WINS = "wins"
+
+LEADERBOARDS = (BOARD_LEVEL, BOARD_POWER, BOARD_STARS, BOARD_WINS)
+
+
+class LeaderboardService:
+    """
+    Service for player leaderboards.
+
+    Boards are sorted sets updated by the services that change the
+    ranked values (player level, total hero power, story stars and
+    battle wins), so reads never scan or sort the players table:
+    rank, neighbours and pages are all O(log n) lookups.
+
+    Level, power and stars can be rebuilt from the database (see the
+    leaderboards warm-up step). Wins cannot: they are counted from
+    battle results, which only live in the battle store, so an
+    in-process wins board starts empty on every restart.
+
+    Ranks returned by this service are 1-based.
+    """
+
+    MAX_PER_PAGE = 100
+    MAX_RADIUS = 25
+
+    def __init__(self, repository=None):
+        """
+        Initialize the leaderboard service.
+
+        Args:
+            repository: Optional leaderboard store (defaults to in-memory)
+        """
+        self.repository = repository or InMemoryLeaderboardRepository()
+
+    # Updates
+
+    async def record_level(self, player_id: str, level: int) -> None:
+        """Set a player's level."""
+        await self.repository.set_score(BOARD_LEVEL, player_id, level)
+
+    async def record_power(self, player_id: str, total: int) -> None:
+        """Set a player's total hero power."""
+        await self.repository.set_score(BOARD_POWER, player_id, total)
+
+    async def load_power(self, totals: Dict[str, int]) -> None:
+        """Set many players' total hero power at once (board rebuilds)."""
+        await self.repository.set_scores(BOARD_POWER, totals)
+
+    async def load_levels(self, levels: Dict[str, int]) -> None:
+        """Set many players' levels at once (board rebuilds)."""
+        await self.repository.set_scores(BOARD_LEVEL, levels)
+
+    async def record_stars(self, player_id: str, stars: int) -> None:
+        """Set a player's total story stars."""
+        await self.repository.set_score(BOARD_STARS, player_id, stars)
+
+    async def load_stars(self, stars: Dict[str, int]) -> None:
+        """Set many players' total story stars at once (board rebuilds)."""
+        await self.repository.set_scores(BOARD_STARS, stars)
+
+    async def record_win(self, player_id: str) -> int:
+        """Count a battle win and return the player's total wins."""
+        return await self.repository.increment(BOARD_WINS, player_id, 1)
+
+    # Queries
+
+    async def get_top(self, board: str, page: int = 1, per_page: int = 20) -> dict:
+        """
+        Get one page of a board, highest score first.
+
+        Args:
+            board: Board name
+            page: 1-based page number
+            per_page: Entries per page (capped at MAX_PER_PAGE)
+
+        Returns:
+            Dictionary with the page entries and the board size
+
+        Raises:
+            ValidationException: If the board is unknown
+        """
+        self._check_board(board)
+        page = max(page, 1)
+        per_page = max(1, min(per_page, self.MAX_PER_PAGE))
+        start = (page - 1) * per_page
+
+        rows = await self.repository.get_range(board, start, start + per_page - 1)
+        return {
+            "board": board,
+            "page": page,
+            "per_page": per_page,
+            "total": await self.repository.count(board),
+            "entries": self._to_entries(rows, start)
+        }
+
+    async def get_rank(self, board: str, player_id: str) -> Optional[dict]:
+        """
+        Get a player's rank and score on a board.
+
+        Args:
+            board: Board name
+            player_id: The player ID
+
+        Returns:
+            Entry dictionary, or None if the player is not ranked
+
+        Raises:
+            ValidationException: If the board is unknown
+        """
+        self._check_board(board)
+        rank = await self.repository.get_rank(board, player_id)
+        if rank is None:
+            return None
+        return {
+            "rank": rank + 1,
+            "player_id": player_id,
+            "score": await self.repository.get_score(board, player_id)
+        }
+
+    async def get_around(self, board: str, player_id: str, radius: int = 5) -> List[dict]:
+        """
+        Get the players ranked just above and below a player.
+
+        Args:
+            board: Board name
+            player_id: The player ID
+            radius: Entries on each side (capped at MAX_RADIUS)
+
+        Returns:
+            Entries around the player (including the player), or an
+            empty list if the player is not ranked
+
+        Raises:
+            ValidationException: If the board is unknown
+        """
+        self._check_board(board)
+        rank = await self.repository.get_rank(board, player_id)
+        if rank is None:
+            return []
+
+        radius = max(0, min(radius, self.MAX_RADIUS))
+        start = max(rank - radius, 0)
+        rows = await self.repository.get_range(board, start, rank + radius)
+        return self._to_entries(rows, start)
+
+    # Internals
+
+    @staticmethod
+    def _check_board(board: str) -> None:
+        """Reject unknown board names."""
+        if board not in LEADERBOARDS:
+            raise ValidationException(
+                f"Unknown leaderboard: {board}",
+                details={"boards": list(LEADERBOARDS)}
+            )
+
+    @staticmethod
+    def _to_entries(rows, start: int) -> List[dict]:
+        """Number (player_id, score) rows from a 0-based start rank."""
+        return [
+            {"rank": start + offset + 1, "player_id": player_id, "score": score}
+            for offset, (player_id, score) in enumerate(rows)
+        ]
@@ -23,7 +23,13 @@ class PlayerService:
     - Inventory
     """
     
-    def __init__(self, player_repository=None, hero_repository=None, equipment_repository=None):
+    def __init__(
+        self,
+        player_repository=None,
+        hero_repository=None,
+        equipment_repository=None,
+        leaderboard_service=None
+    ):
         """
         Initialize the player service.
         
@@ -31,10 +37,12 @@ class PlayerService:
             player_repository: Optional PlayerRepository
             hero_repository: Optional HeroRepository
             equipment_repository: Optional EquipmentRepository
+            leaderboard_service: Optional LeaderboardService kept in step with levels
         """
         self.player_repository = player_repository
         self.hero_repository = hero_repository
         self.equipment_repository = equipment_repository
+        self.leaderboard_service = leaderboard_service
     
     async def get_player(self, player_id: str) -> dict:
         """
@@ -187,6 +195,32 @@ class PlayerService:
         
         return await self.get_resources(player_id)
     
+    async def spend_gold(self, player_id: str, gold: int) -> int:
+        """
+        Spend gold with a single atomic debit.
+        
+        Args:
+            player_id: The player ID
+            gold: Gold to spend
+            
+        Returns:
+            Remaining gold
+            
+        Raises:
+            InsufficientGoldException: If not enough gold
+        """
+        if self.player_repository:
+            remaining = await self.player_repository.spend_gold(player_id, gold)
+            if remaining is not None:
+                return remaining
+            player_data = await self.get_player(player_id)
+            raise InsufficientGoldException(required=gold, available=player_data["gold"])
+        
+        player_data = await self.get_player(player_id)
+        if player_data["gold"] < gold:
+            raise InsufficientGoldException(required=gold, available=player_data["gold"])
+        return player_data["gold"] - gold
+    
     async def add_resources(
         self,
         player_id: str,
@@ -239,6 +273,9 @@ class PlayerService:
         
         updated_data = await self.get_player(player_id)
         
+        if self.leaderboard_service and updated_data["level"] != old_level:
+            await self.leaderboard_service.record_level(player_id, updated_data["level"])
+        
         return {
             "old_level": old_level,
             "new_level": updated_data["level"],
@@ -246,6 +283,19 @@ class PlayerService:
             "current_exp": updated_data["exp"]
         }
     
+    async def rebuild_level_board(self) -> int:
+        """
+        Seed the level board with every player's level.
+        
+        Returns:
+            Number of players written (0 without a repository or leaderboard)
+        """
+        if not (self.player_repository and self.leaderboard_service):
+            return 0
+        levels = await self.player_repository.get_levels()
+        await self.leaderboard_service.load_levels(levels)
+        return len(levels)
+    
     async def get_stats(self, player_id: str) -> dict:
         """
         Get player statistics.
@@ -1,13 +1,25 @@
 """
 Story Service - Business logic for story and stages
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, List
+from uuid import uuid4
 
+from app.domain.entities.enemy import Enemy
+from app.domain.entities.story_progress import StoryProgress
+from app.domain.static_data import StaticDataRegistry, StoryLayout, static_data
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
 from app.core.exceptions import (
     StageNotFoundException,
     InsufficientStaminaException,
     ValidationException
 )
+from app.utils.cache import (
+    CACHE_TAG_STORY_CHAPTERS,
+    invalidate_cached_responses,
+    player_tag
+)
 
 
 # Story data (would be in database)
@@ -73,6 +85,59 @@ CHAPTERS = [
 ]
 
 
+# Enemy templates (would be in database)
+ENEMY_TEMPLATES = {
+    "hoang_can_binh": {
+        "name": "Hoàng Cân Binh",
+        "element": "MOC",
+        "stats": {"hp": 500, "atk": 60, "def_": 30, "spd": 90, "crit": 5, "dex": 5},
+        "exp_reward": 20,
+        "gold_reward": 50
+    },
+    "hoang_can_cung_thu": {
+        "name": "Hoàng Cân Cung Thủ",
+        "element": "HOA",
+        "stats": {"hp": 400, "atk": 75, "def_": 20, "spd": 105, "crit": 10, "dex": 10},
+        "exp_reward": 25,
+        "gold_reward": 60
+    },
+    "truong_giac": {
+        "name": "Trương Giác",
+        "element": "THO",
+        "stats": {"hp": 2000, "atk": 120, "def_": 60, "spd": 100, "crit": 15, "dex": 15},
+        "exp_reward": 150,
+        "gold_reward": 400
+    },
+    "tay_luong_ky_binh": {
+        "name": "Tây Lương Kỵ Binh",
+        "element": "KIM",
+        "stats": {"hp": 700, "atk": 90, "def_": 45, "spd": 110, "crit": 10, "dex": 10},
+        "exp_reward": 40,
+        "gold_reward": 90
+    }
+}
+
+# Stage enemy lineups: (template_id, x, y) on the enemy grid
+STAGE_ENEMIES = {
+    "stage_1_1": [("hoang_can_binh", 0, 1), ("hoang_can_binh", 1, 1)],
+    "stage_1_2": [
+        ("hoang_can_binh", 0, 0),
+        ("hoang_can_binh", 0, 2),
+        ("hoang_can_cung_thu", 2, 1)
+    ],
+    "stage_1_3": [
+        ("truong_giac", 1, 1),
+        ("hoang_can_binh", 0, 0),
+        ("hoang_can_binh", 0, 2)
+    ],
+    "stage_2_1": [
+        ("tay_luong_ky_binh", 0, 1),
+        ("hoang_can_cung_thu", 2, 0),
+        ("hoang_can_cung_thu", 2, 2)
+    ]
+}
+
+
 class StoryService:
     """
     Service for story and stage operations.
@@ -83,18 +148,31 @@ class StoryService:
     - Rewards
     """
     
-    def __init__(self, player_service=None, battle_service=None):
+    def __init__(
+        self,
+        player_service=None,
+        battle_service=None,
+        player_repository=None,
+        registry: Optional[StaticDataRegistry] = None,
+        leaderboard_service=None
+    ):
         """
         Initialize the story service.
         
         Args:
             player_service: Optional PlayerService
             battle_service: Optional BattleService
+            player_repository: Optional PlayerRepository for saved progress
+            registry: Static data registry (defaults to the shared one)
+            leaderboard_service: Optional LeaderboardService kept in step with stars
         """
         self.player_service = player_service
         self.battle_service = battle_service
-        # In-memory progress tracking (would be in database in production)
-        self._player_progress: Dict[str, Dict[str, Any]] = {}
+        self.player_repository = player_repository
+        self.registry = registry or static_data
+        self.leaderboard_service = leaderboard_service
+        # In-memory progress when there is no repository
+        self._player_progress: Dict[str, StoryProgress] = {}
     
     async def get_chapters(self, player_id: str) -> List[dict]:
         """
@@ -106,19 +184,19 @@ class StoryService:
         Returns:
             List of chapters with unlock status
         """
-        progress = self._get_player_progress(player_id)
+        progress = await self._get_player_progress(player_id)
         
         chapters = []
-        for chapter in CHAPTERS:
+        for index, chapter in enumerate(CHAPTERS):
             chapter_info = {
                 "id": chapter["id"],
                 "chapter_number": chapter["chapter_number"],
                 "title": chapter["title"],
                 "description": chapter["description"],
                 "is_mythical": chapter["is_mythical"],
-                "is_unlocked": self._is_chapter_unlocked(player_id, chapter),
+                "is_unlocked": progress.is_chapter_unlocked(index),
                 "stage_count": len(chapter["stages"]),
-                "stages_cleared": progress.get("chapters", {}).get(chapter["id"], {}).get("cleared", 0)
+                "stages_cleared": progress.get_chapter_cleared(index)
             }
             chapters.append(chapter_info)
         
@@ -139,16 +217,17 @@ class StoryService:
         if not chapter:
             raise ValidationException(f"Chapter '{chapter_id}' not found")
         
-        progress = self._get_player_progress(player_id)
-        chapter_progress = progress.get("chapters", {}).get(chapter_id, {})
+        progress = await self._get_player_progress(player_id)
+        ordinals = progress.layout.stage_ordinals
         
         stages = []
         for stage in chapter["stages"]:
+            ordinal = ordinals[stage["id"]]
             stage_info = {
                 **stage,
-                "is_unlocked": self._is_stage_unlocked(player_id, chapter_id, stage),
-                "stars": chapter_progress.get("stages", {}).get(stage["id"], {}).get("stars", 0),
-                "cleared": stage["id"] in chapter_progress.get("cleared_stages", [])
+                "is_unlocked": progress.is_stage_unlocked(ordinal),
+                "stars": progress.get_stars(ordinal),
+                "cleared": progress.is_cleared(ordinal)
             }
             stages.append(stage_info)
         
@@ -194,6 +273,50 @@ class StoryService:
         
         raise StageNotFoundException(stage_id)
     
+    async def get_stage_enemies(self, stage_id: str) -> List[Enemy]:
+        """
+        Build the enemy team for a stage.
+        
+        Template stats are scaled by stage difficulty.
+        
+        Args:
+            stage_id: The stage ID
+            
+        Returns:
+            List of enemies ready for battle
+            
+        Raises:
+            StageNotFoundException: If stage not found
+        """
+        stage = await self.get_stage(stage_id)
+        multiplier = 1 + (stage["difficulty"] - 1) * 0.25
+        
+        enemies = []
+        for template_id, x, y in STAGE_ENEMIES.get(stage_id, []):
+            template = ENEMY_TEMPLATES[template_id]
+            stats = HexagonStats(**template["stats"])
+            enemies.append(Enemy(
+                id=str(uuid4()),
+                name=template["name"],
+                element=Element[template["element"]],
+                position=GridPosition(x, y),
+                stats=HexagonStats(
+                    hp=int(stats.hp * multiplier),
+                    atk=int(stats.atk * multiplier),
+                    def_=int(stats.def_ * multiplier),
+                    spd=stats.spd,
+                    crit=stats.crit,
+                    dex=stats.dex
+                ),
+                max_mana=50,
+                template_id=template_id,
+                difficulty=stage["difficulty"],
+                exp_reward=template["exp_reward"] * stage["difficulty"],
+                gold_reward=template["gold_reward"] * stage["difficulty"]
+            ))
+        
+        return enemies
+    
     async def start_stage(
         self,
         player_id: str,
@@ -245,29 +368,18 @@ class StoryService:
         Returns:
             Progress information
         """
-        progress = self._get_player_progress(player_id)
-        
-        total_stages = sum(len(c["stages"]) for c in CHAPTERS)
-        cleared_stages = sum(
-            len(cp.get("cleared_stages", []))
-            for cp in progress.get("chapters", {}).values()
-        )
-        
-        total_stars = sum(
-            sum(s.get("stars", 0) for s in cp.get("stages", {}).values())
-            for cp in progress.get("chapters", {}).values()
-        )
-        max_stars = total_stages * 3
+        progress = await self._get_player_progress(player_id)
+        layout = progress.layout
         
         return {
             "player_id": player_id,
-            "chapters_cleared": progress.get("chapters_cleared", 0),
-            "total_chapters": len(CHAPTERS),
-            "stages_cleared": cleared_stages,
-            "total_stages": total_stages,
-            "stars_earned": total_stars,
-            "max_stars": max_stars,
-            "current_chapter": progress.get("current_chapter", "chapter_1")
+            "chapters_cleared": progress.chapters_cleared,
+            "total_chapters": len(layout.chapter_ids),
+            "stages_cleared": progress.stages_cleared,
+            "total_stages": layout.total_stages,
+            "stars_earned": progress.stars_earned,
+            "max_stars": layout.total_stages * 3,
+            "current_chapter": layout.chapter_ids[progress.current_chapter]
         }
     
     async def complete_stage(
@@ -288,26 +400,18 @@ class StoryService:
             Rewards and progress update
         """
         stage = await self.get_stage(stage_id)
-        progress = self._get_player_progress(player_id)
+        progress = await self._get_player_progress(player_id)
         
-        chapter_id = stage["chapter_id"]
-        if chapter_id not in progress.get("chapters", {}):
-            progress.setdefault("chapters", {})[chapter_id] = {
-                "cleared_stages": [],
-                "stages": {}
-            }
+        # Record the clear, keeping the best stars
+        stars_before = progress.stars_earned
+        first_clear = progress.record(progress.layout.stage_ordinals[stage_id], stars)
+        await self._save_player_progress(player_id, progress)
         
-        chapter_progress = progress["chapters"][chapter_id]
-        first_clear = stage_id not in chapter_progress["cleared_stages"]
+        if self.leaderboard_service and progress.stars_earned != stars_before:
+            await self.leaderboard_service.record_stars(player_id, progress.stars_earned)
         
-        # Update progress
-        if first_clear:
-            chapter_progress["cleared_stages"].append(stage_id)
-        
-        # Update stars if better
-        current_stars = chapter_progress.get("stages", {}).get(stage_id, {}).get("stars", 0)
-        if stars > current_stars:
-            chapter_progress.setdefault("stages", {})[stage_id] = {"stars": stars}
+        # Chapter listings include this player's progress
+        invalidate_cached_responses(player_tag(CACHE_TAG_STORY_CHAPTERS, player_id))
         
         # Calculate rewards
         if first_clear:
@@ -331,15 +435,64 @@ class StoryService:
             "rewards": rewards
         }
     
-    def _get_player_progress(self, player_id: str) -> Dict[str, Any]:
-        """Get or initialize player progress."""
-        if player_id not in self._player_progress:
-            self._player_progress[player_id] = {
-                "chapters": {},
-                "chapters_cleared": 0,
-                "current_chapter": "chapter_1"
-            }
-        return self._player_progress[player_id]
+    async def rebuild_stars_board(self) -> int:
+        """
+        Seed the stars board from every player's saved progress.
+        
+        Returns:
+            Number of players written (0 without a repository or leaderboard)
+        """
+        if not (self.player_repository and self.leaderboard_service):
+            return 0
+        layout = self._get_layout()
+        saved = await self.player_repository.get_all_story_progress()
+        stars = {
+            player_id: StoryProgress.from_bytes(layout, data).stars_earned
+            for player_id, data in saved.items()
+        }
+        await self.leaderboard_service.load_stars(stars)
+        return len(stars)
+    
+    async def reload_chapters(self, chapters: List[dict]) -> None:
+        """
+        Replace chapter data (e.g. after a content update).
+        
+        Args:
+            chapters: New chapter definitions
+        """
+        CHAPTERS[:] = chapters
+        self.registry.load_story_chapters(chapters)
+        invalidate_cached_responses(CACHE_TAG_STORY_CHAPTERS)
+    
+    async def _get_player_progress(self, player_id: str) -> StoryProgress:
+        """Load player progress (created empty for new players)."""
+        layout = self._get_layout()
+        if self.player_repository:
+            data = await self.player_repository.get_story_progress(player_id)
+            return StoryProgress.from_bytes(layout, data)
+        
+        progress = self._player_progress.get(player_id)
+        if progress is None:
+            progress = StoryProgress(layout)
+            self._player_progress[player_id] = progress
+        elif progress.layout is not layout:
+            # Chapters were reloaded: move progress to the new ordinals
+            progress = progress.relayout(layout)
+            self._player_progress[player_id] = progress
+        return progress
+    
+    async def _save_player_progress(self, player_id: str, progress: StoryProgress) -> None:
+        """Persist player progress as one binary value."""
+        if self.player_repository:
+            await self.player_repository.save_story_progress(player_id, progress.to_bytes())
+    
+    def _get_layout(self) -> StoryLayout:
+        """Current stage ordinals."""
+        layout = self.registry.get_story_layout()
+        if layout is None:
+            self.registry.load_story_chapters(CHAPTERS)
+            layout = self.registry.get_story_layout()
+        return layout
     
     def _find_chapter(self, chapter_id: str) -> Optional[dict]:
         """Find chapter by ID."""
@@ -347,36 +500,3 @@ class StoryService:
             if chapter["id"] == chapter_id:
                 return chapter
         return None
-    
-    def _is_chapter_unlocked(self, player_id: str, chapter: dict) -> bool:
-        """Check if chapter is unlocked for player."""
-        if chapter["chapter_number"] == 1:
-            return True
-        
-        # Previous chapter must be cleared
-        prev_chapter = CHAPTERS[chapter["chapter_number"] - 2]
-        progress = self._get_player_progress(player_id)
-        prev_progress = progress.get("chapters", {}).get(prev_chapter["id"], {})
-        
-        return len(prev_progress.get("cleared_stages", [])) >= len(prev_chapter["stages"])
-    
-    def _is_stage_unlocked(
-        self,
-        player_id: str,
-        chapter_id: str,
-        stage: dict
-    ) -> bool:
-        """Check if stage is unlocked for player."""
-        if stage["stage_number"] == 1:
-            # First stage in chapter, check if chapter is unlocked
-            chapter = self._find_chapter(chapter_id)
-            return self._is_chapter_unlocked(player_id, chapter)
-        
-        # Previous stage must be cleared
-        progress = self._get_player_progress(player_id)
-        chapter_progress = progress.get("chapters", {}).get(chapter_id, {})
-        
-        chapter = self._find_chapter(chapter_id)
-        prev_stage = chapter["stages"][stage["stage_number"] - 2]
-        
-        return prev_stage["id"] in chapter_progress.get("cleared_stages", [])
@@ -0,0 +1,220 @@
+"""
+Team Builder Service - Best team for a stage from the player's roster
+"""
+import copy
+from typing import Any, Dict, List, Optional
+
+from app.domain.entities.battle import BattleResult
+from app.domain.entities.enemy import Enemy
+from app.domain.entities.hero import Hero
+from app.domain.entities.team import Formation, FormationBonus
+from app.domain.factories.hero_factory import get_hero_factory
+from app.domain.services.team_builder import TeamBuilder, TeamCandidate
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+from app.services.battle_service import BattleService
+from app.services.story_service import StoryService
+from app.services.team_service import TeamService
+
+
+# Largest roster loaded for a search
+MAX_ROSTER_SIZE = 1000
+
+# Turn cap for validation battles
+SIMULATION_MAX_TURNS = 200
+
+
+class TeamBuilderService:
+    """
+    Service that suggests the best teams for a stage.
+
+    Handles:
+    - Loading the roster, stage enemies and formations
+    - Beam search over hero subsets, placements and formations
+    - Optional validation of the top teams with auto-battles
+    """
+
+    def __init__(
+        self,
+        hero_repository=None,
+        team_service: Optional[TeamService] = None,
+        story_service: Optional[StoryService] = None,
+        battle_service: Optional[BattleService] = None,
+        builder: Optional[TeamBuilder] = None
+    ):
+        """
+        Initialize the team builder service.
+
+        Args:
+            hero_repository: Optional HeroRepository
+            team_service: Optional TeamService for formations
+            story_service: Optional StoryService for stage enemies
+            battle_service: Optional BattleService for validation battles
+            builder: Optional TeamBuilder
+        """
+        self.hero_repository = hero_repository
+        self.team_service = team_service or TeamService()
+        self.story_service = story_service or StoryService()
+        self.battle_service = battle_service or BattleService()
+        self.builder = builder or TeamBuilder()
+
+    async def build_team(
+        self,
+        player_id: str,
+        stage_id: str,
+        top_k: int = 3,
+        time_budget_ms: int = 300,
+        simulate: int = 0
+    ) -> dict:
+        """
+        Find the best teams for a stage.
+
+        Args:
+            player_id: The player ID
+            stage_id: The target stage ID
+            top_k: Number of teams to return
+            time_budget_ms: Search time budget in milliseconds
+            simulate: Number of top teams to validate with an auto-battle
+
+        Returns:
+            Dictionary with the suggested teams and search statistics
+
+        Raises:
+            StageNotFoundException: If stage not found
+        """
+        enemies = await self.story_service.get_stage_enemies(stage_id)
+        formations = [self._to_formation(data) for data in await self.team_service.get_formations()]
+        roster = await self._load_roster(player_id)
+
+        result = self.builder.build(
+            roster,
+            [enemy.element for enemy in enemies],
+            formations,
+            top_k=top_k,
+            time_budget=time_budget_ms / 1000
+        )
+
+        teams = [self._team_to_dict(team) for team in result.teams]
+        for team, candidate in zip(teams[:simulate], result.teams):
+            team["simulation"] = self._simulate(player_id, stage_id, candidate, enemies)
+        if simulate:
+            # Validated wins first, then search score
+            teams.sort(key=lambda team: (
+                bool(team["simulation"] and team["simulation"]["victory"]),
+                team["score"]
+            ), reverse=True)
+
+        return {
+            "stage_id": stage_id,
+            "teams": teams,
+            "roster_size": len(roster),
+            "candidates": result.candidates,
+            "explored": result.explored,
+            "timed_out": result.timed_out,
+            "elapsed_ms": round(result.elapsed * 1000, 2)
+        }
+
+    def _simulate(
+        self,
+        player_id: str,
+        stage_id: str,
+        candidate: TeamCandidate,
+        enemies: List[Enemy]
+    ) -> Dict[str, Any]:
+        """Auto-battle a team against fresh copies of the stage enemies."""
+        heroes = []
+        for hero, position in candidate.members:
+            fighter = copy.deepcopy(hero)
+            fighter.position = position
+            fighter.current_hp = fighter.stats.hp
+            fighter.current_mana = 0
+            heroes.append(fighter)
+
+        battle = self.battle_service.start_battle(
+            player_id, stage_id, heroes, copy.deepcopy(enemies)
+        )
+        turns = self.battle_service.auto_battle(battle, SIMULATION_MAX_TURNS)
+
+        result = battle.check_battle_end()
+        return {
+            "victory": result == BattleResult.VICTORY,
+            "turns": turns,
+            "hp_remaining": sum(hero.current_hp for hero in battle.player_team if hero.is_alive)
+        }
+
+    async def _load_roster(self, player_id: str) -> List[Hero]:
+        """Load the player's heroes as domain entities."""
+        if not self.hero_repository:
+            return self._mock_roster()
+
+        rows = await self.hero_repository.get_by_player(player_id, limit=MAX_ROSTER_SIZE)
+        return [self._to_domain(row) for row in rows]
+
+    def _to_domain(self, hero) -> Hero:
+        """Convert a hero model to a domain hero."""
+        return Hero(
+            id=str(hero.id),
+            name=hero.template.name if hero.template else hero.template_id,
+            element=Element[hero.template.element] if hero.template else Element.KIM,
+            position=GridPosition(0, 0),
+            stats=HexagonStats(
+                hp=hero.current_hp,
+                atk=hero.current_atk,
+                def_=hero.current_def,
+                spd=hero.current_spd,
+                crit=hero.current_crit,
+                dex=hero.current_dex
+            ),
+            template_id=hero.template_id,
+            level=hero.level,
+            stars=hero.stars,
+            ascension_level=hero.ascension_level,
+            awakening_level=hero.awakening_level
+        )
+
+    def _to_formation(self, data: dict) -> Formation:
+        """Convert formation data to a domain formation."""
+        return Formation(
+            id=data["id"],
+            name=data["name"],
+            description=data.get("description", ""),
+            required_elements=data.get("required_elements", 0),
+            required_heroes=data.get("required_heroes", []),
+            min_members=data.get("required_members", 1),
+            bonuses=[
+                FormationBonus(
+                    stat=bonus["stat"],
+                    value=bonus["value"],
+                    bonus_type=bonus.get("bonus_type", "percent")
+                )
+                for bonus in data.get("bonuses", [])
+            ]
+        )
+
+    def _team_to_dict(self, team: TeamCandidate) -> dict:
+        """Convert a candidate team to response data."""
+        return {
+            "formation_id": team.formation.id if team.formation_active else None,
+            "power": team.power,
+            "score": round(team.score, 2),
+            "members": [
+                {
+                    "hero_id": hero.id,
+                    "hero_name": hero.name,
+                    "element": hero.element.name,
+                    "position": {"x": position.x, "y": position.y},
+                    "power": hero.get_total_power()
+                }
+                for hero, position in team.members
+            ],
+            "simulation": None
+        }
+
+    def _mock_roster(self) -> List[Hero]:
+        """Return mock roster: one hero of every template."""
+        factory = get_hero_factory()
+        return [
+            factory.create_hero(template.template_id, GridPosition(0, 0))
+            for template in factory.get_all_templates()
+        ]
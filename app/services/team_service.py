@@ -1,8 +1,8 @@
 """
 Team Service - Business logic for team management
 """
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
-from uuid import uuid4
 
 from app.core.exceptions import (
     TeamNotFoundException,
@@ -10,6 +10,7 @@ from app.core.exceptions import (
     TeamFullException,
     ValidationException
 )
+from app.repositories.memory_team_repository import InMemoryTeamRepository
 
 
 class TeamService:
@@ -20,21 +21,35 @@ class TeamService:
     - Team creation and management
     - Formation management
     - Team composition
+    
+    Teams are stored with compact members ([hero_id, x, y]). Each
+    player's compact records are cached (bounded LRU) and dropped on
+    every write to that player's teams; hero names and power are
+    resolved in one batch lookup on every read, so level-ups and gear
+    changes show up without touching the team cache.
+    
+    The cache lives as long as the service. The API builds one per
+    request, so a request reads its teams once and no worker serves
+    teams another worker has since changed.
     """
     
     MAX_TEAMS_PER_PLAYER = 10
     MAX_MEMBERS_PER_TEAM = 5
     
-    def __init__(self, hero_service=None):
+    def __init__(self, hero_service=None, team_repository=None, max_cached_players: int = 4096):
         """
         Initialize the team service.
         
         Args:
             hero_service: Optional HeroService for hero validation
+            team_repository: Optional team store (defaults to in-memory)
+            max_cached_players: Players whose team records are kept in memory
         """
         self.hero_service = hero_service
-        # In-memory storage (would be in database in production)
-        self._teams: Dict[str, Dict[str, Any]] = {}
+        self.team_repository = team_repository or InMemoryTeamRepository()
+        self.max_cached_players = max_cached_players
+        # player_id -> compact team records
+        self._team_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
     
     async def get_teams(self, player_id: str) -> List[dict]:
         """
@@ -44,23 +59,19 @@ class TeamService:
             player_id: The player ID
             
         Returns:
-            List of team data
+            List of team data ordered by slot number
         """
-        teams = [
-            team for team_id, team in self._teams.items()
-            if team["player_id"] == player_id
-        ]
-        
-        if not teams:
+        records = await self._get_records(player_id)
+        if not records:
             # Create default team
-            default_team = await self.create_team(
+            await self.create_team(
                 player_id,
                 name="Default Team",
                 is_default=True
             )
-            teams = [default_team]
+            records = await self._get_records(player_id)
         
-        return teams
+        return await self._resolve(player_id, records)
     
     async def get_team(self, team_id: str, player_id: str) -> dict:
         """
@@ -76,11 +87,10 @@ class TeamService:
         Raises:
             TeamNotFoundException: If team not found
         """
-        team = self._teams.get(team_id)
-        if not team or team["player_id"] != player_id:
-            raise TeamNotFoundException(team_id)
-        
-        return team
+        for record in await self._get_records(player_id):
+            if record["id"] == team_id:
+                return (await self._resolve(player_id, [record]))[0]
+        raise TeamNotFoundException(team_id)
     
     async def create_team(
         self,
@@ -89,7 +99,7 @@ class TeamService:
         is_default: bool = False
     ) -> dict:
         """
-        Create a new team.
+        Create a new team in the lowest free slot.
         
         Args:
             player_id: The player ID
@@ -100,10 +110,7 @@ class TeamService:
             Created team data
         """
         # Check team limit
-        existing_teams = [
-            t for t in self._teams.values()
-            if t["player_id"] == player_id
-        ]
+        existing_teams = await self.team_repository.get_by_player(player_id)
         if len(existing_teams) >= self.MAX_TEAMS_PER_PLAYER:
             raise ValidationException(
                 f"Maximum number of teams ({self.MAX_TEAMS_PER_PLAYER}) reached"
@@ -111,25 +118,30 @@ class TeamService:
         
         # If setting as default, unset other defaults
         if is_default:
-            for team in existing_teams:
-                team["is_default"] = False
-        
-        team_id = str(uuid4())
-        slot_number = len(existing_teams) + 1
-        
-        team = {
-            "id": team_id,
-            "player_id": player_id,
-            "name": name,
-            "slot_number": slot_number,
-            "members": [],
-            "formation_id": None,
-            "is_default": is_default,
-            "total_power": 0
-        }
-        
-        self._teams[team_id] = team
-        return team
+            await self.team_repository.clear_default(player_id)
+        
+        used_slots = {team["slot_number"] for team in existing_teams}
+        slot_number = next(
+            slot for slot in range(1, self.MAX_TEAMS_PER_PLAYER + 1)
+            if slot not in used_slots
+        )
+        
+        try:
+            record = await self.team_repository.create_team({
+                "player_id": player_id,
+                "name": name,
+                "slot_number": slot_number,
+                "members": [],
+                "formation_id": None,
+                "is_default": is_default
+            })
+        except ValueError as exc:
+            # Another request took the slot first
+            raise ValidationException(str(exc))
+        finally:
+            self._invalidate(player_id)
+        
+        return (await self._resolve(player_id, [record]))[0]
     
     async def update_team(
         self,
@@ -150,10 +162,11 @@ class TeamService:
         Returns:
             Updated team data
         """
-        team = await self.get_team(team_id, player_id)
+        await self.get_team(team_id, player_id)
+        values: Dict[str, Any] = {}
         
         if name is not None:
-            team["name"] = name
+            values["name"] = name
         
         if members is not None:
             if len(members) > self.MAX_MEMBERS_PER_TEAM:
@@ -168,10 +181,9 @@ class TeamService:
                     raise ValidationException("Duplicate position in team")
                 positions.add(pos)
             
-            team["members"] = members
-            team["total_power"] = self._calculate_team_power(members)
+            values["members"] = [self._compact_member(m) for m in members]
         
-        return team
+        return await self._save(team_id, player_id, values)
     
     async def delete_team(self, team_id: str, player_id: str) -> bool:
         """
@@ -189,7 +201,8 @@ class TeamService:
         if team["is_default"]:
             raise ValidationException("Cannot delete default team")
         
-        del self._teams[team_id]
+        await self.team_repository.delete_team(team_id, player_id)
+        self._invalidate(player_id)
         return True
     
     async def add_member(
@@ -228,28 +241,13 @@ class TeamService:
         ):
             raise ValidationException("Position is already occupied")
         
-        # Get hero data
-        hero_data = None
+        # Verify the player owns the hero
         if self.hero_service:
-            hero_data = await self.hero_service.get_hero(hero_id, player_id)
-        else:
-            hero_data = {
-                "id": hero_id,
-                "name": "Test Hero",
-                "power": 1000
-            }
-        
-        member = {
-            "hero_id": hero_id,
-            "hero_name": hero_data.get("name", "Unknown"),
-            "position": position,
-            "power": hero_data.get("power", 0)
-        }
+            await self.hero_service.get_hero(hero_id, player_id)
         
-        team["members"].append(member)
-        team["total_power"] = self._calculate_team_power(team["members"])
-        
-        return team
+        members = [self._compact_member(m) for m in team["members"]]
+        members.append([hero_id, position["x"], position["y"]])
+        return await self._save(team_id, player_id, {"members": members})
     
     async def remove_member(
         self,
@@ -270,13 +268,11 @@ class TeamService:
         """
         team = await self.get_team(team_id, player_id)
         
-        team["members"] = [
-            m for m in team["members"]
+        members = [
+            self._compact_member(m) for m in team["members"]
             if m["hero_id"] != hero_id
         ]
-        team["total_power"] = self._calculate_team_power(team["members"])
-        
-        return team
+        return await self._save(team_id, player_id, {"members": members})
     
     async def update_formation(
         self,
@@ -295,10 +291,8 @@ class TeamService:
         Returns:
             Updated team data
         """
-        team = await self.get_team(team_id, player_id)
-        team["formation_id"] = formation_id
-        
-        return team
+        await self.get_team(team_id, player_id)
+        return await self._save(team_id, player_id, {"formation_id": formation_id})
     
     async def get_formations(self) -> List[dict]:
         """
@@ -313,6 +307,7 @@ class TeamService:
                 "name": "Ngũ Hành Trận",
                 "description": "Requires 5 heroes with all different elements",
                 "required_members": 5,
+                "required_elements": 5,
                 "bonuses": [
                     {"stat": "all", "value": 5, "bonus_type": "percent"},
                     {"stat": "element_power", "value": 20, "bonus_type": "percent"}
@@ -323,6 +318,7 @@ class TeamService:
                 "name": "Long Đằng Hổ Khiếu",
                 "description": "Offensive formation for 3 heroes",
                 "required_members": 3,
+                "required_elements": 0,
                 "bonuses": [
                     {"stat": "atk", "value": 15, "bonus_type": "percent"},
                     {"stat": "spd", "value": 10, "bonus_type": "percent"}
@@ -330,6 +326,67 @@ class TeamService:
             }
         ]
     
+    async def _save(self, team_id: str, player_id: str, values: Dict[str, Any]) -> dict:
+        """Write team changes, drop the player's cached teams and return the team."""
+        if values:
+            await self.team_repository.update_team(team_id, player_id, values)
+            self._invalidate(player_id)
+        return await self.get_team(team_id, player_id)
+    
+    async def _get_records(self, player_id: str) -> List[Dict[str, Any]]:
+        """A player's compact team records, from the cache or the store."""
+        records = self._team_cache.get(player_id)
+        if records is None:
+            records = await self.team_repository.get_by_player(player_id)
+            self._team_cache[player_id] = records
+            while len(self._team_cache) > self.max_cached_players:
+                self._team_cache.popitem(last=False)
+        self._team_cache.move_to_end(player_id)
+        return records
+    
+    def _invalidate(self, player_id: str) -> None:
+        """Drop a player's cached team records."""
+        self._team_cache.pop(player_id, None)
+    
+    async def _resolve(self, player_id: str, records: List[Dict[str, Any]]) -> List[dict]:
+        """Expand compact team records with hero names and power."""
+        hero_ids = list(dict.fromkeys(
+            member[0] for record in records for member in record["members"]
+        ))
+        heroes = await self._get_hero_briefs(hero_ids, player_id)
+        
+        teams = []
+        for record in records:
+            members = []
+            for hero_id, x, y in record["members"]:
+                hero = heroes.get(hero_id, {})
+                members.append({
+                    "hero_id": hero_id,
+                    "hero_name": hero.get("name", "Unknown"),
+                    "position": {"x": x, "y": y},
+                    "power": hero.get("power", 0)
+                })
+            teams.append({
+                **record,
+                "members": members,
+                "total_power": self._calculate_team_power(members)
+            })
+        return teams
+    
+    async def _get_hero_briefs(self, hero_ids: List[str], player_id: str) -> Dict[str, dict]:
+        """Brief hero data keyed by hero ID."""
+        if self.hero_service:
+            return await self.hero_service.get_hero_briefs(hero_ids, player_id)
+        
+        # Mock data
+        return {hero_id: {"name": "Test Hero", "power": 1000} for hero_id in hero_ids}
+    
+    @staticmethod
+    def _compact_member(member: Dict[str, Any]) -> list:
+        """Convert a member to its stored [hero_id, x, y] form."""
+        position = member.get("position", {})
+        return [member["hero_id"], position.get("x", 0), position.get("y", 0)]
+    
     def _calculate_team_power(self, members: List[Dict[str, Any]]) -> int:
         """Calculate total team power."""
         return sum(m.get("power", 0) for m in members)
@@ -0,0 +1,286 @@
+"""
+Battle Frames Utility
+Compact frame schema for the battle WebSocket channel
+
+Frames are small dicts with short keys. A full snapshot is sent on
+connect and on resync; after that only the fields that changed since
+the previous frame are pushed.
+
+Server -> client:
+    full:  {"t": "full", "s": seq, "b": battle_id, "n": turn, "a": actor_id,
+            "p": is_player_turn, "st": state,
+            "c": [[id, name, element, x, y, hp, max_hp, mana, max_mana,
+                   effects, side], ...]}
+    delta: {"t": "delta", "s": seq, "n": turn, "a": actor_id, "p": is_player_turn,
+            "c": {id: {"h": hp, "m": mana, "e": effects}},   # changed fields only
+            "st": state,                                      # only when changed
+            "ev": [action results]}                           # optional
+    error: {"t": "error", "code": error_code, "msg": message}
+
+Client -> server:
+    {"t": "action", "action_type": ..., "target_ids": [...], "skill_id": ...}
+    {"t": "resync"}
+
+Frames are msgpack-encoded binary messages when msgpack is installed
+and the client asks for it, otherwise JSON text messages.
+"""
+import json
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+from app.domain.entities.battle import Battle
+
+
+# Side markers in full snapshot character rows
+SIDE_PLAYER = 0
+SIDE_ENEMY = 1
+
+# Compact keys for per-character delta fields
+DELTA_KEYS = {
+    "current_hp": "h",
+    "current_mana": "m",
+    "status_effects": "e"
+}
+
+
+def capture_battle_state(battle: Battle) -> Dict[str, Dict[str, Any]]:
+    """
+    Capture the mutable state of every character.
+
+    Args:
+        battle: The battle to capture
+
+    Returns:
+        Mapping of character ID to HP, mana and status effects
+    """
+    return {
+        c.id: {
+            "current_hp": c.current_hp,
+            "current_mana": c.current_mana,
+            "status_effects": list(c.status_effects)
+        }
+        for c in battle.player_team + battle.enemy_team
+    }
+
+
+def diff_battle_state(
+    before: Dict[str, Dict[str, Any]],
+    after: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the per-character fields that changed between two captures.
+
+    Args:
+        before: Capture taken before the action
+        after: Capture taken after the action
+
+    Returns:
+        Mapping of character ID to only the changed fields
+    """
+    changes = {}
+    for character_id, state in after.items():
+        previous = before.get(character_id, {})
+        changed = {k: v for k, v in state.items() if previous.get(k) != v}
+        if changed:
+            changes[character_id] = changed
+    return changes
+
+
+class BattleFrameEncoder:
+    """
+    Builds full and delta frames for one connection.
+
+    Keeps the state last sent to the client so each delta only carries
+    what changed since the previous frame.
+    """
+
+    def __init__(self):
+        """Initialize the encoder with no state sent yet."""
+        self.seq = 0
+        self._last_state: Optional[Dict[str, Dict[str, Any]]] = None
+        self._last_battle_state: Optional[str] = None
+
+    def full(self, battle: Battle) -> Dict[str, Any]:
+        """
+        Build a full snapshot frame.
+
+        Args:
+            battle: The battle to snapshot
+
+        Returns:
+            Full frame
+        """
+        self.seq += 1
+        self._last_state = capture_battle_state(battle)
+        self._last_battle_state = battle.state.value
+
+        rows = []
+        for side, team in ((SIDE_PLAYER, battle.player_team), (SIDE_ENEMY, battle.enemy_team)):
+            for c in team:
+                rows.append([
+                    c.id, c.name, c.element.name, c.position.x, c.position.y,
+                    c.current_hp, c.stats.hp, c.current_mana, c.max_mana,
+                    list(c.status_effects), side
+                ])
+
+        return {
+            "t": "full",
+            "s": self.seq,
+            "b": battle.id,
+            **self._turn_fields(battle),
+            "st": battle.state.value,
+            "c": rows
+        }
+
+    def delta(
+        self,
+        battle: Battle,
+        events: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a delta frame against the previously sent state.
+
+        Falls back to a full frame if nothing has been sent yet.
+
+        Args:
+            battle: The battle after the change
+            events: Optional action results to include
+
+        Returns:
+            Delta (or full) frame
+        """
+        if self._last_state is None:
+            return self.full(battle)
+
+        self.seq += 1
+        state = capture_battle_state(battle)
+        changes = {
+            character_id: {DELTA_KEYS[k]: v for k, v in changed.items()}
+            for character_id, changed in diff_battle_state(self._last_state, state).items()
+        }
+        self._last_state = state
+
+        frame = {"t": "delta", "s": self.seq, **self._turn_fields(battle), "c": changes}
+        if battle.state.value != self._last_battle_state:
+            frame["st"] = battle.state.value
+            self._last_battle_state = battle.state.value
+        if events:
+            frame["ev"] = events
+        return frame
+
+    def _turn_fields(self, battle: Battle) -> Dict[str, Any]:
+        """Turn pointer fields shared by full and delta frames."""
+        current = battle.get_current_actor()
+        return {
+            "n": battle.turn_number,
+            "a": current.id if current else None,
+            "p": battle.is_player_turn()
+        }
+
+
+# Action codes used in compact action rows
+ACTION_CODES = {
+    "attack": "a",
+    "skill": "s",
+    "defend": "d",
+    "heal": "h",
+    "pass": "p"
+}
+
+
+def compact_action(action: Dict[str, Any]) -> List[Any]:
+    """
+    Compress an action result into a short row.
+
+    Row layout: [actor_id, code, target_ids, damage, crits, killed_ids]
+
+    Args:
+        action: Action result from BattleService.execute_action
+
+    Returns:
+        Compact action row
+    """
+    if "targets" in action:
+        hits = action["targets"]
+    elif "damage" in action:
+        hits = [{
+            "target_id": action["target_ids"][0],
+            "damage": action["damage"],
+            "is_crit": action["is_crit"],
+            "target_died": action["target_died"]
+        }]
+    else:
+        hits = []
+
+    return [
+        action["actor_id"],
+        ACTION_CODES.get(action["action_type"], action["action_type"]),
+        action.get("target_ids") or [],
+        sum(hit.get("damage", 0) for hit in hits),
+        sum(1 for hit in hits if hit.get("is_crit")),
+        [hit["target_id"] for hit in hits if hit.get("target_died")]
+    ]
+
+
+def error_frame(error_code: str, message: str) -> Dict[str, Any]:
+    """
+    Build an error frame.
+
+    Args:
+        error_code: Application error code
+        message: Human readable message
+
+    Returns:
+        Error frame
+    """
+    return {"t": "error", "code": error_code, "msg": message}
+
+
+def supports_binary() -> bool:
+    """Check whether msgpack is available for binary frames."""
+    return msgpack is not None
+
+
+def encode_frame(frame: Dict[str, Any], binary: bool = False) -> Union[bytes, str]:
+    """
+    Encode a frame for sending.
+
+    Args:
+        frame: The frame to encode
+        binary: Use msgpack if available
+
+    Returns:
+        msgpack bytes, or compact JSON text
+    """
+    if binary and msgpack is not None:
+        return msgpack.packb(frame, use_bin_type=True)
+    return json.dumps(frame, separators=(",", ":"), ensure_ascii=False)
+
+
+def decode_frame(data: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    Decode a received frame.
+
+    Args:
+        data: Binary (msgpack) or text (JSON) message
+
+    Returns:
+        Decoded frame
+
+    Raises:
+        ValueError: If the message cannot be decoded
+    """
+    if isinstance(data, (bytes, bytearray)):
+        if msgpack is None:
+            raise ValueError("Binary frames require msgpack")
+        frame = msgpack.unpackb(data, raw=False)
+    else:
+        frame = json.loads(data)
+
+    if not isinstance(frame, dict) or "t" not in frame:
+        raise ValueError("Frame must be an object with a 't' field")
+    return frame
@@ -0,0 +1,245 @@
+"""
+Response Cache Utility
+In-process cache of serialized responses with TTLs, ETags and tag invalidation
+
+Entries hold the final response bytes, so a hit skips both the
+service call and model validation. Each entry carries tags; services
+call invalidate_cached_responses() with a tag when the underlying data
+changes (e.g. banner swap, chapter data reload).
+
+The cache, and so invalidation, is per worker: a change made through
+one worker drops that worker's entries only, and the others keep
+serving their copies until the TTL runs out. Cached data is static
+data that changes with a deploy (which restarts every worker) or is
+reloaded on every worker; the TTLs bound how stale anything else can
+get.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Iterable, Optional, Tuple
+
+
+# Cache scopes
+SCOPE_GLOBAL = "global"
+SCOPE_PLAYER = "player"
+
+# Invalidation tags
+CACHE_TAG_GACHA_BANNERS = "gacha_banners"
+CACHE_TAG_STORY_CHAPTERS = "story_chapters"
+CACHE_TAG_FORMATIONS = "formations"
+CACHE_TAG_EQUIPMENT_SETS = "equipment_sets"
+CACHE_TAG_EQUIPMENT_TEMPLATES = "equipment_templates"
+CACHE_TAG_HERO_TEMPLATES = "hero_templates"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    A cached, already serialized response.
+
+    Attributes:
+        body: Serialized JSON body
+        etag: Strong ETag for the body
+        expires_at: Clock time when the entry expires
+        tags: Invalidation tags
+    """
+
+    body: bytes
+    etag: str
+    expires_at: float
+    tags: FrozenSet[str]
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong ETag from a response body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        Quoted ETag value
+    """
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses weak comparison as required for If-None-Match.
+
+    Args:
+        if_none_match: Raw header value (may list several ETags)
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def strip_weak(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    current = strip_weak(etag)
+    return any(strip_weak(tag) == current for tag in if_none_match.split(","))
+
+
+def player_tag(tag: str, player_id: str) -> str:
+    """
+    Build the player-specific variant of a tag.
+
+    Args:
+        tag: Base tag
+        player_id: The player ID
+
+    Returns:
+        Tag that only matches that player's entries
+    """
+    return f"{tag}:{player_id}"
+
+
+def build_cache_key(
+    route: str,
+    path: str,
+    query: str = "",
+    player_id: Optional[str] = None
+) -> Tuple[str, str, str, str]:
+    """
+    Build a cache key for a request.
+
+    Args:
+        route: Route identifier
+        path: Request path
+        query: Raw query string
+        player_id: Player ID for player-scoped routes
+
+    Returns:
+        Hashable cache key
+    """
+    normalized_query = "&".join(sorted(query.split("&"))) if query else ""
+    return (route, player_id or "", path, normalized_query)
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of serialized responses.
+
+    Expired entries are dropped lazily on lookup.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            clock: Monotonic clock (overridable for tests)
+        """
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[tuple, CachedResponse]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[CachedResponse]:
+        """
+        Get a live entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached response or None on miss/expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: tuple,
+        body: bytes,
+        ttl: float,
+        tags: Iterable[str] = ()
+    ) -> CachedResponse:
+        """
+        Store a serialized response.
+
+        Args:
+            key: Cache key
+            body: Serialized response body
+            ttl: Time to live in seconds
+            tags: Invalidation tags
+
+        Returns:
+            The stored entry
+        """
+        entry = CachedResponse(
+            body=body,
+            etag=make_etag(body),
+            expires_at=self.clock() + ttl,
+            tags=frozenset(tags)
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def ttl_remaining(self, entry: CachedResponse) -> int:
+        """Whole seconds until an entry expires."""
+        return max(0, int(entry.expires_at - self.clock()))
+
+    def invalidate(self, *tags: str) -> int:
+        """
+        Drop every entry carrying any of the given tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of entries removed
+        """
+        wanted = set(tags)
+        stale = [key for key, entry in self._entries.items() if entry.tags & wanted]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Shared cache for this worker
+response_cache = ResponseCache()
+
+
+def invalidate_cached_responses(*tags: str) -> int:
+    """
+    Invalidation hook for services.
+
+    Args:
+        tags: Tags whose cached responses are stale
+
+    Returns:
+        Number of entries removed
+    """
+    return response_cache.invalidate(*tags)
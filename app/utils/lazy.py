@@ -0,0 +1,44 @@
+"""
+Lazy Imports Utility
+Package re-exports resolved on first use (PEP 562 module __getattr__)
+
+A package __init__ that imports all of its submodules makes importing
+any one of them pay for all the others. With lazy_exports the package
+lists its re-exports by submodule and each submodule is imported the
+first time one of its names is looked up; `from package import Name`
+keeps working unchanged.
+"""
+import importlib
+import sys
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, Sequence[str]]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build __getattr__ and __dir__ for a package with lazy re-exports.
+
+    Args:
+        package: The package's __name__
+        exports: Submodule name (relative to the package) -> names it provides
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package's __init__
+    """
+    owners = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> object:
+        module = owners.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f"{package}.{module}"), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(owners))
+
+    return __getattr__, __dir__
@@ -0,0 +1,368 @@
+"""
+Metrics Utility
+Per-route latency histograms, per-request DB timing and Prometheus output
+
+Histograms use fixed log-spaced buckets (each bound twice the last), so
+recording is one bisect and memory per route is constant. Each request
+gets a RequestTimings in a context variable; the SQLAlchemy hook and the
+endpoint wrapper add to it, and the middleware folds it into the route's
+stats when the response is sent.
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def log_buckets(start: float, factor: float, count: int) -> Tuple[float, ...]:
+    """
+    Build log-spaced bucket upper bounds.
+
+    Args:
+        start: First upper bound
+        factor: Ratio between consecutive bounds
+        count: Number of bounds
+
+    Returns:
+        Tuple of upper bounds
+    """
+    return tuple(start * factor ** index for index in range(count))
+
+
+# 0.5ms .. ~33s
+LATENCY_BUCKETS = log_buckets(0.0005, 2, 17)
+
+# 64B .. 4MB
+SIZE_BUCKETS = log_buckets(64, 4, 9)
+
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """
+    Cumulative-style histogram over fixed bucket bounds.
+
+    Values above the last bound only count towards +Inf.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize the histogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds
+        """
+        self.bounds = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[int]:
+        """Running totals per bound, ending with the +Inf total."""
+        totals = []
+        running = 0
+        for count in self.counts:
+            running += count
+            totals.append(running)
+        return totals
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of its bucket.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Bucket upper bound (the last bound for the +Inf bucket, 0 when empty)
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        for index, running in enumerate(self.cumulative()):
+            if running >= target:
+                return self.bounds[min(index, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+
+@dataclass
+class RouteStats:
+    """
+    Aggregated metrics for one (method, route) pair.
+
+    Attributes:
+        latency: Request duration histogram (seconds)
+        response_size: Response body size histogram (bytes)
+        statuses: Response count per status code
+        db_statements: Total SQL statements run
+        db_seconds: Total time spent in SQL statements
+    """
+
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    response_size: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    statuses: Dict[int, int] = field(default_factory=dict)
+    db_statements: int = 0
+    db_seconds: float = 0.0
+
+
+@dataclass
+class RequestTimings:
+    """
+    Timing breakdown of one request.
+
+    Attributes:
+        started_at: perf_counter value when the request arrived
+        db_statements: SQL statements run so far
+        db_seconds: Time spent in SQL statements
+        endpoint_seconds: Time spent inside the endpoint function
+    """
+
+    started_at: float = field(default_factory=time.perf_counter)
+    db_statements: int = 0
+    db_seconds: float = 0.0
+    endpoint_seconds: float = 0.0
+
+    def breakdown(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Split the elapsed time into db, service and serialization.
+
+        Service is endpoint time not spent in SQL; serialization is
+        everything outside the endpoint (request parsing, dependencies,
+        response validation and encoding).
+
+        Args:
+            now: perf_counter value to measure to (defaults to now)
+
+        Returns:
+            Seconds per part, plus the total
+        """
+        total = (now if now is not None else time.perf_counter()) - self.started_at
+        return {
+            "db": self.db_seconds,
+            "service": max(self.endpoint_seconds - self.db_seconds, 0.0),
+            "serialization": max(total - self.endpoint_seconds, 0.0),
+            "total": total
+        }
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timings() -> RequestTimings:
+    """Begin timing a request in the current context."""
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """Timings of the request being handled, if any."""
+    return _request_timings.get()
+
+
+class MetricsRegistry:
+    """
+    Process-wide request metrics.
+
+    Attributes:
+        routes: Stats per (method, route template)
+        in_flight: Requests currently being handled
+        db_statements: SQL statements run, including outside requests
+        db_seconds: Time spent in SQL statements, including outside requests
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.in_flight = 0
+        self.db_statements = 0
+        self.db_seconds = 0.0
+
+    def record_query(self, seconds: float) -> None:
+        """
+        Record one SQL statement against the registry and current request.
+
+        Args:
+            seconds: Statement duration
+        """
+        self.db_statements += 1
+        self.db_seconds += seconds
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.db_statements += 1
+            timings.db_seconds += seconds
+
+    def record_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        response_bytes: int,
+        timings: Optional[RequestTimings] = None
+    ) -> None:
+        """
+        Record a finished request.
+
+        Args:
+            method: HTTP method
+            route: Route template (not the raw path)
+            status: Response status code
+            seconds: Request duration
+            response_bytes: Response body size
+            timings: The request's timings, for its DB totals
+        """
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.latency.observe(seconds)
+        stats.response_size.observe(response_bytes)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if timings is not None:
+            stats.db_statements += timings.db_statements
+            stats.db_seconds += timings.db_seconds
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        self.__init__()
+
+
+def _escape(value) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    """Render Prometheus labels."""
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _format_bound(bound: float) -> str:
+    """Render a bucket bound without float noise."""
+    return f"{bound:.6g}"
+
+
+def _render_histogram(name: str, histogram: Histogram, labels: str) -> List[str]:
+    """Render one histogram's bucket, sum and count lines."""
+    lines = []
+    cumulative = histogram.cumulative()
+    for bound, total in zip(histogram.bounds, cumulative):
+        lines.append(f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} {total}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative[-1]}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def render_prometheus(registry: "MetricsRegistry") -> str:
+    """
+    Render a registry in the Prometheus text exposition format.
+
+    Args:
+        registry: Metrics to render
+
+    Returns:
+        Exposition text
+    """
+    routes = sorted(registry.routes.items())
+    lines = [
+        "# HELP http_requests_in_flight Requests currently being handled.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {registry.in_flight}",
+        "# HELP http_requests_total Requests handled.",
+        "# TYPE http_requests_total counter"
+    ]
+    for (method, route), stats in routes:
+        for status, count in sorted(stats.statuses.items()):
+            lines.append(
+                f"http_requests_total{{{_labels(method=method, route=route, status=status)}}} {count}"
+            )
+
+    lines += [
+        "# HELP http_request_duration_seconds Request latency.",
+        "# TYPE http_request_duration_seconds histogram"
+    ]
+    for (method, route), stats in routes:
+        lines += _render_histogram(
+            "http_request_duration_seconds", stats.latency, _labels(method=method, route=route)
+        )
+
+    lines += [
+        "# HELP http_response_size_bytes Response body size.",
+        "# TYPE http_response_size_bytes histogram"
+    ]
+    for (method, route), stats in routes:
+        lines += _render_histogram(
+            "http_response_size_bytes", stats.response_size, _labels(method=method, route=route)
+        )
+
+    lines += [
+        "# HELP http_db_statements_total SQL statements run by requests.",
+        "# TYPE http_db_statements_total counter"
+    ]
+    lines += [
+        f"http_db_statements_total{{{_labels(method=method, route=route)}}} {stats.db_statements}"
+        for (method, route), stats in routes
+    ]
+    lines += [
+        "# HELP http_db_seconds_total Time spent in SQL statements by requests.",
+        "# TYPE http_db_seconds_total counter"
+    ]
+    lines += [
+        f"http_db_seconds_total{{{_labels(method=method, route=route)}}} {stats.db_seconds:.6f}"
+        for (method, route), stats in routes
+    ]
+
+    lines += [
+        "# HELP db_statements_total SQL statements run by this process.",
+        "# TYPE db_statements_total counter",
+        f"db_statements_total {registry.db_statements}",
+        "# HELP db_seconds_total Time spent in SQL statements by this process.",
+        "# TYPE db_seconds_total counter",
+        f"db_seconds_total {registry.db_seconds:.6f}"
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def instrument_engine(engine, registry: Optional["MetricsRegistry"] = None) -> None:
+    """
+    Count statements and DB time on a SQLAlchemy engine.
+
+    Args:
+        engine: Engine or AsyncEngine to instrument
+        registry: Registry to record into (defaults to the shared one)
+    """
+    from sqlalchemy import event
+
+    target = getattr(engine, "sync_engine", engine)
+    store = registry or metrics
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        store.record_query(time.perf_counter() - started)
+
+    @event.listens_for(target, "handle_error")
+    def _handle_error(exception_context):
+        connection = exception_context.connection
+        stack = connection.info.get("query_started_at") if connection is not None else None
+        if stack:
+            store.record_query(time.perf_counter() - stack.pop())
+
+
+# Shared registry
+metrics = MetricsRegistry()
@@ -0,0 +1,282 @@
+"""
+Profiling Utility
+Per-request stack sampling and a bounded on-disk profile store
+
+A daemon thread wakes every interval and samples the event loop
+thread's stack with sys._current_frames(). A sample is charged to the
+tracked request whose task is running; every other tracked request on
+that loop gets a "(waiting)" sample (awaiting I/O or the loop) so the
+profile accounts for wall time, not just CPU. The thread blocks while
+no request is tracked.
+
+Profiles are saved as JSON files in a directory holding at most
+max_files (oldest dropped first) and can be rendered as collapsed
+stacks ("frame;frame;frame count" lines) for flamegraph.pl, speedscope
+or inferno.
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+
+# Deepest stack kept per sample (the root-most frames are dropped past it)
+STACK_LIMIT = 128
+
+# Pseudo-frames for time a request spent off the CPU
+WAITING_FRAME = "(waiting)"
+OTHER_TASK_FRAME = "(other task running)"
+
+
+def collapse_stack(frame, limit: int = STACK_LIMIT) -> str:
+    """
+    Render a frame and its callers as a collapsed stack.
+
+    Args:
+        frame: Innermost frame
+        limit: Most frames to keep
+
+    Returns:
+        "module:function;...;module:function", root first
+    """
+    names = []
+    while frame is not None and len(names) < limit:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{getattr(code, 'co_qualname', code.co_name)}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+@dataclass(eq=False)
+class RequestProfile:
+    """
+    Stack samples of one in-flight request.
+
+    Attributes:
+        task: The asyncio task handling the request
+        loop: Its event loop
+        thread_id: Thread running that loop
+        started_at: perf_counter value when tracking began
+        stacks: Sample count per collapsed stack (written by the sampler
+            thread under its lock; read the snapshot untrack() returns)
+    """
+
+    task: Optional[asyncio.Task]
+    loop: asyncio.AbstractEventLoop
+    thread_id: int
+    started_at: float = field(default_factory=time.perf_counter)
+    stacks: Counter = field(default_factory=Counter)
+
+    @property
+    def samples(self) -> int:
+        """Samples taken"""
+        return sum(self.stacks.values())
+
+
+class StackSampler:
+    """
+    Samples the stacks of tracked requests from a background thread.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initialize the sampler (the thread starts on first use).
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self._active: Dict[int, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self) -> RequestProfile:
+        """
+        Start sampling the current task. Call from the event loop thread.
+
+        Returns:
+            The profile samples are added to
+        """
+        profile = RequestProfile(
+            task=asyncio.current_task(),
+            loop=asyncio.get_running_loop(),
+            thread_id=threading.get_ident()
+        )
+        with self._lock:
+            self._active[id(profile)] = profile
+            self._wake.set()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="stack-sampler", daemon=True
+                )
+                self._thread.start()
+        return profile
+
+    def untrack(self, profile: RequestProfile) -> Counter:
+        """
+        Stop sampling a request.
+
+        Returns:
+            Snapshot of the request's stack counts, taken under the lock
+        """
+        with self._lock:
+            self._active.pop(id(profile), None)
+            return Counter(profile.stacks)
+
+    def sample(self) -> None:
+        """Take one sample of every tracked request."""
+        with self._lock:
+            profiles = list(self._active.values())
+        if not profiles:
+            return
+
+        frames = sys._current_frames()
+        running: Dict[int, Optional[asyncio.Task]] = {}
+        hits = []
+        for profile in profiles:
+            loop_key = id(profile.loop)
+            if loop_key not in running:
+                running[loop_key] = asyncio.current_task(profile.loop)
+            current = running[loop_key]
+
+            if current is not None and current is profile.task:
+                frame = frames.get(profile.thread_id)
+                if frame is not None:
+                    hits.append((profile, collapse_stack(frame)))
+            elif current is not None:
+                hits.append((profile, OTHER_TASK_FRAME))
+            else:
+                hits.append((profile, WAITING_FRAME))
+
+        # Requests untracked while the stacks were walked keep their snapshot
+        with self._lock:
+            for profile, stack in hits:
+                if id(profile) in self._active:
+                    profile.stacks[stack] += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._wake.clear()
+            self._wake.wait()
+            time.sleep(self.interval)
+            self.sample()
+
+
+class ProfileStore:
+    """
+    Saved profiles as JSON files in a bounded directory ring.
+    """
+
+    def __init__(self, directory: str, max_files: int = 200):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory for profile files (created if missing)
+            max_files: Profiles kept; the oldest are deleted past this
+        """
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def save(self, record: Dict[str, Any]) -> str:
+        """
+        Save a profile and drop the oldest past max_files.
+
+        Args:
+            record: Metadata plus "stacks" ({collapsed stack: count})
+
+        Returns:
+            The profile ID
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_id = uuid4().hex[:16]
+        record = {"id": profile_id, "captured_at": time.time(), **record}
+
+        path = self.directory / f"{time.time_ns()}-{profile_id}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(record))
+        os.replace(temporary, path)
+        self._prune()
+        return profile_id
+
+    def list(
+        self,
+        limit: Optional[int] = None,
+        route: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Profile metadata, newest first (without stacks).
+
+        Files are read newest first and reading stops at limit.
+
+        Args:
+            limit: Most profiles to return (after route filtering)
+            route: Only profiles of this route template
+        """
+        summaries = []
+        for path in self._files()[::-1]:
+            if limit is not None and len(summaries) >= limit:
+                break
+            record = self._read(path)
+            if record is None or (route is not None and record.get("route") != route):
+                continue
+            record.pop("stacks", None)
+            summaries.append(record)
+        return summaries
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Get a saved profile, or None if it is unknown or was dropped."""
+        if not profile_id.isalnum():
+            return None
+        for path in self.directory.glob(f"*-{profile_id}.json"):
+            return self._read(path)
+        return None
+
+    def _files(self) -> List[Path]:
+        """Profile files, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("*.json"))
+
+    def _prune(self) -> None:
+        """Delete the oldest files past max_files."""
+        files = self._files()
+        for path in files[:max(len(files) - self.max_files, 0)]:
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _read(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+
+def to_collapsed(record: Dict[str, Any]) -> str:
+    """
+    Render a saved profile in the collapsed-stack format.
+
+    Args:
+        record: Profile from ProfileStore.get()
+
+    Returns:
+        One "stack count" line per distinct stack, most samples first
+    """
+    stacks = sorted(record["stacks"].items(), key=lambda item: -item[1])
+    return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+
+# Shared sampler
+sampler = StackSampler()
@@ -0,0 +1,252 @@
+"""
+Query Budget Utility
+Per-request SQL statement tracking, N+1 detection and query budgets
+
+For development and tests. A listener on the engine records every
+statement into the current request's log. Statements are reduced to a
+shape (literals and bind parameters replaced by ?), so the same query
+run for each row of a loop shows up as one shape repeated N times.
+
+Endpoints declare their budget with @query_budget(n). When a request
+finishes, the tracker compares its statement count to the budget,
+flags repeated shapes as N+1 and keeps per-route totals for report().
+"""
+import logging
+import re
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|:\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\([^)]*\)(?:\s*,\s*\([^)]*\))*", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape.
+
+    Args:
+        statement: SQL text
+
+    Returns:
+        Statement with literals, parameters, IN lists and VALUES rows collapsed
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _BIND_PARAMETER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (?)", shape)
+    shape = _VALUES_LIST.sub("VALUES (?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def query_budget(max_queries: int) -> Callable:
+    """
+    Declare the most SQL statements one call of an endpoint may run.
+
+    Args:
+        max_queries: Statement budget per request
+
+    Returns:
+        Decorator that tags the endpoint and returns it unchanged
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+    return decorator
+
+
+def get_query_budget(endpoint: Callable) -> Optional[int]:
+    """Budget declared on an endpoint, if any."""
+    return getattr(endpoint, "__query_budget__", None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request ran more statements than its route's budget (strict mode)."""
+
+
+@dataclass
+class RequestQueries:
+    """
+    Statements run by one request.
+
+    Attributes:
+        shapes: Count per statement shape
+    """
+
+    shapes: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        """Total statements run"""
+        return sum(self.shapes.values())
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """Shapes run at least threshold times."""
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+@dataclass
+class RouteQueryReport:
+    """
+    Query totals for one route across requests.
+
+    Attributes:
+        budget: Budget the route was checked against
+        requests: Requests seen
+        total_statements: Statements across all requests
+        max_statements: Most statements in one request
+        over_budget: Requests that exceeded the budget
+        repeated: Highest repeat count seen per N+1 shape
+    """
+
+    budget: int
+    requests: int = 0
+    total_statements: int = 0
+    max_statements: int = 0
+    over_budget: int = 0
+    repeated: Dict[str, int] = field(default_factory=dict)
+
+
+_request_queries: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "request_queries", default=None
+)
+
+
+class QueryTracker:
+    """
+    Tracks statements per request and checks them against route budgets.
+    """
+
+    def __init__(
+        self,
+        default_budget: int = 20,
+        repeat_threshold: int = 3,
+        strict: bool = False
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            default_budget: Budget for routes that declare none
+            repeat_threshold: Repeats of one shape that count as N+1
+            strict: Raise QueryBudgetExceeded instead of only logging
+        """
+        self.default_budget = default_budget
+        self.repeat_threshold = repeat_threshold
+        self.strict = strict
+        self.routes: Dict[str, RouteQueryReport] = {}
+
+    def start(self) -> RequestQueries:
+        """Start a statement log for the request in the current context."""
+        queries = RequestQueries()
+        _request_queries.set(queries)
+        return queries
+
+    def record(self, statement: str) -> None:
+        """Record a statement against the current request, if any."""
+        queries = _request_queries.get()
+        if queries is not None:
+            queries.shapes[normalize_statement(statement)] += 1
+
+    def finish(self, queries: RequestQueries, route: str, budget: Optional[int] = None) -> List[str]:
+        """
+        Check a finished request and add it to the route's totals.
+
+        Args:
+            queries: The request's statement log
+            route: Route label (e.g. "POST /api/v1/equipment/fuse")
+            budget: Declared budget (defaults to default_budget)
+
+        Returns:
+            Problems found (empty when within budget and no N+1)
+
+        Raises:
+            QueryBudgetExceeded: In strict mode, if the budget was exceeded
+        """
+        _request_queries.set(None)
+        budget = self.default_budget if budget is None else budget
+        count = queries.count
+        repeated = queries.repeated(self.repeat_threshold)
+
+        report = self.routes.get(route)
+        if report is None:
+            report = self.routes[route] = RouteQueryReport(budget=budget)
+        report.requests += 1
+        report.total_statements += count
+        report.max_statements = max(report.max_statements, count)
+        for shape, times in repeated.items():
+            report.repeated[shape] = max(report.repeated.get(shape, 0), times)
+
+        problems = [
+            f"{route}: same query run {times} times (possible N+1): {shape}"
+            for shape, times in repeated.items()
+        ]
+        if count > budget:
+            report.over_budget += 1
+            problems.append(f"{route}: {count} statements, budget is {budget}")
+
+        for problem in problems:
+            logger.warning(problem)
+        if self.strict and count > budget:
+            raise QueryBudgetExceeded(problems[-1])
+        return problems
+
+    def report(self, limit: int = 10) -> str:
+        """
+        List the routes with the most statements per request.
+
+        Args:
+            limit: Routes to list
+
+        Returns:
+            Report text (empty when nothing was tracked)
+        """
+        worst = sorted(
+            self.routes.items(),
+            key=lambda item: (item[1].over_budget, len(item[1].repeated), item[1].max_statements),
+            reverse=True
+        )[:limit]
+        lines = []
+        for route, report in worst:
+            lines.append(
+                f"{route}: max {report.max_statements}/{report.budget} statements, "
+                f"avg {report.total_statements / report.requests:.1f} over {report.requests} requests"
+                + (f", {report.over_budget} over budget" if report.over_budget else "")
+            )
+            for shape, times in sorted(report.repeated.items(), key=lambda item: -item[1]):
+                lines.append(f"    N+1 x{times}: {shape}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Drop all route totals."""
+        self.routes.clear()
+
+
+def install_query_tracking(engine, tracker: Optional[QueryTracker] = None) -> None:
+    """
+    Record every statement run on a SQLAlchemy engine.
+
+    Args:
+        engine: Engine or AsyncEngine to instrument
+        tracker: Tracker to record into (defaults to the shared one)
+    """
+    from sqlalchemy import event
+
+    target = getattr(engine, "sync_engine", engine)
+    store = tracker or query_tracker
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        store.record(statement)
+
+
+# Shared tracker
+query_tracker = QueryTracker()
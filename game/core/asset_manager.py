@@ -0,0 +1,231 @@
+"""
+Asset Manager
+Shared, lazily loaded fonts and images
+
+Components used to create their own pygame.font.Font on construction,
+so a scene with many cards and bars loaded the same font file dozens of
+times. The asset manager loads each (path, size) font and each image
+once, on first use, and hands out the shared object. Scenes can preload
+the assets of the scene that usually comes next on a worker thread, and
+memory_usage() reports what is loaded.
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+import pygame
+from game.utils.settings import Settings
+
+
+# Project root, for resolving relative asset paths such as Settings.FONT_PATH
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class AssetManager:
+    """Loads fonts and images once and shares them"""
+    
+    def __init__(self, font_path: Optional[str] = None, root: str = PROJECT_ROOT):
+        """
+        Initialize asset manager
+        
+        Args:
+            font_path: Default font file (defaults to Settings.FONT_PATH);
+                pygame's built-in font is used if the file is missing
+            root: Directory relative asset paths are resolved against
+        """
+        self.root = root
+        self.font_path = self._resolve_font(font_path or Settings.FONT_PATH)
+        self.hits = 0
+        self.misses = 0
+        
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._images: Dict[Tuple[str, bool], pygame.Surface] = {}
+        self._converted: Dict[Tuple[str, bool], bool] = {}
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def _resolve(self, path: str) -> str:
+        """Make a relative asset path absolute"""
+        return path if os.path.isabs(path) else os.path.join(self.root, path)
+    
+    def _resolve_font(self, path: Optional[str]) -> Optional[str]:
+        """Absolute font path, or None (pygame's built-in font) if it does not exist"""
+        if path is None:
+            return None
+        path = self._resolve(path)
+        return path if os.path.isfile(path) else None
+    
+    def get_font(self, size: int, path: Optional[str] = None) -> pygame.font.Font:
+        """
+        Get a shared font, loading it on first use
+        
+        Args:
+            size: Font size
+            path: Font file (defaults to the configured font)
+        
+        Returns:
+            Font shared by every caller asking for the same (path, size)
+        """
+        font_path = self._resolve_font(path) if path else self.font_path
+        key = (font_path, size)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.hits += 1
+                return font
+            self.misses += 1
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(font_path, size)
+            self._fonts[key] = font
+            return font
+    
+    def get_image(self, path: str, alpha: bool = True) -> pygame.Surface:
+        """
+        Get a shared image, loading it on first use
+        
+        Images are converted to the display format once a display exists,
+        which makes blitting them much cheaper.
+        
+        Args:
+            path: Image file (relative paths are resolved against root)
+            alpha: Whether to keep per-pixel alpha
+        
+        Returns:
+            Image surface shared by every caller (do not draw on it)
+        
+        Raises:
+            FileNotFoundError: If the image file does not exist
+        """
+        key = (self._resolve(path), alpha)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                image = self._load_image(key[0])
+                self._images[key] = image
+            
+            # Conversion needs the display, so it happens here on first use,
+            # not on the preloading thread
+            if not self._converted.get(key) and pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+                self._images[key] = image
+                self._converted[key] = True
+            return image
+    
+    @staticmethod
+    def _load_image(path: str) -> pygame.Surface:
+        """Load an image file from disk"""
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Image not found: {path}")
+        return pygame.image.load(path)
+    
+    def preload(
+        self,
+        font_sizes: Iterable[int] = (),
+        images: Iterable[str] = ()
+    ) -> Future:
+        """
+        Load fonts and images on a worker thread
+        
+        Assets already loaded are skipped; missing images are ignored so a
+        bad manifest never breaks the current scene.
+        
+        Args:
+            font_sizes: Sizes of the default font to load
+            images: Image paths to load
+        
+        Returns:
+            Future that completes when the assets are loaded
+        """
+        font_sizes = list(font_sizes)
+        images = list(images)
+        
+        def load():
+            for size in font_sizes:
+                self.get_font(size)
+            for path in images:
+                key = (self._resolve(path), True)
+                with self._lock:
+                    if key in self._images:
+                        continue
+                try:
+                    image = self._load_image(key[0])
+                except (FileNotFoundError, pygame.error):
+                    continue
+                with self._lock:
+                    self._images.setdefault(key, image)
+        
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-preload")
+            return self._executor.submit(load)
+    
+    def unload_image(self, path: str):
+        """
+        Drop a cached image (e.g. a large background no longer shown)
+        
+        Args:
+            path: Image path passed to get_image
+        """
+        resolved = self._resolve(path)
+        with self._lock:
+            for key in [key for key in self._images if key[0] == resolved]:
+                del self._images[key]
+                self._converted.pop(key, None)
+    
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Report loaded assets and their approximate memory
+        
+        Image bytes are the pixel buffers; font bytes are the font file
+        sizes (each loaded size keeps its own copy of the face).
+        
+        Returns:
+            Counts and byte totals for fonts and images
+        """
+        with self._lock:
+            font_bytes = sum(self._font_file_size(path) for path, _ in self._fonts)
+            image_bytes = sum(
+                image.get_pitch() * image.get_height() for image in self._images.values()
+            )
+            return {
+                "fonts": len(self._fonts),
+                "font_bytes": font_bytes,
+                "images": len(self._images),
+                "image_bytes": image_bytes,
+                "total_bytes": font_bytes + image_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+    
+    @staticmethod
+    def _font_file_size(path: Optional[str]) -> int:
+        """Size of a font file (pygame's built-in font if path is None)"""
+        if path is None:
+            path = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    
+    def clear(self):
+        """Drop every cached font and image"""
+        with self._lock:
+            self._fonts.clear()
+            self._images.clear()
+            self._converted.clear()
+    
+    def shutdown(self):
+        """Stop the preloading thread and drop assets (call before pygame.quit())"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self.clear()
+
+
+# Shared asset manager used by components and scenes
+assets = AssetManager()
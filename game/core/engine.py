@@ -3,6 +3,7 @@ Game Engine
 Main game loop and initialization
 """
 import pygame
+from game.core.asset_manager import assets
 from game.core.scene_manager import SceneManager
 from game.scenes.main_menu import MainMenuScene
 from game.scenes.demo_scene import DemoScene
@@ -44,9 +45,11 @@ class GameEngine:
         """Main game loop"""
         # Start with main menu
         self.scene_manager.change_scene("main_menu")
+        idle = False
         
         while self.running:
-            dt = self.clock.tick(self.settings.FPS) / 1000.0
+            fps = self.settings.IDLE_FPS if idle else self.settings.FPS
+            dt = self.clock.tick(fps) / 1000.0
             
             # Handle events
             events = pygame.event.get()
@@ -59,11 +62,15 @@ class GameEngine:
             # Update current scene
             self.scene_manager.update(dt)
             
-            # Render
-            self.screen.fill((0, 0, 0))
-            self.scene_manager.render(self.screen)
-            pygame.display.flip()
+            # Render only what changed; idle frames draw nothing
+            dirty = self.scene_manager.render_dirty(self.screen)
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            idle = not events and dirty == []
         
+        assets.shutdown()
         pygame.quit()
     
     def change_scene(self, scene_name: str, **kwargs):
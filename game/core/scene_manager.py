@@ -4,6 +4,7 @@ Manages scene transitions and lifecycle
 """
 from typing import Dict, Type, Optional, List
 import pygame
+from game.core.asset_manager import assets
 from game.scenes.base_scene import BaseScene
 
 
@@ -52,6 +53,19 @@ class SceneManager:
         
         self.current_scene = scene_class(self.engine, **kwargs)
         self.current_scene.on_enter()
+        self.preload_next(self.current_scene)
+    
+    def preload_next(self, scene: BaseScene):
+        """
+        Start loading the assets of the scenes likely to follow
+        
+        Args:
+            scene: Scene whose NEXT_SCENES should be preloaded
+        """
+        for name in scene.NEXT_SCENES:
+            scene_class = self.scenes.get(name)
+            if scene_class and (scene_class.FONT_SIZES or scene_class.IMAGES):
+                assets.preload(font_sizes=scene_class.FONT_SIZES, images=scene_class.IMAGES)
     
     def push_scene(self, name: str, **kwargs):
         """
@@ -75,6 +89,9 @@ class SceneManager:
         if self.scene_stack:
             self.current_scene = self.scene_stack.pop()
             self.current_scene.on_resume()
+            # The popped scene's last frame is gone from the screen
+            if self.current_scene.renderer:
+                self.current_scene.renderer.invalidate()
     
     def update(self, dt: float):
         """
@@ -95,3 +112,17 @@ class SceneManager:
         """
         if self.current_scene:
             self.current_scene.render(screen)
+    
+    def render_dirty(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Render what changed in the current scene
+        
+        Args:
+            screen: Pygame surface to render to
+            
+        Returns:
+            Redrawn screen rectangles, or None if the whole screen was redrawn
+        """
+        if self.current_scene:
+            return self.current_scene.render_dirty(screen)
+        return []
@@ -3,12 +3,22 @@ Base Scene abstract class
 All game scenes inherit from this class
 """
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
 import pygame
+from game.ui.render_cache import DirtyRenderer
 
 
 class BaseScene(ABC):
     """Abstract base class for all game scenes"""
     
+    # Assets the scene uses, preloaded while a scene listing it in
+    # NEXT_SCENES is shown (see SceneManager.preload_next)
+    FONT_SIZES: Tuple[int, ...] = ()
+    IMAGES: Tuple[str, ...] = ()
+    
+    # Scenes the player usually goes to from this one
+    NEXT_SCENES: Tuple[str, ...] = ()
+    
     def __init__(self, engine):
         """
         Initialize base scene
@@ -17,6 +27,10 @@ class BaseScene(ABC):
             engine: Reference to the game engine
         """
         self.engine = engine
+        
+        # Scenes that build a static background layer set this in on_enter
+        # to get dirty-rect rendering (see render_dirty)
+        self.renderer: Optional[DirtyRenderer] = None
     
     @abstractmethod
     def on_enter(self):
@@ -58,6 +72,32 @@ class BaseScene(ABC):
         """
         pass
     
+    def get_widgets(self) -> List:
+        """
+        Get the components drawn over the background, in drawing order
+        
+        Returns:
+            Widgets for the dirty renderer
+        """
+        return []
+    
+    def render_dirty(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        Render only what changed since the last frame
+        
+        Args:
+            screen: Pygame surface to render to
+            
+        Returns:
+            Redrawn screen rectangles (empty when idle), or None if the
+            whole screen was redrawn because the scene has no renderer
+        """
+        if self.renderer is None:
+            screen.fill((0, 0, 0))
+            self.render(screen)
+            return None
+        return self.renderer.render(screen, self.get_widgets())
+    
     @abstractmethod
     def handle_event(self, event: pygame.event.Event):
         """
@@ -10,14 +10,21 @@ from game.ui.components.grid import Grid
 from game.ui.components.health_bar import HealthBar
 from game.ui.components.mana_bar import ManaBar
 from game.ui.components.card import Card
+from game.ui.components.label import Label
 from game.ui.components.modal import Modal
+from game.ui.render_cache import DirtyRenderer
 from game.utils.colors import Colors
 from game.utils.settings import Settings
+from game.core.asset_manager import assets
 
 
 class BattleScene(BaseScene):
     """Battle scene for turn-based combat with 3x3 grid"""
     
+    # Scene labels, then grid, cards, bars, buttons and modals
+    FONT_SIZES = (36, 24, 20, 18, 14, 12, 32, 22)
+    NEXT_SCENES = ("main_menu",)
+    
     def __init__(self, engine):
         """
         Initialize battle scene
@@ -36,6 +43,7 @@ class BattleScene(BaseScene):
         self.mana_bars: Dict[str, ManaBar] = {}
         self.character_cards: List[Card] = []
         self.modal: Optional[Modal] = None
+        self.labels: Dict[str, Label] = {}
         
         # Game state
         self.turn = 1
@@ -46,9 +54,9 @@ class BattleScene(BaseScene):
     def on_enter(self):
         """Called when scene becomes active"""
         # Initialize fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.label_font = pygame.font.Font(None, 24)
-        self.info_font = pygame.font.Font(None, 20)
+        self.title_font = assets.get_font(36)
+        self.label_font = assets.get_font(24)
+        self.info_font = assets.get_font(20)
         
         # Create player grid (left side)
         self.player_grid = Grid(
@@ -115,6 +123,48 @@ class BattleScene(BaseScene):
         # Create health and mana bars
         self._create_status_bars()
         
+        # Labels whose text changes during the battle
+        center_x = self.settings.SCREEN_WIDTH // 2
+        self.labels = {
+            "title": Label((center_x, 20), font_size=36, color=Colors.TEXT, anchor="midtop"),
+            "phase": Label((center_x, 55), font_size=24, color=Colors.TEXT_SECONDARY, anchor="midtop"),
+            "action": Label((500, 515), font_size=20, color=Colors.PRIMARY)
+        }
+        self._refresh_labels()
+        
+        self.renderer = DirtyRenderer(self._build_background())
+    
+    def _build_background(self) -> pygame.Surface:
+        """Prebuild the static layer: background, section labels and VS"""
+        background = pygame.Surface((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
+        background.fill(Colors.BACKGROUND)
+        
+        static_labels = [
+            (self.label_font, "Your Team", Colors.TEXT, (50, 120)),
+            (self.label_font, "Enemy Team", Colors.TEXT, (self.settings.SCREEN_WIDTH - 275, 120)),
+            (self.label_font, "Player HP:", Colors.TEXT_SECONDARY, (50, 395)),
+            (self.label_font, "Enemy HP:", Colors.TEXT_SECONDARY, (self.settings.SCREEN_WIDTH - 250, 395)),
+            (self.label_font, "Actions:", Colors.TEXT_SECONDARY, (50, 475)),
+            (self.label_font, "Team:", Colors.TEXT_SECONDARY, (50, 540)),
+        ]
+        for font, text, color, position in static_labels:
+            background.blit(font.render(text, True, color), position)
+        
+        vs_surface = self.title_font.render("VS", True, (200, 50, 50))
+        vs_rect = vs_surface.get_rect(center=(self.settings.SCREEN_WIDTH // 2, 250))
+        background.blit(vs_surface, vs_rect)
+        return background
+    
+    def get_widgets(self) -> list:
+        """Components drawn over the background, in drawing order (modal last)"""
+        widgets = list(self.labels.values())
+        widgets += [grid for grid in (self.player_grid, self.enemy_grid) if grid]
+        widgets += list(self.health_bars.values()) + list(self.mana_bars.values())
+        widgets += self.buttons + self.character_cards
+        if self.modal:
+            widgets.append(self.modal)
+        return widgets
+        
     def _setup_characters(self):
         """Setup initial character positions"""
         # Player team
@@ -215,6 +265,7 @@ class BattleScene(BaseScene):
         self.health_bars.clear()
         self.mana_bars.clear()
         self.character_cards.clear()
+        self.labels.clear()
         self.player_grid = None
         self.enemy_grid = None
         self.modal = None
@@ -257,6 +308,18 @@ class BattleScene(BaseScene):
         # Update modal if visible
         if self.modal:
             self.modal.update(dt)
+        
+        # Dynamic labels (redrawn only when their text changes)
+        if self.labels:
+            self._refresh_labels()
+    
+    def _refresh_labels(self):
+        """Set the turn, phase and selected action label texts"""
+        self.labels["title"].text = f"Battle - Turn {self.turn}"
+        self.labels["phase"].text = f"Phase: {self.current_phase.capitalize()}"
+        self.labels["action"].text = (
+            f"Selected: {self.selected_action.capitalize()}" if self.selected_action else ""
+        )
     
     def render(self, screen: pygame.Surface):
         """
@@ -265,74 +328,8 @@ class BattleScene(BaseScene):
         Args:
             screen: Pygame surface to render to
         """
-        # Background
-        screen.fill(Colors.BACKGROUND)
-        
-        # Title
-        title_text = f"Battle - Turn {self.turn}"
-        title_surface = self.title_font.render(title_text, True, Colors.TEXT)
-        screen.blit(title_surface, (self.settings.SCREEN_WIDTH // 2 - title_surface.get_width() // 2, 20))
-        
-        # Phase indicator
-        phase_text = f"Phase: {self.current_phase.capitalize()}"
-        phase_surface = self.label_font.render(phase_text, True, Colors.TEXT_SECONDARY)
-        screen.blit(phase_surface, (self.settings.SCREEN_WIDTH // 2 - phase_surface.get_width() // 2, 55))
-        
-        # Grid labels
-        player_label = self.label_font.render("Your Team", True, Colors.TEXT)
-        screen.blit(player_label, (50, 120))
-        
-        enemy_label = self.label_font.render("Enemy Team", True, Colors.TEXT)
-        screen.blit(enemy_label, (self.settings.SCREEN_WIDTH - 275, 120))
-        
-        # Render grids
-        if self.player_grid:
-            self.player_grid.render(screen)
-        if self.enemy_grid:
-            self.enemy_grid.render(screen)
-        
-        # Status bar labels
-        player_hp_label = self.label_font.render("Player HP:", True, Colors.TEXT_SECONDARY)
-        screen.blit(player_hp_label, (50, 395))
-        
-        enemy_hp_label = self.label_font.render("Enemy HP:", True, Colors.TEXT_SECONDARY)
-        screen.blit(enemy_hp_label, (self.settings.SCREEN_WIDTH - 250, 395))
-        
-        # Render status bars
-        for bar in self.health_bars.values():
-            bar.render(screen)
-        for bar in self.mana_bars.values():
-            bar.render(screen)
-        
-        # Action label
-        action_label = self.label_font.render("Actions:", True, Colors.TEXT_SECONDARY)
-        screen.blit(action_label, (50, 475))
-        
-        # Render buttons
-        for button in self.buttons:
-            button.render(screen)
-        
-        # Selected action indicator
-        if self.selected_action:
-            action_text = f"Selected: {self.selected_action.capitalize()}"
-            action_surface = self.info_font.render(action_text, True, Colors.PRIMARY)
-            screen.blit(action_surface, (500, 515))
-        
-        # VS indicator
-        vs_surface = self.title_font.render("VS", True, (200, 50, 50))
-        vs_rect = vs_surface.get_rect(center=(self.settings.SCREEN_WIDTH // 2, 250))
-        screen.blit(vs_surface, vs_rect)
-        
-        # Render character cards
-        cards_label = self.label_font.render("Team:", True, Colors.TEXT_SECONDARY)
-        screen.blit(cards_label, (50, 540))
-        
-        for card in self.character_cards:
-            card.render(screen)
-        
-        # Render modal on top if visible
-        if self.modal:
-            self.modal.render(screen)
+        # Background layer (static labels included), then components
+        self.renderer.render_full(screen, self.get_widgets())
     
     def handle_event(self, event: pygame.event.Event):
         """
@@ -11,13 +11,19 @@ from game.ui.components.hexagon_chart import HexagonChart
 from game.ui.components.card import Card
 from game.ui.components.grid import Grid
 from game.ui.components.modal import Modal
+from game.ui.render_cache import DirtyRenderer
 from game.utils.colors import Colors
 from game.utils.settings import Settings
+from game.core.asset_manager import assets
 
 
 class DemoScene(BaseScene):
     """Demo scene showing all UI components"""
     
+    # Scene labels, then buttons, chart, cards, bars, grid and modals
+    FONT_SIZES = (48, 24, 18, 16, 14, 12, 20, 32, 22)
+    NEXT_SCENES = ("main_menu",)
+    
     def __init__(self, engine):
         """
         Initialize demo scene
@@ -38,8 +44,8 @@ class DemoScene(BaseScene):
     def on_enter(self):
         """Called when scene becomes active"""
         # Initialize fonts
-        self.title_font = pygame.font.Font(None, 48)
-        self.label_font = pygame.font.Font(None, 24)
+        self.title_font = assets.get_font(48)
+        self.label_font = assets.get_font(24)
         
         # Create demo buttons
         self.components.append(
@@ -154,6 +160,66 @@ class DemoScene(BaseScene):
         self.grid.set_cell_content(0, 1, {"name": "LB", "element": "Mộc"})
         self.grid.set_cell_content(1, 0, {"name": "QV", "element": "Kim"})
         self.grid.set_cell_content(1, 2, {"name": "TP", "element": "Hỏa"})
+        
+        self.renderer = DirtyRenderer(self._build_background())
+    
+    def _build_background(self) -> pygame.Surface:
+        """Prebuild the static layer: background, section labels and element swatches"""
+        background = pygame.Surface((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
+        background.fill(Colors.BACKGROUND)
+        
+        # Title
+        title_surface = self.title_font.render("UI Components Demo", True, Colors.TEXT)
+        background.blit(title_surface, (50, 30))
+        
+        # Section labels
+        section_labels = [
+            ("Buttons:", (50, 70)),
+            ("Health & Mana Bars:", (50, 150)),
+            ("Character Stats (Hexagon Chart):", (400, 70)),
+            ("Element Colors:", (50, 300)),
+            ("Character Cards:", (750, 70)),
+            ("Battle Grid (3x3):", (750, 250)),
+            ("Click cells to select", (750, 490)),
+        ]
+        for text, position in section_labels:
+            label = self.label_font.render(text, True, Colors.TEXT_SECONDARY)
+            background.blit(label, position)
+        
+        # Element colors
+        elements = [
+            ("Kim (Metal)", Colors.ELEMENT_KIM),
+            ("Mộc (Wood)", Colors.ELEMENT_MOC),
+            ("Thủy (Water)", Colors.ELEMENT_THUY),
+            ("Hỏa (Fire)", Colors.ELEMENT_HOA),
+            ("Thổ (Earth)", Colors.ELEMENT_THO),
+        ]
+        
+        y_offset = 330
+        for name, color in elements:
+            # Color box
+            pygame.draw.rect(background, color, (50, y_offset, 30, 30))
+            pygame.draw.rect(background, Colors.TEXT, (50, y_offset, 30, 30), 1)
+            # Label
+            text = self.label_font.render(name, True, Colors.TEXT)
+            background.blit(text, (90, y_offset + 5))
+            y_offset += 40
+        return background
+    
+    def get_widgets(self) -> list:
+        """Components drawn over the background, in drawing order (modal last)"""
+        widgets = list(self.components)
+        widgets += [
+            widget
+            for widget in (self.health_bar, self.mana_bar, self.hexagon_chart)
+            if widget
+        ]
+        widgets += self.cards
+        if self.grid:
+            widgets.append(self.grid)
+        if self.modal:
+            widgets.append(self.modal)
+        return widgets
     
     def on_exit(self):
         """Called when scene is deactivated"""
@@ -215,82 +281,8 @@ class DemoScene(BaseScene):
         Args:
             screen: Pygame surface to render to
         """
-        # Background
-        screen.fill(Colors.BACKGROUND)
-        
-        # Title
-        title_surface = self.title_font.render("UI Components Demo", True, Colors.TEXT)
-        screen.blit(title_surface, (50, 30))
-        
-        # Section labels
-        # Buttons section
-        label = self.label_font.render("Buttons:", True, Colors.TEXT_SECONDARY)
-        screen.blit(label, (50, 70))
-        
-        # Bars section
-        label = self.label_font.render("Health & Mana Bars:", True, Colors.TEXT_SECONDARY)
-        screen.blit(label, (50, 150))
-        
-        # Hexagon section
-        label = self.label_font.render("Character Stats (Hexagon Chart):", True, Colors.TEXT_SECONDARY)
-        screen.blit(label, (400, 70))
-        
-        # Render all components
-        for component in self.components:
-            component.render(screen)
-        
-        if self.health_bar:
-            self.health_bar.render(screen)
-        
-        if self.mana_bar:
-            self.mana_bar.render(screen)
-        
-        if self.hexagon_chart:
-            self.hexagon_chart.render(screen)
-        
-        # Display element colors
-        label = self.label_font.render("Element Colors:", True, Colors.TEXT_SECONDARY)
-        screen.blit(label, (50, 300))
-        
-        elements = [
-            ("Kim (Metal)", Colors.ELEMENT_KIM),
-            ("Mộc (Wood)", Colors.ELEMENT_MOC),
-            ("Thủy (Water)", Colors.ELEMENT_THUY),
-            ("Hỏa (Fire)", Colors.ELEMENT_HOA),
-            ("Thổ (Earth)", Colors.ELEMENT_THO),
-        ]
-        
-        y_offset = 330
-        for name, color in elements:
-            # Color box
-            pygame.draw.rect(screen, color, (50, y_offset, 30, 30))
-            pygame.draw.rect(screen, Colors.TEXT, (50, y_offset, 30, 30), 1)
-            # Label
-            text = self.label_font.render(name, True, Colors.TEXT)
-            screen.blit(text, (90, y_offset + 5))
-            y_offset += 40
-        
-        # Cards section
-        label = self.label_font.render("Character Cards:", True, Colors.TEXT_SECONDARY)
-        screen.blit(label, (750, 70))
-        
-        for card in self.cards:
-            card.render(screen)
-        
-        # Grid section
-        label = self.label_font.render("Battle Grid (3x3):", True, Colors.TEXT_SECONDARY)
-        screen.blit(label, (750, 250))
-        
-        if self.grid:
-            self.grid.render(screen)
-        
-        # Grid instructions
-        instr = self.label_font.render("Click cells to select", True, Colors.TEXT_SECONDARY)
-        screen.blit(instr, (750, 490))
-        
-        # Render modal on top if visible
-        if self.modal:
-            self.modal.render(screen)
+        # Background layer (labels and swatches included), then components
+        self.renderer.render_full(screen, self.get_widgets())
     
     def handle_event(self, event: pygame.event.Event):
         """
@@ -5,13 +5,18 @@ The initial scene shown when the game starts
 import pygame
 from game.scenes.base_scene import BaseScene
 from game.ui.components.button import Button
+from game.ui.render_cache import DirtyRenderer
 from game.utils.colors import Colors
 from game.utils.settings import Settings
+from game.core.asset_manager import assets
 
 
 class MainMenuScene(BaseScene):
     """Main menu scene with start game, settings, and quit options"""
     
+    FONT_SIZES = (72, 18)
+    NEXT_SCENES = ("battle", "demo")
+    
     def __init__(self, engine):
         """
         Initialize main menu scene
@@ -27,7 +32,7 @@ class MainMenuScene(BaseScene):
     def on_enter(self):
         """Called when scene becomes active"""
         # Initialize title font
-        self.title_font = pygame.font.Font(None, 72)
+        self.title_font = assets.get_font(72)
         
         # Create menu buttons
         screen_center_x = self.settings.SCREEN_WIDTH // 2
@@ -73,6 +78,25 @@ class MainMenuScene(BaseScene):
                 on_click=self._on_quit
             )
         )
+        
+        self.renderer = DirtyRenderer(self._build_background())
+    
+    def _build_background(self) -> pygame.Surface:
+        """Prebuild the static layer: background and title"""
+        background = pygame.Surface((self.settings.SCREEN_WIDTH, self.settings.SCREEN_HEIGHT))
+        background.fill(Colors.BACKGROUND)
+        
+        title_text = "Ngọa Long Tam Quốc"
+        title_surface = self.title_font.render(title_text, True, Colors.TEXT)
+        title_rect = title_surface.get_rect(
+            center=(self.settings.SCREEN_WIDTH // 2, 150)
+        )
+        background.blit(title_surface, title_rect)
+        return background
+    
+    def get_widgets(self) -> list:
+        """Components drawn over the background, in drawing order"""
+        return self.buttons
     
     def on_exit(self):
         """Called when scene is deactivated"""
@@ -103,20 +127,8 @@ class MainMenuScene(BaseScene):
         Args:
             screen: Pygame surface to render to
         """
-        # Background
-        screen.fill(Colors.BACKGROUND)
-        
-        # Title
-        title_text = "Ngọa Long Tam Quốc"
-        title_surface = self.title_font.render(title_text, True, Colors.TEXT)
-        title_rect = title_surface.get_rect(
-            center=(self.settings.SCREEN_WIDTH // 2, 150)
-        )
-        screen.blit(title_surface, title_rect)
-        
-        # Buttons
-        for button in self.buttons:
-            button.render(screen)
+        # Background layer (title included), then buttons
+        self.renderer.render_full(screen, self.get_widgets())
     
     def handle_event(self, event: pygame.event.Event):
         """
@@ -3,6 +3,8 @@ Button UI Component
 """
 import pygame
 from typing import Callable, Optional, Tuple
+from game.ui.render_cache import text_cache
+from game.core.asset_manager import assets
 
 
 class Button:
@@ -36,7 +38,7 @@ class Button:
         """
         self.rect = pygame.Rect(position[0], position[1], size[0], size[1])
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font = assets.get_font(font_size)
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
@@ -46,6 +48,18 @@ class Button:
         self.is_hovered = False
         self.is_pressed = False
     
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area the button draws in"""
+        return self.rect
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the button looks (for dirty-rect rendering)"""
+        return (
+            tuple(self.rect), self.text, self.is_hovered, self.disabled,
+            self.color, self.hover_color, self.text_color
+        )
+    
     def update(self, dt: float):
         """
         Update button state
@@ -99,6 +113,6 @@ class Button:
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 2, border_radius=5)
         
         # Text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = text_cache.render(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
@@ -4,6 +4,8 @@ Displays character or item cards with stats and rarity
 """
 import pygame
 from typing import Tuple, Optional, Dict, Callable
+from game.ui.render_cache import text_cache
+from game.core.asset_manager import assets
 
 
 class Card:
@@ -52,9 +54,13 @@ class Card:
         
         self.is_hovered = False
         
-        # Pre-create fonts
-        self.name_font = pygame.font.Font(None, 18)
-        self.stat_font = pygame.font.Font(None, 14)
+        # Scaled copy of the image, rebuilt only when image or size change
+        self._scaled_image: Optional[pygame.Surface] = None
+        self._scaled_key: Optional[tuple] = None
+        
+        # Shared fonts (loaded once by the asset manager)
+        self.name_font = assets.get_font(18)
+        self.stat_font = assets.get_font(14)
         
         # Rarity colors
         self.rarity_colors = {
@@ -75,6 +81,30 @@ class Card:
             "Thổ": (139, 69, 19),     # Saddle Brown - Earth
         }
     
+    @property
+    def stat_text(self) -> str:
+        """Stats line shown under the stars (first three stats)"""
+        return " | ".join(f"{k}:{v}" for k, v in list(self.stats.items())[:3])
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area the card draws in (the stats line may overhang)"""
+        if not self.stats:
+            return self.rect
+        stat_width, stat_height = self.stat_font.size(self.stat_text)
+        stat_rect = pygame.Rect(0, 0, stat_width, stat_height)
+        stat_rect.centerx = self.rect.centerx
+        stat_rect.y = self.rect.y + self.rect.height // 2 + 40
+        return self.rect.union(stat_rect)
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the card looks (for dirty-rect rendering)"""
+        return (
+            tuple(self.rect), self.name, self.element, self.rarity, self.stat_text,
+            id(self.image) if self.image else None, self.bg_color,
+            self.is_hovered, self.selected
+        )
+    
     def update(self, dt: float):
         """
         Update card state
@@ -131,9 +161,12 @@ class Card:
         )
         
         if self.image:
-            # Scale image to fit
-            scaled_image = pygame.transform.scale(self.image, (image_rect.width, image_rect.height))
-            screen.blit(scaled_image, image_rect)
+            # Scale image to fit (cached until the image or its size changes)
+            scaled_key = (id(self.image), image_rect.size)
+            if scaled_key != self._scaled_key:
+                self._scaled_image = pygame.transform.scale(self.image, image_rect.size)
+                self._scaled_key = scaled_key
+            screen.blit(self._scaled_image, image_rect)
         else:
             # Placeholder with element color
             placeholder_color = (60, 60, 80)
@@ -160,7 +193,7 @@ class Card:
         
         # Name
         name_y = self.rect.y + self.rect.height // 2 + 5
-        name_surface = self.name_font.render(self.name, True, (255, 255, 255))
+        name_surface = text_cache.render(self.name_font, self.name, (255, 255, 255))
         name_rect = name_surface.get_rect(centerx=self.rect.centerx, y=name_y)
         screen.blit(name_surface, name_rect)
         
@@ -174,8 +207,7 @@ class Card:
         # Stats (if provided)
         if self.stats:
             stats_y = star_y + 15
-            stat_text = " | ".join(f"{k}:{v}" for k, v in list(self.stats.items())[:3])
-            stat_surface = self.stat_font.render(stat_text, True, (200, 200, 200))
+            stat_surface = text_cache.render(self.stat_font, self.stat_text, (200, 200, 200))
             stat_rect = stat_surface.get_rect(centerx=self.rect.centerx, y=stats_y)
             screen.blit(stat_surface, stat_rect)
     
@@ -4,6 +4,8 @@ Battle grid (3x3) for turn-based combat positioning
 """
 import pygame
 from typing import Tuple, Optional, Callable, List, Any
+from game.ui.render_cache import render_key_of, text_cache
+from game.core.asset_manager import assets
 
 
 class GridCell:
@@ -99,8 +101,8 @@ class Grid:
         
         self._create_cells()
         
-        # Pre-create font
-        self.label_font = pygame.font.Font(None, 20)
+        # Shared font (loaded once by the asset manager)
+        self.label_font = assets.get_font(20)
     
     def _create_cells(self):
         """Create grid cells"""
@@ -135,6 +137,22 @@ class Grid:
         """Total height of the grid"""
         return self.rows * self.cell_size + (self.rows - 1) * self.spacing
     
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area the grid draws in"""
+        return pygame.Rect(self.position, (self.width, self.height))
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the grid looks (for dirty-rect rendering)"""
+        return (self.position, self.cell_size, self.spacing) + tuple(
+            (
+                cell.is_selected, cell.is_target, cell.is_highlighted,
+                cell.is_hovered, render_key_of(cell.content)
+            )
+            for row in self.cells
+            for cell in row
+        )
+    
     def get_cell(self, row: int, col: int) -> Optional[GridCell]:
         """
         Get cell at specified position
@@ -329,7 +347,7 @@ class Grid:
         
         # Draw position label (for debugging/demo)
         label = f"({cell.row},{cell.col})"
-        label_surface = self.label_font.render(label, True, (150, 150, 150))
+        label_surface = text_cache.render(self.label_font, label, (150, 150, 150))
         label_rect = label_surface.get_rect(
             bottomright=(cell.rect.right - 5, cell.rect.bottom - 5)
         )
@@ -374,11 +392,11 @@ class Grid:
             )
             
             # Draw name
-            name_surface = self.label_font.render(name[:4], True, (255, 255, 255))
+            name_surface = text_cache.render(self.label_font, name[:4], (255, 255, 255))
             name_rect = name_surface.get_rect(center=cell.rect.center)
             screen.blit(name_surface, name_rect)
         elif isinstance(content, str):
             # Simple string label
-            text_surface = self.label_font.render(content[:4], True, (255, 255, 255))
+            text_surface = text_cache.render(self.label_font, content[:4], (255, 255, 255))
             text_rect = text_surface.get_rect(center=cell.rect.center)
             screen.blit(text_surface, text_rect)
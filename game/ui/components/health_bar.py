@@ -3,6 +3,8 @@ HealthBar UI Component
 """
 import pygame
 from typing import Tuple
+from game.ui.render_cache import text_cache
+from game.core.asset_manager import assets
 
 
 class HealthBar:
@@ -46,8 +48,17 @@ class HealthBar:
         self.displayed_value = current
         self.animation_speed = 50  # HP per second
         
-        # Pre-create font to avoid creating on every render
-        self.font = pygame.font.Font(None, 12)
+        # Shared font (loaded once by the asset manager)
+        self.font = assets.get_font(12)
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area the bar draws in"""
+        return self.rect
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the bar looks (for dirty-rect rendering)"""
+        return (tuple(self.rect), self.current, self.maximum, int(self.displayed_value))
     
     @property
     def percentage(self) -> float:
@@ -98,6 +109,6 @@ class HealthBar:
         
         # Text (optional)
         text = f"{int(self.displayed_value)}/{self.maximum}"
-        text_surface = self.font.render(text, True, (255, 255, 255))
+        text_surface = text_cache.render(self.font, text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
@@ -4,7 +4,9 @@ Displays character stats in a hexagonal radar chart
 """
 import pygame
 import math
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
+from game.ui.render_cache import text_cache
+from game.core.asset_manager import assets
 
 
 class HexagonChart:
@@ -43,8 +45,28 @@ class HexagonChart:
         # Stat order for consistent hexagon layout
         self.stat_order = ['HP', 'ATK', 'DEF', 'SPD', 'CRIT', 'DEX']
         
-        # Pre-create font to avoid creating on every render
-        self.font = pygame.font.Font(None, 16)
+        # Shared font (loaded once by the asset manager)
+        self.font = assets.get_font(16)
+        
+        # Translucent stat polygon, rebuilt only when the stats change
+        self._fill_surface: Optional[pygame.Surface] = None
+        self._fill_key: Optional[tuple] = None
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area the chart draws in, stat labels included"""
+        label_width = max((self.font.size(name)[0] for name in self.stat_order), default=0)
+        extent = self.radius + 20 + label_width // 2 + 1
+        return pygame.Rect(
+            self.center_x - extent, self.center_y - extent, extent * 2, extent * 2
+        )
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the chart looks (for dirty-rect rendering)"""
+        return (
+            self.center_x, self.center_y, self.radius, self.max_value,
+            tuple(self.stats.items()), self.line_color, self.fill_color, self.fill_alpha
+        )
     
     def get_normalized_stats(self) -> Dict[str, float]:
         """
@@ -112,10 +134,18 @@ class HexagonChart:
         
         # Draw filled stat polygon with transparency
         if len(stat_vertices) >= 3:
-            # Create a temporary surface for alpha blending
-            temp_surface = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-            pygame.draw.polygon(temp_surface, (*self.fill_color, self.fill_alpha), stat_vertices)
-            screen.blit(temp_surface, (0, 0))
+            # Alpha-blend through a chart-sized surface, reused until stats change
+            size = self.radius * 2 + 2
+            origin = (self.center_x - self.radius - 1, self.center_y - self.radius - 1)
+            fill_key = self.render_key()
+            if fill_key != self._fill_key:
+                self._fill_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+                local_vertices = [(x - origin[0], y - origin[1]) for x, y in stat_vertices]
+                pygame.draw.polygon(
+                    self._fill_surface, (*self.fill_color, self.fill_alpha), local_vertices
+                )
+                self._fill_key = fill_key
+            screen.blit(self._fill_surface, origin)
         
         # Draw stat polygon outline
         if len(stat_vertices) >= 3:
@@ -128,6 +158,6 @@ class HexagonChart:
             x = self.center_x + label_distance * math.cos(angle)
             y = self.center_y - label_distance * math.sin(angle)
             
-            text_surface = self.font.render(stat_name, True, (255, 255, 255))
+            text_surface = text_cache.render(self.font, stat_name, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(x, y))
             screen.blit(text_surface, text_rect)
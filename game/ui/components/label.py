@@ -0,0 +1,68 @@
+"""
+Label UI Component
+Single line of text that can change at runtime
+"""
+import pygame
+from typing import Tuple
+from game.ui.render_cache import text_cache
+from game.core.asset_manager import assets
+
+
+class Label:
+    """Text label component (for text that changes, e.g. turn counters)"""
+    
+    def __init__(
+        self,
+        position: Tuple[int, int],
+        text: str = "",
+        font_size: int = 24,
+        color: Tuple[int, int, int] = (255, 255, 255),
+        anchor: str = "topleft"
+    ):
+        """
+        Initialize label component
+        
+        Args:
+            position: (x, y) position of the anchor point
+            text: Label text
+            font_size: Font size for the text
+            color: Text color
+            anchor: Rect attribute placed at position ("topleft", "midtop", "center", ...)
+        """
+        self.position = position
+        self.text = text
+        self.color = color
+        self.anchor = anchor
+        self.font = assets.get_font(font_size)
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Screen area covered by the text"""
+        rect = pygame.Rect((0, 0), self.font.size(self.text))
+        setattr(rect, self.anchor, self.position)
+        return rect
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the label looks"""
+        return (self.text, self.color, self.position, self.anchor)
+    
+    def update(self, dt: float):
+        """
+        Update label state
+        
+        Args:
+            dt: Delta time in seconds
+        """
+        pass
+    
+    def render(self, screen: pygame.Surface):
+        """
+        Render label to screen
+        
+        Args:
+            screen: Pygame surface to render to
+        """
+        if not self.text:
+            return
+        text_surface = text_cache.render(self.font, self.text, self.color)
+        screen.blit(text_surface, self.bounds)
@@ -5,6 +5,8 @@ Dialog box for displaying information or confirmations
 import pygame
 from typing import Tuple, Optional, Callable, List
 from game.ui.components.button import Button
+from game.ui.render_cache import get_overlay, text_cache
+from game.core.asset_manager import assets
 
 
 class Modal:
@@ -50,9 +52,9 @@ class Modal:
         self.visible = True
         self.buttons: List[Button] = []
         
-        # Pre-create fonts
-        self.title_font = pygame.font.Font(None, 32)
-        self.content_font = pygame.font.Font(None, 22)
+        # Shared fonts (loaded once by the asset manager)
+        self.title_font = assets.get_font(32)
+        self.content_font = assets.get_font(22)
         
         # Cache wrapped content lines
         self._wrapped_lines: List[str] = []
@@ -121,6 +123,18 @@ class Modal:
         
         self._wrapped_lines = lines
     
+    @property
+    def bounds(self) -> Optional[pygame.Rect]:
+        """Screen area the modal draws in (None: the overlay covers the screen)"""
+        return None if self.visible else self.rect
+    
+    def render_key(self) -> tuple:
+        """Everything that affects how the modal looks (for dirty-rect rendering)"""
+        return (
+            self.visible, tuple(self.rect), self.title, self.content, self.overlay_alpha,
+            tuple(button.render_key() for button in self.buttons)
+        )
+    
     def show(self):
         """Show the modal"""
         self.visible = True
@@ -194,9 +208,8 @@ class Modal:
         if not self.visible:
             return
         
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, self.overlay_alpha))
+        # Draw semi-transparent overlay (shared, built once per screen size)
+        overlay = get_overlay(screen.get_size(), (0, 0, 0, self.overlay_alpha))
         screen.blit(overlay, (0, 0))
         
         # Draw modal background
@@ -212,7 +225,7 @@ class Modal:
         
         # Draw title text
         if self.title:
-            title_surface = self.title_font.render(self.title, True, (255, 255, 255))
+            title_surface = text_cache.render(self.title_font, self.title, (255, 255, 255))
             title_rect = title_surface.get_rect(centerx=self.rect.centerx, centery=self.rect.y + 20)
             screen.blit(title_surface, title_rect)
         
@@ -228,7 +241,7 @@ class Modal:
         if self._wrapped_lines:
             content_y = self.rect.y + 60
             for i, line in enumerate(self._wrapped_lines):
-                line_surface = self.content_font.render(line, True, (220, 220, 220))
+                line_surface = text_cache.render(self.content_font, line, (220, 220, 220))
                 screen.blit(line_surface, (self.rect.x + 20, content_y + i * 25))
         
         # Draw buttons
@@ -0,0 +1,220 @@
+"""
+Render Cache
+Cached text surfaces, shared overlays and dirty-rect rendering
+
+Most of a frame looks like the previous one. Rendering text with
+font.render(), allocating full-screen alpha surfaces and redrawing every
+component at 60 FPS costs CPU even when nothing moved. This module keeps
+rendered text and overlays around, and DirtyRenderer redraws only the
+screen regions whose components changed, so an idle scene draws nothing.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import pygame
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)"""
+    
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize text cache
+        
+        Args:
+            max_entries: Most surfaces kept; least recently used are dropped
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict = OrderedDict()
+    
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, ...],
+        antialias: bool = True
+    ) -> pygame.Surface:
+        """
+        Render text, reusing the surface from an earlier identical call
+        
+        The returned surface is shared; blit it, do not draw on it.
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+            antialias: Whether to antialias
+        
+        Returns:
+            Rendered text surface
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop every cached surface"""
+        self._surfaces.clear()
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
+# Shared text cache used by the UI components
+text_cache = TextCache()
+
+
+@lru_cache(maxsize=8)
+def get_overlay(size: Tuple[int, int], color: Tuple[int, int, int, int]) -> pygame.Surface:
+    """
+    Get a filled SRCALPHA surface, built once per (size, color)
+    
+    Args:
+        size: (width, height) of the overlay
+        color: RGBA fill color
+    
+    Returns:
+        Shared overlay surface (do not draw on it)
+    """
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill(color)
+    return overlay
+
+
+def merge_rects(rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+    """
+    Merge overlapping rectangles so no region is redrawn twice
+    
+    Args:
+        rects: Rectangles to merge
+    
+    Returns:
+        Non-overlapping union rectangles
+    """
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRenderer:
+    """
+    Redraws only the parts of the screen whose widgets changed
+    
+    A widget is any component with render(screen), render_key() and
+    bounds. render_key() returns a hashable value covering everything
+    that affects how the widget looks; bounds is the screen area it draws
+    in, or None if it covers the whole screen (e.g. a modal overlay).
+    Regions are restored from the scene's static background layer before
+    the widgets overlapping them are drawn again in order.
+    """
+    
+    def __init__(self, background: pygame.Surface):
+        """
+        Initialize dirty renderer
+        
+        Args:
+            background: Prebuilt static layer (scene background and labels)
+        """
+        self.background = background
+        self._drawn: Dict[int, Tuple[object, object, pygame.Rect]] = {}
+        self._full = True
+    
+    def invalidate(self):
+        """Redraw the whole screen on the next frame"""
+        self._full = True
+    
+    def render_full(self, screen: pygame.Surface, widgets: Sequence) -> None:
+        """
+        Draw the background and every widget
+        
+        Args:
+            screen: Pygame surface to render to
+            widgets: Widgets in drawing order
+        """
+        self._full = True
+        self.render(screen, widgets)
+    
+    def render(self, screen: pygame.Surface, widgets: Sequence) -> List[pygame.Rect]:
+        """
+        Redraw the regions of widgets that changed since the last frame
+        
+        Args:
+            screen: Pygame surface to render to
+            widgets: Widgets in drawing order
+        
+        Returns:
+            Screen rectangles that were redrawn (empty if nothing changed)
+        """
+        screen_rect = screen.get_rect()
+        current: Dict[int, Tuple[object, object, pygame.Rect]] = {}
+        dirty: List[pygame.Rect] = []
+        
+        for widget in widgets:
+            bounds = widget.bounds
+            bounds = screen_rect if bounds is None else bounds.clip(screen_rect)
+            state = (widget, widget.render_key(), bounds)
+            current[id(widget)] = state
+            
+            previous = self._drawn.get(id(widget))
+            if previous is None:
+                dirty.append(bounds)
+            elif previous[1] != state[1] or previous[2] != bounds:
+                dirty.extend((previous[2], bounds))
+        
+        for widget_id, previous in self._drawn.items():
+            if widget_id not in current:
+                dirty.append(previous[2])
+        
+        if self._full:
+            dirty = [screen_rect]
+        self._drawn = current
+        self._full = False
+        
+        regions = merge_rects(dirty)
+        for region in regions:
+            screen.set_clip(region)
+            screen.blit(self.background, region, region)
+            for widget, _, bounds in current.values():
+                if bounds.colliderect(region):
+                    widget.render(screen)
+        screen.set_clip(None)
+        return regions
+
+
+def render_key_of(content: object) -> Optional[object]:
+    """
+    Best-effort render key for arbitrary content (e.g. grid cell content)
+    
+    Args:
+        content: Content to describe
+    
+    Returns:
+        A hashable value that changes when the content's look changes
+    """
+    if content is None or isinstance(content, str):
+        return content
+    if hasattr(content, "render_key"):
+        return content.render_key()
+    if isinstance(content, dict):
+        return (content.get("name"), content.get("element"))
+    return id(content)
@@ -11,6 +11,7 @@ class Settings:
     SCREEN_WIDTH: int = 1280
     SCREEN_HEIGHT: int = 720
     FPS: int = 60
+    IDLE_FPS: int = 30  # Frame cap while nothing is redrawn or happening
     FULLSCREEN: bool = False
     
     # API
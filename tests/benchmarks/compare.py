@@ -0,0 +1,125 @@
+"""
+Compare a pytest-benchmark JSON run against the stored baseline
+
+Usage:
+    python -m tests.benchmarks.compare benchmark.json [--threshold 0.15]
+    python -m tests.benchmarks.compare benchmark.json --update
+
+Benchmarks are compared by median time. The command exits non-zero when
+any benchmark is slower than the baseline by more than the threshold.
+--update rewrites the baseline from the run instead.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Allowed slowdown before a benchmark counts as a regression
+DEFAULT_THRESHOLD = 0.15
+
+
+def load_medians(path: Path) -> Dict[str, float]:
+    """
+    Read median seconds per benchmark from a run or a baseline file.
+
+    Args:
+        path: pytest-benchmark --benchmark-json output, or a baseline
+
+    Returns:
+        Median seconds keyed by benchmark full name
+    """
+    data = json.loads(path.read_text())
+    if "medians" in data:
+        return data["medians"]
+    return {bench["fullname"]: bench["stats"]["median"] for bench in data["benchmarks"]}
+
+
+def save_baseline(run_path: Path, baseline_path: Path) -> None:
+    """
+    Store a run's medians as the baseline.
+
+    Args:
+        run_path: pytest-benchmark JSON output
+        baseline_path: Baseline file to write
+    """
+    data = json.loads(run_path.read_text())
+    machine = data.get("machine_info", {})
+    baseline = {
+        "machine": {
+            "python": machine.get("python_version"),
+            "cpu": machine.get("cpu", {}).get("brand_raw"),
+            "system": machine.get("system")
+        },
+        "medians": load_medians(run_path)
+    }
+    baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def compare(
+    current: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare medians against the baseline.
+
+    Args:
+        current: Medians from the run
+        baseline: Baseline medians
+        threshold: Allowed relative slowdown (0.15 = 15%)
+
+    Returns:
+        (report lines, regressed benchmark names)
+    """
+    lines = []
+    regressions = []
+    for name in sorted(current):
+        if name not in baseline:
+            lines.append(f"  new       {name}: {current[name] * 1000:.3f}ms")
+            continue
+        change = current[name] / baseline[name] - 1
+        status = "ok"
+        if change > threshold:
+            status = "REGRESSED"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "faster"
+        lines.append(
+            f"  {status:<9} {name}: {baseline[name] * 1000:.3f}ms -> "
+            f"{current[name] * 1000:.3f}ms ({change:+.1%})"
+        )
+    for name in sorted(set(baseline) - set(current)):
+        lines.append(f"  missing   {name}")
+    return lines, regressions
+
+
+def main(argv=None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("run", type=Path, help="pytest-benchmark --benchmark-json output")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update", action="store_true", help="Rewrite the baseline from the run")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        save_baseline(args.run, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    lines, regressions = compare(
+        load_medians(args.run), load_medians(args.baseline), args.threshold
+    )
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark fixtures
+
+Benchmarks run once as plain tests in the normal suite (pytest.ini sets
+--benchmark-disable). To measure and compare against the baseline:
+
+    pytest tests/benchmarks --benchmark-enable --benchmark-json=benchmark.json
+    python -m tests.benchmarks.compare benchmark.json
+"""
+import asyncio
+import random
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.enemy import Enemy
+from app.domain.factories.hero_factory import HeroFactory
+from app.domain.factories.skill_factory import SkillFactory
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+# Fixed seed so every run benchmarks the same battles and rolls
+BENCHMARK_SEED = 1234
+
+
+@pytest.fixture(scope="session")
+def hero_factory():
+    """Shared hero factory"""
+    return HeroFactory()
+
+
+@pytest.fixture(scope="session")
+def skill_factory():
+    """Shared skill factory"""
+    return SkillFactory()
+
+
+@pytest.fixture
+def rng():
+    """Seeded random source (also seeds the global one used by services)"""
+    random.seed(BENCHMARK_SEED)
+    return random.Random(BENCHMARK_SEED)
+
+
+@pytest.fixture
+def make_heroes(hero_factory):
+    """Build n heroes from the factory templates, cycling through them"""
+    templates = [template.template_id for template in hero_factory.get_all_templates()]
+
+    def make(count):
+        return [
+            hero_factory.create_hero(
+                templates[index % len(templates)],
+                GridPosition(index % 3, (index // 3) % 3)
+            )
+            for index in range(count)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def make_enemies():
+    """Build n enemies with a spread of speeds"""
+
+    def make(count):
+        return [
+            Enemy(
+                id=str(uuid4()),
+                name=f"Enemy {index}",
+                element=list(Element)[index % len(Element)],
+                position=GridPosition(index % 3, (index // 3) % 3),
+                stats=HexagonStats(hp=2500, atk=110, def_=60, spd=70 + index * 5, crit=5, dex=5),
+                template_id="benchmark_enemy",
+                exp_reward=50,
+                gold_reward=100
+            )
+            for index in range(count)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine to completion on a private event loop"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
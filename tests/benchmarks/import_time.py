@@ -0,0 +1,165 @@
+"""
+Summarize `python -X importtime` for a module's cold start
+
+Usage:
+    python -m tests.benchmarks.import_time [app.main] [--top 15] [--budget 1.5]
+
+Each run imports the module in a fresh interpreter. The fastest of
+--runs is reported, with the slowest modules by self time and the
+heaviest top-level packages. The command exits non-zero when the
+cumulative import time is over --budget seconds.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+DEFAULT_MODULE = "app.main"
+
+# Cold start budget for app.main, in seconds
+DEFAULT_BUDGET = 1.5
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    """
+    One line of -X importtime output.
+
+    Attributes:
+        name: Module name
+        self_us: Time spent in the module itself (microseconds)
+        cumulative_us: Time including the modules it imported
+        depth: Nesting level (0 for the imported module itself)
+    """
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse -X importtime stderr.
+
+    Args:
+        output: stderr of the interpreter
+
+    Returns:
+        Records in output order (imports finish before their importer)
+    """
+    records = []
+    for line in output.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            records.append(ImportRecord(name, int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def profile_imports(module: str = DEFAULT_MODULE) -> List[ImportRecord]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Parsed import records
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    python_path = [str(REPO_ROOT), os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, python_path))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def cumulative_seconds(records: List[ImportRecord], module: str) -> float:
+    """Cumulative import time of a module, in seconds (0 if it was not imported)."""
+    for record in records:
+        if record.name == module:
+            return record.cumulative_us / 1e6
+    return 0.0
+
+
+def package_totals(records: List[ImportRecord]) -> Dict[str, int]:
+    """Self time per top-level package (microseconds)."""
+    totals: Dict[str, int] = defaultdict(int)
+    for record in records:
+        totals[record.name.split(".")[0]] += record.self_us
+    return dict(totals)
+
+
+def summarize(records: List[ImportRecord], module: str, top: int = 15) -> str:
+    """
+    Render the slowest modules and packages.
+
+    Args:
+        records: Parsed import records
+        module: The module that was imported
+        top: Rows per table
+
+    Returns:
+        Report text
+    """
+    lines = [f"import {module}: {cumulative_seconds(records, module) * 1000:.1f}ms cumulative", ""]
+    lines.append("slowest modules (self time):")
+    for record in sorted(records, key=lambda record: -record.self_us)[:top]:
+        lines.append(f"  {record.self_us / 1000:8.1f}ms  {record.name}")
+    lines.append("")
+    lines.append("heaviest packages (self time):")
+    for name, total in sorted(package_totals(records).items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"  {total / 1000:8.1f}ms  {name}")
+    return "\n".join(lines)
+
+
+def fastest_run(module: str, runs: int) -> List[ImportRecord]:
+    """Profile several fresh imports and keep the fastest (least noisy) one."""
+    return min(
+        (profile_imports(module) for _ in range(max(runs, 1))),
+        key=lambda records: cumulative_seconds(records, module)
+    )
+
+
+def main(argv=None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget", type=float, help="Fail above this many seconds")
+    args = parser.parse_args(argv)
+
+    records = fastest_run(args.module, args.runs)
+    print(summarize(records, args.module, args.top))
+
+    seconds = cumulative_seconds(records, args.module)
+    if args.budget is not None and seconds > args.budget:
+        print(f"import {args.module} took {seconds:.2f}s, budget is {args.budget:.2f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Benchmarks for battle hot paths
+Damage calculation, full auto-battles and turn order
+"""
+import copy
+
+import pytest
+
+from app.domain.entities.battle import TurnOrder
+from app.services.battle_service import BattleService
+from app.utils.damage_calculator import DamageCalculator
+
+
+# Safety cap for auto-battles (matches the team builder's simulation cap)
+MAX_BATTLE_TURNS = 200
+
+
+def run_battle(service, heroes, enemies):
+    """Auto-play a battle to the end and return the number of actions"""
+    battle = service.start_battle("benchmark-player", "benchmark-stage", heroes, enemies)
+    return service.auto_battle(battle, MAX_BATTLE_TURNS)
+
+
+class TestDamageBenchmarks:
+    """Damage formula throughput"""
+
+    def test_calculate_damage_throughput(self, benchmark, make_heroes, skill_factory, rng):
+        """1000 damage calculations across hero pairs and skill multipliers"""
+        calculator = DamageCalculator()
+        heroes = make_heroes(10)
+        multipliers = [skill.damage_multiplier for skill in skill_factory.get_all_templates()]
+        pairs = [
+            (rng.choice(heroes), rng.choice(heroes), rng.choice(multipliers), rng.random() < 0.2)
+            for _ in range(1000)
+        ]
+
+        def calculate_all():
+            return sum(
+                calculator.calculate_damage(
+                    attacker.stats,
+                    defender.stats,
+                    multiplier,
+                    attacker.element,
+                    defender.element,
+                    is_crit
+                )
+                for attacker, defender, multiplier, is_crit in pairs
+            )
+
+        assert benchmark(calculate_all) > 0
+
+
+class TestBattleBenchmarks:
+    """Whole battles and turn order"""
+
+    def test_full_battle(self, benchmark, make_heroes, make_enemies, rng):
+        """5 heroes against 5 enemies, auto-played to the end"""
+        service = BattleService()
+        heroes = make_heroes(5)
+        enemies = make_enemies(5)
+
+        def setup():
+            return (service, copy.deepcopy(heroes), copy.deepcopy(enemies)), {}
+
+        actions = benchmark.pedantic(run_battle, setup=setup, rounds=20)
+
+        assert 0 < actions <= MAX_BATTLE_TURNS
+
+    def test_turn_order_with_many_units(self, benchmark, make_heroes, make_enemies):
+        """Build and cycle a 24-unit turn order for 10 rounds"""
+        units = make_heroes(12) + make_enemies(12)
+
+        def cycle():
+            order = TurnOrder(characters=units)
+            rounds = 0
+            while rounds < 10:
+                if order.advance():
+                    rounds += 1
+            return order
+
+        order = benchmark(cycle)
+
+        assert len(order.get_order()) == 24
@@ -0,0 +1,43 @@
+"""
+Benchmarks for gacha pulls
+"""
+from collections import Counter
+
+import pytest
+
+from app.services.gacha_service import BANNERS, GachaService
+
+
+# Pulls in the large simulation (a small sample when benchmarks are disabled)
+SIMULATED_PULLS = 1_000_000
+SMOKE_PULLS = 1_000
+
+
+class TestGachaBenchmarks:
+    """Single ten-pulls and a large pull simulation"""
+
+    def test_ten_pull(self, benchmark, run, rng):
+        """One ten-pull through the service"""
+        service = GachaService()
+
+        result = benchmark(lambda: run(service.pull("benchmark-player", "standard", 10)))
+
+        assert len(result["results"]) == 10
+
+    def test_simulated_pulls(self, benchmark, rng):
+        """A million single pulls on the standard banner"""
+        pulls = SMOKE_PULLS if benchmark.disabled else SIMULATED_PULLS
+        banner = BANNERS["standard"]
+
+        def simulate():
+            service = GachaService()
+            return Counter(
+                service._perform_single_pull("benchmark-player", banner)["rarity"]
+                for _ in range(pulls)
+            )
+
+        rarities = benchmark.pedantic(simulate, rounds=1, iterations=1)
+
+        assert sum(rarities.values()) == pulls
+        # Pity guarantees at least one 5-star every pity_counter pulls
+        assert rarities[5] >= pulls // banner["pity_counter"]
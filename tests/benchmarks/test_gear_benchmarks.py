@@ -0,0 +1,25 @@
+"""
+Benchmarks for the gear optimizer
+"""
+import pytest
+
+from app.domain.services.gear_optimizer import GearObjective, GearOptimizer
+from app.domain.services.set_bonus_resolver import SetBonusResolver
+from app.domain.static_data import StaticDataRegistry
+from tests.unit.domain.test_gear_optimizer import BASE, SETS, synthetic_inventory
+
+
+class TestGearBenchmarks:
+    """Loadout search over large inventories"""
+
+    @pytest.mark.parametrize("size", [1_000, 10_000])
+    def test_optimize_inventory(self, benchmark, size):
+        """Top 5 loadouts with a speed floor from a synthetic inventory"""
+        inventory = synthetic_inventory(size, seed=11)
+        objective = GearObjective(weights={"atk": 1.0, "crit": 2.0}, min_stats={"spd": 150})
+        optimizer = GearOptimizer(SetBonusResolver(StaticDataRegistry(SETS)), time_budget=5.0)
+
+        result = benchmark(optimizer.optimize, BASE, inventory, objective, top_k=5)
+
+        assert len(result.loadouts) == 5
+        assert not result.timed_out
@@ -0,0 +1,48 @@
+"""
+Cold start budget for app.main
+
+Runs in the normal suite: a fresh interpreter imports app.main under
+-X importtime. Fails when the import exceeds the budget or when modules
+that should load lazily (SQLAlchemy and its driver, passlib, redis) are
+imported at startup.
+"""
+import os
+
+from tests.benchmarks.import_time import (
+    DEFAULT_BUDGET,
+    cumulative_seconds,
+    fastest_run,
+    parse_importtime,
+    summarize
+)
+
+
+# Loaded on first use only; importing any of them at startup is a regression
+LAZY_PACKAGES = ("sqlalchemy", "asyncpg", "passlib", "redis")
+
+
+class TestImportTime:
+    """Cold start of the API app"""
+
+    def test_parse_importtime(self):
+        """Parses self, cumulative and nesting depth."""
+        records = parse_importtime(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   app.utils\n"
+            "import time:      3000 |       3120 | app.main\n"
+        )
+        assert [(r.name, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+            ("app.utils", 120, 120, 1),
+            ("app.main", 3000, 3120, 0)
+        ]
+        assert cumulative_seconds(records, "app.main") == 0.00312
+
+    def test_app_main_cold_start(self):
+        """import app.main stays within budget and skips lazy packages."""
+        budget = float(os.environ.get("IMPORT_TIME_BUDGET", DEFAULT_BUDGET))
+        records = fastest_run("app.main", runs=2)
+        report = summarize(records, "app.main", top=10)
+
+        loaded = sorted({r.name.split(".")[0] for r in records} & set(LAZY_PACKAGES))
+        assert not loaded, f"imported at startup: {loaded}\n{report}"
+        assert cumulative_seconds(records, "app.main") <= budget, report
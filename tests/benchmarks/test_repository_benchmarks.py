@@ -0,0 +1,126 @@
+"""
+Benchmarks for repository CRUD against in-memory SQLite
+"""
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.config.database import Base
+from app.models.hero import HeroTemplate
+from app.repositories.hero_repository import HeroRepository
+from app.repositories.player_repository import PlayerRepository
+
+
+# Heroes owned by the benchmark player
+ROSTER_SIZE = 50
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    """SQLite has no JSONB; store it as JSON."""
+    return "JSON"
+
+
+@pytest.fixture
+def session(run, hero_factory):
+    """Session on a fresh in-memory database with templates and one roster"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        db = factory()
+        templates = hero_factory.get_all_templates()
+        db.add_all([
+            HeroTemplate(
+                id=template.template_id,
+                name=template.name,
+                element=template.element.value,
+                base_rarity=template.rarity,
+                hero_class="DPS",
+                base_hp=template.base_hp,
+                base_atk=template.base_atk,
+                base_def=template.base_def,
+                base_spd=template.base_spd,
+                base_crit=template.base_crit,
+                base_dex=template.base_dex,
+                growth_hp=1, growth_atk=1, growth_def=1,
+                growth_spd=1, growth_crit=1, growth_dex=1
+            )
+            for template in templates
+        ])
+        player = await PlayerRepository(db).create({
+            "username": "benchmark", "email": "benchmark@example.com", "password_hash": "x"
+        })
+        heroes = HeroRepository(db)
+        for index in range(ROSTER_SIZE):
+            template = templates[index % len(templates)]
+            await heroes.create({
+                "player_id": player.id,
+                "template_id": template.template_id,
+                "current_hp": template.base_hp,
+                "current_atk": template.base_atk,
+                "current_def": template.base_def,
+                "current_spd": template.base_spd,
+                "current_crit": template.base_crit,
+                "current_dex": template.base_dex
+            })
+        await db.commit()
+        return db, player
+
+    db, player = run(setup())
+    db.info["player_id"] = player.id
+    yield db
+    run(db.close())
+    run(engine.dispose())
+
+
+class TestRepositoryBenchmarks:
+    """Repository round trips"""
+
+    def test_player_crud_cycle(self, benchmark, run, session):
+        """Create, read, update and delete one player"""
+        repository = PlayerRepository(session)
+        counter = iter(range(10 ** 9))
+
+        async def crud():
+            index = next(counter)
+            player = await repository.create({
+                "username": f"player{index}",
+                "email": f"player{index}@example.com",
+                "password_hash": "x"
+            })
+            await repository.get_by_username(player.username)
+            await repository.add_experience(player.id, 500)
+            return await repository.delete(player.id)
+
+        assert benchmark(lambda: run(crud()))
+
+    def test_load_roster(self, benchmark, run, session):
+        """Load a 50-hero roster with templates and skills"""
+        repository = HeroRepository(session)
+        player_id = session.info["player_id"]
+
+        async def load():
+            session.expunge_all()
+            return await repository.get_by_player(player_id)
+
+        assert len(benchmark(lambda: run(load()))) == ROSTER_SIZE
+
+    def test_bulk_level_update(self, benchmark, run, session):
+        """Write levels for the whole roster in one statement"""
+        repository = HeroRepository(session)
+        player_id = session.info["player_id"]
+        hero_ids = [hero.id for hero in run(repository.get_by_player(player_id))]
+
+        async def update_all():
+            await repository.bulk_update_levels([
+                {"id": hero_id, "level": 10, "exp": 0} for hero_id in hero_ids
+            ])
+
+        benchmark(lambda: run(update_all()))
@@ -0,0 +1,41 @@
+"""
+Benchmarks for team power
+"""
+import pytest
+
+from app.domain.entities.team import Formation, FormationBonus, Team
+from app.domain.value_objects.grid_position import GridPosition
+
+
+class TestTeamBenchmarks:
+    """Team power evaluation"""
+
+    def test_total_power_after_swaps(self, benchmark, make_heroes):
+        """Swap a member in and out, then read the total power"""
+        heroes = make_heroes(6)
+        team = Team(
+            id="benchmark-team",
+            player_id="benchmark-player",
+            name="Benchmark",
+            slot_number=1,
+            formation=Formation(
+                id="benchmark",
+                name="Benchmark",
+                description="",
+                required_elements=2,
+                bonuses=[FormationBonus(stat="atk", value=10)]
+            )
+        )
+        for index, hero in enumerate(heroes[:5]):
+            team.add_member(hero, GridPosition(index % 3, index // 3))
+        spare = heroes[5]
+
+        def swap_and_score():
+            team.remove_member(heroes[0].id)
+            team.add_member(spare, GridPosition(0, 0))
+            power = team.get_total_power()
+            team.remove_member(spare.id)
+            team.add_member(heroes[0], GridPosition(0, 0))
+            return power
+
+        assert benchmark(swap_and_score) > 0
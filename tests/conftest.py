@@ -0,0 +1,91 @@
+"""
+Shared test configuration
+
+Query tracking runs in strict mode for the whole suite: a request that
+exceeds its route's query budget fails the test. The worst offenders
+are listed at the end of the run.
+
+Repository tests use ``db_session``: a fresh in-memory SQLite database
+(aiosqlite) with every table created, set up as in app.config.sqlite.
+``api`` is an HTTP client on the app whose requests use that session.
+The app's own engine points at a SQLite file in the temp directory.
+"""
+import os
+import tempfile
+
+# The app's own database for this run (removed at the end)
+TEST_DATABASE = os.path.join(tempfile.gettempdir(), f"ngoa_long_tests_{os.getpid()}.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{TEST_DATABASE}")
+os.environ.setdefault("QUERY_TRACKING_ENABLED", "true")
+os.environ.setdefault("QUERY_BUDGET_STRICT", "true")
+# No database for the app's own lifespan; tests load templates and boards themselves
+os.environ.setdefault("WARMUP_EQUIPMENT_TEMPLATES", "false")
+os.environ.setdefault("WARMUP_LEADERBOARDS", "false")
+# No Redis server for the app's shared stores
+os.environ.setdefault("BATTLE_STORE_BACKEND", "memory")
+os.environ.setdefault("LEADERBOARD_BACKEND", "memory")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.config.sqlite import SQLITE_CONNECT_ARGS, configure_sqlite_engine  # noqa: E402
+from app.utils.query_budget import query_tracker  # noqa: E402
+
+
+@pytest.fixture
+async def db_engine():
+    """Async engine on a fresh in-memory SQLite database with every table."""
+    import app.models  # noqa: F401 (registers the models on Base)
+    from app.config.database import Base
+
+    engine = configure_sqlite_engine(
+        create_async_engine("sqlite+aiosqlite://", connect_args=SQLITE_CONNECT_ARGS, poolclass=StaticPool)
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Session on the test database."""
+    factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+
+@pytest.fixture
+async def api(db_session):
+    """
+    Client on the app's /api/v1 with every request on db_session.
+
+    Authenticate with api.headers["Authorization"] = f"Bearer {token}".
+    """
+    from app.api.deps import get_db_session
+    from app.main import app
+
+    async def test_session():
+        yield db_session
+
+    app.dependency_overrides[get_db_session] = test_session
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test/api/v1") as client:
+        yield client
+    app.dependency_overrides.pop(get_db_session, None)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the routes with the most statements per request."""
+    report = query_tracker.report()
+    if report:
+        terminalreporter.section("query budgets")
+        terminalreporter.write_line(report)
+
+
+def pytest_sessionfinish(session):
+    """Remove this run's app database."""
+    if os.path.exists(TEST_DATABASE):
+        os.remove(TEST_DATABASE)
@@ -0,0 +1,16 @@
+"""
+Load test harness
+
+A swarm of scripted virtual players drives the API with open-loop
+(Poisson) session arrivals and reports throughput plus per-endpoint
+latency percentiles and errors.
+
+In-process, against app.main:app with offline stand-ins:
+
+    python -m tests.loadtest --rate 20 --duration 30
+
+Against a local server (same SECRET_KEY as the harness):
+
+    uvicorn app.main:app --workers 4
+    python -m tests.loadtest --url http://127.0.0.1:8000 --workers 4 --rate 200
+"""
@@ -0,0 +1,110 @@
+"""
+Command line entry point: python -m tests.loadtest --help
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+from tests.loadtest.backends import load_app, make_client, prepare_database, started
+from tests.loadtest.runner import LoadConfig, run_load, session_player_ids
+from tests.loadtest.scenarios import Scenario, SessionConfig, resolve_scenario
+
+
+def parse_mix(values: List[str]) -> List[Tuple[Scenario, float]]:
+    """
+    Parse "name[=weight]" scenario options.
+
+    Args:
+        values: Options as given, e.g. ["session=8", "gacha=2"]
+
+    Returns:
+        (scenario, weight) pairs
+    """
+    mix = []
+    for value in values:
+        name, _, weight = value.partition("=")
+        mix.append((resolve_scenario(name), float(weight or 1)))
+    return mix
+
+
+def main(argv=None) -> int:
+    """Run a load test and print the report."""
+    parser = argparse.ArgumentParser(description="Drive the API with a swarm of virtual players")
+    parser.add_argument("--url", help="Server to load (default: app.main:app in-process)")
+    parser.add_argument("--rate", type=float, default=5.0, help="Session arrivals per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of arrivals")
+    parser.add_argument(
+        "--scenario", action="append", default=[],
+        help="name[=weight] or module:function[=weight]; repeatable (default: session)"
+    )
+    parser.add_argument("--max-in-flight", type=int, default=500)
+    parser.add_argument("--session-timeout", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=1, help="Server workers, for req/s per worker")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--stage", default=SessionConfig.stage_id)
+    parser.add_argument("--battle-actions", type=int, default=SessionConfig.battle_actions)
+    parser.add_argument("--pull-count", type=int, default=SessionConfig.pull_count)
+    parser.add_argument("--heroes", type=int, default=5, help="Heroes seeded per new player")
+    parser.add_argument(
+        "--no-seed", action="store_true",
+        help="Skip seeding players into DATABASE_URL (for --url runs whose players exist)"
+    )
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON here")
+    parser.add_argument(
+        "--max-error-rate", type=float,
+        help="Exit non-zero when errors exceed this fraction of requests"
+    )
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        rate=args.rate,
+        duration=args.duration,
+        max_in_flight=args.max_in_flight,
+        session_timeout=args.session_timeout,
+        seed=args.seed,
+        workers=args.workers
+    )
+    session_config = SessionConfig(
+        stage_id=args.stage,
+        battle_actions=args.battle_actions,
+        pull_count=args.pull_count
+    )
+    mix = parse_mix(args.scenario or ["session"])
+
+    async def run():
+        player_ids = session_player_ids(config)
+        if args.url:
+            # The server's players live in its database; DATABASE_URL must point there
+            if not args.no_seed:
+                await prepare_database(player_ids, args.heroes)
+            async with make_client(None, args.url, max_connections=args.max_in_flight) as client:
+                return await run_load(client, mix, config, session_config)
+
+        app = load_app()
+        from app.config.settings import get_settings
+        from app.config.sqlite import is_sqlite
+
+        # Start from empty tables on the SQLite stand-in only, never a real database
+        await prepare_database(
+            player_ids, args.heroes, reset=is_sqlite(get_settings().DATABASE_URL)
+        )
+        async with started(app), make_client(app, max_connections=args.max_in_flight) as client:
+            return await run_load(client, mix, config, session_config)
+
+    report = asyncio.run(run())
+    print(report.render())
+    if args.json:
+        args.json.write_text(json.dumps(report.to_dict(), indent=2) + "\n")
+
+    if args.max_error_rate is not None and report.requests:
+        if report.errors / report.requests > args.max_error_rate:
+            print(f"Error rate above {args.max_error_rate:.1%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
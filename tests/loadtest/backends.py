@@ -0,0 +1,224 @@
+"""
+Targets for the load test
+
+In-process runs drive app.main:app through httpx's ASGI transport with
+offline stand-ins: SQLite (aiosqlite) for the database URL and, when
+fakeredis is installed, a fake Redis behind the leaderboards so the
+Redis code path is exercised without a server. Remote runs talk to a
+local uvicorn over HTTP and use whatever backends it was started with.
+
+Either way the players the sessions log in as must exist: seed them
+with prepare_database() against the database the app uses. The ASGI
+transport sends no lifespan events, so in-process runs wrap the client
+in started(app) to warm up (and shut down) as a server would.
+"""
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional, Sequence
+from uuid import UUID, uuid4
+
+import httpx
+
+try:
+    from fakeredis import aioredis as fake_aioredis
+except ImportError:  # pragma: no cover - optional stand-in
+    fake_aioredis = None
+
+
+API_PREFIX = "/api/v1"
+
+# Resources a seeded player starts with (enough for every scenario)
+SEED_RESOURCES = {"gold": 1_000_000, "gems": 100_000, "stamina": 10_000, "max_stamina": 10_000}
+
+
+def use_offline_backends(database_path: Optional[Path] = None) -> None:
+    """
+    Point the settings at local stand-ins.
+
+    Must run before app.main is first imported, as settings are cached
+    on first use. Values already set in the environment win.
+
+    Args:
+        database_path: SQLite file (defaults to one in the temp directory)
+    """
+    database_path = database_path or Path(tempfile.gettempdir()) / "ngoa_long_loadtest.db"
+    os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{database_path}")
+    os.environ.setdefault("LEADERBOARD_BACKEND", "memory")
+    os.environ.setdefault("BATTLE_STORE_BACKEND", "memory")
+    os.environ.setdefault("QUERY_TRACKING_ENABLED", "false")
+
+
+def load_app(offline: bool = True):
+    """
+    Import the FastAPI app, optionally with offline stand-ins.
+
+    Args:
+        offline: Configure SQLite and fake Redis first
+
+    Returns:
+        The app.main FastAPI application
+    """
+    if offline:
+        use_offline_backends()
+
+    from app.main import app
+
+    if offline and fake_aioredis is not None:
+        from app.api.deps import get_leaderboard_service
+        from app.repositories.leaderboard_repository import RedisLeaderboardRepository
+
+        get_leaderboard_service().repository = RedisLeaderboardRepository(
+            client=fake_aioredis.FakeRedis(decode_responses=True)
+        )
+    return app
+
+
+def make_client(
+    app=None,
+    base_url: Optional[str] = None,
+    max_connections: int = 500,
+    timeout: float = 30.0
+) -> httpx.AsyncClient:
+    """
+    Build the client virtual players share.
+
+    Args:
+        app: ASGI app to call in-process
+        base_url: Server URL (e.g. http://127.0.0.1:8000) used instead of app
+        max_connections: Connection pool size for a remote server
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Client whose base URL ends in /api/v1
+    """
+    if base_url:
+        return httpx.AsyncClient(
+            base_url=base_url.rstrip("/") + API_PREFIX,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest" + API_PREFIX,
+        timeout=timeout
+    )
+
+
+@asynccontextmanager
+async def started(app) -> AsyncIterator[None]:
+    """
+    Run the app's startup and shutdown around an in-process run.
+
+    Args:
+        app: The FastAPI application
+    """
+    async with app.router.lifespan_context(app):
+        yield
+
+
+async def prepare_database(
+    player_ids: Sequence[str],
+    heroes_per_player: int = 5,
+    reset: bool = False
+) -> int:
+    """
+    Create the tables and seed players with heroes to play with.
+
+    Players that already exist are left alone, so a remote server's
+    database can be seeded repeatedly. Uses the app's DATABASE_URL.
+
+    Args:
+        player_ids: Players the sessions will log in as
+        heroes_per_player: Heroes given to each new player
+        reset: Drop every table first (only for a throwaway database)
+
+    Returns:
+        Number of players created
+    """
+    from sqlalchemy import select
+
+    import app.models  # noqa: F401 (registers the models on Base)
+    from app.config.database import Base, get_engine, get_session_factory
+    from app.domain.factories import get_hero_factory
+    from app.models.hero import Hero, HeroTemplate
+    from app.models.player import Player
+
+    async with get_engine().begin() as connection:
+        if reset:
+            await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+    templates = get_hero_factory().get_all_templates()
+    async with get_session_factory()() as session:
+        known = set((await session.execute(select(HeroTemplate.id))).scalars())
+        session.add_all(
+            _template_row(template) for template in templates if template.template_id not in known
+        )
+
+        ids = [UUID(player_id) for player_id in player_ids]
+        existing = set((await session.execute(select(Player.id).where(Player.id.in_(ids)))).scalars())
+        new_ids = [player_id for player_id in ids if player_id not in existing]
+        session.add_all(
+            Player(
+                id=player_id,
+                username=f"load-{player_id.hex[:24]}",
+                email=f"{player_id.hex}@loadtest.invalid",
+                password_hash="load-test",
+                **SEED_RESOURCES
+            )
+            for player_id in new_ids
+        )
+        await session.flush()
+
+        session.add_all(
+            Hero(
+                id=uuid4(),
+                player_id=player_id,
+                template_id=template.template_id,
+                current_hp=template.base_hp,
+                current_atk=template.base_atk,
+                current_def=template.base_def,
+                current_spd=template.base_spd,
+                current_crit=template.base_crit,
+                current_dex=template.base_dex
+            )
+            for number, player_id in enumerate(new_ids)
+            for template in (
+                templates[(number + offset) % len(templates)] for offset in range(heroes_per_player)
+            )
+        )
+        await session.commit()
+    return len(new_ids)
+
+
+def _template_row(template):
+    """HeroTemplate row for a factory template."""
+    from app.models.hero import HeroTemplate
+
+    growth = template.growth_rates
+    return HeroTemplate(
+        id=template.template_id,
+        name=template.name,
+        element=template.element.name,
+        base_rarity=template.rarity,
+        # Factory templates carry no class
+        hero_class="DPS",
+        base_hp=template.base_hp,
+        base_atk=template.base_atk,
+        base_def=template.base_def,
+        base_spd=template.base_spd,
+        base_crit=template.base_crit,
+        base_dex=template.base_dex,
+        growth_hp=growth.get("HP", 0),
+        growth_atk=growth.get("ATK", 0),
+        growth_def=growth.get("DEF", 0),
+        growth_spd=growth.get("SPD", 0),
+        growth_crit=growth.get("CRIT", 0),
+        growth_dex=growth.get("DEX", 0),
+        description=template.description
+    )
@@ -0,0 +1,159 @@
+"""
+Open-loop load runner
+
+Sessions arrive as a Poisson process at a fixed rate whether or not
+earlier sessions have finished, the way real players do. A closed loop
+(N players each starting again when done) slows its own arrivals when
+the server slows down and so hides queueing; here a slow server shows
+up as growing latency and in-flight sessions instead.
+
+Requests inside a session are sequential, as a client would send them.
+Each session plays as its own player, with an ID derived from the seed
+and the session number so the players can be seeded beforehand (see
+session_player_ids).
+"""
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import httpx
+
+from tests.loadtest.scenarios import Scenario, SessionConfig, SessionFailed, VirtualPlayer
+from tests.loadtest.stats import LoadReport
+
+
+# Namespace of the load test's player IDs
+PLAYER_NAMESPACE = uuid.UUID("5b0c2d7e-3f1a-4e8b-9c6d-0a7f1e2b3c4d")
+
+
+@dataclass
+class LoadConfig:
+    """
+    Arrival model and limits.
+
+    Attributes:
+        rate: Mean session arrivals per second
+        duration: Seconds during which sessions arrive
+        max_in_flight: Arrivals beyond this many running sessions are dropped
+        session_timeout: Seconds before a running session is abandoned
+        seed: Seed for arrival times, scenario picks and player choices
+        workers: Server workers behind the target, for per-worker throughput
+    """
+
+    rate: float = 5.0
+    duration: float = 10.0
+    max_in_flight: int = 500
+    session_timeout: float = 60.0
+    seed: int = 1234
+    workers: int = 1
+
+
+def arrival_times(rate: float, duration: float, rng: random.Random) -> List[float]:
+    """
+    Offsets of Poisson arrivals within a window.
+
+    Args:
+        rate: Mean arrivals per second
+        duration: Window length in seconds
+        rng: Random source
+
+    Returns:
+        Ascending offsets in seconds, all below duration
+    """
+    times = []
+    offset = rng.expovariate(rate)
+    while offset < duration:
+        times.append(offset)
+        offset += rng.expovariate(rate)
+    return times
+
+
+def session_player_id(seed: int, number: int) -> str:
+    """
+    Player ID of one session of a seeded run.
+
+    Args:
+        seed: Run seed
+        number: Session number (arrival order)
+
+    Returns:
+        A UUID string, the same for every run with this seed
+    """
+    return str(uuid.uuid5(PLAYER_NAMESPACE, f"load-player-{seed}-{number}"))
+
+
+def session_player_ids(config: LoadConfig) -> List[str]:
+    """
+    Player IDs of every session a run with this config can start.
+
+    Returns:
+        One ID per scheduled arrival, in arrival order
+    """
+    count = len(arrival_times(config.rate, config.duration, random.Random(config.seed)))
+    return [session_player_id(config.seed, number) for number in range(count)]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: Sequence[Tuple[Scenario, float]],
+    config: LoadConfig,
+    session_config: SessionConfig
+) -> LoadReport:
+    """
+    Drive open-loop load against a client.
+
+    Args:
+        client: Client whose base URL ends in /api/v1
+        scenarios: (scenario, weight) pairs each arrival is drawn from
+        config: Arrival model and limits
+        session_config: Knobs passed to every scenario
+
+    Returns:
+        Report of the run
+    """
+    rng = random.Random(config.seed)
+    report = LoadReport(workers=config.workers)
+    functions = [scenario for scenario, _ in scenarios]
+    weights = [weight for _, weight in scenarios]
+    running = set()
+
+    async def session(number: int, scenario: Scenario, player_rng: random.Random) -> None:
+        player = VirtualPlayer(
+            client, report, session_player_id(config.seed, number), player_rng
+        )
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(scenario(player, session_config), config.session_timeout)
+        except SessionFailed:
+            report.sessions_failed += 1
+        except Exception as error:
+            # Timeouts and bugs in a scenario end that session, not the run
+            report.sessions_failed += 1
+            report.session_errors[type(error).__name__] += 1
+        else:
+            report.session_latencies.append(time.perf_counter() - started)
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    for number, offset in enumerate(arrival_times(config.rate, config.duration, rng)):
+        delay = started_at + offset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        report.start_lags.append(max(loop.time() - started_at - offset, 0.0))
+
+        if len(running) >= config.max_in_flight:
+            report.sessions_dropped += 1
+            continue
+        report.sessions_started += 1
+        scenario = rng.choices(functions, weights)[0]
+        task = asyncio.create_task(session(number, scenario, random.Random(rng.random())))
+        running.add(task)
+        task.add_done_callback(running.discard)
+
+    if running:
+        await asyncio.gather(*running)
+    report.wall_seconds = loop.time() - started_at
+    return report
@@ -0,0 +1,243 @@
+"""
+Virtual player scripts
+
+A scenario is an async function taking a VirtualPlayer and a
+SessionConfig. It plays one session through player.request(), which
+times every call under the endpoint's route template. A failed request
+raises SessionFailed and ends the session; the runner counts it.
+
+Custom scenarios can live anywhere and be passed to the command line as
+"package.module:function".
+"""
+import importlib
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import httpx
+
+from tests.loadtest.stats import LoadReport
+
+
+@dataclass
+class SessionConfig:
+    """
+    Knobs for the built-in scenarios.
+
+    Attributes:
+        stage_id: Stage to battle
+        battle_actions: Most player actions per battle (fewer if it ends first)
+        team_size: Most heroes put in the battle team
+        banner_id: Banner to pull on
+        pull_count: Pulls per gacha request
+    """
+
+    stage_id: str = "stage_1_1"
+    battle_actions: int = 20
+    team_size: int = 5
+    banner_id: str = "standard"
+    pull_count: int = 10
+
+
+class SessionFailed(Exception):
+    """A request in a session failed; the session stops there."""
+
+
+class VirtualPlayer:
+    """
+    One simulated player driving the API through an httpx client.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        report: LoadReport,
+        player_id: str,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize the player.
+
+        Args:
+            client: Client whose base URL ends in /api/v1
+            report: Report to record requests into
+            player_id: Player ID signed into the access token
+            rng: Random source for the script's choices
+        """
+        self.client = client
+        self.report = report
+        self.player_id = player_id
+        self.rng = rng or random.Random()
+        self.headers: Dict[str, str] = {}
+
+    async def request(
+        self,
+        method: str,
+        route: str,
+        expect: Iterable[int] = (200, 201),
+        json: Optional[dict] = None,
+        **path_params
+    ) -> dict:
+        """
+        Send one request and record it under its route template.
+
+        Args:
+            method: HTTP method
+            route: Route template relative to /api/v1 (e.g. "/battles/{battle_id}/end")
+            expect: Status codes that count as success
+            json: Request body
+            **path_params: Values for the template's placeholders
+
+        Returns:
+            Decoded JSON body (empty for bodiless responses)
+
+        Raises:
+            SessionFailed: On an unexpected status or any error sending the request
+        """
+        endpoint = f"{method} {route}"
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, route.format(**path_params), json=json, headers=self.headers
+            )
+        except Exception as error:
+            # Transport errors, and in-process the app's own exceptions
+            # (e.g. QueryBudgetExceeded) re-raised by the ASGI transport
+            self.report.record(endpoint, time.perf_counter() - started, type(error).__name__)
+            raise SessionFailed(f"{endpoint}: {error!r}") from error
+
+        elapsed = time.perf_counter() - started
+        if response.status_code not in expect:
+            self.report.record(endpoint, elapsed, str(response.status_code))
+            raise SessionFailed(f"{endpoint}: {response.status_code} {response.text[:200]}")
+        self.report.record(endpoint, elapsed)
+        return response.json() if response.content else {}
+
+    async def login(self) -> None:
+        """
+        Log in and authorize further requests.
+
+        The login endpoint still returns a placeholder token, so the
+        player signs its own access token with the app's SECRET_KEY. A
+        remote server must run with the same SECRET_KEY.
+        """
+        # Imported here so the settings are read after offline backends are configured
+        from app.core.security import create_access_token
+
+        await self.request(
+            "POST", "/auth/login", json={"username": self.player_id, "password": "load-test"}
+        )
+        self.headers["Authorization"] = f"Bearer {create_access_token(self.player_id)}"
+
+
+async def build_team(player: VirtualPlayer, config: SessionConfig) -> str:
+    """
+    Create a team from the player's listed heroes.
+
+    Returns:
+        The team ID
+    """
+    heroes = await player.request("GET", "/heroes")
+    team = await player.request("POST", "/teams", json={"name": "Load test"})
+    for index, hero in enumerate(heroes["heroes"][:config.team_size]):
+        await player.request(
+            "POST",
+            "/teams/{team_id}/members",
+            json={"hero_id": hero["id"], "position": {"x": index % 3, "y": index // 3}},
+            team_id=team["id"]
+        )
+    return team["id"]
+
+
+async def play_battle(player: VirtualPlayer, config: SessionConfig, team_id: str) -> None:
+    """
+    Start a stage, attack until it ends or the action limit, then end it.
+
+    Enemy HP is tracked from the damage in each response so the player
+    always targets a living enemy (the weakest, as a player would).
+    """
+    state = await player.request(
+        "POST", "/battles/start", json={"stage_id": config.stage_id, "team_id": team_id}
+    )
+    battle_id = state["battle_id"]
+    enemy_hp = {
+        enemy["id"]: enemy["current_hp"] for enemy in state["enemy_team"] if enemy["is_alive"]
+    }
+
+    for _ in range(config.battle_actions):
+        if not enemy_hp:
+            break
+        target_id = min(enemy_hp, key=enemy_hp.get)
+        result = await player.request(
+            "POST",
+            "/battles/{battle_id}/action",
+            json={"action_type": "attack", "target_ids": [target_id]},
+            battle_id=battle_id
+        )
+        for hit in result["damage_dealt"] or []:
+            if hit["target_id"] in enemy_hp:
+                enemy_hp[hit["target_id"]] -= hit["damage"]
+                if enemy_hp[hit["target_id"]] <= 0:
+                    del enemy_hp[hit["target_id"]]
+        if result["battle_ended"]:
+            break
+
+    await player.request("POST", "/battles/{battle_id}/end", battle_id=battle_id)
+
+
+async def pull_gacha(player: VirtualPlayer, config: SessionConfig) -> None:
+    """Pull on the configured banner."""
+    await player.request(
+        "POST",
+        "/gacha/pull",
+        json={"banner_id": config.banner_id, "pull_count": config.pull_count}
+    )
+
+
+async def full_session(player: VirtualPlayer, config: SessionConfig) -> None:
+    """Login, list heroes, clear a stage, then a ten-pull."""
+    await player.login()
+    team_id = await build_team(player, config)
+    await play_battle(player, config, team_id)
+    await pull_gacha(player, config)
+
+
+async def battle_session(player: VirtualPlayer, config: SessionConfig) -> None:
+    """Login and clear a stage."""
+    await player.login()
+    team_id = await build_team(player, config)
+    await play_battle(player, config, team_id)
+
+
+async def gacha_session(player: VirtualPlayer, config: SessionConfig) -> None:
+    """Login, check the banners, then pull."""
+    await player.login()
+    await player.request("GET", "/gacha/banners")
+    await pull_gacha(player, config)
+
+
+Scenario = Callable[[VirtualPlayer, SessionConfig], Awaitable[None]]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "session": full_session,
+    "battle": battle_session,
+    "gacha": gacha_session
+}
+
+
+def resolve_scenario(name: str) -> Scenario:
+    """
+    Look up a built-in scenario or import "package.module:function".
+
+    Raises:
+        ValueError: If the name is neither
+    """
+    if name in SCENARIOS:
+        return SCENARIOS[name]
+    module_name, _, attribute = name.partition(":")
+    if not attribute:
+        raise ValueError(
+            f"Unknown scenario {name!r}; use one of {sorted(SCENARIOS)} or module:function"
+        )
+    return getattr(importlib.import_module(module_name), attribute)
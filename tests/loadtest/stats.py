@@ -0,0 +1,199 @@
+"""
+Load test statistics
+
+Latencies are kept as raw samples so percentiles are exact; a run of a
+few minutes produces at most a few hundred thousand floats.
+"""
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+
+# Percentiles shown per endpoint
+REPORT_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples: Values, in any order
+        q: Quantile in [0, 1]
+
+    Returns:
+        The smallest sample with at least q of the samples at or below it
+        (0 when there are no samples)
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(q * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class EndpointStats:
+    """
+    Results for one endpoint (method and route template).
+
+    Attributes:
+        latencies: Duration of every request, errors included (seconds)
+        errors: Failed requests per status code or exception name
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        """Requests sent"""
+        return len(self.latencies)
+
+    @property
+    def error_count(self) -> int:
+        """Requests that failed"""
+        return sum(self.errors.values())
+
+    def record(self, seconds: float, error: Optional[str] = None) -> None:
+        """Record one request."""
+        self.latencies.append(seconds)
+        if error is not None:
+            self.errors[error] += 1
+
+
+@dataclass
+class LoadReport:
+    """
+    Results of one load test run.
+
+    Attributes:
+        endpoints: Stats per "METHOD /route/{template}"
+        session_latencies: Duration of every finished session (seconds)
+        start_lags: How late each session started against its scheduled
+            arrival; large values mean the generator could not keep up
+        sessions_started: Sessions that began
+        sessions_failed: Sessions aborted by a failed request, a timeout or an error
+        session_errors: Failed sessions per exception name, for failures
+            that were not a recorded request (timeouts, scenario bugs)
+        sessions_dropped: Arrivals skipped because max_in_flight was reached
+        wall_seconds: Time from the first arrival to the last response
+        workers: Server workers the load was spread over
+    """
+
+    endpoints: Dict[str, EndpointStats] = field(default_factory=dict)
+    session_latencies: List[float] = field(default_factory=list)
+    start_lags: List[float] = field(default_factory=list)
+    sessions_started: int = 0
+    sessions_failed: int = 0
+    sessions_dropped: int = 0
+    session_errors: Counter = field(default_factory=Counter)
+    wall_seconds: float = 0.0
+    workers: int = 1
+
+    def record(self, endpoint: str, seconds: float, error: Optional[str] = None) -> None:
+        """
+        Record one request.
+
+        Args:
+            endpoint: "METHOD /route/{template}"
+            seconds: Request duration
+            error: Status code or exception name when the request failed
+        """
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.record(seconds, error)
+
+    @property
+    def requests(self) -> int:
+        """Requests sent across all endpoints"""
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        """Failed requests across all endpoints"""
+        return sum(stats.error_count for stats in self.endpoints.values())
+
+    @property
+    def requests_per_second(self) -> float:
+        """Throughput over the whole run"""
+        return self.requests / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def requests_per_second_per_worker(self) -> float:
+        """Throughput divided by the number of server workers"""
+        return self.requests_per_second / max(self.workers, 1)
+
+    @property
+    def sessions_per_second(self) -> float:
+        """Finished sessions per second"""
+        return len(self.session_latencies) / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        """Summary suitable for JSON output."""
+        return {
+            "wall_seconds": self.wall_seconds,
+            "workers": self.workers,
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_second": self.requests_per_second,
+            "requests_per_second_per_worker": self.requests_per_second_per_worker,
+            "sessions": {
+                "started": self.sessions_started,
+                "completed": len(self.session_latencies),
+                "failed": self.sessions_failed,
+                "dropped": self.sessions_dropped,
+                "errors": dict(self.session_errors),
+                "per_second": self.sessions_per_second,
+                **_percentiles(self.session_latencies)
+            },
+            "start_lag": _percentiles(self.start_lags),
+            "endpoints": {
+                endpoint: {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    **_percentiles(stats.latencies)
+                }
+                for endpoint, stats in sorted(self.endpoints.items())
+            }
+        }
+
+    def render(self) -> str:
+        """Human-readable report table."""
+        lines = [
+            f"{self.requests} requests in {self.wall_seconds:.1f}s: "
+            f"{self.requests_per_second:.1f} req/s "
+            f"({self.requests_per_second_per_worker:.1f} per worker over {self.workers}), "
+            f"{self.errors} errors",
+            f"sessions: {self.sessions_started} started, {len(self.session_latencies)} completed, "
+            f"{self.sessions_failed} failed, {self.sessions_dropped} dropped, "
+            f"{self.sessions_per_second:.2f}/s, "
+            f"p50 {_ms(percentile(self.session_latencies, 0.5))} "
+            f"p99 {_ms(percentile(self.session_latencies, 0.99))}",
+            *(f"    {error}: {count}" for error, count in self.session_errors.most_common()),
+            f"start lag: p50 {_ms(percentile(self.start_lags, 0.5))} "
+            f"p99 {_ms(percentile(self.start_lags, 0.99))}",
+            "",
+            f"{'endpoint':<40} {'reqs':>7} {'errors':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+        ]
+        for endpoint, stats in sorted(self.endpoints.items()):
+            lines.append(
+                f"{endpoint:<40} {stats.requests:>7} {stats.error_count:>7} "
+                + " ".join(f"{_ms(percentile(stats.latencies, q)):>9}" for q in REPORT_PERCENTILES)
+                + f" {_ms(max(stats.latencies, default=0.0)):>9}"
+            )
+            for error, count in stats.errors.most_common():
+                lines.append(f"    {error}: {count}")
+        return "\n".join(lines)
+
+
+def _percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    """Report percentiles keyed p50/p95/p99, in seconds."""
+    return {f"p{round(q * 100)}": percentile(samples, q) for q in REPORT_PERCENTILES}
+
+
+def _ms(seconds: float) -> str:
+    """Render seconds as milliseconds."""
+    return f"{seconds * 1000:.1f}ms"
@@ -0,0 +1,135 @@
+"""
+Tests for the load test harness
+"""
+import random
+
+import pytest
+
+from tests.loadtest.backends import make_client, prepare_database, started
+from tests.loadtest.runner import (
+    LoadConfig,
+    arrival_times,
+    run_load,
+    session_player_id,
+    session_player_ids
+)
+from tests.loadtest.scenarios import (
+    SCENARIOS,
+    SessionConfig,
+    full_session,
+    gacha_session,
+    resolve_scenario
+)
+from tests.loadtest.stats import LoadReport, percentile
+
+
+@pytest.fixture
+def app():
+    """The FastAPI app, in-process"""
+    from app.main import app
+    return app
+
+
+class TestStats:
+    """Tests for percentiles and the report"""
+
+    def test_percentile_nearest_rank(self):
+        """Percentiles pick the nearest-rank sample."""
+        samples = [float(value) for value in range(1, 101)]
+        assert percentile(samples, 0.5) == 50.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile(samples, 1.0) == 100.0
+        assert percentile([], 0.5) == 0.0
+
+    def test_report_counts_errors_per_endpoint(self):
+        """Errors are counted per endpoint and status."""
+        report = LoadReport(wall_seconds=2.0, workers=2)
+        report.record("GET /heroes", 0.01)
+        report.record("GET /heroes", 0.02, "500")
+        report.record("POST /gacha/pull", 0.03)
+        report.record("POST /gacha/pull", 0.04)
+
+        assert report.requests == 4
+        assert report.errors == 1
+        assert report.requests_per_second == 2.0
+        assert report.requests_per_second_per_worker == 1.0
+        assert report.to_dict()["endpoints"]["GET /heroes"]["errors"] == {"500": 1}
+        assert "GET /heroes" in report.render()
+
+
+class TestArrivals:
+    """Tests for the open-loop arrival model"""
+
+    def test_arrivals_are_seeded_and_within_window(self):
+        """Arrival times repeat for a seed and stay inside the window."""
+        first = arrival_times(100, 10, random.Random(7))
+        second = arrival_times(100, 10, random.Random(7))
+        assert first == second
+        assert first == sorted(first)
+        assert all(0 <= offset < 10 for offset in first)
+
+    def test_arrival_count_matches_rate(self):
+        """About rate x duration sessions arrive."""
+        count = len(arrival_times(100, 10, random.Random(7)))
+        assert 900 < count < 1100
+
+
+class TestScenarios:
+    """Tests for the virtual player scripts"""
+
+    def test_resolve_scenario(self):
+        """Built-in names and module:function paths resolve."""
+        assert resolve_scenario("session") is SCENARIOS["session"]
+        assert resolve_scenario("tests.loadtest.scenarios:gacha_session") is gacha_session
+        with pytest.raises(ValueError):
+            resolve_scenario("unknown")
+
+    def test_player_ids_follow_the_arrivals(self):
+        """Every scheduled session gets its own stable player ID."""
+        config = LoadConfig(rate=40, duration=0.25, seed=3)
+        player_ids = session_player_ids(config)
+
+        assert len(player_ids) == len(arrival_times(40, 0.25, random.Random(3)))
+        assert len(set(player_ids)) == len(player_ids)
+        assert player_ids[0] == session_player_id(3, 0)
+
+    async def test_run_load_in_process(self, app):
+        """A short in-process run against seeded players completes sessions without errors."""
+        config = LoadConfig(rate=40, duration=0.25, seed=3)
+        assert await prepare_database(session_player_ids(config), reset=True) > 0
+
+        async with started(app), make_client(app) as client:
+            report = await run_load(client, [(full_session, 1)], config, SessionConfig(battle_actions=5))
+
+        assert report.sessions_started > 0
+        assert report.sessions_failed == 0
+        assert len(report.session_latencies) == report.sessions_started
+        assert report.errors == 0
+        assert not report.session_errors
+        assert report.endpoints["POST /gacha/pull"].requests == report.sessions_started
+        assert report.endpoints["POST /battles/{battle_id}/action"].requests > 0
+
+    async def test_unexpected_errors_fail_the_session_only(self, app):
+        """An exception that is not an HTTP error ends its session and is counted."""
+        async def broken(player, config):
+            raise RuntimeError("scenario bug")
+
+        async def app_error(player, config):
+            await player.request("GET", "/boom")
+
+        async def raising_app(scope, receive, send):
+            raise LookupError("budget exceeded")
+
+        async with make_client(raising_app) as client:
+            report = await run_load(
+                client,
+                [(broken, 1), (app_error, 1)],
+                LoadConfig(rate=40, duration=0.25, seed=3),
+                SessionConfig()
+            )
+
+        assert report.sessions_started > 0
+        assert report.sessions_failed == report.sessions_started
+        assert report.session_errors["RuntimeError"] + report.endpoints["GET /boom"].errors[
+            "LookupError"
+        ] == report.sessions_started
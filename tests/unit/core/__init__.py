@@ -0,0 +1 @@
+# Core unit tests
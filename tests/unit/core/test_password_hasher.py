@@ -0,0 +1,154 @@
+"""
+Tests for PasswordHasher
+Hashing runs off the event loop and sheds load when saturated
+"""
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.exceptions import ServerBusyException
+from app.core.password_hasher import PasswordHasher
+
+
+def create_context(rounds: int) -> CryptContext:
+    """Helper to create a bcrypt context pinned to a cost factor"""
+    return CryptContext(
+        schemes=["bcrypt"],
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds
+    )
+
+
+class BlockingContext:
+    """Stub context whose hash() blocks until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.release.wait(timeout=5)
+        return f"hashed:{password}"
+
+
+class TestPasswordHashing:
+    """Test hashing and verification through the pool"""
+
+    async def test_hash_and_verify(self):
+        """Should verify a password hashed by the pool"""
+        hasher = PasswordHasher(context=create_context(4))
+
+        hashed = await hasher.hash("password")
+
+        assert await hasher.verify("password", hashed) is True
+        assert await hasher.verify("wrong", hashed) is False
+
+    async def test_no_rehash_when_cost_unchanged(self):
+        """Should not rehash when cost factor matches"""
+        hasher = PasswordHasher(context=create_context(4))
+        hashed = await hasher.hash("password")
+
+        is_valid, new_hash = await hasher.verify_and_update("password", hashed)
+
+        assert is_valid is True
+        assert new_hash is None
+
+    async def test_rehash_when_cost_changes(self):
+        """Should return a new hash when cost factor changed"""
+        old_hasher = PasswordHasher(context=create_context(4))
+        new_hasher = PasswordHasher(context=create_context(5))
+        hashed = await old_hasher.hash("password")
+
+        is_valid, new_hash = await new_hasher.verify_and_update("password", hashed)
+
+        assert is_valid is True
+        assert new_hash is not None
+        assert "$05$" in new_hash
+
+    async def test_no_rehash_for_wrong_password(self):
+        """Should not rehash when the password does not match"""
+        old_hasher = PasswordHasher(context=create_context(4))
+        new_hasher = PasswordHasher(context=create_context(5))
+        hashed = await old_hasher.hash("password")
+
+        is_valid, new_hash = await new_hasher.verify_and_update("wrong", hashed)
+
+        assert is_valid is False
+        assert new_hash is None
+
+
+class TestBackPressure:
+    """Test admission control"""
+
+    async def test_rejects_when_saturated(self):
+        """Should raise 429 immediately when pool and queue are full"""
+        context = BlockingContext()
+        hasher = PasswordHasher(max_workers=1, queue_limit=1, context=context)
+
+        running = asyncio.ensure_future(hasher.hash("a"))
+        queued = asyncio.ensure_future(hasher.hash("b"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServerBusyException) as exc_info:
+            await hasher.hash("c")
+
+        assert exc_info.value.status_code == 429
+
+        context.release.set()
+        assert await asyncio.gather(running, queued) == ["hashed:a", "hashed:b"]
+        assert hasher.in_flight == 0
+        hasher.shutdown()
+
+    async def test_accepts_again_after_drain(self):
+        """Should admit new work once slots are freed"""
+        context = BlockingContext()
+        context.release.set()
+        hasher = PasswordHasher(max_workers=1, queue_limit=0, context=context)
+
+        assert await hasher.hash("a") == "hashed:a"
+        assert await hasher.hash("b") == "hashed:b"
+
+
+class TestLoginBurstLatency:
+    """Load test: event loop stays responsive during a login burst"""
+
+    async def test_event_loop_latency_stays_flat(self):
+        """Loop lag should stay far below a single bcrypt verification"""
+        hasher = PasswordHasher(max_workers=4, queue_limit=64, context=create_context(10))
+        hashed = await hasher.hash("password")
+
+        # Cost of one verification when run inline on the loop
+        start = time.perf_counter()
+        create_context(10).verify("password", hashed)
+        single_verify = time.perf_counter() - start
+
+        # A full collection landing in the probe window would be
+        # measured as loop lag; take it up front
+        gc.collect()
+        lags = []
+        done = asyncio.Event()
+
+        async def probe():
+            interval = 0.005
+            while not done.is_set():
+                tick = time.perf_counter()
+                await asyncio.sleep(interval)
+                lags.append(time.perf_counter() - tick - interval)
+
+        probe_task = asyncio.ensure_future(probe())
+        results = await asyncio.gather(
+            *(hasher.verify("password", hashed) for _ in range(32))
+        )
+        done.set()
+        await probe_task
+        hasher.shutdown()
+
+        assert all(results)
+        assert lags
+        # Inline hashing would stall the loop for at least one full
+        # verification per login; offloaded it stays near the probe interval
+        assert max(lags) < max(0.02, single_verify / 2)
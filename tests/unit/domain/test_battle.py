@@ -387,3 +387,37 @@ class TestTurnOrderClass:
         
         assert turn_order.current_index == 0
         assert is_new_round is True
+
+
+class TestTurnPointer:
+    """Test capturing and restoring the turn pointer"""
+    
+    def test_restore_turn_pointer(self):
+        """Restored battle should resume at the same actor and round"""
+        hero = create_test_hero(spd=150)
+        enemy = create_test_enemy(spd=100)
+        battle = Battle(
+            id=str(uuid4()),
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[enemy]
+        )
+        battle.calculate_turn_order()
+        battle.next_turn()
+        battle.next_turn()
+        battle.next_turn()
+        pointer = battle.get_turn_pointer()
+        
+        restored = Battle(
+            id=battle.id,
+            player_id=battle.player_id,
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[enemy]
+        )
+        restored.restore_turn_pointer(pointer)
+        
+        assert restored.turn_number == 2
+        assert restored.get_current_actor().id == enemy.id
+        assert pointer["order"] == [hero.id, enemy.id]
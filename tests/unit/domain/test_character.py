@@ -440,6 +440,31 @@ class TestHeroExperience:
         
         assert hero.level >= 2
         assert result.leveled_up is True
+    
+    def test_large_exp_gain_matches_level_by_level(self):
+        """Closed-form level up should match applying one level at a time"""
+        hero = Hero(
+            id=str(uuid4()),
+            name="Test Hero",
+            element=Element.MOC,
+            position=GridPosition(x=0, y=0),
+            stats=HexagonStats.default(),
+            template_id="test",
+            level=3,
+            exp=20
+        )
+        
+        level, exp = 3, 20 + 123456
+        while exp >= hero.get_required_exp(level):
+            exp -= hero.get_required_exp(level)
+            level += 1
+        
+        result = hero.gain_exp(123456)
+        
+        assert (hero.level, hero.exp) == (level, exp)
+        assert result.old_level == 3
+        assert result.new_level == level
+        assert result.exp_remaining == exp
 
 
 class TestHeroEquipment:
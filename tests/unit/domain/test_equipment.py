@@ -4,7 +4,7 @@ Following TDD approach - tests written first
 """
 import pytest
 from uuid import uuid4
-from app.domain.entities.equipment import Equipment, EquipmentType, Rarity
+from app.domain.entities.equipment import Equipment, EquipmentType, Rarity, enhance_gold_cost
 
 
 class TestEquipmentCreation:
@@ -334,6 +334,53 @@ class TestEquipmentEnhancement:
         
         assert equipment.level == 2
         assert result.success is True
+    
+    def test_enhance_to_matches_single_steps(self):
+        """Enhancing to a level should equal enhancing one level at a time"""
+        def make():
+            return Equipment(
+                id="eq-1",
+                name="Test Weapon",
+                equipment_type=EquipmentType.WEAPON,
+                rarity=Rarity.MYTHIC,
+                base_hp=55,
+                base_atk=43,
+                base_spd=9
+            )
+        stepped = make()
+        for _ in range(29):
+            stepped.enhance()
+        direct = make()
+        
+        result = direct.enhance_to(30)
+        
+        assert direct.level == stepped.level == 30
+        assert direct.get_total_stats() == stepped.get_total_stats()
+        assert result.stats_gained.atk == 4 * 29
+        # Sum of level * 100 for levels 1..29
+        assert result.gold_cost == 43500
+    
+    def test_enhance_to_caps_at_max_level(self):
+        """Targets above the rarity cap should stop at max level"""
+        equipment = Equipment(
+            id="eq-1",
+            name="Test Weapon",
+            equipment_type=EquipmentType.WEAPON,
+            rarity=Rarity.COMMON,
+            base_atk=10
+        )
+        
+        assert equipment.get_enhance_cost(99) == enhance_gold_cost(1, 10)
+        result = equipment.enhance_to(99)
+        
+        assert result.new_level == 10
+        assert equipment.enhance_to(12).success is False
+    
+    def test_enhance_gold_cost(self):
+        """Cost should be the sum of level * 100 over the range"""
+        assert enhance_gold_cost(1, 2) == 100
+        assert enhance_gold_cost(5, 8) == 500 + 600 + 700
+        assert enhance_gold_cost(8, 8) == 0
 
 
 class TestEquipmentSet:
@@ -0,0 +1,116 @@
+"""
+Tests for EquipmentFusion Domain Service
+Result rarity, template choice and substat merging
+"""
+import pytest
+
+from app.domain.services.equipment_fusion import EquipmentFusion, FusionInput, merge_substats
+from app.domain.static_data import StaticDataRegistry
+
+
+TEMPLATES = [
+    {"id": "iron_sword", "name": "Thiết Kiếm", "equipment_type": "WEAPON", "base_rarity": 3},
+    {"id": "steel_sword", "name": "Cương Kiếm", "equipment_type": "WEAPON", "base_rarity": 4},
+    {"id": "thanh_long_dao", "name": "Thanh Long Đao", "equipment_type": "WEAPON",
+     "base_rarity": 4, "set_id": "thanh_long"},
+    {"id": "leather_armor", "name": "Giáp Da", "equipment_type": "ARMOR", "base_rarity": 3}
+]
+
+
+@pytest.fixture
+def fusion():
+    """Planner over a registry with test templates"""
+    registry = StaticDataRegistry()
+    registry.load_equipment_templates(TEMPLATES)
+    return EquipmentFusion(registry)
+
+
+def make_input(piece_id, template_id="iron_sword", rarity=3, equipment_type="weapon", **kwargs):
+    """Create a fusion input"""
+    return FusionInput(
+        id=piece_id,
+        template_id=template_id,
+        equipment_type=equipment_type,
+        rarity=rarity,
+        **kwargs
+    )
+
+
+class TestPlan:
+    """Test planning a single fusion"""
+
+    def test_three_same_rarity_upgrade(self, fusion):
+        """Three pieces of one rarity should produce the next rarity"""
+        plan = fusion.plan([make_input("a"), make_input("b"), make_input("c")])
+
+        assert plan.rarity == 4
+        assert plan.template.id == "steel_sword"
+        assert plan.consumed == ["a", "b", "c"]
+
+    def test_upgrade_prefers_primary_set(self, fusion):
+        """The result should stay in the primary's set when possible"""
+        inputs = [make_input(p, set_id="thanh_long") for p in "abc"]
+
+        assert fusion.plan(inputs).template.id == "thanh_long_dao"
+
+    def test_two_pieces_keep_rarity(self, fusion):
+        """Below the upgrade count the lowest rarity is kept"""
+        plan = fusion.plan([make_input("a", "steel_sword", 4), make_input("b")])
+
+        assert plan.rarity == 3
+        assert plan.template.id == "iron_sword"
+
+    def test_locked_and_equipped_rejected(self, fusion):
+        """Locked or equipped pieces should never be consumed"""
+        with pytest.raises(ValueError, match="locked"):
+            fusion.plan([make_input("a"), make_input("b", is_locked=True)])
+        with pytest.raises(ValueError, match="equipped"):
+            fusion.plan([make_input("a"), make_input("b", is_equipped=True)])
+
+    def test_mixed_types_rejected(self, fusion):
+        """Only one equipment type may be fused"""
+        with pytest.raises(ValueError):
+            fusion.plan([make_input("a"), make_input("b", "leather_armor", equipment_type="armor")])
+
+    def test_substats_merged(self):
+        """Best value kept, others added at half, top 4 kept"""
+        merged = merge_substats([
+            [{"stat": "ATK", "value": 10}, {"stat": "SPD", "value": 4}],
+            [{"stat": "atk", "value": 6}, {"stat": "HP", "value": 50}],
+            [{"stat": "DEF", "value": 8}, {"stat": "CRIT", "value": 3}, {"stat": "MANA", "value": 99}]
+        ])
+
+        assert merged == [
+            {"stat": "HP", "value": 50},
+            {"stat": "ATK", "value": 13},
+            {"stat": "DEF", "value": 8},
+            {"stat": "SPD", "value": 4}
+        ]
+
+
+class TestPlanDuplicates:
+    """Test planning fusions over a whole inventory"""
+
+    def test_groups_by_template(self, fusion):
+        """Full groups of one template fuse, leftovers stay"""
+        inventory = (
+            [make_input(f"sword-{i}") for i in range(7)]
+            + [make_input(f"armor-{i}", "leather_armor", equipment_type="armor") for i in range(2)]
+        )
+
+        plans = fusion.plan_duplicates(inventory)
+
+        assert [plan.consumed for plan in plans] == [
+            ["sword-0", "sword-1", "sword-2"],
+            ["sword-3", "sword-4", "sword-5"]
+        ]
+
+    def test_protected_pieces_skipped(self, fusion):
+        """Locked and equipped pieces should not count as duplicates"""
+        inventory = [
+            make_input("a"), make_input("b", is_locked=True),
+            make_input("c", is_equipped=True), make_input("d")
+        ]
+
+        assert fusion.plan_duplicates(inventory) == []
+        assert fusion.plan_duplicates(inventory, group_size=2)[0].consumed == ["a", "d"]
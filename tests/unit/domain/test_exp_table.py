@@ -0,0 +1,55 @@
+"""
+Tests for ExpTable Value Object
+Cumulative EXP curve with closed-form level-ups
+"""
+import pytest
+
+from app.domain.value_objects.exp_table import ExpTable
+
+
+def apply_by_loop(required, level, exp, amount):
+    """Reference implementation: one level at a time"""
+    exp += amount
+    while exp >= required(level):
+        exp -= required(level)
+        level += 1
+    return level, exp
+
+
+class TestExpTable:
+    """Test cumulative EXP lookups"""
+    
+    def test_total_exp_for_level(self):
+        """Cumulative EXP should be the sum of per-level requirements"""
+        table = ExpTable(lambda level: level * 100)
+        
+        assert table.total_exp_for_level(1) == 0
+        assert table.total_exp_for_level(2) == 100
+        assert table.total_exp_for_level(4) == 100 + 200 + 300
+    
+    def test_exact_threshold_levels_up(self):
+        """Reaching the requirement exactly should level up with 0 left"""
+        table = ExpTable(lambda level: level * 100)
+        
+        assert table.apply(1, 0, 100) == (2, 0)
+        assert table.apply(1, 0, 99) == (1, 99)
+    
+    @pytest.mark.parametrize("level,exp,amount", [
+        (1, 0, 0),
+        (1, 50, 49),
+        (5, 120, 10_000),
+        (42, 0, 1_000_000),
+        (1, 0, 50_000_000),
+    ])
+    def test_matches_level_by_level(self, level, exp, amount):
+        """Should match the iterative level-up for any amount"""
+        required = lambda lvl: 100 + lvl * 50
+        table = ExpTable(required, initial_levels=10)
+        
+        assert table.apply(level, exp, amount) == apply_by_loop(required, level, exp, amount)
+    
+    def test_table_grows_on_demand(self):
+        """Levels beyond the precomputed range should still resolve"""
+        table = ExpTable(lambda level: 10, initial_levels=5)
+        
+        assert table.apply(1, 0, 10_000) == (1001, 0)
@@ -0,0 +1,218 @@
+"""
+Tests for GearOptimizer Domain Service
+Branch-and-bound loadout search with Pareto pruning
+"""
+import itertools
+import random
+
+import pytest
+
+from app.domain.entities.equipment import Equipment, EquipmentType, Rarity
+from app.domain.services.gear_optimizer import SLOTS, GearObjective, GearOptimizer, pareto_filter
+from app.domain.services.set_bonus_resolver import SetBonusResolver
+from app.domain.static_data import StaticDataRegistry
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+BASE = HexagonStats(hp=1000, atk=100, def_=50, spd=100, crit=10, dex=10)
+
+SETS = [
+    {"id": "thanh_long", "name": "Thanh Long", "two_piece_bonus": {"atk": 40}},
+    {"id": "bat_quai", "name": "Bát Quái", "two_piece_bonus": {"spd": 30},
+     "four_piece_bonus": {"spd": 30, "atk": 20}}
+]
+
+
+@pytest.fixture
+def optimizer():
+    """Optimizer over a registry with two test sets"""
+    return GearOptimizer(SetBonusResolver(StaticDataRegistry(SETS)), time_budget=5.0)
+
+
+def make_piece(piece_id, slot, set_id=None, **stats):
+    """Create a piece with the given base stats"""
+    return Equipment(
+        id=piece_id,
+        name=piece_id,
+        equipment_type=EquipmentType(slot),
+        rarity=Rarity.EPIC,
+        set_id=set_id,
+        **{f"base_{name.rstrip('_')}": value for name, value in stats.items()}
+    )
+
+
+def synthetic_inventory(size, seed=7):
+    """Random inventory spread over all slots and sets"""
+    rng = random.Random(seed)
+    sets = [None, None, "thanh_long", "bat_quai"]
+    return [
+        make_piece(
+            f"eq-{index}",
+            SLOTS[index % len(SLOTS)],
+            rng.choice(sets),
+            hp=rng.randint(0, 300),
+            atk=rng.randint(0, 80),
+            def_=rng.randint(0, 60),
+            spd=rng.randint(0, 25),
+            crit=rng.randint(0, 15),
+            dex=rng.randint(0, 15)
+        )
+        for index in range(size)
+    ]
+
+
+def brute_force(optimizer, inventory, objective, top_k):
+    """Reference: score every loadout"""
+    by_slot = [[p for p in inventory if p.equipment_type.value == slot] + [None] for slot in SLOTS]
+    scores = []
+    for pieces in itertools.product(*by_slot):
+        pieces = [piece for piece in pieces if piece is not None]
+        bonus = optimizer.set_resolver.resolve(p.set_id for p in pieces)
+        stats = BASE.add(bonus)
+        for piece in pieces:
+            stats = stats.add(piece.get_total_stats())
+        if objective.is_satisfied(stats):
+            scores.append(objective.score(stats))
+    return sorted(scores, reverse=True)[:top_k]
+
+
+class TestObjective:
+    """Test objective parsing"""
+
+    def test_unknown_stat_rejected(self):
+        """Unknown stats should raise"""
+        with pytest.raises(ValueError):
+            GearObjective(weights={"mana": 1})
+
+    def test_zero_weights_rejected(self):
+        """An objective must optimize something"""
+        with pytest.raises(ValueError):
+            GearObjective(weights={"atk": 0})
+
+
+class TestParetoFilter:
+    """Test per-slot dominance pruning"""
+
+    def test_dominated_piece_dropped(self):
+        """A piece worse on every relevant stat should be dropped"""
+        objective = GearObjective(weights={"atk": 1}, min_stats={"spd": 120})
+        strong = make_piece("strong", "weapon", atk=50, spd=10)
+        weak = make_piece("weak", "weapon", atk=40, spd=5, hp=999)
+        fast = make_piece("fast", "weapon", atk=10, spd=20)
+
+        kept = pareto_filter([weak, strong, fast], objective)
+
+        assert {p.id for p in kept} == {"strong", "fast"}
+
+    def test_keep_k_dominators(self):
+        """With keep=2 a piece dominated once should survive"""
+        objective = GearObjective(weights={"atk": 1})
+        pieces = [make_piece(f"p{atk}", "weapon", atk=atk) for atk in (30, 20, 10)]
+
+        kept = pareto_filter(pieces, objective, keep=2)
+
+        assert [p.id for p in kept] == ["p30", "p20"]
+
+    def test_identical_pieces_kept_once(self):
+        """Copies with the same relevant stats should collapse to one"""
+        objective = GearObjective(weights={"atk": 1})
+        copies = [make_piece(f"copy{i}", "weapon", atk=30, hp=i) for i in range(4)]
+
+        kept = pareto_filter(copies + [make_piece("weak", "weapon", atk=20)], objective, keep=2)
+
+        assert [p.id for p in kept] == ["copy0", "weak"]
+
+
+class TestOptimize:
+    """Test the branch-and-bound search"""
+
+    def test_matches_brute_force(self, optimizer):
+        """Top scores should equal an exhaustive search"""
+        inventory = synthetic_inventory(32, seed=3)
+        objective = GearObjective(weights={"atk": 1.0, "crit": 2.0})
+
+        result = optimizer.optimize(BASE, inventory, objective, top_k=5)
+
+        assert [l.score for l in result.loadouts] == pytest.approx(
+            brute_force(optimizer, inventory, objective, 5)
+        )
+        assert not result.timed_out
+
+    def test_constraint_respected(self, optimizer):
+        """Loadouts should satisfy minimum stats, matching brute force"""
+        inventory = synthetic_inventory(32, seed=5)
+        objective = GearObjective(weights={"ATK": 1.0}, min_stats={"SPD": 160})
+
+        result = optimizer.optimize(BASE, inventory, objective, top_k=3)
+
+        assert all(l.stats.spd >= 160 for l in result.loadouts)
+        assert [l.score for l in result.loadouts] == pytest.approx(
+            brute_force(optimizer, inventory, objective, 3)
+        )
+
+    def test_set_bonus_can_win(self, optimizer):
+        """Two weaker set pieces should beat stronger off-set pieces"""
+        inventory = [
+            make_piece("w-set", "weapon", "thanh_long", atk=30),
+            make_piece("a-set", "armor", "thanh_long", atk=30),
+            make_piece("w-off", "weapon", atk=45),
+            make_piece("a-off", "armor", atk=45)
+        ]
+
+        result = optimizer.optimize(BASE, inventory, GearObjective(weights={"atk": 1}), top_k=1)
+
+        best = result.loadouts[0]
+        assert best.pieces["weapon"].id == "w-set"
+        assert best.pieces["armor"].id == "a-set"
+        assert best.stats.atk == 100 + 60 + 40
+        assert best.pieces["relic"] is None
+
+    def test_slot_left_empty_when_pieces_hurt(self, optimizer):
+        """With a negative weight, an empty slot should beat any piece"""
+        inventory = [
+            make_piece("w-slow", "weapon", atk=50, spd=20),
+            make_piece("a-slow", "armor", atk=5, spd=10)
+        ]
+        objective = GearObjective(weights={"atk": 1, "spd": -2})
+
+        result = optimizer.optimize(BASE, inventory, objective, top_k=1)
+
+        best = result.loadouts[0]
+        assert best.pieces["weapon"].id == "w-slow"
+        assert best.pieces["armor"] is None
+        assert best.score == pytest.approx(100 - 200 + 50 - 40)
+
+    def test_time_budget_stops_search(self):
+        """An exhausted budget should stop early and report it"""
+        ticks = itertools.count()
+        optimizer = GearOptimizer(
+            SetBonusResolver(StaticDataRegistry(SETS)),
+            clock=lambda: next(ticks)
+        )
+
+        result = optimizer.optimize(
+            BASE, synthetic_inventory(400), GearObjective(weights={"hp": 1, "atk": 1, "def": 1}),
+            top_k=50, time_budget=0
+        )
+
+        assert result.timed_out
+        assert len(result.loadouts) <= 50
+
+
+class TestLargeInventory:
+    """Search work on synthetic inventories"""
+
+    @pytest.mark.parametrize("size", [1_000, 10_000])
+    def test_search_work_is_bounded(self, optimizer, size):
+        """Pruning should keep the visited nodes flat as the inventory grows"""
+        inventory = synthetic_inventory(size)
+        objective = GearObjective(weights={"atk": 1.0}, min_stats={"spd": 150})
+        # Frozen clock: the budget never runs out, so only the search bounds the work
+        frozen = GearOptimizer(optimizer.set_resolver, clock=lambda: 0.0)
+
+        result = frozen.optimize(BASE, inventory, objective, top_k=5, time_budget=0)
+
+        assert not result.timed_out
+        assert len(result.loadouts) == 5
+        assert result.candidates < size / 4
+        assert result.explored < 2_000
@@ -5,7 +5,7 @@ Following TDD approach - tests written first
 import pytest
 from uuid import uuid4
 
-from app.domain.factories.hero_factory import HeroFactory, HeroTemplate
+from app.domain.factories.hero_factory import HeroFactory, HeroTemplate, get_hero_factory
 from app.domain.value_objects.element import Element
 from app.domain.value_objects.grid_position import GridPosition
 
@@ -260,3 +260,19 @@ class TestHeroRarity:
         
         template = factory.get_template("quan_vu")
         assert hero.rarity == template.rarity
+
+
+class TestHeroFactorySharing:
+    """Test that templates are built once per process"""
+    
+    def test_factories_share_templates(self):
+        """Later factories reuse the template objects of the first"""
+        first = HeroFactory()
+        second = HeroFactory()
+        
+        assert first.get_template("quan_vu") is second.get_template("quan_vu")
+        assert first._templates is not second._templates
+    
+    def test_get_hero_factory_is_shared(self):
+        """get_hero_factory should return the same factory every time"""
+        assert get_hero_factory() is get_hero_factory()
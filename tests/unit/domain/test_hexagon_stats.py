@@ -151,6 +151,19 @@ class TestHexagonStatsSerialization:
         assert result == original
 
 
+    def test_from_mapping_accepts_any_key_style(self):
+        """Game data keys and field names should both be understood"""
+        stats = HexagonStats.from_mapping({"DEF": 3, "def_": 2, "Crit": 1, "unique_effect": "x"})
+        
+        assert stats == HexagonStats(hp=0, atk=0, def_=5, spd=0, crit=1, dex=0)
+    
+    def test_subtract(self):
+        """Subtracting should give the per-stat difference"""
+        stats = HexagonStats(hp=100, atk=50, def_=30, spd=60, crit=10, dex=20)
+        
+        assert stats.subtract(stats) == HexagonStats.zero()
+
+
 class TestHexagonStatsEquality:
     """Test HexagonStats equality comparison"""
     
@@ -0,0 +1,96 @@
+"""
+Tests for SetBonusResolver Domain Service
+Set bonus resolution and bulk combination scoring
+"""
+import pytest
+
+from app.domain.services.set_bonus_resolver import SetBonusResolver, weighted_score
+from app.domain.static_data import StaticDataRegistry
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+SETS = [
+    {
+        "id": "thanh_long",
+        "name": "Thanh Long",
+        "two_piece_bonus": {"atk": 15, "crit": 10},
+        "three_piece_bonus": {"unique_effect": "Giảm 20% sát thương"},
+        "pieces": ["thanh_long_dao", "thanh_long_giap", "thanh_long_phu"]
+    },
+    {
+        "id": "ho_giap",
+        "name": "Hổ Giáp",
+        "two_piece_bonus": {"DEF": 20},
+        "four_piece_bonus": {"HP": 300, "DEF": 30}
+    }
+]
+
+
+@pytest.fixture
+def registry():
+    """Registry with two test sets"""
+    return StaticDataRegistry(SETS)
+
+
+@pytest.fixture
+def resolver(registry):
+    """Resolver over the test registry"""
+    return SetBonusResolver(registry)
+
+
+class TestResolve:
+    """Test stateless resolution"""
+
+    def test_below_threshold_gives_nothing(self, resolver):
+        """A single piece should not grant a set bonus"""
+        assert resolver.resolve(["thanh_long", None]) == HexagonStats.zero()
+
+    def test_thresholds_are_cumulative(self, resolver):
+        """Four pieces should grant both the 2 and 4 piece bonuses"""
+        bonus = resolver.resolve(["ho_giap"] * 4)
+
+        assert bonus.def_ == 50
+        assert bonus.hp == 300
+
+    def test_bonuses_merge_across_sets(self, resolver):
+        """2+2 should merge both sets' bonuses"""
+        bonus = resolver.resolve(["thanh_long", "thanh_long", "ho_giap", "ho_giap"])
+
+        assert bonus == HexagonStats(hp=0, atk=15, def_=20, spd=0, crit=10, dex=0)
+
+    def test_template_lookup(self, registry):
+        """Templates listed as set pieces should map to the set"""
+        assert registry.get_set_id_for_template("thanh_long_giap") == "thanh_long"
+        assert registry.get_set_id_for_template("iron_sword") is None
+
+
+class TestCombinations:
+    """Test the bulk combination path"""
+
+    def test_every_combination_fits_the_slots(self, resolver):
+        """Combinations should never need more pieces than slots"""
+        combinations = resolver.get_combinations(slots=4)
+
+        assert () in combinations
+        assert (("ho_giap", 2), ("thanh_long", 2)) in combinations
+        assert (("ho_giap", 4),) in combinations
+        assert all(sum(pieces for _, pieces in key) <= 4 for key in combinations)
+
+    def test_registry_reload_rebuilds_table(self, registry, resolver):
+        """Combinations should pick up new set data after a reload"""
+        resolver.get_combinations(slots=4)
+
+        registry.load_equipment_sets([
+            {"id": "ho_giap", "name": "Hổ Giáp", "two_piece_bonus": {"DEF": 25}}
+        ])
+
+        assert resolver.get_combinations(slots=4)[(("ho_giap", 2),)].def_ == 25
+
+    def test_score_combinations_best_first(self, resolver):
+        """The highest weighted combination should come first"""
+        scored = resolver.score_combinations({"ATK": 1.0, "CRIT": 1.0})
+
+        assert scored[0][0] in {(("thanh_long", 2),), (("thanh_long", 3),),
+                                (("ho_giap", 2), ("thanh_long", 2))}
+        assert scored[0][2] == 25
+        assert weighted_score(scored[-1][1], {"ATK": 1.0, "CRIT": 1.0}) == 0
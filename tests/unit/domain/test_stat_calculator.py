@@ -0,0 +1,164 @@
+"""
+Tests for StatCalculator Domain Service
+Single stat pipeline with per-hero memoization
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.entities.equipment import Equipment, EquipmentType, Rarity
+from app.domain.entities.hero import Hero
+from app.domain.entities.mount import Mount
+from app.domain.entities.team import Formation, FormationBonus
+from app.domain.services.set_bonus_resolver import SetBonusResolver
+from app.domain.services.stat_calculator import StatCalculator, level_stats
+from app.domain.static_data import StaticDataRegistry
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+BASE = HexagonStats(hp=1000, atk=100, def_=50, spd=100, crit=10, dex=10)
+GROWTH = {"HP": 10, "ATK": 5, "DEF": 2, "SPD": 0, "CRIT": 1, "DEX": 1}
+
+
+def make_piece(piece_id, atk=0, set_id=None):
+    """Create an equipment piece with only ATK"""
+    return Equipment(
+        id=piece_id,
+        name=piece_id,
+        equipment_type=EquipmentType.WEAPON,
+        rarity=Rarity.EPIC,
+        base_atk=atk,
+        set_id=set_id
+    )
+
+
+def make_hero(**kwargs):
+    """Create a hero with the test template stats"""
+    return Hero(
+        id="hero-1",
+        name="Test Hero",
+        element=Element.KIM,
+        position=GridPosition(x=0, y=0),
+        stats=BASE,
+        growth_rates=dict(GROWTH),
+        **kwargs
+    )
+
+
+class TestPipelineStages:
+    """Test each stage of the pipeline"""
+
+    def test_growth_per_level(self):
+        """Stats should grow by the template rate for each level past 1"""
+        stats = level_stats(BASE, GROWTH, 11)
+
+        assert stats.hp == 1100
+        assert stats.atk == 150
+        assert stats.spd == 100
+
+    def test_ascension_and_awakening_multiplier(self):
+        """Ascension adds 5% and awakening 10% per level"""
+        stats = StatCalculator().calculate(BASE, ascension_level=2, awakening_level=1)
+
+        assert stats.hp == 1200
+        assert stats.atk == 120
+
+    def test_equipment_and_set_bonus(self):
+        """Equipment totals and reached set thresholds should be added"""
+        registry = StaticDataRegistry([
+            {"id": "thanh_long", "name": "Thanh Long",
+             "two_piece_bonus": {"ATK": 15, "unique_effect": "x"},
+             "four_piece_bonus": {"ATK": 100}}
+        ])
+        calculator = StatCalculator(SetBonusResolver(registry))
+        pieces = [
+            make_piece("w", atk=40, set_id="thanh_long"),
+            make_piece("a", atk=10, set_id="thanh_long")
+        ]
+
+        stats = calculator.calculate(BASE, equipment=pieces)
+
+        assert stats.atk == 100 + 40 + 10 + 15
+
+    def test_mount_and_team_bonus(self):
+        """Mount stats and the team bonus should both be added"""
+        mount = Mount(id="m1", name="Xích Thố", base_spd=20)
+
+        stats = StatCalculator().calculate(BASE, mount=mount, team_bonus={"spd": 5})
+
+        assert stats.spd == 125
+
+    def test_formation_flat_then_percent(self):
+        """Formation flat bonuses apply before percent bonuses"""
+        formation = Formation(
+            id="f1",
+            name="Test",
+            bonuses=[
+                FormationBonus(stat="atk", value=20, bonus_type="flat"),
+                FormationBonus(stat="all", value=10, bonus_type="percent")
+            ]
+        )
+
+        stats = StatCalculator().calculate(BASE, formation=formation)
+
+        assert stats.atk == 132
+        assert stats.hp == 1100
+
+
+class TestMemoization:
+    """Test per-hero memoization keyed by input version"""
+
+    def test_unchanged_inputs_reuse_result(self):
+        """Repeated reads should not rerun the pipeline"""
+        calculator = StatCalculator()
+        hero = make_hero()
+        pieces = [make_piece("w", atk=40)]
+
+        with patch.object(calculator, "calculate", wraps=calculator.calculate) as spy:
+            first = calculator.get_hero_stats(hero, pieces)
+            second = calculator.get_hero_stats(hero, pieces)
+
+        assert first is second
+        assert spy.call_count == 1
+
+    @pytest.mark.parametrize("change", ["level", "enhance", "ascend"])
+    def test_changed_input_recomputes(self, change):
+        """Any input change should produce a new result"""
+        calculator = StatCalculator()
+        hero = make_hero(level=5)
+        piece = make_piece("w", atk=40)
+        before = calculator.get_hero_stats(hero, [piece])
+
+        if change == "level":
+            hero.level += 1
+        elif change == "enhance":
+            piece.enhance()
+        else:
+            hero.ascension_level += 1
+
+        assert calculator.get_hero_stats(hero, [piece]) != before
+
+
+class TestHeroIntegration:
+    """Test Hero using the pipeline"""
+
+    def test_level_up_applies_template_growth(self):
+        """Levelling up should recompute stats from template growth"""
+        hero = make_hero()
+
+        hero.gain_exp(100 + 150)  # level 1 -> 3
+
+        assert hero.level == 3
+        assert hero.stats.hp == 1020
+        assert hero.current_hp == 1020
+        assert hero.base_stats == BASE
+
+    def test_effective_stats_include_equipment(self):
+        """Effective stats should include equipped items"""
+        hero = make_hero()
+
+        stats = hero.get_effective_stats([make_piece("w", atk=40)])
+
+        assert stats.atk == 140
@@ -0,0 +1,131 @@
+"""
+Tests for StoryProgress Entity
+Cleared-stage bitset, 2-bit stars and running totals
+"""
+import random
+
+import pytest
+
+from app.domain.entities.story_progress import StoryProgress
+from app.domain.static_data import StoryLayout
+
+
+def make_layout(*chapter_sizes):
+    """Layout with chapters of the given sizes"""
+    return StoryLayout.from_chapters([
+        {
+            "id": f"chapter_{c + 1}",
+            "stages": [
+                {"id": f"stage_{c + 1}_{s + 1}", "stage_number": s + 1}
+                for s in range(size)
+            ]
+        }
+        for c, size in enumerate(chapter_sizes)
+    ])
+
+
+class TestStoryLayout:
+    """Test global stage ordinals"""
+
+    def test_ordinals_follow_chapter_order(self):
+        """Stages should be numbered across chapters"""
+        layout = make_layout(3, 2)
+
+        assert layout.stage_ordinals["stage_2_1"] == 3
+        assert layout.stage_chapters == [0, 0, 0, 1, 1]
+        assert layout.previous_stages == [-1, 0, 1, -1, 3]
+
+    def test_pinned_ordinals_are_kept(self):
+        """A stage inserted with a pinned ordinal should not shift others"""
+        layout = StoryLayout.from_chapters([{
+            "id": "chapter_1",
+            "stages": [
+                {"id": "a", "stage_number": 1, "ordinal": 0},
+                {"id": "new", "stage_number": 2, "ordinal": 2},
+                {"id": "b", "stage_number": 3, "ordinal": 1}
+            ]
+        }])
+
+        assert layout.stage_ordinals == {"a": 0, "new": 2, "b": 1}
+        assert layout.previous_stages[1] == 2
+
+
+class TestStoryProgress:
+    """Test recording clears and unlock checks"""
+
+    def test_record_keeps_best_stars(self):
+        """Stars should only go up and totals should follow"""
+        progress = StoryProgress(make_layout(3))
+
+        assert progress.record(1, 2)
+        assert not progress.record(1, 1)
+        progress.record(1, 3)
+
+        assert progress.get_stars(1) == 3
+        assert (progress.stages_cleared, progress.stars_earned) == (1, 3)
+        assert progress.get_chapter_stars(0) == 3
+
+    def test_unlocks_follow_clears(self):
+        """Stages unlock in order and the next chapter after a full clear"""
+        progress = StoryProgress(make_layout(2, 1))
+
+        assert progress.is_stage_unlocked(0)
+        assert not progress.is_stage_unlocked(1)
+        assert not progress.is_chapter_unlocked(1)
+
+        progress.record(0, 1)
+        progress.record(1, 1)
+
+        assert progress.is_chapter_unlocked(1)
+        assert progress.is_stage_unlocked(2)
+        assert progress.chapters_cleared == 1
+        assert progress.current_chapter == 1
+
+    def test_round_trip_matches_reference(self):
+        """Random clears should survive serialization with the same totals"""
+        rng = random.Random(3)
+        layout = make_layout(10, 7, 12)
+        progress = StoryProgress(layout)
+        best = {}
+        for _ in range(200):
+            ordinal = rng.randrange(layout.stage_count)
+            stars = rng.randint(0, 3)
+            progress.record(ordinal, stars)
+            best[ordinal] = max(best.get(ordinal, 0), stars)
+
+        loaded = StoryProgress.from_bytes(layout, progress.to_bytes())
+
+        assert loaded.stages_cleared == len(best)
+        assert loaded.stars_earned == sum(best.values())
+        assert all(loaded.get_stars(o) == s and loaded.is_cleared(o) for o, s in best.items())
+        assert len(progress.to_bytes()) == 3 + 4 + 8
+
+    def test_saved_progress_survives_new_stages(self):
+        """Progress saved before stages were appended should load padded"""
+        old = StoryProgress(make_layout(3))
+        old.record(2, 3)
+
+        loaded = StoryProgress.from_bytes(make_layout(3, 4), old.to_bytes())
+
+        assert loaded.get_stars(2) == 3
+        assert loaded.is_chapter_unlocked(0) and not loaded.is_cleared(3)
+
+    def test_relayout_follows_stage_ids(self):
+        """Progress moved to a reordered layout should stay on the same stages"""
+        old = StoryProgress(make_layout(2, 2))
+        old.record(old.layout.stage_ordinals["stage_2_1"], 2)
+        reordered = StoryLayout.from_chapters([
+            {"id": "chapter_2", "stages": [{"id": "stage_2_1", "stage_number": 1}]},
+            {"id": "chapter_1", "stages": [{"id": "stage_1_1", "stage_number": 1}]}
+        ])
+
+        moved = old.relayout(reordered)
+
+        assert moved.get_stars(reordered.stage_ordinals["stage_2_1"]) == 2
+        assert not moved.is_cleared(reordered.stage_ordinals["stage_1_1"])
+        assert moved.stars_earned == 2
+
+    def test_unknown_format_rejected(self):
+        """Data with an unknown version should be rejected"""
+        with pytest.raises(ValueError):
+            StoryProgress.from_bytes(make_layout(3), b"\x09\x03\x00\x00\x00")
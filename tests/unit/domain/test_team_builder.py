@@ -0,0 +1,153 @@
+"""
+Tests for TeamBuilder Domain Service
+Beam search over roster, placement and formation
+"""
+import itertools
+import random
+from uuid import uuid4
+
+from app.domain.entities.hero import Hero
+from app.domain.entities.team import Formation, FormationBonus
+from app.domain.services.team_builder import TeamBuilder, element_advantage
+from app.domain.services.team_evaluator import TeamEvaluator
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+def make_hero(element=Element.KIM, atk=100, template_id="hero"):
+    """Create a test hero"""
+    return Hero(
+        id=str(uuid4()),
+        name=template_id,
+        element=element,
+        position=GridPosition(0, 0),
+        stats=HexagonStats(hp=1000, atk=atk, def_=50, spd=100, crit=10, dex=10),
+        template_id=template_id
+    )
+
+
+def brute_force_best(roster, enemy_elements, formation, team_size):
+    """Reference: score every subset and placement"""
+    best = 0.0
+    for heroes in itertools.combinations(roster, team_size):
+        bonus = sum(
+            hero.get_total_power() * element_advantage(hero.element, enemy_elements)
+            for hero in heroes
+        )
+        for cells in itertools.permutations(GridPosition.ALL_POSITIONS, team_size):
+            evaluator = TeamEvaluator(formation)
+            for hero, position in zip(heroes, cells):
+                evaluator.add(hero, position)
+            best = max(best, evaluator.get_total_power() + bonus)
+    return best
+
+
+class TestElementAdvantage:
+    """Test the stage element score"""
+
+    def test_counter_element_scores_higher(self):
+        """Kim beats Mộc, so Kim heroes should score above Mộc heroes against Mộc"""
+        enemies = [Element.MOC, Element.MOC]
+
+        assert element_advantage(Element.KIM, enemies) > 0
+        assert element_advantage(Element.MOC, enemies) == 0
+        assert element_advantage(Element.KIM, []) == 0
+
+    def test_builder_prefers_counter_heroes(self):
+        """Equal-power heroes that counter the stage should be picked"""
+        roster = [make_hero(Element.KIM) for _ in range(3)] + [make_hero(Element.THUY) for _ in range(3)]
+
+        result = TeamBuilder().build(roster, [Element.MOC], team_size=3, top_k=1)
+
+        assert all(hero.element == Element.KIM for hero, _ in result.teams[0].members)
+
+
+class TestSearch:
+    """Test beam search quality and limits"""
+
+    def test_matches_brute_force_on_small_roster(self):
+        """The beam should find the exhaustive optimum on a small roster"""
+        rng = random.Random(5)
+        elements = [Element.KIM, Element.MOC, Element.HOA]
+        roster = [make_hero(rng.choice(elements), atk=rng.randint(80, 140)) for _ in range(7)]
+        formation = Formation(
+            id="f", name="F", required_elements=3, min_members=3,
+            bonuses=[FormationBonus(stat="all", value=10)]
+        )
+        enemies = [Element.MOC]
+
+        result = TeamBuilder().build(roster, enemies, [formation], team_size=3, top_k=1)
+        expected = max(
+            brute_force_best(roster, enemies, None, 3),
+            brute_force_best(roster, enemies, formation, 3)
+        )
+
+        assert abs(result.teams[0].score - expected) < 1e-6
+
+    def test_required_hero_survives_pruning(self):
+        """A weak formation-required hero must stay in the candidate pool"""
+        builder = TeamBuilder()
+        roster = [make_hero(Element.KIM, atk=200) for _ in range(8)]
+        quan_vu = make_hero(Element.KIM, atk=50, template_id="quan_vu")
+        formation = Formation(id="ngu_ho", name="Ngũ Hổ", required_heroes=["quan_vu"])
+        scores = {hero.id: hero.get_total_power() for hero in roster + [quan_vu]}
+
+        pool = builder.prune_roster(roster + [quan_vu], scores, [formation], 5)
+
+        assert quan_vu in pool
+        assert len(pool) == 6
+
+    def test_time_budget_stops_search(self):
+        """An expired budget should return early and say so"""
+        ticks = itertools.count()
+        builder = TeamBuilder(clock=lambda: next(ticks))
+        roster = [make_hero() for _ in range(10)]
+
+        result = builder.build(roster, [], time_budget=0)
+
+        assert result.timed_out
+
+    def test_timeout_mid_search_returns_full_teams(self):
+        """Partial beam states should be completed, never returned short"""
+        for budget in (0, 2.5):
+            # Ticks 0, 1, 2, ...: the deadline passes before depth 1, or after depth 2
+            ticks = itertools.count()
+            builder = TeamBuilder(clock=lambda: next(ticks))
+            roster = [make_hero(atk=100 + index) for index in range(10)]
+
+            result = builder.build(roster, [], time_budget=budget)
+
+            assert result.timed_out
+            assert result.teams
+            assert [len(team.members) for team in result.teams] == [5] * len(result.teams)
+            assert all(team.power > 0 for team in result.teams)
+
+    def test_large_roster_search_is_bounded(self):
+        """250 heroes should be pruned so the search work stays bounded"""
+        rng = random.Random(9)
+        elements = list(Element)
+        roster = [
+            make_hero(rng.choice(elements), atk=rng.randint(50, 300), template_id=f"t{i % 40}")
+            for i in range(250)
+        ]
+        formations = [
+            Formation(id="ngu_hanh", name="Ngũ Hành", required_elements=5, min_members=5,
+                      bonuses=[FormationBonus(stat="all", value=5)]),
+            Formation(id="ngu_ho", name="Ngũ Hổ", required_heroes=["t1", "t2"],
+                      bonuses=[FormationBonus(stat="all", value=10)])
+        ]
+
+        # Frozen clock: the budget never runs out, so the work done is
+        # what the search itself bounds
+        builder = TeamBuilder(clock=lambda: 0.0)
+        result = builder.build(roster, [Element.HOA], formations, time_budget=0)
+
+        scores = {hero.id: hero.get_total_power() for hero in roster}
+        pool = builder.prune_roster(roster, scores, formations, 5)
+        max_explored = (1 + len(formations)) * 5 * builder.beam_width * len(pool) * 9
+        assert not result.timed_out
+        assert len(pool) <= 5 * len(elements) + 2
+        assert 0 < result.explored <= max_explored
+        assert len(result.teams) == 3
+        assert all(len(team.members) == 5 for team in result.teams)
@@ -0,0 +1,140 @@
+"""
+Tests for TeamEvaluator Domain Service
+Bitboard synergy and incremental formation checks
+"""
+import random
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.hero import Hero
+from app.domain.entities.team import Formation, FormationBonus
+from app.domain.services.team_evaluator import ADJACENCY_MASKS, TeamEvaluator, cell_index
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.grid_position import GridPosition
+from app.domain.value_objects.hexagon_stats import HexagonStats
+
+
+def make_hero(element=Element.KIM, template_id="hero", atk=100):
+    """Create a test hero"""
+    return Hero(
+        id=str(uuid4()),
+        name=template_id,
+        element=element,
+        position=GridPosition(0, 0),
+        stats=HexagonStats(hp=1000, atk=atk, def_=50, spd=100, crit=10, dex=10),
+        template_id=template_id
+    )
+
+
+def pairwise_synergy(placed):
+    """Reference: O(n^2) adjacent same-element pairs"""
+    pairs = 0
+    for i, (hero1, pos1) in enumerate(placed):
+        for hero2, pos2 in placed[i + 1:]:
+            if hero1.element == hero2.element and pos1.is_adjacent(pos2):
+                pairs += 1
+    return pairs
+
+
+class TestAdjacency:
+    """Test the precomputed adjacency masks"""
+
+    def test_masks_match_grid_adjacency(self):
+        """Every mask bit should agree with GridPosition.is_adjacent"""
+        for a in GridPosition.ALL_POSITIONS:
+            for b in GridPosition.ALL_POSITIONS:
+                bit = bool(ADJACENCY_MASKS[cell_index(a)] >> cell_index(b) & 1)
+                assert bit == a.is_adjacent(b)
+
+    def test_center_touches_every_cell(self):
+        """The center cell should be adjacent to all 8 others"""
+        assert ADJACENCY_MASKS[cell_index(GridPosition(1, 1))] == 0b111101111
+
+
+class TestIncrementalSynergy:
+    """Test synergy kept current across updates"""
+
+    def test_random_updates_match_pairwise(self):
+        """Adds, removes and moves should always equal the pairwise count"""
+        rng = random.Random(11)
+        elements = list(Element)[:2]
+        evaluator = TeamEvaluator()
+        placed = {}
+
+        for _ in range(500):
+            free = evaluator.free_positions()
+            action = rng.random()
+            if placed and (action < 0.3 or not free):
+                hero_id = rng.choice(list(placed))
+                evaluator.remove(hero_id)
+                del placed[hero_id]
+            elif placed and action < 0.6 and free:
+                hero_id = rng.choice(list(placed))
+                position = rng.choice(free)
+                evaluator.move(hero_id, position)
+                placed[hero_id] = (placed[hero_id][0], position)
+            elif len(placed) < 5 and free:
+                hero = make_hero(rng.choice(elements))
+                position = rng.choice(free)
+                evaluator.add(hero, position)
+                placed[hero.id] = (hero, position)
+
+            assert evaluator.synergy_pairs == pairwise_synergy(list(placed.values()))
+
+    def test_power_with_matches_add(self):
+        """Previewing an add should equal the power after adding"""
+        formation = Formation(
+            id="f", name="F", required_elements=2, min_members=3,
+            bonuses=[FormationBonus(stat="all", value=10)]
+        )
+        evaluator = TeamEvaluator(formation)
+        evaluator.add(make_hero(Element.KIM), GridPosition(0, 0))
+        evaluator.add(make_hero(Element.MOC), GridPosition(2, 0))
+        candidate = make_hero(Element.KIM)
+
+        preview = evaluator.power_with(candidate, GridPosition(1, 0))
+        evaluator.add(candidate, GridPosition(1, 0))
+
+        assert evaluator.is_formation_active()
+        assert preview == evaluator.get_total_power()
+
+
+class TestFormationTracking:
+    """Test incremental formation eligibility"""
+
+    def test_required_hero_tracked(self):
+        """The formation should switch on and off with its required hero"""
+        formation = Formation(id="ngu_ho", name="Ngũ Hổ", required_heroes=["quan_vu"])
+        evaluator = TeamEvaluator(formation)
+        quan_vu = make_hero(template_id="quan_vu")
+
+        assert not evaluator.is_formation_active()
+        evaluator.add(quan_vu, GridPosition(0, 0))
+        assert evaluator.is_formation_active()
+        evaluator.remove(quan_vu.id)
+        assert not evaluator.is_formation_active()
+
+    def test_set_formation_recounts(self):
+        """Changing formation should use the current members"""
+        evaluator = TeamEvaluator()
+        evaluator.add(make_hero(Element.KIM), GridPosition(0, 0))
+        evaluator.add(make_hero(Element.MOC), GridPosition(1, 0))
+
+        evaluator.set_formation(Formation(id="f", name="F", required_elements=2))
+        assert evaluator.is_formation_active()
+
+        evaluator.set_formation(Formation(id="g", name="G", required_elements=3))
+        assert not evaluator.is_formation_active()
+
+    def test_refresh_member_updates_power(self):
+        """Re-reading a changed member should update the power sum"""
+        hero = make_hero()
+        evaluator = TeamEvaluator()
+        evaluator.add(hero, GridPosition(0, 0))
+        before = evaluator.base_power
+
+        hero.stats = HexagonStats(hp=2000, atk=200, def_=50, spd=100, crit=10, dex=10)
+        evaluator.refresh_member(hero)
+
+        assert evaluator.base_power == hero.get_total_power() > before
@@ -0,0 +1,125 @@
+"""
+Tests for AssetManager
+Shared fonts and images, preloading and memory accounting
+"""
+import pytest
+import pygame
+from game.core.asset_manager import AssetManager
+from game.ui.components.button import Button
+from game.ui.components.card import Card
+
+
+# Initialize pygame for testing
+pygame.init()
+pygame.display.set_mode((100, 100), pygame.HIDDEN)
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    """A small image file on disk"""
+    path = tmp_path / "hero.png"
+    image = pygame.Surface((16, 8), pygame.SRCALPHA)
+    image.fill((200, 50, 50, 255))
+    pygame.image.save(image, str(path))
+    return str(path)
+
+
+class TestFonts:
+    """Test shared font loading"""
+    
+    def test_same_size_is_shared(self):
+        """Same (path, size) should return the same font object"""
+        manager = AssetManager()
+        
+        assert manager.get_font(18) is manager.get_font(18)
+        assert manager.get_font(18) is not manager.get_font(24)
+        assert manager.misses == 2
+    
+    def test_missing_font_file_falls_back(self):
+        """A configured font that does not exist should use pygame's font"""
+        manager = AssetManager(font_path="assets/fonts/missing.ttf")
+        
+        assert manager.font_path is None
+        assert manager.get_font(18).size("Ngọa Long")[0] > 0
+    
+    def test_components_share_fonts(self):
+        """Components of the same size should use one font"""
+        first = Button(position=(0, 0), text="A")
+        second = Button(position=(0, 50), text="B")
+        card = Card(position=(0, 0), name="Lưu Bị")
+        
+        assert first.font is second.font
+        assert card.name_font is first.font
+
+
+class TestImages:
+    """Test shared image loading"""
+    
+    def test_image_is_loaded_once(self, image_path):
+        """Repeated requests should return the cached image"""
+        manager = AssetManager()
+        
+        first = manager.get_image(image_path)
+        
+        assert manager.get_image(image_path) is first
+        assert first.get_size() == (16, 8)
+        assert manager.misses == 1
+        assert manager.hits == 1
+    
+    def test_missing_image_raises(self, tmp_path):
+        """Should raise FileNotFoundError for a missing image"""
+        manager = AssetManager()
+        
+        with pytest.raises(FileNotFoundError):
+            manager.get_image(str(tmp_path / "missing.png"))
+    
+    def test_unload_image(self, image_path):
+        """Unloaded images should be loaded again on next use"""
+        manager = AssetManager()
+        manager.get_image(image_path)
+        
+        manager.unload_image(image_path)
+        manager.get_image(image_path)
+        
+        assert manager.misses == 2
+
+
+class TestPreloadAndMemory:
+    """Test background preloading and memory accounting"""
+    
+    def test_preload_then_get_is_a_hit(self, image_path, tmp_path):
+        """Preloaded assets should be served from the cache"""
+        manager = AssetManager()
+        
+        manager.preload(
+            font_sizes=[30], images=[image_path, str(tmp_path / "missing.png")]
+        ).result(timeout=5)
+        misses = manager.misses
+        manager.get_font(30)
+        manager.get_image(image_path)
+        
+        assert manager.misses == misses
+        manager.shutdown()
+    
+    def test_memory_usage(self, image_path):
+        """Should count loaded assets and their bytes"""
+        manager = AssetManager()
+        manager.get_font(18)
+        image = manager.get_image(image_path)
+        
+        usage = manager.memory_usage()
+        
+        assert usage["fonts"] == 1
+        assert usage["font_bytes"] > 0
+        assert usage["images"] == 1
+        assert usage["image_bytes"] == image.get_pitch() * image.get_height()
+        assert usage["total_bytes"] == usage["font_bytes"] + usage["image_bytes"]
+    
+    def test_shutdown_drops_assets(self):
+        """Shutdown should leave nothing loaded"""
+        manager = AssetManager()
+        manager.get_font(18)
+        
+        manager.shutdown()
+        
+        assert manager.memory_usage()["fonts"] == 0
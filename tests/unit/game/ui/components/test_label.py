@@ -0,0 +1,41 @@
+"""
+Tests for Label UI component
+"""
+import pytest
+import pygame
+from game.ui.components.label import Label
+
+
+# Initialize pygame for testing
+pygame.init()
+pygame.display.set_mode((100, 100), pygame.HIDDEN)
+
+
+class TestLabel:
+    """Test Label component"""
+    
+    def test_bounds_follow_anchor(self):
+        """Bounds should be placed by the anchor point"""
+        label = Label(position=(200, 20), text="Battle - Turn 1", anchor="midtop")
+        
+        assert label.bounds.midtop == (200, 20)
+        assert label.bounds.width > 0
+    
+    def test_render_key_changes_with_text(self):
+        """Changing the text should change the render key"""
+        label = Label(position=(0, 0), text="Turn 1")
+        key = label.render_key()
+        
+        label.text = "Turn 2"
+        
+        assert label.render_key() != key
+    
+    def test_empty_label_renders_nothing(self):
+        """An empty label should leave the surface untouched"""
+        label = Label(position=(0, 0), text="")
+        screen = pygame.Surface((50, 50))
+        
+        label.render(screen)
+        
+        assert label.bounds.width == 0
+        assert screen.get_at((0, 0)) == pygame.Color(0, 0, 0)
@@ -0,0 +1,179 @@
+"""
+Tests for the render cache
+Text surface cache, shared overlays and dirty-rect rendering
+"""
+import pytest
+import pygame
+from game.ui.components.button import Button
+from game.ui.components.health_bar import HealthBar
+from game.ui.components.label import Label
+from game.ui.components.modal import Modal
+from game.ui.render_cache import DirtyRenderer, TextCache, get_overlay, merge_rects
+
+
+# Initialize pygame for testing
+pygame.init()
+pygame.display.set_mode((100, 100), pygame.HIDDEN)
+
+
+def make_background(size=(400, 300)) -> pygame.Surface:
+    """Helper to create a plain background layer"""
+    background = pygame.Surface(size)
+    background.fill((20, 20, 40))
+    return background
+
+
+def full_render(background: pygame.Surface, widgets) -> pygame.Surface:
+    """Helper to draw a frame from scratch for comparison"""
+    screen = background.copy()
+    for widget in widgets:
+        widget.render(screen)
+    return screen
+
+
+def same_pixels(a: pygame.Surface, b: pygame.Surface) -> bool:
+    """Helper to compare two surfaces pixel by pixel"""
+    return pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+
+class TestTextCache:
+    """Test cached text surfaces"""
+    
+    def test_reuses_surface_for_same_text(self):
+        """Same font, text and color should return the same surface"""
+        cache = TextCache()
+        font = pygame.font.Font(None, 18)
+        
+        first = cache.render(font, "Attack", (255, 255, 255))
+        second = cache.render(font, "Attack", (255, 255, 255))
+        
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_color_is_part_of_key(self):
+        """A different color should render a new surface"""
+        cache = TextCache()
+        font = pygame.font.Font(None, 18)
+        
+        cache.render(font, "Attack", (255, 255, 255))
+        cache.render(font, "Attack", [255, 0, 0])
+        
+        assert len(cache) == 2
+    
+    def test_evicts_least_recently_used(self):
+        """Should keep at most max_entries surfaces"""
+        cache = TextCache(max_entries=2)
+        font = pygame.font.Font(None, 18)
+        
+        first = cache.render(font, "a", (255, 255, 255))
+        cache.render(font, "b", (255, 255, 255))
+        cache.render(font, "a", (255, 255, 255))
+        cache.render(font, "c", (255, 255, 255))
+        
+        assert len(cache) == 2
+        assert cache.render(font, "a", (255, 255, 255)) is first
+        assert cache.misses == 3
+
+
+class TestHelpers:
+    """Test overlay and rectangle helpers"""
+    
+    def test_overlay_is_shared(self):
+        """Overlays of the same size and color should be built once"""
+        first = get_overlay((200, 100), (0, 0, 0, 128))
+        
+        assert get_overlay((200, 100), (0, 0, 0, 128)) is first
+        assert first.get_at((0, 0)) == pygame.Color(0, 0, 0, 128)
+    
+    def test_merge_overlapping_rects(self):
+        """Overlapping rects should merge, separate ones should not"""
+        merged = merge_rects([
+            pygame.Rect(0, 0, 10, 10),
+            pygame.Rect(5, 5, 10, 10),
+            pygame.Rect(50, 50, 5, 5),
+            pygame.Rect(0, 0, 0, 0)
+        ])
+        
+        assert sorted(map(tuple, merged)) == [(0, 0, 15, 15), (50, 50, 5, 5)]
+
+
+class TestDirtyRenderer:
+    """Test dirty-rect rendering"""
+    
+    def test_first_frame_is_full_then_idle(self):
+        """Should draw everything once, then nothing while idle"""
+        background = make_background()
+        screen = pygame.Surface(background.get_size())
+        widgets = [Button(position=(10, 10), text="Start")]
+        renderer = DirtyRenderer(background)
+        
+        assert renderer.render(screen, widgets) == [screen.get_rect()]
+        assert renderer.render(screen, widgets) == []
+    
+    def test_redraws_only_changed_widget(self):
+        """Should redraw just the changed widget's area"""
+        background = make_background()
+        screen = pygame.Surface(background.get_size())
+        button = Button(position=(10, 10), size=(100, 40), text="Start")
+        bar = HealthBar(position=(10, 100), width=100, height=10, current=80)
+        renderer = DirtyRenderer(background)
+        renderer.render(screen, [button, bar])
+        
+        bar.current = bar.displayed_value = 30
+        dirty = renderer.render(screen, [button, bar])
+        
+        assert dirty == [bar.rect]
+        assert same_pixels(screen, full_render(background, [button, bar]))
+    
+    def test_moved_label_clears_old_area(self):
+        """Text that changes should not leave stale pixels behind"""
+        background = make_background()
+        screen = pygame.Surface(background.get_size())
+        label = Label(position=(10, 10), text="Battle - Turn 10")
+        renderer = DirtyRenderer(background)
+        renderer.render(screen, [label])
+        
+        label.text = "Turn 2"
+        renderer.render(screen, [label])
+        
+        assert same_pixels(screen, full_render(background, [label]))
+    
+    def test_removed_modal_restores_screen(self):
+        """Closing a modal should redraw the screen without it"""
+        background = make_background()
+        screen = pygame.Surface(background.get_size())
+        button = Button(position=(10, 10), text="Start")
+        modal = Modal(position=(50, 50), size=(200, 150), title="Hi", content="Text")
+        renderer = DirtyRenderer(background)
+        
+        assert renderer.render(screen, [button, modal]) == [screen.get_rect()]
+        assert renderer.render(screen, [button]) == [screen.get_rect()]
+        assert same_pixels(screen, full_render(background, [button]))
+    
+    def test_change_under_modal_keeps_overlay(self):
+        """A widget changing under a modal should be redrawn beneath it"""
+        background = make_background()
+        screen = pygame.Surface(background.get_size())
+        button = Button(position=(10, 10), size=(100, 40), text="Start")
+        modal = Modal(position=(150, 50), size=(200, 150), title="Hi")
+        renderer = DirtyRenderer(background)
+        renderer.render(screen, [button, modal])
+        
+        button.is_hovered = True
+        dirty = renderer.render(screen, [button, modal])
+        
+        assert dirty == [button.rect]
+        assert same_pixels(screen, full_render(background, [button, modal]))
+    
+    def test_invalidate_forces_full_redraw(self):
+        """Should redraw everything after invalidate"""
+        background = make_background()
+        screen = pygame.Surface(background.get_size())
+        widgets = [Button(position=(10, 10), text="Start")]
+        renderer = DirtyRenderer(background)
+        renderer.render(screen, widgets)
+        
+        renderer.invalidate()
+        
+        assert renderer.render(screen, widgets) == [screen.get_rect()]
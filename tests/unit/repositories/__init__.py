@@ -0,0 +1 @@
+# Repository unit tests
@@ -0,0 +1,81 @@
+"""
+Tests for RedisBattleRepository
+Runs against fakeredis; behaviour must match the in-memory BattleRepository
+"""
+import pytest
+
+from app.repositories.battle_repository import (
+    BATTLE_HISTORY_LIMIT,
+    BattleRepository,
+    RedisBattleRepository
+)
+from app.services.battle_session_service import BattleSessionService
+from tests.unit.services.test_battle_session_service import snapshot, start
+
+fake_aioredis = pytest.importorskip("fakeredis.aioredis")
+
+
+@pytest.fixture
+def repository():
+    """Redis battle store on a fresh fake server"""
+    return RedisBattleRepository(client=fake_aioredis.FakeRedis(decode_responses=True))
+
+
+class TestRedisBattleRepository:
+    """Test the shared battle store"""
+
+    async def test_active_battle_and_claim(self, repository):
+        """Checkpoints should round trip and expose the owning worker"""
+        await repository.save_active_battle("b1", {
+            "player_id": "p1", "worker_id": "w1", "seq": 4, "checkpoint": {"turn": [1, 2]}
+        })
+
+        record = await repository.get_active_battle("b1")
+
+        assert record["checkpoint"] == {"turn": [1, 2]}
+        assert await repository.get_battle_claim("b1") == {"worker_id": "w1", "seq": 4}
+        assert (await repository.get_player_active_battle("p1"))["seq"] == 4
+        assert await repository.get_battle_claim("missing") is None
+
+    async def test_log_after_seq_and_delete(self, repository):
+        """Log reads should skip covered entries; deleting drops the log too"""
+        await repository.save_active_battle("b1", {"player_id": "p1", "worker_id": "w1", "seq": 0})
+        for seq in range(1, 6):
+            await repository.append_battle_log("b1", {"seq": seq})
+
+        assert [e["seq"] for e in await repository.get_battle_log("b1", after_seq=3)] == [4, 5]
+        assert await repository.delete_active_battle("b1")
+        assert not await repository.delete_active_battle("b1")
+        assert await repository.get_battle_log("b1") == []
+        assert await repository.get_player_active_battle("p1") is None
+
+    async def test_history_matches_memory_store(self, repository):
+        """History paging, trimming and stats should match the in-memory store"""
+        memory = BattleRepository()
+        for index in range(BATTLE_HISTORY_LIMIT + 5):
+            result = {"battle_id": f"b{index}", "victory": index % 3 == 0}
+            await repository.save_battle_result("p1", result)
+            await memory.save_battle_result("p1", result)
+
+        page = await repository.get_battle_history("p1", skip=2, limit=5)
+        expected = await memory.get_battle_history("p1", skip=2, limit=5)
+
+        assert [b["battle_id"] for b in page] == [b["battle_id"] for b in expected]
+        assert await repository.count_battle_history("p1") == BATTLE_HISTORY_LIMIT
+        assert await repository.get_battle_stats("p1") == await memory.get_battle_stats("p1")
+
+        await repository.clear_player_battles("p1")
+        assert await repository.count_battle_history("p1") == 0
+
+    async def test_workers_share_battles(self, repository):
+        """A battle started on one worker should continue on another"""
+        worker_a = BattleSessionService(battle_repository=repository, flush_every=2, worker_id="a")
+        battle, enemies = await start(worker_a)
+        for _ in range(3):
+            await worker_a.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+
+        worker_b = BattleSessionService(battle_repository=repository, worker_id="b")
+        restored = await worker_b.get_battle(battle.id, "player-1")
+
+        assert snapshot(restored) == snapshot(battle)
+        assert (await repository.get_battle_claim(battle.id))["worker_id"] == "b"
@@ -0,0 +1,76 @@
+"""
+Tests for EquipmentRepository
+Runs against an in-memory SQLite database
+"""
+import pytest
+from uuid import uuid4
+
+from app.models.equipment import Equipment, EquipmentTemplate
+from app.models.hero import Hero, HeroTemplate
+from app.models.player import Player
+from app.repositories.equipment_repository import (
+    EquipmentRepository,
+    EquipmentTemplateRepository
+)
+
+
+@pytest.fixture
+async def player(db_session):
+    """A player with one hero wearing a weapon (other slots empty) and a spare armor"""
+    player = Player(id=uuid4(), username="tester", email="t@example.com", password_hash="x")
+    db_session.add_all([
+        player,
+        EquipmentTemplate(id="kiem", name="Kiếm", equipment_type="weapon", base_rarity=3, base_atk=40),
+        EquipmentTemplate(id="giap", name="Giáp", equipment_type="armor", base_rarity=3, base_def=20),
+        HeroTemplate(
+            id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+            base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+            growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+        )
+    ])
+    weapon = Equipment(id=uuid4(), player_id=player.id, template_id="kiem")
+    armor = Equipment(id=uuid4(), player_id=player.id, template_id="giap")
+    db_session.add_all([weapon, armor])
+    await db_session.flush()
+    db_session.add(Hero(
+        id=uuid4(), player_id=player.id, template_id="quan_vu", weapon_id=weapon.id,
+        current_hp=1100, current_atk=120, current_def=80, current_spd=95,
+        current_crit=15, current_dex=10
+    ))
+    await db_session.flush()
+    return player, weapon, armor
+
+
+class TestEquippedQueries:
+    """Test queries that exclude or flag worn equipment"""
+    
+    async def test_unequipped_with_empty_slots(self, db_session, player):
+        """Empty hero slots should not hide every unequipped piece"""
+        owner, weapon, armor = player
+        repository = EquipmentRepository(db_session)
+        
+        unequipped = await repository.get_unequipped(owner.id)
+        
+        assert [piece.id for piece in unequipped] == [armor.id]
+    
+    async def test_equipped_flag(self, db_session, player):
+        """Should flag only the worn piece"""
+        owner, weapon, armor = player
+        repository = EquipmentRepository(db_session)
+        
+        flags = dict(
+            (piece.id, equipped)
+            for piece, equipped in await repository.get_with_equipped_flag(owner.id)
+        )
+        
+        assert flags == {weapon.id: True, armor.id: False}
+
+
+class TestTemplates:
+    """Test loading equipment templates"""
+    
+    async def test_get_all(self, db_session, player):
+        """Should return every template in one query"""
+        templates = await EquipmentTemplateRepository(db_session).get_all()
+        
+        assert sorted(template.id for template in templates) == ["giap", "kiem"]
@@ -0,0 +1,76 @@
+"""
+Tests for HeroRepository
+Runs against an in-memory SQLite database
+"""
+import pytest
+from uuid import uuid4
+
+from app.models.equipment import Equipment, EquipmentTemplate
+from app.models.hero import Hero, HeroTemplate
+from app.models.player import Player
+from app.repositories.hero_repository import HeroRepository
+
+
+# Power of a hero with the Quan Vũ base stats below
+HERO_POWER = 1100 + 120 * 5 + 80 * 3 + 95 * 2 + 15 * 10 + 10 * 2
+
+
+def make_hero(player_id, **slots) -> Hero:
+    """Helper to create a Quan Vũ hero row"""
+    return Hero(
+        id=uuid4(), player_id=player_id, template_id="quan_vu",
+        current_hp=1100, current_atk=120, current_def=80, current_spd=95,
+        current_crit=15, current_dex=10, **slots
+    )
+
+
+@pytest.fixture
+async def players(db_session):
+    """Two heroes for the first player (one wearing a weapon) and one for the second"""
+    first = Player(id=uuid4(), username="first", email="a@example.com", password_hash="x")
+    second = Player(id=uuid4(), username="second", email="b@example.com", password_hash="x")
+    db_session.add_all([
+        first,
+        second,
+        EquipmentTemplate(id="kiem", name="Kiếm", equipment_type="weapon", base_rarity=3, base_atk=40),
+        HeroTemplate(
+            id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+            base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+            growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+        )
+    ])
+    weapon = Equipment(id=uuid4(), player_id=first.id, template_id="kiem", bonus_atk=10)
+    spare = Equipment(id=uuid4(), player_id=first.id, template_id="kiem", bonus_atk=99)
+    db_session.add_all([weapon, spare])
+    await db_session.flush()
+    db_session.add_all([
+        make_hero(first.id, weapon_id=weapon.id),
+        make_hero(first.id),
+        make_hero(second.id)
+    ])
+    await db_session.flush()
+    return first, second
+
+
+class TestPowerTotals:
+    """Test the power leaderboard aggregate"""
+    
+    async def test_totals_for_every_player(self, db_session, players):
+        """Heroes and the pieces they wear should count; spare pieces should not"""
+        first, second = players
+        
+        totals = await HeroRepository(db_session).get_power_totals()
+        
+        # The worn weapon adds (40 base + 10 bonus) ATK
+        assert totals == {
+            str(first.id): 2 * HERO_POWER + 50 * 5,
+            str(second.id): HERO_POWER
+        }
+    
+    async def test_totals_for_one_player(self, db_session, players):
+        """Should total only the given player"""
+        first, second = players
+        
+        totals = await HeroRepository(db_session).get_power_totals(second.id)
+        
+        assert totals == {str(second.id): HERO_POWER}
@@ -0,0 +1,64 @@
+"""
+Tests for InMemoryLeaderboardRepository
+Ordering must match Redis ZREVRANGE/ZREVRANK
+"""
+import random
+
+import pytest
+
+from app.repositories.leaderboard_repository import InMemoryLeaderboardRepository
+
+
+def reference_order(scores):
+    """Players sorted like ZREVRANGE: score desc, then member desc"""
+    return sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+
+class TestInMemoryLeaderboard:
+    """Test sorted-set behaviour"""
+
+    async def test_rank_and_range(self):
+        """Higher scores rank first and ties follow reverse member order"""
+        repository = InMemoryLeaderboardRepository()
+        for player_id, score in [("a", 10), ("b", 30), ("c", 10), ("d", 20)]:
+            await repository.set_score("level", player_id, score)
+
+        assert await repository.get_range("level", 0, 3) == [
+            ("b", 30), ("d", 20), ("c", 10), ("a", 10)
+        ]
+        assert await repository.get_rank("level", "c") == 2
+        assert await repository.get_rank("level", "missing") is None
+        assert await repository.get_range("level", 3, 10) == [("a", 10)]
+
+    async def test_updates_move_entries(self):
+        """Setting, incrementing and removing should reorder the board"""
+        repository = InMemoryLeaderboardRepository()
+        await repository.set_score("wins", "a", 1)
+        await repository.set_score("wins", "b", 2)
+
+        assert await repository.increment("wins", "a", 5) == 6
+        assert await repository.get_rank("wins", "a") == 0
+        assert await repository.remove("wins", "a")
+        assert not await repository.remove("wins", "a")
+        assert await repository.count("wins") == 1
+
+    async def test_matches_reference_after_random_updates(self):
+        """Random updates should keep the board in reference order"""
+        rng = random.Random(7)
+        repository = InMemoryLeaderboardRepository()
+        scores = {}
+        for _ in range(500):
+            player_id = f"p{rng.randrange(40)}"
+            if rng.random() < 0.5:
+                scores[player_id] = rng.randrange(50)
+                await repository.set_score("power", player_id, scores[player_id])
+            else:
+                delta = rng.randrange(-5, 10)
+                scores[player_id] = scores.get(player_id, 0) + delta
+                await repository.increment("power", player_id, delta)
+
+        expected = reference_order(scores)
+        assert await repository.get_range("power", 0, len(expected)) == expected
+        for rank, (player_id, score) in enumerate(expected):
+            assert await repository.get_rank("power", player_id) == rank
+            assert await repository.get_score("power", player_id) == score
@@ -0,0 +1,36 @@
+"""
+Tests for PlayerRepository
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.repositories.player_repository import PlayerRepository
+
+
+def create_repository(player):
+    """Helper to create a repository around a fake session"""
+    repository = PlayerRepository(db=AsyncMock())
+    repository.get = AsyncMock(return_value=player)
+    return repository
+
+
+class TestAddExperience:
+    """Test player level-ups"""
+    
+    async def test_multiple_levels_in_one_call(self):
+        """Should apply several level-ups at once"""
+        player = SimpleNamespace(level=1, exp=50)
+        repository = create_repository(player)
+        
+        # 100 + 200 + 300 to reach level 4, 50 left over
+        await repository.add_experience("player-1", 600)
+        
+        assert (player.level, player.exp) == (4, 50)
+        repository.db.flush.assert_awaited_once()
+    
+    async def test_missing_player(self):
+        """Should return None for an unknown player"""
+        repository = create_repository(None)
+        
+        assert await repository.add_experience("missing", 100) is None
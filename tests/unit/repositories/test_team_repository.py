@@ -0,0 +1,106 @@
+"""
+Tests for TeamRepository on SQLite
+"""
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.repositories.team_repository import TeamRepository
+from app.services.team_service import TeamService
+
+
+@pytest.fixture
+async def player_id(db_session):
+    """A stored player"""
+    from app.models.player import Player
+
+    player = Player(id=uuid4(), username="captain", email="c@example.com", password_hash="x")
+    db_session.add(player)
+    await db_session.flush()
+    return str(player.id)
+
+
+def make_record(player_id, slot_number=1, **values):
+    """Team record for create_team"""
+    return {
+        "player_id": player_id, "name": f"Team {slot_number}", "slot_number": slot_number,
+        "formation_id": None, "is_default": False, "members": [], **values
+    }
+
+
+class TestTeamRepository:
+    """Test team records stored in the teams table"""
+
+    async def test_slot_unique_per_player(self, db_session, player_id):
+        """A second team in a used slot should be rejected without losing the first"""
+        repository = TeamRepository(db_session)
+        first = await repository.create_team(make_record(player_id))
+
+        with pytest.raises(ValueError):
+            await repository.create_team(make_record(player_id))
+        second = await repository.create_team(make_record(player_id, slot_number=2))
+
+        teams = await repository.get_by_player(player_id)
+        assert [team["id"] for team in teams] == [first["id"], second["id"]]
+
+    async def test_members_round_trip_compact(self, db_session, player_id):
+        """Members should be stored and read back as [hero_id, x, y] arrays"""
+        repository = TeamRepository(db_session)
+        team = await repository.create_team(make_record(player_id))
+        members = [["h1", 0, 0], ["h2", 2, 1]]
+
+        assert await repository.update_team(team["id"], player_id, {"members": members})
+        db_session.expunge_all()
+
+        record = await repository.get_for_player(team["id"], player_id)
+        assert record["members"] == members
+        assert await repository.get_for_player(team["id"], str(uuid4())) is None
+
+    async def test_clear_default_and_delete(self, db_session, player_id):
+        """clear_default should unset every default; delete should be per owner"""
+        repository = TeamRepository(db_session)
+        team = await repository.create_team(make_record(player_id, is_default=True))
+
+        await repository.clear_default(player_id)
+        assert not await repository.delete_team(team["id"], str(uuid4()))
+
+        assert (await repository.get_for_player(team["id"], player_id))["is_default"] is False
+        assert await repository.delete_team(team["id"], player_id)
+        assert await repository.get_by_player(player_id) == []
+
+
+class TestTeamServiceCache:
+    """Test the team service's record cache over the SQL repository"""
+
+    @pytest.fixture
+    def service(self, db_session):
+        """Team service on the test database; heroes resolve to placeholders"""
+        hero_service = AsyncMock()
+        hero_service.get_hero.return_value = {}
+        hero_service.get_hero_briefs.side_effect = lambda hero_ids, player_id: {
+            hero_id: {"name": hero_id, "power": 10} for hero_id in hero_ids
+        }
+        return TeamService(hero_service=hero_service, team_repository=TeamRepository(db_session))
+
+    async def test_writes_invalidate_cached_records(self, service, player_id):
+        """Every write should drop the cached records so the next read sees it"""
+        team = (await service.get_teams(player_id))[0]
+        assert player_id in service._team_cache
+
+        await service.add_member(team["id"], player_id, "h1", {"x": 1, "y": 0})
+        # Reloaded from the database after the write
+        assert service._team_cache[player_id][0]["members"] == [["h1", 1, 0]]
+
+        second = await service.create_team(player_id, "Second")
+        assert player_id not in service._team_cache
+        await service.delete_team(second["id"], player_id)
+        assert [t["id"] for t in await service.get_teams(player_id)] == [team["id"]]
+
+    async def test_cached_reads_skip_the_database(self, service, player_id):
+        """A cached player's teams should be read without a query"""
+        await service.get_teams(player_id)
+        service.team_repository.get_by_player = AsyncMock()
+
+        await service.get_teams(player_id)
+
+        service.team_repository.get_by_player.assert_not_awaited()
@@ -0,0 +1,168 @@
+"""
+Tests for battle WebSocket frames
+Full snapshots on connect, deltas afterwards
+"""
+import json
+import pytest
+from uuid import uuid4
+
+from app.domain.entities.battle import Battle, BattleState
+from app.domain.entities.hero import Hero
+from app.domain.entities.enemy import Enemy
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.hexagon_stats import HexagonStats
+from app.domain.value_objects.grid_position import GridPosition
+from app.utils import battle_frames
+from app.utils.battle_frames import (
+    BattleFrameEncoder,
+    decode_frame,
+    encode_frame,
+    error_frame
+)
+
+
+def create_test_battle() -> Battle:
+    """Helper to create a battle with one hero and two enemies"""
+    hero = Hero(
+        id="hero-1",
+        name="Quan Vũ",
+        element=Element.KIM,
+        position=GridPosition(x=0, y=1),
+        stats=HexagonStats(hp=1000, atk=100, def_=50, spd=150, crit=10, dex=10)
+    )
+    enemies = [
+        Enemy(
+            id=f"enemy-{i}",
+            name="Hoàng Cân Binh",
+            element=Element.MOC,
+            position=GridPosition(x=2, y=i),
+            stats=HexagonStats(hp=500, atk=50, def_=30, spd=100 - i, crit=5, dex=5)
+        )
+        for i in range(2)
+    ]
+    battle = Battle(
+        id=str(uuid4()),
+        player_id="player-1",
+        stage_id="stage_1_1",
+        player_team=[hero],
+        enemy_team=enemies
+    )
+    battle.calculate_turn_order()
+    return battle
+
+
+class TestFullFrame:
+    """Test full snapshot frames"""
+    
+    def test_full_frame_contains_every_character(self):
+        """Full frame should list all characters as compact rows"""
+        battle = create_test_battle()
+        
+        frame = BattleFrameEncoder().full(battle)
+        
+        assert frame["t"] == "full"
+        assert frame["a"] == "hero-1"
+        assert frame["p"] is True
+        assert len(frame["c"]) == 3
+        assert frame["c"][0] == [
+            "hero-1", "Quan Vũ", "KIM", 0, 1, 1000, 1000, 0, 100, [], 0
+        ]
+    
+    def test_delta_without_snapshot_falls_back_to_full(self):
+        """First frame should always be a full snapshot"""
+        frame = BattleFrameEncoder().delta(create_test_battle())
+        
+        assert frame["t"] == "full"
+
+
+class TestDeltaFrame:
+    """Test delta frames"""
+    
+    def test_delta_contains_only_changes(self):
+        """Delta should carry only changed characters and fields"""
+        battle = create_test_battle()
+        encoder = BattleFrameEncoder()
+        encoder.full(battle)
+        
+        battle.enemy_team[0].take_damage(120)
+        battle.next_turn()
+        frame = encoder.delta(battle)
+        
+        assert frame["t"] == "delta"
+        assert frame["c"] == {"enemy-0": {"h": 380}}
+        assert frame["a"] == "enemy-0"
+        assert "st" not in frame
+    
+    def test_delta_is_relative_to_previous_frame(self):
+        """Unchanged state should produce an empty delta"""
+        battle = create_test_battle()
+        encoder = BattleFrameEncoder()
+        encoder.full(battle)
+        battle.player_team[0].gain_mana(20)
+        encoder.delta(battle)
+        
+        frame = encoder.delta(battle)
+        
+        assert frame["c"] == {}
+        assert frame["s"] == 3
+    
+    def test_delta_reports_state_change_and_events(self):
+        """Delta should include battle state when it changes"""
+        battle = create_test_battle()
+        encoder = BattleFrameEncoder()
+        encoder.full(battle)
+        
+        battle.state = BattleState.VICTORY
+        frame = encoder.delta(battle, events=[{"action_type": "attack"}])
+        
+        assert frame["st"] == "victory"
+        assert frame["ev"] == [{"action_type": "attack"}]
+    
+    def test_delta_is_smaller_than_full(self):
+        """Delta frames should be much smaller than full snapshots"""
+        battle = create_test_battle()
+        encoder = BattleFrameEncoder()
+        full = encode_frame(encoder.full(battle))
+        
+        battle.enemy_team[1].take_damage(50)
+        delta = encode_frame(encoder.delta(battle))
+        
+        assert len(delta) < len(full) / 2
+
+
+class TestEncoding:
+    """Test frame encoding"""
+    
+    def test_json_roundtrip(self):
+        """JSON frames should decode back to the same frame"""
+        frame = error_frame("NOT_PLAYER_TURN", "It is not the player's turn")
+        
+        data = encode_frame(frame)
+        
+        assert isinstance(data, str)
+        assert decode_frame(data) == frame
+    
+    def test_binary_falls_back_to_json_without_msgpack(self, monkeypatch):
+        """Binary encoding should fall back to JSON text"""
+        monkeypatch.setattr(battle_frames, "msgpack", None)
+        
+        data = encode_frame({"t": "resync"}, binary=True)
+        
+        assert json.loads(data) == {"t": "resync"}
+        with pytest.raises(ValueError):
+            decode_frame(b"\x81\xa1t\xa6resync")
+    
+    def test_msgpack_roundtrip(self):
+        """Binary frames should roundtrip through msgpack"""
+        pytest.importorskip("msgpack")
+        frame = BattleFrameEncoder().full(create_test_battle())
+        
+        data = encode_frame(frame, binary=True)
+        
+        assert isinstance(data, bytes)
+        assert decode_frame(data) == frame
+    
+    def test_rejects_frame_without_type(self):
+        """Frames must be objects with a type field"""
+        with pytest.raises(ValueError):
+            decode_frame('{"action_type": "attack"}')
@@ -319,3 +319,133 @@ class TestSkillUsage:
         
         assert result["success"] is False
         assert "insufficient mana" in result["error"].lower()
+
+
+class TestPlayerAction:
+    """Test executing a player action with enemy turns"""
+    
+    def test_action_plays_enemy_turns(self):
+        """Should return to the player's turn after enemies act"""
+        service = BattleService()
+        hero = create_test_hero(spd=150)
+        enemy = create_test_enemy(spd=100)
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[enemy]
+        )
+        
+        result = service.execute_action(battle, "attack", target_ids=[enemy.id])
+        
+        assert result["action"]["actor_id"] == hero.id
+        assert len(result["enemy_actions"]) == 1
+        assert battle.is_player_turn()
+        assert battle.turn_number == 2
+    
+    def test_action_ends_battle_on_victory(self):
+        """Should end the battle when the last enemy dies"""
+        service = BattleService()
+        hero = create_test_hero(spd=150)
+        enemy = create_test_enemy()
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[enemy]
+        )
+        enemy.current_hp = 1
+        
+        result = service.execute_action(battle, "attack", target_ids=[enemy.id])
+        
+        assert result["battle_ended"] is True
+        assert result["result"] == "victory"
+        assert battle.state == BattleState.VICTORY
+    
+    def test_action_rejected_on_enemy_turn(self):
+        """Should raise when it is not the player's turn"""
+        from app.core.exceptions import NotPlayerTurnException
+        
+        service = BattleService()
+        hero = create_test_hero(spd=50)
+        enemy = create_test_enemy(spd=100)
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[enemy]
+        )
+        
+        with pytest.raises(NotPlayerTurnException):
+            service.execute_action(battle, "attack", target_ids=[enemy.id])
+
+
+class TestAutoAction:
+    """Test default action selection for auto-battle"""
+    
+    def test_auto_targets_countered_enemy(self):
+        """Should prefer an enemy the hero's element counters"""
+        service = BattleService()
+        hero = create_test_hero(spd=150)
+        weak = create_test_enemy()
+        other = create_test_enemy()
+        other.element = Element.THO
+        other.current_hp = 10
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[other, weak]
+        )
+        
+        action = service.choose_auto_action(battle, hero)
+        
+        assert action == {"action_type": "attack", "target_ids": [weak.id], "skill_id": None}
+    
+    def test_repeat_retargets_dead_enemy(self):
+        """Repeated action should switch to a living target"""
+        service = BattleService()
+        hero = create_test_hero(spd=150)
+        dead = create_test_enemy()
+        alive = create_test_enemy()
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[hero],
+            enemy_team=[dead, alive]
+        )
+        dead.current_hp = 0
+        
+        action = service.repeat_action(
+            battle, hero, {"action_type": "attack", "target_ids": [dead.id]}
+        )
+        
+        assert action["target_ids"] == [alive.id]
+    
+    def test_auto_battle_plays_to_the_end(self):
+        """Should keep acting for heroes until the battle is over"""
+        service = BattleService()
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[create_test_hero(spd=150)],
+            enemy_team=[create_test_enemy()]
+        )
+        
+        turns = service.auto_battle(battle, max_turns=200)
+        
+        assert battle.is_ended()
+        assert 0 < turns < 200
+    
+    def test_auto_battle_respects_turn_cap(self):
+        """Should stop after max_turns hero actions"""
+        service = BattleService()
+        battle = service.start_battle(
+            player_id=str(uuid4()),
+            stage_id="stage_1_1",
+            player_team=[create_test_hero(spd=150)],
+            enemy_team=[create_test_enemy()]
+        )
+        
+        assert service.auto_battle(battle, max_turns=1) == 1
+        assert not battle.is_ended()
@@ -0,0 +1,265 @@
+"""
+Tests for BattleSessionService
+Live battles are cached per worker and rebuilt from the replay log
+"""
+import pytest
+from uuid import uuid4
+
+from app.core.exceptions import BattleNotFoundException
+from app.domain.entities.battle import BattleState
+from app.domain.entities.hero import Hero
+from app.domain.entities.enemy import Enemy
+from app.domain.value_objects.element import Element
+from app.domain.value_objects.hexagon_stats import HexagonStats
+from app.domain.value_objects.grid_position import GridPosition
+from app.repositories.battle_repository import BattleRepository
+from app.services.battle_session_service import BattleSessionService
+
+
+def create_test_team():
+    """Helper to create a hero team and an enemy team"""
+    heroes = [
+        Hero(
+            id=str(uuid4()),
+            name=f"Hero {i}",
+            element=Element.KIM,
+            position=GridPosition(x=0, y=i),
+            stats=HexagonStats(hp=1000, atk=100, def_=50, spd=150 - i, crit=10, dex=10),
+            template_id="test_hero"
+        )
+        for i in range(2)
+    ]
+    enemies = [
+        Enemy(
+            id=str(uuid4()),
+            name=f"Enemy {i}",
+            element=Element.MOC,
+            position=GridPosition(x=2, y=i),
+            stats=HexagonStats(hp=5000, atk=50, def_=30, spd=100 - i, crit=5, dex=5),
+            template_id="test_enemy",
+            exp_reward=50,
+            gold_reward=100
+        )
+        for i in range(2)
+    ]
+    return heroes, enemies
+
+
+def snapshot(battle):
+    """Helper to capture comparable battle state"""
+    return (
+        battle.get_battle_state_snapshot(),
+        battle.get_turn_pointer(),
+        [c.current_mana for c in battle.player_team + battle.enemy_team]
+    )
+
+
+async def start(service, player_id="player-1"):
+    """Helper to start a battle through the service"""
+    heroes, enemies = create_test_team()
+    battle = await service.start_battle(player_id, "stage_1_1", heroes, enemies)
+    return battle, enemies
+
+
+class TestSessionCache:
+    """Test in-memory session handling"""
+    
+    async def test_actions_mutate_cached_battle(self):
+        """Actions should apply to the cached battle object"""
+        service = BattleSessionService(flush_every=100)
+        battle, enemies = await start(service)
+        
+        await service.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        
+        cached = await service.get_battle(battle.id, "player-1")
+        assert cached is battle
+        assert enemies[0].current_hp < enemies[0].stats.hp
+    
+    async def test_write_behind_every_n_actions(self):
+        """Checkpoint should only be written every N actions"""
+        repository = BattleRepository()
+        service = BattleSessionService(battle_repository=repository, flush_every=3)
+        battle, enemies = await start(service)
+        
+        for _ in range(2):
+            await service.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        assert (await repository.get_active_battle(battle.id))["seq"] == 0
+        assert len(await repository.get_battle_log(battle.id)) == 2
+        
+        await service.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        assert (await repository.get_active_battle(battle.id))["seq"] == 3
+    
+    async def test_eviction_flushes_dirty_battle(self):
+        """Evicted battles should be checkpointed"""
+        repository = BattleRepository()
+        service = BattleSessionService(
+            battle_repository=repository, capacity=1, flush_every=100
+        )
+        first, enemies = await start(service, "player-1")
+        await service.execute_action(first.id, "player-1", "attack", [enemies[0].id])
+        
+        await start(service, "player-2")
+        
+        assert (await repository.get_active_battle(first.id))["seq"] == 1
+    
+    async def test_other_player_cannot_access_battle(self):
+        """Should hide battles owned by another player"""
+        service = BattleSessionService()
+        battle, _ = await start(service)
+        
+        with pytest.raises(BattleNotFoundException):
+            await service.get_battle(battle.id, "player-2")
+
+
+class TestFailover:
+    """Test rehydrating a battle on a different worker"""
+    
+    async def test_restarted_worker_rehydrates_from_log(self):
+        """Another worker should rebuild identical state from checkpoint plus log"""
+        repository = BattleRepository()
+        worker_a = BattleSessionService(
+            battle_repository=repository, flush_every=4, worker_id="a"
+        )
+        battle, enemies = await start(worker_a)
+        for _ in range(6):
+            await worker_a.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        expected = snapshot(battle)
+        
+        # Worker A is gone; its cache is lost but the store survives
+        worker_b = BattleSessionService(battle_repository=repository, worker_id="b")
+        restored = await worker_b.get_battle(battle.id, "player-1")
+        
+        assert restored is not battle
+        assert snapshot(restored) == expected
+        assert (await repository.get_active_battle(battle.id))["worker_id"] == "b"
+    
+    async def test_rehydrated_battle_continues(self):
+        """Rehydrated battle should accept further actions"""
+        repository = BattleRepository()
+        worker_a = BattleSessionService(battle_repository=repository, flush_every=100)
+        battle, enemies = await start(worker_a)
+        await worker_a.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        
+        worker_b = BattleSessionService(battle_repository=repository)
+        await worker_b.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        
+        assert len(await repository.get_battle_log(battle.id)) == 2
+    
+    async def test_stale_cache_rebuilds_after_takeover(self):
+        """A worker whose battle was taken over should rebuild, not reuse its copy"""
+        repository = BattleRepository()
+        worker_a = BattleSessionService(battle_repository=repository, flush_every=100, worker_id="a")
+        battle, enemies = await start(worker_a)
+        await worker_a.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        
+        worker_b = BattleSessionService(battle_repository=repository, worker_id="b")
+        await worker_b.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        expected = snapshot(await worker_b.get_battle(battle.id, "player-1"))
+        
+        restored = await worker_a.get_battle(battle.id, "player-1")
+        
+        assert restored is not battle
+        assert snapshot(restored) == expected
+        assert (await repository.get_battle_claim(battle.id))["worker_id"] == "a"
+    
+    async def test_stale_worker_does_not_overwrite_checkpoint(self):
+        """Eviction and shutdown flushes should skip battles owned elsewhere"""
+        repository = BattleRepository()
+        worker_a = BattleSessionService(
+            battle_repository=repository, capacity=1, flush_every=100, worker_id="a"
+        )
+        battle, enemies = await start(worker_a)
+        await worker_a.execute_action(battle.id, "player-1", "attack", [enemies[0].id])
+        
+        worker_b = BattleSessionService(battle_repository=repository, worker_id="b")
+        await worker_b.get_battle(battle.id, "player-1")
+        await worker_a.flush_all()
+        await start(worker_a, "player-2")
+        
+        assert (await repository.get_battle_claim(battle.id))["worker_id"] == "b"
+    
+    async def test_unknown_battle_raises(self):
+        """Should raise when there is nothing to rehydrate"""
+        service = BattleSessionService()
+        
+        with pytest.raises(BattleNotFoundException):
+            await service.get_battle("missing", "player-1")
+
+
+class TestEndBattle:
+    """Test finishing a battle"""
+    
+    async def test_end_records_result_and_clears_store(self):
+        """Ending should save history and drop the active battle"""
+        repository = BattleRepository()
+        service = BattleSessionService(battle_repository=repository)
+        battle, _ = await start(service)
+        
+        result = await service.end_battle(battle.id, "player-1")
+        
+        assert result["victory"] is False
+        assert battle.state == BattleState.RETREAT
+        assert await repository.get_active_battle(battle.id) is None
+        assert await repository.get_battle_log(battle.id) == []
+        assert await repository.count_battle_history("player-1") == 1
+
+
+class TestBatchActions:
+    """Test running several turns in one call"""
+    
+    async def test_auto_runs_until_battle_end(self):
+        """Auto policy should play until the battle is decided"""
+        repository = BattleRepository()
+        service = BattleSessionService(battle_repository=repository)
+        battle, enemies = await start(service)
+        for enemy in enemies:
+            enemy.current_hp = 150
+        
+        result = await service.execute_batch(battle.id, "player-1", "auto", max_turns=50)
+        
+        assert result["battle_ended"] is True
+        assert result["stop_reason"] == "battle_ended"
+        assert result["result"] == "victory"
+        assert len(await repository.get_battle_log(battle.id)) == result["turns_played"]
+        assert (await repository.get_active_battle(battle.id))["seq"] == result["turns_played"]
+    
+    async def test_max_turns_limits_batch(self):
+        """Batch should stop after max_turns player actions"""
+        service = BattleSessionService()
+        battle, _ = await start(service)
+        
+        result = await service.execute_batch(battle.id, "player-1", "auto", max_turns=3)
+        
+        assert result["turns_played"] == 3
+        assert result["stop_reason"] == "max_turns"
+        assert all(len(row) == 6 for row in result["actions"])
+    
+    async def test_repeat_last_reuses_previous_action(self):
+        """Repeat policy should reuse the last chosen action"""
+        service = BattleSessionService()
+        battle, enemies = await start(service)
+        await service.execute_action(battle.id, "player-1", "defend")
+        
+        result = await service.execute_batch(battle.id, "player-1", "repeat_last", max_turns=2)
+        
+        player_rows = [row for row in result["actions"] if row[0] in {h.id for h in battle.player_team}]
+        assert [row[1] for row in player_rows] == ["d", "d"]
+        assert enemies[0].current_hp == enemies[0].stats.hp
+    
+    async def test_explicit_actions_stop_on_invalid(self):
+        """Explicit list should stop at the first invalid action"""
+        service = BattleSessionService()
+        battle, enemies = await start(service)
+        
+        result = await service.execute_batch(
+            battle.id,
+            "player-1",
+            "actions",
+            actions=[
+                {"action_type": "attack", "target_ids": [enemies[0].id]},
+                {"action_type": "teleport"}
+            ]
+        )
+        
+        assert result["turns_played"] == 1
+        assert result["stop_reason"] == "INVALID_ACTION"
@@ -0,0 +1,362 @@
+"""
+Tests for EquipmentService enhancement
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.core.exceptions import (
+    EquipmentNotFoundException,
+    InsufficientGoldException,
+    ValidationException
+)
+from app.domain.services.equipment_fusion import EquipmentFusion
+from app.domain.static_data import StaticDataRegistry
+from app.repositories.equipment_repository import (
+    EquipmentRepository,
+    EquipmentTemplateRepository
+)
+from app.services.equipment_service import EquipmentService
+
+
+def make_row(row_id, level=1):
+    """Equipment row with no bonus stats"""
+    return SimpleNamespace(
+        id=row_id, template_id="iron_sword", level=level, substats=[], is_locked=False,
+        bonus_hp=0, bonus_atk=0, bonus_def=0, bonus_spd=0, bonus_crit=0, bonus_dex=0
+    )
+
+
+def make_fusion(**template):
+    """Fusion planner whose registry knows iron_sword (50 ATK, 10 SPD unless given)"""
+    registry = StaticDataRegistry()
+    registry.load_equipment_templates([{
+        "id": "iron_sword", "name": "Thiết Kiếm", "equipment_type": "WEAPON",
+        "base_rarity": 5, "base_atk": 50, "base_spd": 10, **template
+    }])
+    return EquipmentFusion(registry)
+
+
+class TestEnhanceToLevel:
+    """Test enhancing straight to a target level"""
+    
+    async def test_one_debit_and_one_update(self):
+        """Level 1 -> 10 should cost 4500 gold in a single debit"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_equipment_for_player.return_value = make_row("eq-1")
+        player_service = AsyncMock()
+        service = EquipmentService(equipment_repository, player_service, fusion=make_fusion())
+        
+        result = await service.enhance_to_level("eq-1", "player-1", 10)
+        
+        assert result["new_level"] == 10
+        assert result["gold_spent"] == 4500
+        # 9 levels of 10% of the 50 ATK base
+        assert result["stats_gained"]["atk"] == 45
+        player_service.spend_gold.assert_awaited_once_with("player-1", 4500)
+        update = equipment_repository.bulk_update_levels.await_args.args[0]
+        assert update == [{
+            "id": "eq-1", "level": 10, "bonus_hp": 0, "bonus_atk": 45, "bonus_def": 0,
+            "bonus_spd": 9, "bonus_crit": 0, "bonus_dex": 0
+        }]
+    
+    async def test_target_capped_at_max_level(self):
+        """Targets above the rarity cap should stop at max level"""
+        service = EquipmentService()
+        
+        result = await service.enhance_to_level("eq-1", "player-1", 99)
+        
+        assert result["new_level"] == 25
+    
+    async def test_template_sets_base_stats_and_cap(self):
+        """Gains and the level cap should come from the piece's template"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_equipment_for_player.return_value = make_row("eq-1")
+        service = EquipmentService(
+            equipment_repository, AsyncMock(),
+            fusion=make_fusion(base_rarity=3, base_atk=0, base_spd=0, base_hp=400)
+        )
+        
+        result = await service.enhance_to_level("eq-1", "player-1", 99)
+        
+        # Rare pieces stop at 15; 14 levels of 10% of 400 HP
+        assert result["new_level"] == 15
+        assert result["stats_gained"] == {
+            "hp": 560, "atk": 0, "def_": 0, "spd": 0, "crit": 0, "dex": 0
+        }
+    
+    async def test_response_uses_template(self):
+        """Name, slot, rarity and base stats should be the template's"""
+        service = EquipmentService(fusion=make_fusion())
+        
+        data = service._equipment_to_response(make_row("eq-1"))
+        unknown = service._equipment_to_response(
+            SimpleNamespace(**{**vars(make_row("eq-2")), "template_id": "lost"})
+        )
+        
+        assert (data["name"], data["equipment_type"], data["rarity"]) == (
+            "Thiết Kiếm", "weapon", "legendary"
+        )
+        assert data["total_stats"]["atk"] == 50
+        assert unknown["rarity"] == "common"
+        assert unknown["total_stats"]["atk"] == 0
+    
+    async def test_target_below_current_rejected(self):
+        """A target at or below the current level should raise"""
+        service = EquipmentService()
+        
+        with pytest.raises(ValidationException):
+            await service.enhance_to_level("eq-1", "player-1", 1)
+
+
+class TestEnhanceMany:
+    """Test batch enhancement"""
+    
+    async def test_batch_is_loaded_and_charged_once(self):
+        """Every item should come from one query, one debit and one update"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_many_for_player.return_value = [
+            make_row("eq-1"), make_row("eq-2", level=5)
+        ]
+        player_service = AsyncMock()
+        service = EquipmentService(equipment_repository, player_service)
+        
+        result = await service.enhance_many("player-1", {"eq-1": 3, "eq-2": 6})
+        
+        # 100 + 200 for eq-1, 500 for eq-2
+        assert result["gold_spent"] == 800
+        assert [r["new_level"] for r in result["results"]] == [3, 6]
+        player_service.spend_gold.assert_awaited_once_with("player-1", 800)
+        equipment_repository.bulk_update_levels.assert_awaited_once()
+        equipment_repository.get_equipment_for_player.assert_not_awaited()
+    
+    async def test_power_total_refreshed(self):
+        """Enhancing should rewrite the player's power total once"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_many_for_player.return_value = [make_row("eq-1")]
+        hero_service = AsyncMock()
+        service = EquipmentService(equipment_repository, hero_service=hero_service)
+        
+        await service.enhance_many("player-1", {"eq-1": 3})
+        
+        hero_service.refresh_power.assert_awaited_once_with("player-1")
+    
+    async def test_missing_item_enhances_nothing(self):
+        """A missing item should fail the whole batch before spending"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_many_for_player.return_value = [make_row("eq-1")]
+        player_service = AsyncMock()
+        service = EquipmentService(equipment_repository, player_service)
+        
+        with pytest.raises(EquipmentNotFoundException):
+            await service.enhance_many("player-1", {"eq-1": 3, "eq-404": 3})
+        
+        player_service.spend_gold.assert_not_awaited()
+        equipment_repository.bulk_update_levels.assert_not_awaited()
+    
+    async def test_insufficient_gold_enhances_nothing(self):
+        """A failed debit should skip the update"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_many_for_player.return_value = [make_row("eq-1")]
+        player_service = AsyncMock()
+        player_service.spend_gold.side_effect = InsufficientGoldException(required=4500, available=10)
+        service = EquipmentService(equipment_repository, player_service)
+        
+        with pytest.raises(InsufficientGoldException):
+            await service.enhance_many("player-1", {"eq-1": 10})
+        
+        equipment_repository.bulk_update_levels.assert_not_awaited()
+
+
+class TestEquipmentEndpoints:
+    """Test the equipment endpoints on the per-request services"""
+    
+    async def test_batch_enhance_writes_levels_and_gold(self, api, db_session):
+        """POST /equipment/enhance/batch should debit and level the stored pieces"""
+        from app.core.security import create_access_token
+        from app.models.equipment import Equipment, EquipmentTemplate
+        from app.models.player import Player
+        
+        player = Player(
+            id=uuid4(), username="smith", email="s@example.com", password_hash="x", gold=1000
+        )
+        piece = Equipment(id=uuid4(), player_id=player.id, template_id="iron_sword")
+        db_session.add_all([
+            player,
+            EquipmentTemplate(id="iron_sword", name="Thiết Kiếm", equipment_type="WEAPON", base_rarity=3),
+            piece
+        ])
+        await db_session.flush()
+        api.headers["Authorization"] = f"Bearer {create_access_token(str(player.id))}"
+        
+        response = await api.post(
+            "/equipment/enhance/batch", json={"targets": {str(piece.id): 3}}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["gold_spent"] == 300
+        await db_session.refresh(player)
+        await db_session.refresh(piece)
+        assert (player.gold, piece.level) == (700, 3)
+
+
+class TestFuse:
+    """Test equipment fusion"""
+    
+    @pytest.fixture
+    def registry(self):
+        """Registry with test templates"""
+        registry = StaticDataRegistry()
+        registry.load_equipment_templates([
+            {"id": "iron_sword", "name": "Thiết Kiếm", "equipment_type": "WEAPON", "base_rarity": 3},
+            {
+                "id": "steel_sword", "name": "Cương Kiếm", "equipment_type": "WEAPON",
+                "base_rarity": 4, "base_atk": 60
+            }
+        ])
+        return registry
+    
+    async def test_fuse_loads_once_and_replaces_in_one_call(self, registry):
+        """Inputs should come from one query and be swapped in one transaction"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_with_equipped_flag.return_value = [
+            (make_row(f"eq-{i}"), False) for i in range(3)
+        ]
+        service = EquipmentService(equipment_repository, fusion=EquipmentFusion(registry))
+        
+        result = await service.fuse("player-1", ["eq-0", "eq-1", "eq-2"])
+        
+        assert result["result_equipment"]["template_id"] == "steel_sword"
+        assert result["result_equipment"]["rarity"] == "epic"
+        assert result["consumed_equipment"] == ["eq-0", "eq-1", "eq-2"]
+        equipment_repository.get_with_equipped_flag.assert_awaited_once()
+        player_id, created, consumed = equipment_repository.replace_many.await_args.args
+        assert [values["template_id"] for values in created] == ["steel_sword"]
+        assert consumed == ["eq-0", "eq-1", "eq-2"]
+        equipment_repository.get_equipment_for_player.assert_not_awaited()
+    
+    async def test_fused_power_from_template_and_substats(self, registry):
+        """The new piece's power should count its base stats and merged substats"""
+        equipment_repository = AsyncMock()
+        rows = [make_row(f"eq-{i}") for i in range(3)]
+        for row in rows:
+            row.substats = [{"stat": "CRIT", "value": 4}]
+        equipment_repository.get_with_equipped_flag.return_value = [(row, False) for row in rows]
+        service = EquipmentService(equipment_repository, fusion=EquipmentFusion(registry))
+        
+        result = (await service.fuse("player-1", ["eq-0", "eq-1", "eq-2"]))["result_equipment"]
+        
+        crit = sum(substat["value"] for substat in result["substats"] if substat["stat"] == "CRIT")
+        assert crit > 0
+        # 60 ATK x 5 plus CRIT x 10
+        assert result["power"] == 60 * 5 + crit * 10
+    
+    async def test_equipped_piece_rejected(self, registry):
+        """Equipped pieces should fail the fusion before anything is written"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_with_equipped_flag.return_value = [
+            (make_row("eq-0"), False), (make_row("eq-1"), True)
+        ]
+        service = EquipmentService(equipment_repository, fusion=EquipmentFusion(registry))
+        
+        with pytest.raises(ValidationException):
+            await service.fuse("player-1", ["eq-0", "eq-1"])
+        
+        equipment_repository.replace_many.assert_not_awaited()
+    
+    async def test_fuse_all_duplicates(self, registry):
+        """Every full group should be fused in one replace call"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_with_equipped_flag.return_value = [
+            (make_row(f"eq-{i}"), False) for i in range(7)
+        ]
+        hero_service = AsyncMock()
+        service = EquipmentService(
+            equipment_repository, fusion=EquipmentFusion(registry), hero_service=hero_service
+        )
+        
+        result = await service.fuse_all_duplicates("player-1")
+        
+        assert len(result["fusions"]) == 2
+        assert result["consumed_count"] == 6
+        equipment_repository.replace_many.assert_awaited_once()
+        hero_service.refresh_power.assert_awaited_once_with("player-1")
+
+
+class TestFuseWithDatabase:
+    """Test fusion on real rows, with templates loaded from the database"""
+    
+    @pytest.fixture
+    async def inventory(self, db_session):
+        """Five iron swords, one worn by a hero whose other slots are empty"""
+        from app.models.equipment import Equipment, EquipmentTemplate
+        from app.models.hero import Hero, HeroTemplate
+        from app.models.player import Player
+        
+        player = Player(id=uuid4(), username="smith", email="s@example.com", password_hash="x")
+        db_session.add_all([
+            player,
+            EquipmentTemplate(id="iron_sword", name="Thiết Kiếm", equipment_type="WEAPON", base_rarity=3),
+            EquipmentTemplate(
+                id="steel_sword", name="Cương Kiếm", equipment_type="WEAPON", base_rarity=4, base_atk=60
+            ),
+            HeroTemplate(
+                id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+                base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+                growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+            )
+        ])
+        swords = [Equipment(id=uuid4(), player_id=player.id, template_id="iron_sword") for _ in range(5)]
+        db_session.add_all(swords)
+        await db_session.flush()
+        db_session.add(Hero(
+            player_id=player.id, template_id="quan_vu", weapon_id=swords[0].id,
+            current_hp=1100, current_atk=120, current_def=80, current_spd=95,
+            current_crit=15, current_dex=10
+        ))
+        await db_session.flush()
+        
+        registry = StaticDataRegistry()
+        registry.load_equipment_templates(await EquipmentTemplateRepository(db_session).get_all())
+        service = EquipmentService(
+            EquipmentRepository(db_session), fusion=EquipmentFusion(registry)
+        )
+        return service, player, swords
+    
+    async def test_fuse_all_duplicates_skips_worn_piece(self, inventory):
+        """The four unworn swords should make one fusion, the worn one stays"""
+        service, player, swords = inventory
+        
+        result = await service.fuse_all_duplicates(player.id)
+        
+        assert result["consumed_count"] == 3
+        assert str(swords[0].id) not in result["fusions"][0]["consumed_equipment"]
+        assert result["fusions"][0]["result_equipment"]["template_id"] == "steel_sword"
+    
+    async def test_fuse_selected_rows(self, inventory):
+        """Fusing chosen rows should resolve their templates from the registry"""
+        service, player, swords = inventory
+        
+        result = await service.fuse(player.id, [str(sword.id) for sword in swords[1:4]])
+        
+        assert result["consumed_equipment"] == [str(sword.id) for sword in swords[1:4]]
+        assert len(await service.equipment_repository.get_unequipped(player.id)) == 2
+    
+    async def test_fuse_endpoint_replaces_rows(self, inventory, api, monkeypatch):
+        """POST /equipment/fuse should swap the stored rows and report the new power"""
+        from app.core.security import create_access_token
+        from app.domain.services import equipment_fusion
+        
+        service, player, swords = inventory
+        monkeypatch.setattr(equipment_fusion, "static_data", service.fusion.registry)
+        api.headers["Authorization"] = f"Bearer {create_access_token(str(player.id))}"
+        
+        response = await api.post(
+            "/equipment/fuse", json={"equipment_ids": [str(sword.id) for sword in swords[1:4]]}
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["result_equipment"]["power"] == 60 * 5
+        unworn = await service.equipment_repository.get_unequipped(player.id)
+        assert sorted(row.template_id for row in unworn) == ["iron_sword", "steel_sword"]
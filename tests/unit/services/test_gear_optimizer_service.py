@@ -0,0 +1,72 @@
+"""
+Tests for GearOptimizerService
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from app.core.exceptions import ValidationException
+from app.domain.static_data import StaticDataRegistry
+from app.services.gear_optimizer_service import GearOptimizerService
+from app.services.hero_service import HeroService
+
+
+TEMPLATES = [
+    {"id": "iron_sword", "name": "Thiết Kiếm", "equipment_type": "WEAPON",
+     "base_rarity": 3, "base_atk": 40},
+    {"id": "steel_sword", "name": "Cương Kiếm", "equipment_type": "WEAPON",
+     "base_rarity": 4, "base_atk": 60, "required_level": 50}
+]
+
+
+def make_row(row_id, template_id, **bonus):
+    """Equipment row with optional bonus stats"""
+    return SimpleNamespace(
+        id=row_id, template_id=template_id, level=1, is_locked=False,
+        **{f"bonus_{name}": bonus.get(name, 0) for name in ("hp", "atk", "def", "spd", "crit", "dex")}
+    )
+
+
+class TestOptimizeGear:
+    """Test loading inventories and searching loadouts"""
+
+    async def test_unequipped_and_equipped_pieces_are_candidates(self, caplog):
+        """The hero's own pieces should compete with unequipped ones"""
+        registry = StaticDataRegistry()
+        registry.load_equipment_templates(TEMPLATES)
+        equipment_repository = AsyncMock()
+        equipment_repository.get_unequipped.return_value = [
+            make_row("eq-1", "iron_sword"),
+            make_row("eq-2", "steel_sword"),
+            make_row("eq-3", "unknown_template", atk=999)
+        ]
+        equipment_repository.get_many_for_player.return_value = [
+            make_row("eq-4", "iron_sword", atk=10)
+        ]
+        hero_service = HeroService()
+        hero_service.get_hero = AsyncMock(return_value={
+            "id": "hero-1",
+            "template_id": "quan_vu",
+            "level": 1,
+            "equipment": {"weapon_id": "eq-4", "armor_id": None}
+        })
+        service = GearOptimizerService(
+            equipment_repository=equipment_repository,
+            hero_service=hero_service,
+            registry=registry
+        )
+
+        result = await service.optimize("hero-1", "player-1", {"atk": 1}, top_k=1)
+
+        # Steel sword needs level 50, unknown templates are skipped and logged
+        assert result["inventory_size"] == 3
+        assert "unknown_template" in caplog.text
+        assert result["loadouts"][0]["equipment"]["weapon"] == "eq-4"
+        equipment_repository.get_many_for_player.assert_awaited_once_with(["eq-4"], "player-1")
+
+    async def test_invalid_objective_rejected(self):
+        """Unknown stats should surface as a validation error"""
+        service = GearOptimizerService()
+
+        with pytest.raises(ValidationException):
+            await service.optimize("hero-1", "player-1", {"mana": 1})
@@ -0,0 +1,295 @@
+"""
+Tests for HeroService level-ups
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.core.exceptions import HeroNotFoundException, ValidationException
+from app.domain.services.set_bonus_resolver import SetBonusResolver
+from app.domain.static_data import DEFAULT_EQUIPMENT_SETS, StaticDataRegistry
+from app.domain.value_objects.hexagon_stats import STAT_FIELDS
+from app.repositories.equipment_repository import EquipmentRepository
+from app.repositories.hero_repository import HeroRepository
+from app.services.hero_service import HeroService
+from app.services.leaderboard_service import LeaderboardService
+
+
+class TestLevelUp:
+    """Test single hero level-up"""
+    
+    async def test_level_up_with_exp_books(self):
+        """Books should be converted to EXP and applied in one step"""
+        service = HeroService()
+        
+        # 5 books = 500 EXP; level 1 -> 2 costs 150, 2 -> 3 costs 200
+        result = await service.level_up("hero-1", "player-1", [{"quantity": 5}])
+        
+        assert result["old_level"] == 1
+        assert result["new_level"] == 3
+        # Quan Vũ template: 1100 HP + 8 HP per level
+        assert result["stats"]["hp"] == 1116
+
+
+class TestBulkLevelUp:
+    """Test levelling many heroes from one EXP pool"""
+    
+    async def test_pool_is_split_evenly(self):
+        """Each hero should get an equal share, remainder to the first"""
+        service = HeroService()
+        
+        result = await service.level_up_bulk("player-1", ["a", "b", "c"], 1000)
+        
+        gained = [hero["exp_gained"] for hero in result["heroes"]]
+        assert gained == [334, 333, 333]
+        assert result["exp_spent"] == 1000
+    
+    async def test_single_write_for_all_heroes(self):
+        """Should load heroes in one query and write them in one call"""
+        heroes = [
+            SimpleNamespace(id=hero_id, level=1, exp=0)
+            for hero_id in ("a", "b")
+        ]
+        repository = AsyncMock()
+        repository.get_heroes_for_player.return_value = heroes
+        service = HeroService(hero_repository=repository)
+        
+        # 400 EXP each: 150 to level 2, 200 to level 3, 50 left
+        await service.level_up_bulk("player-1", ["a", "b"], 800)
+        
+        repository.get_heroes_for_player.assert_awaited_once()
+        repository.bulk_update_levels.assert_awaited_once()
+        updates = repository.bulk_update_levels.await_args.args[0]
+        assert [(u["id"], u["level"], u["exp"]) for u in updates] == [
+            ("a", 3, 50),
+            ("b", 3, 50)
+        ]
+    
+    async def test_foreign_hero_rejected(self):
+        """Should raise if a hero does not belong to the player"""
+        repository = AsyncMock()
+        repository.get_heroes_for_player.return_value = []
+        service = HeroService(hero_repository=repository)
+        
+        with pytest.raises(HeroNotFoundException):
+            await service.level_up_bulk("player-1", ["a"], 100)
+        repository.bulk_update_levels.assert_not_awaited()
+    
+    async def test_empty_selection_rejected(self):
+        """Should require at least one hero"""
+        with pytest.raises(ValidationException):
+            await HeroService().level_up_bulk("player-1", [], 100)
+
+
+class TestEquipSets:
+    """Test equipment and set bonuses applied when stats are read"""
+    
+    @pytest.fixture
+    def set_resolver(self):
+        """Resolver over the default sets plus two Hổ Giáp templates"""
+        registry = StaticDataRegistry(DEFAULT_EQUIPMENT_SETS)
+        registry.load_equipment_templates([
+            {"id": "ho_giap_thuong", "name": "Hổ Giáp Thương", "equipment_type": "WEAPON",
+             "base_rarity": 4, "base_atk": 30},
+            {"id": "ho_giap_giap", "name": "Hổ Giáp Giáp", "equipment_type": "ARMOR",
+             "base_rarity": 4, "base_def": 15}
+        ])
+        return SetBonusResolver(registry)
+    
+    def make_piece(self, piece_id, template_id, **bonus):
+        """Equipment row with optional enhancement bonus"""
+        return SimpleNamespace(
+            id=piece_id, template_id=template_id,
+            **{f"bonus_{name.rstrip('_')}": bonus.get(name, 0) for name in STAT_FIELDS}
+        )
+    
+    async def test_second_set_piece_adds_bonus(self, set_resolver):
+        """Completing a 2-piece set should add both pieces and the set bonus"""
+        weapon = self.make_piece("eq-1", "ho_giap_thuong")
+        armor = self.make_piece("eq-2", "ho_giap_giap", def_=5)
+        equipment_repository = AsyncMock()
+        equipment_repository.get_equipment_for_player.return_value = armor
+        equipment_repository.get_many_for_player.return_value = [weapon, armor]
+        service = HeroService(equipment_repository=equipment_repository, set_resolver=set_resolver)
+        service.get_hero = AsyncMock(return_value={
+            "id": "set-hero",
+            "template_id": "quan_vu",
+            "level": 1,
+            "stats": {"hp": 1100, "atk": 120, "def_": 70, "spd": 95, "crit": 15, "dex": 10},
+            "equipment": {"weapon_id": "eq-1", "armor_id": None}
+        })
+        
+        result = await service.equip_item("set-hero", "player-1", "eq-2", "armor")
+        
+        # Base DEF 70 + armor 15 + enhancement 5 + Hổ Giáp 2-piece 20
+        assert result["new_stats"]["def_"] == 110
+        assert result["new_stats"]["atk"] == 150
+        equipment_repository.get_many_for_player.assert_awaited_once_with(
+            ["eq-1", "eq-2"], "player-1"
+        )
+    
+    async def test_stored_stats_exclude_equipment(self, set_resolver):
+        """Repeated equips should never change what level-ups persist"""
+        equipment_repository = AsyncMock()
+        equipment_repository.get_many_for_player.return_value = [
+            self.make_piece("eq-1", "ho_giap_thuong"),
+            self.make_piece("eq-2", "ho_giap_giap")
+        ]
+        service = HeroService(equipment_repository=equipment_repository, set_resolver=set_resolver)
+        service.get_hero = AsyncMock(return_value={
+            "id": "set-hero",
+            "template_id": "quan_vu",
+            "level": 1,
+            "stats": {"hp": 1100, "atk": 120, "def_": 70, "spd": 95, "crit": 15, "dex": 10},
+            "equipment": {"weapon_id": "eq-1", "armor_id": "eq-2"}
+        })
+        
+        for _ in range(3):
+            await service.equip_item("set-hero", "player-1", "eq-2", "armor")
+        stats = service._calculate_stats({"id": "set-hero", "template_id": "quan_vu"}, 1)
+        
+        assert stats["def_"] == 70
+
+
+class TestHeroDetails:
+    """Test loading several heroes at once"""
+    
+    async def test_one_query_for_all_heroes(self):
+        """Should load every hero with a single repository call"""
+        repository = AsyncMock()
+        service = HeroService(hero_repository=repository)
+        
+        repository.get_heroes_for_player.return_value = []
+        with pytest.raises(HeroNotFoundException):
+            await service.get_hero_details(["a", "b"], "player-1")
+        
+        repository.get_heroes_for_player.assert_awaited_once_with(["a", "b"], "player-1")
+        repository.get_hero_for_player.assert_not_awaited()
+
+
+class TestHeroEndpoints:
+    """Test the hero endpoints on the per-request services"""
+    
+    @pytest.fixture
+    async def player(self, api, db_session):
+        """An authenticated player owning one hero"""
+        from app.core.security import create_access_token
+        from app.models.hero import Hero, HeroTemplate
+        from app.models.player import Player
+        
+        player = Player(id=uuid4(), username="lister", email="l@example.com", password_hash="x")
+        hero = Hero(
+            id=uuid4(), player_id=player.id, template_id="quan_vu", level=3,
+            current_hp=1116, current_atk=124, current_def=82, current_spd=95,
+            current_crit=15, current_dex=10
+        )
+        db_session.add_all([
+            player,
+            HeroTemplate(
+                id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+                base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+                growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+            ),
+            hero
+        ])
+        await db_session.flush()
+        api.headers["Authorization"] = f"Bearer {create_access_token(str(player.id))}"
+        return hero
+    
+    async def test_list_reads_the_database(self, api, player):
+        """GET /heroes should list the player's stored heroes"""
+        response = await api.get("/heroes")
+        
+        body = response.json()
+        assert response.status_code == 200
+        assert body["total"] == 1
+        assert [(hero["id"], hero["level"]) for hero in body["heroes"]] == [(str(player.id), 3)]
+    
+    async def test_detail_and_bulk_level_up(self, api, player):
+        """GET /heroes/{id} and the bulk level-up should use the repositories"""
+        detail = await api.get(f"/heroes/{player.id}")
+        levelled = await api.post(
+            "/heroes/level-up/bulk", json={"hero_ids": [str(player.id)], "exp_pool": 1000}
+        )
+        missing = await api.get(f"/heroes/{uuid4()}")
+        
+        assert detail.json()["stats"]["hp"] == 1116
+        assert levelled.status_code == 200
+        assert player.level == levelled.json()["heroes"][0]["new_level"] > 3
+        assert missing.status_code == 404
+
+
+class TestPowerLeaderboard:
+    """Test absolute power totals on the leaderboard"""
+    
+    @pytest.fixture
+    async def roster(self, db_session):
+        """A player with two heroes and an unworn weapon"""
+        from app.models.equipment import Equipment, EquipmentTemplate
+        from app.models.hero import Hero, HeroTemplate
+        from app.models.player import Player
+        
+        player = Player(id=uuid4(), username="ranked", email="r@example.com", password_hash="x")
+        weapon = Equipment(id=uuid4(), player_id=player.id, template_id="kiem")
+        heroes = [
+            Hero(
+                id=uuid4(), player_id=player.id, template_id="quan_vu",
+                current_hp=1100, current_atk=120, current_def=80, current_spd=95,
+                current_crit=15, current_dex=10
+            )
+            for _ in range(2)
+        ]
+        db_session.add_all([
+            player,
+            EquipmentTemplate(id="kiem", name="Kiếm", equipment_type="weapon", base_rarity=3, base_atk=40),
+            HeroTemplate(
+                id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+                base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+                growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+            ),
+            weapon,
+            *heroes
+        ])
+        await db_session.flush()
+        
+        leaderboard = LeaderboardService()
+        service = HeroService(
+            hero_repository=HeroRepository(db_session),
+            equipment_repository=EquipmentRepository(db_session),
+            leaderboard_service=leaderboard
+        )
+        return service, leaderboard, str(player.id), heroes, weapon
+    
+    async def test_rebuild_seeds_board(self, roster):
+        """Rebuilding should write every player's total from the database"""
+        service, leaderboard, player_id, heroes, weapon = roster
+        
+        assert await service.rebuild_power_board() == 1
+        
+        entry = await leaderboard.get_rank("power", player_id)
+        assert entry["score"] == 2 * service._calculate_power(heroes[0])
+    
+    async def test_level_up_writes_absolute_total(self, roster):
+        """A drifted score should be replaced by the player's real total"""
+        service, leaderboard, player_id, heroes, weapon = roster
+        await leaderboard.record_power(player_id, 999_999)
+        
+        await service.level_up_bulk(player_id, [str(heroes[0].id)], 1000)
+        
+        totals = await service.hero_repository.get_power_totals()
+        assert totals[player_id] > 2 * 2300
+        assert (await leaderboard.get_rank("power", player_id))["score"] == totals[player_id]
+    
+    async def test_equipping_changes_total(self, roster):
+        """Worn pieces should count towards the total"""
+        service, leaderboard, player_id, heroes, weapon = roster
+        await service.rebuild_power_board()
+        before = (await leaderboard.get_rank("power", player_id))["score"]
+        
+        await service.equip_item(str(heroes[0].id), player_id, str(weapon.id), "weapon")
+        equipped = (await leaderboard.get_rank("power", player_id))["score"]
+        await service.unequip_item(str(heroes[0].id), player_id, "weapon")
+        
+        assert equipped == before + 40 * 5
+        assert (await leaderboard.get_rank("power", player_id))["score"] == before
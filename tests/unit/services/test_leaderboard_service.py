@@ -0,0 +1,78 @@
+"""
+Tests for LeaderboardService and the services that feed it
+"""
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.domain.static_data import StaticDataRegistry
+from app.services.leaderboard_service import LeaderboardService
+from app.services.story_service import StoryService
+
+
+async def create_board(count):
+    """Power board with players p0..p{count-1} scoring 10 * index"""
+    service = LeaderboardService()
+    for index in range(count):
+        await service.record_power(f"p{index}", 10 * index)
+    return service
+
+
+class TestLeaderboardQueries:
+    """Test rank, pages and neighbours"""
+
+    async def test_top_pages(self):
+        """Pages should continue ranks from the previous page"""
+        service = await create_board(25)
+
+        page = await service.get_top("power", page=2, per_page=10)
+
+        assert page["total"] == 25
+        assert page["entries"][0] == {"rank": 11, "player_id": "p14", "score": 140}
+        assert len(page["entries"]) == 10
+
+    async def test_rank_and_around(self):
+        """Neighbours should be centred on the player and clipped at the top"""
+        service = await create_board(10)
+
+        rank = await service.get_rank("power", "p7")
+        around = await service.get_around("power", "p8", radius=2)
+
+        assert rank == {"rank": 3, "player_id": "p7", "score": 70}
+        assert [entry["player_id"] for entry in around] == ["p9", "p8", "p7", "p6"]
+        assert await service.get_rank("power", "missing") is None
+        assert await service.get_around("power", "missing") == []
+
+    async def test_unknown_board(self):
+        """Unknown boards should be rejected"""
+        service = LeaderboardService()
+
+        with pytest.raises(ValidationException):
+            await service.get_top("gold")
+
+
+class TestIncrementalUpdates:
+    """Test boards fed by other services"""
+
+    async def test_story_clears_update_stars(self):
+        """Better clears should raise the player's stars total"""
+        leaderboard = LeaderboardService()
+        story = StoryService(registry=StaticDataRegistry(), leaderboard_service=leaderboard)
+
+        await story.complete_stage("player-1", "stage_1_1", 2)
+        await story.complete_stage("player-1", "stage_1_1", 3)
+        await story.complete_stage("player-2", "stage_1_1", 1)
+
+        page = await leaderboard.get_top("stars")
+        assert [(e["player_id"], e["score"]) for e in page["entries"]] == [
+            ("player-1", 3), ("player-2", 1)
+        ]
+
+    async def test_wins_accumulate(self):
+        """Each win should add one"""
+        leaderboard = LeaderboardService()
+
+        await leaderboard.record_win("player-1")
+        total = await leaderboard.record_win("player-1")
+
+        assert total == 2
+        assert (await leaderboard.get_rank("wins", "player-1"))["rank"] == 1
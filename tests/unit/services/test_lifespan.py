@@ -0,0 +1,234 @@
+"""
+Tests for the application lifespan
+Startup warm-up, readiness vs liveness and compiled gacha tables
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import lifespan as lifespan_module
+from app.api.deps import get_battle_session_service
+from app.api.lifespan import WarmupState, readiness_report, warm_up
+from app.config.settings import get_settings
+from app.domain.static_data import StaticDataRegistry
+from app.main import app
+from app.services.gacha_service import BANNERS, GachaService, compile_banner_tables
+
+
+class TestReadiness:
+    """Test /ready against /health"""
+
+    def test_not_ready_before_warm_up(self):
+        """Should report starting (503) while liveness is already fine"""
+        app.state.warmup = None
+        client = TestClient(app)
+
+        assert client.get("/health").status_code == 200
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+    def test_ready_after_lifespan(self):
+        """Should warm up on startup and report ready"""
+        from app.config import database
+
+        with TestClient(app) as client:
+            engine_created = bool(database.get_engine.cache_info().currsize)
+            response = client.get("/ready")
+            cached = client.get("/api/v1/gacha/banners")
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["status"] == "ready"
+        assert body["cache"]["warm"] is True
+        assert body["static_data_version"] >= 1
+        # Readiness reports the pool without creating the engine itself
+        assert body["database"]["engine"] == ("created" if engine_created else "not created")
+        assert set(body["warmup"]["steps"]) == set(lifespan_module.WARMUP_STEPS)
+        assert cached.headers["X-Cache"] == "HIT"
+
+    async def test_failed_step_degrades_readiness(self, monkeypatch):
+        """Should keep running steps and report degraded when one fails"""
+        async def broken(app, settings):
+            raise RuntimeError("pool unavailable")
+
+        monkeypatch.setitem(lifespan_module.WARMUP_STEPS, "database_pool", broken)
+        state = await warm_up(app, get_settings())
+        report = readiness_report(state)
+
+        assert state.finished and not state.ready
+        assert report["status"] == "degraded"
+        assert report["warmup"]["steps"]["database_pool"]["error"] == "pool unavailable"
+        assert report["warmup"]["steps"]["response_cache"]["ok"] is True
+
+    async def test_failed_step_retried_until_ready(self, monkeypatch):
+        """Failed steps should be re-run with growing delays until they pass"""
+        calls = []
+        delays = []
+
+        async def flaky(app, settings):
+            calls.append(len(calls))
+            if len(calls) < 3:
+                raise RuntimeError("database starting")
+            return {"connections": 1}
+
+        async def sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setitem(lifespan_module.WARMUP_STEPS, "database_pool", flaky)
+        monkeypatch.setattr(lifespan_module.asyncio, "sleep", sleep)
+        settings = get_settings()
+        monkeypatch.setattr(settings, "WARMUP_RETRY_DELAY", 0.5)
+        monkeypatch.setattr(settings, "WARMUP_RETRY_ATTEMPTS", 5)
+        state = await warm_up(app, settings)
+
+        assert await lifespan_module.retry_failed_steps(app, state, settings)
+        assert delays == [0.5, 1.0]
+        assert state.steps["database_pool"].attempts == 3
+        assert readiness_report(state)["status"] == "ready"
+
+    def test_shutdown_cancels_retries(self, monkeypatch):
+        """Stopping the server should cancel a pending retry"""
+        cancelled = []
+
+        async def broken(app, settings):
+            raise RuntimeError("pool unavailable")
+
+        async def retry(app, state, settings):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        monkeypatch.setitem(lifespan_module.WARMUP_STEPS, "database_pool", broken)
+        monkeypatch.setattr(lifespan_module, "retry_failed_steps", retry)
+        with TestClient(app) as client:
+            assert client.get("/ready").json()["status"] == "degraded"
+
+        assert cancelled == [True]
+
+    def test_warm_up_disabled_is_ready(self):
+        """A finished state with no steps counts as ready"""
+        assert readiness_report(WarmupState(finished=True))["status"] == "ready"
+
+    async def test_equipment_templates_loaded_from_database(self, db_engine, monkeypatch):
+        """The warm-up step should fill the registry from EquipmentTemplate rows"""
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from app.config import database
+        from app.models.equipment import EquipmentTemplate
+
+        factory = async_sessionmaker(db_engine, expire_on_commit=False)
+        async with factory() as session:
+            session.add(EquipmentTemplate(
+                id="kiem", name="Kiếm", equipment_type="WEAPON", base_rarity=3, base_atk=40
+            ))
+            await session.commit()
+        monkeypatch.setattr(database, "get_session_factory", lambda: factory)
+        monkeypatch.setattr(get_settings(), "WARMUP_EQUIPMENT_TEMPLATES", True)
+        registry = StaticDataRegistry()
+        monkeypatch.setattr(lifespan_module, "static_data", registry)
+
+        detail = await lifespan_module.WARMUP_STEPS["equipment_templates"](app, get_settings())
+
+        assert detail["equipment_templates"] == 1
+        assert registry.get_equipment_template("kiem").base_stats.atk == 40
+
+    async def test_leaderboards_seeded_from_database(self, db_engine, monkeypatch):
+        """The warm-up step should write every player's level, power and stars"""
+        from uuid import uuid4
+
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from app.config import database
+        from app.domain.entities.story_progress import StoryProgress
+        from app.domain.static_data import static_data
+        from app.models.hero import Hero, HeroTemplate
+        from app.models.player import Player
+        from app.services.leaderboard_service import LeaderboardService
+        from app.services.story_service import CHAPTERS
+
+        if static_data.get_story_layout() is None:
+            static_data.load_story_chapters(CHAPTERS)
+        layout = static_data.get_story_layout()
+        progress = StoryProgress(layout)
+        progress.record(layout.stage_ordinals["stage_1_1"], 3)
+
+        factory = async_sessionmaker(db_engine, expire_on_commit=False)
+        player = Player(
+            id=uuid4(), username="ranked", email="r@example.com", password_hash="x",
+            level=7, story_progress=progress.to_bytes()
+        )
+        async with factory() as session:
+            session.add_all([
+                player,
+                HeroTemplate(
+                    id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+                    base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+                    growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+                ),
+                Hero(
+                    player_id=player.id, template_id="quan_vu",
+                    current_hp=1000, current_atk=0, current_def=0, current_spd=0,
+                    current_crit=0, current_dex=0
+                )
+            ])
+            await session.commit()
+        leaderboard = LeaderboardService()
+        monkeypatch.setattr(database, "get_session_factory", lambda: factory)
+        monkeypatch.setattr(get_settings(), "WARMUP_LEADERBOARDS", True)
+        monkeypatch.setattr("app.api.deps.get_leaderboard_service", lambda: leaderboard)
+
+        detail = await lifespan_module.WARMUP_STEPS["leaderboards"](app, get_settings())
+
+        assert detail == {"level": 1, "power": 1, "stars": 1}
+        assert (await leaderboard.get_rank("level", str(player.id)))["score"] == 7
+        assert (await leaderboard.get_rank("power", str(player.id)))["score"] == 1000
+        assert (await leaderboard.get_rank("stars", str(player.id)))["score"] == 3
+
+    def test_shutdown_flushes_battles_before_engine(self, monkeypatch):
+        """Should checkpoint live battles before releasing the pool"""
+        calls = []
+        sessions = get_battle_session_service()
+
+        async def flush_all():
+            calls.append("flush")
+
+        async def dispose():
+            calls.append("dispose")
+
+        monkeypatch.setattr(sessions, "flush_all", flush_all)
+        monkeypatch.setattr(lifespan_module, "_dispose_engine", dispose)
+        with TestClient(app):
+            pass
+
+        assert calls == ["flush", "dispose"]
+
+
+class TestBannerTables:
+    """Test compiled gacha roll tables"""
+
+    def test_tables_follow_banner_rates(self):
+        """Thresholds should be cumulative rarity rates"""
+        table = compile_banner_tables()["standard"]
+
+        assert table.five_star_below == 2
+        assert table.four_star_below == 20
+        assert table.pity_threshold == 90
+        assert table.featured is None
+
+    async def test_banner_swap_recompiles(self):
+        """Should rebuild tables after set_banners"""
+        original = dict(BANNERS)
+        service = GachaService()
+        swapped = {**original["standard"], "id": "swap", "rates": {3: 50, 4: 40, 5: 10}}
+        try:
+            await service.set_banners({"swap": swapped})
+            assert set(compile_banner_tables()) == {"swap"}
+            assert compile_banner_tables()["swap"].four_star_below == 50
+        finally:
+            await service.set_banners(original)
+
+        assert "standard" in compile_banner_tables()
@@ -0,0 +1,132 @@
+"""
+Tests for request metrics
+Histograms, per-request DB timing, Prometheus output and the middleware
+"""
+import pytest
+from types import SimpleNamespace
+
+from app.api.metrics import MetricsMiddleware, timed_endpoint
+from app.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+    get_request_timings,
+    render_prometheus,
+    start_request_timings
+)
+
+
+def make_app(registry, status=200, body=b'{"ok": true}', queries=(0.002,)):
+    """Fake routed ASGI app that runs a timed endpoint with some queries"""
+
+    @timed_endpoint
+    async def endpoint():
+        for seconds in queries:
+            registry.record_query(seconds)
+
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path="/api/v1/heroes/{hero_id}")
+        await endpoint()
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+async def call(middleware, headers=()):
+    """Send one GET through the middleware and collect the messages"""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/heroes/1", "headers": list(headers)}
+    await middleware(scope, None, send)
+    return messages
+
+
+class TestHistogram:
+    """Test log-bucketed histograms"""
+
+    def test_buckets_are_cumulative(self):
+        """Values should land in the first bound they fit under"""
+        histogram = Histogram((1, 2, 4))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [2, 2, 3, 4]
+        assert histogram.sum == 14.5
+        assert histogram.quantile(0.5) == 1
+        assert histogram.quantile(0.99) == 4
+
+
+class TestRequestTimings:
+    """Test per-request DB accounting"""
+
+    def test_queries_add_to_current_request(self):
+        """Queries should count against the registry and the active request"""
+        registry = MetricsRegistry()
+        timings = start_request_timings()
+
+        registry.record_query(0.01)
+        registry.record_query(0.02)
+
+        assert get_request_timings() is timings
+        assert timings.db_statements == 2
+        assert registry.db_seconds == pytest.approx(0.03)
+
+    def test_breakdown_splits_time(self):
+        """Service excludes DB time; serialization is time outside the endpoint"""
+        timings = start_request_timings()
+        timings.endpoint_seconds = 0.05
+        timings.db_seconds = 0.02
+
+        breakdown = timings.breakdown(now=timings.started_at + 0.08)
+
+        assert breakdown["service"] == pytest.approx(0.03)
+        assert breakdown["serialization"] == pytest.approx(0.03)
+        assert breakdown["total"] == pytest.approx(0.08)
+
+
+class TestMetricsMiddleware:
+    """Test recording requests"""
+
+    async def test_records_route_template(self):
+        """Requests should be recorded under the route template"""
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(make_app(registry), registry=registry)
+
+        await call(middleware)
+        await call(middleware)
+
+        stats = registry.routes[("GET", "/api/v1/heroes/{hero_id}")]
+        assert stats.latency.count == 2
+        assert stats.statuses == {200: 2}
+        assert stats.db_statements == 2
+        assert stats.response_size.sum == 2 * len(b'{"ok": true}')
+        assert registry.in_flight == 0
+
+    async def test_breakdown_header_is_opt_in(self):
+        """Only requests asking for it should get Server-Timing"""
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(make_app(registry), registry=registry)
+
+        plain = await call(middleware)
+        timed = await call(middleware, [(b"x-debug-timing", b"1")])
+
+        assert plain[0]["headers"] == []
+        name, value = timed[0]["headers"][0]
+        assert name == b"server-timing"
+        assert value.startswith(b"db;dur=2.00, service;dur=")
+
+    async def test_prometheus_output(self):
+        """Rendered metrics should include labelled histogram series"""
+        registry = MetricsRegistry()
+        await call(MetricsMiddleware(make_app(registry, status=404), registry=registry))
+
+        text = render_prometheus(registry)
+
+        labels = 'method="GET",route="/api/v1/heroes/{hero_id}"'
+        assert f'http_requests_total{{{labels},status="404"}} 1' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"http_db_statements_total{{{labels}}} 1" in text
+        assert "# TYPE http_response_size_bytes histogram" in text
@@ -0,0 +1,203 @@
+"""
+Tests for request profiling
+Stack sampler, profile store, profiling middleware and the admin endpoints
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_profile_store
+from app.api.profiling import ProfilingMiddleware
+from app.config.settings import get_settings
+from app.core.security import create_access_token
+from app.main import app
+from app.utils.profiling import WAITING_FRAME, ProfileStore, StackSampler, to_collapsed
+
+
+def busy_loop(seconds: float) -> None:
+    """Hold the CPU (and the event loop) for a while."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def make_app(store: ProfileStore, **options) -> FastAPI:
+    """Small app with a fast, a busy and an idle endpoint behind the middleware."""
+    profiled = FastAPI()
+
+    @profiled.get("/fast")
+    async def fast():
+        return {"ok": True}
+
+    @profiled.get("/busy/{item_id}")
+    async def busy(item_id: str):
+        busy_loop(0.06)
+        return {"item_id": item_id}
+
+    @profiled.get("/idle")
+    async def idle():
+        await asyncio.sleep(0.06)
+        return {"ok": True}
+
+    options.setdefault("sampler", StackSampler(interval=0.002))
+    profiled.add_middleware(ProfilingMiddleware, store=store, **options)
+    return profiled
+
+
+async def request(profiled: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=profiled)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+class TestStackSampler:
+    """Test sampling tracked requests"""
+
+    async def test_untrack_returns_snapshot(self):
+        """untrack should hand back a copy that later samples cannot touch"""
+        sampler = StackSampler(interval=60)
+        profile = sampler.track()
+        sampler.sample()
+
+        stacks = sampler.untrack(profile)
+        sampler.sample()
+
+        assert stacks == profile.stacks
+        assert stacks is not profile.stacks
+        assert sum(stacks.values()) == 1
+
+
+class TestProfileStore:
+    """Test the bounded profile directory"""
+
+    def test_save_get_and_list(self, tmp_path):
+        """Should round-trip a record and list it without stacks"""
+        store = ProfileStore(str(tmp_path))
+        profile_id = store.save({"route": "/x", "stacks": {"a;b": 3}})
+
+        assert store.get(profile_id)["stacks"] == {"a;b": 3}
+        summary = store.list()[0]
+        assert summary["id"] == profile_id
+        assert "stacks" not in summary
+
+    def test_prunes_oldest(self, tmp_path):
+        """Should keep only the newest max_files profiles"""
+        store = ProfileStore(str(tmp_path), max_files=3)
+        ids = [store.save({"n": n, "stacks": {}}) for n in range(5)]
+
+        assert [record["id"] for record in store.list()] == ids[:1:-1]
+        assert store.get(ids[0]) is None
+
+    def test_list_filters_route_before_limit(self, tmp_path):
+        """limit should count only profiles of the requested route"""
+        store = ProfileStore(str(tmp_path))
+        wanted = [store.save({"route": "/a", "stacks": {}}) for _ in range(3)]
+        store.save({"route": "/b", "stacks": {}})
+
+        assert [record["id"] for record in store.list(limit=2, route="/a")] == wanted[:0:-1]
+
+    def test_rejects_path_like_ids(self, tmp_path):
+        """Should not resolve IDs outside the store"""
+        store = ProfileStore(str(tmp_path))
+
+        assert store.get("../secrets") is None
+        assert store.list() == []
+
+    def test_to_collapsed(self):
+        """Should emit one line per stack, most samples first"""
+        record = {"stacks": {"main;a": 1, "main;b": 4}}
+
+        assert to_collapsed(record) == "main;b 4\nmain;a 1\n"
+
+
+class TestProfilingMiddleware:
+    """Test which requests are kept"""
+
+    async def test_keeps_slow_request(self, tmp_path):
+        """A slow request should be saved with its hot function on the stack"""
+        store = ProfileStore(str(tmp_path))
+        profiled = make_app(store, slow_seconds=0.03)
+
+        response = await request(profiled, "/busy/42?verbose=1")
+        record = store.get(store.list()[0]["id"])
+
+        assert response.status_code == 200
+        assert record["reason"] == "slow"
+        assert record["route"] == "/busy/{item_id}"
+        assert record["path_params"] == {"item_id": "42"}
+        assert record["query"] == {"verbose": "1"}
+        assert record["status"] == 200
+        assert record["samples"] > 0
+        assert any("busy_loop" in stack for stack in record["stacks"])
+
+    async def test_idle_time_is_waiting(self, tmp_path):
+        """Time spent awaiting should show as the waiting pseudo-frame"""
+        store = ProfileStore(str(tmp_path))
+        profiled = make_app(store, slow_seconds=0.03)
+
+        await request(profiled, "/idle")
+        record = store.get(store.list()[0]["id"])
+
+        assert record["stacks"][WAITING_FRAME] >= record["samples"] // 2
+
+    async def test_drops_fast_request(self, tmp_path):
+        """Fast requests are dropped unless sampled"""
+        store = ProfileStore(str(tmp_path))
+        profiled = make_app(store, slow_seconds=10.0, chance=lambda: 0.0)
+
+        await request(profiled, "/fast")
+
+        assert store.list() == []
+
+    async def test_samples_by_rate(self, tmp_path):
+        """sample_rate should keep requests that are not slow"""
+        store = ProfileStore(str(tmp_path))
+        profiled = make_app(store, slow_seconds=10.0, sample_rate=0.5, chance=lambda: 0.2)
+
+        await request(profiled, "/busy/1")
+
+        assert store.list()[0]["reason"] == "sampled"
+
+
+class TestAdminProfiles:
+    """Test the admin profile endpoints"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProfileStore(str(tmp_path))
+        app.dependency_overrides[get_profile_store] = lambda: store
+        yield store
+        app.dependency_overrides.pop(get_profile_store, None)
+
+    @pytest.fixture
+    def client(self):
+        client = TestClient(app)
+        client.headers["Authorization"] = f"Bearer {create_access_token('ops-player')}"
+        return client
+
+    def test_requires_admin(self, store, client, monkeypatch):
+        """Non-admin players should get 403"""
+        monkeypatch.setattr(get_settings(), "ADMIN_PLAYER_IDS", [])
+
+        assert client.get("/api/v1/admin/profiles").status_code == 403
+
+    def test_list_and_download(self, store, client, monkeypatch):
+        """Admins should list profiles and download collapsed stacks"""
+        monkeypatch.setattr(get_settings(), "ADMIN_PLAYER_IDS", ["ops-player"])
+        profile_id = store.save({
+            "reason": "slow", "method": "GET", "route": "/x", "path": "/x",
+            "path_params": {}, "query": {}, "status": 200, "duration_ms": 812.0,
+            "interval_ms": 5.0, "samples": 3, "stacks": {"main;hot": 3}
+        })
+
+        listed = client.get("/api/v1/admin/profiles", params={"route": "/x"})
+        downloaded = client.get(f"/api/v1/admin/profiles/{profile_id}")
+        missing = client.get("/api/v1/admin/profiles/0123456789abcdef")
+
+        assert [profile["id"] for profile in listed.json()] == [profile_id]
+        assert downloaded.text == "main;hot 3\n"
+        assert missing.status_code == 404
@@ -0,0 +1,239 @@
+"""
+Tests for query budgets
+Statement shapes, N+1 detection and budget enforcement, and the
+budgeted endpoints run against a real (SQLite) database
+"""
+import pytest
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+
+from app.api.deps import get_current_player_id, get_equipment_service, get_hero_service
+from app.api.query_budget import QueryBudgetMiddleware
+from app.api.v1.heroes import level_up_heroes_bulk
+from app.domain.services.equipment_fusion import EquipmentFusion
+from app.domain.static_data import StaticDataRegistry
+from app.main import app
+from app.repositories.equipment_repository import EquipmentRepository, EquipmentTemplateRepository
+from app.repositories.hero_repository import HeroRepository
+from app.repositories.player_repository import PlayerRepository
+from app.services.equipment_service import EquipmentService
+from app.services.hero_service import HeroService
+from app.services.leaderboard_service import LeaderboardService
+from app.services.player_service import PlayerService
+from app.utils.query_budget import (
+    QueryBudgetExceeded,
+    QueryTracker,
+    install_query_tracking,
+    normalize_statement,
+    query_budget,
+    query_tracker
+)
+
+
+def make_app(tracker, statements, budget=None):
+    """Fake routed ASGI app running the given statements"""
+
+    async def endpoint():
+        pass
+
+    if budget is not None:
+        query_budget(budget)(endpoint)
+
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path="/api/v1/heroes/{hero_id}", endpoint=endpoint)
+        for statement in statements:
+            tracker.record(statement)
+
+    return app
+
+
+async def call(middleware):
+    """Send one GET through the middleware"""
+    await middleware({"type": "http", "method": "GET", "headers": []}, None, None)
+
+
+class TestNormalizeStatement:
+    """Test statement shapes"""
+
+    def test_literals_and_parameters_collapse(self):
+        """Statements differing only in values should share a shape"""
+        first = normalize_statement("SELECT * FROM heroes WHERE id = $1 AND level > 10")
+        second = normalize_statement("SELECT *  FROM heroes\nWHERE id = 'abc' AND level > 3")
+
+        assert first == second == "SELECT * FROM heroes WHERE id = ? AND level > ?"
+
+    def test_in_lists_collapse(self):
+        """IN lists and VALUES rows of any length should share a shape"""
+        assert normalize_statement("SELECT 1 WHERE id IN ($1, $2, $3)") == "SELECT ? WHERE id IN (?)"
+        assert normalize_statement("INSERT INTO t (a) VALUES (1), (2)") == "INSERT INTO t (a) VALUES (?)"
+
+
+class TestQueryBudgets:
+    """Test per-request checks"""
+
+    async def test_repeated_shape_flagged_as_n_plus_one(self):
+        """The same query per row should be reported"""
+        tracker = QueryTracker(repeat_threshold=3)
+        statements = [f"SELECT * FROM heroes WHERE id = {i}" for i in range(4)]
+
+        await call(QueryBudgetMiddleware(make_app(tracker, statements), tracker=tracker))
+
+        report = tracker.routes["GET /api/v1/heroes/{hero_id}"]
+        assert report.repeated == {"SELECT * FROM heroes WHERE id = ?": 4}
+        assert "N+1 x4" in tracker.report()
+
+    async def test_declared_budget_enforced_in_strict_mode(self):
+        """Exceeding the endpoint's budget should fail the request"""
+        tracker = QueryTracker(strict=True)
+        app = make_app(tracker, ["SELECT 1", "SELECT 2 FROM t"], budget=1)
+
+        with pytest.raises(QueryBudgetExceeded):
+            await call(QueryBudgetMiddleware(app, tracker=tracker))
+
+        assert tracker.routes["GET /api/v1/heroes/{hero_id}"].over_budget == 1
+
+    async def test_default_budget_when_undeclared(self):
+        """Routes without a declared budget use the default"""
+        tracker = QueryTracker(default_budget=5)
+
+        await call(QueryBudgetMiddleware(make_app(tracker, ["SELECT 1"]), tracker=tracker))
+
+        report = tracker.routes["GET /api/v1/heroes/{hero_id}"]
+        assert (report.budget, report.max_statements, report.over_budget) == (5, 1, 0)
+
+
+@pytest.fixture
+async def game(db_engine, db_session):
+    """The app wired to repositories on the test database, with statements tracked"""
+    from app.models.equipment import Equipment, EquipmentTemplate
+    from app.models.hero import Hero, HeroTemplate
+    from app.models.player import Player
+
+    player = Player(
+        id=uuid4(), username="budget", email="q@example.com", password_hash="x", gold=1_000_000
+    )
+    swords = [Equipment(id=uuid4(), player_id=player.id, template_id="iron_sword") for _ in range(8)]
+    heroes = [
+        Hero(
+            id=uuid4(), player_id=player.id, template_id="quan_vu", weapon_id=swords[0].id,
+            current_hp=1100, current_atk=120, current_def=80, current_spd=95,
+            current_crit=15, current_dex=10
+        )
+    ] + [
+        Hero(
+            id=uuid4(), player_id=player.id, template_id="quan_vu",
+            current_hp=1100, current_atk=120, current_def=80, current_spd=95,
+            current_crit=15, current_dex=10
+        )
+        for _ in range(4)
+    ]
+    db_session.add_all([
+        player,
+        EquipmentTemplate(id="iron_sword", name="Thiết Kiếm", equipment_type="WEAPON", base_rarity=3),
+        EquipmentTemplate(id="steel_sword", name="Cương Kiếm", equipment_type="WEAPON", base_rarity=4),
+        HeroTemplate(
+            id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+            base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+            growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+        ),
+        *swords
+    ])
+    await db_session.flush()
+    db_session.add_all(heroes)
+    await db_session.flush()
+
+    registry = StaticDataRegistry()
+    registry.load_equipment_templates(await EquipmentTemplateRepository(db_session).get_all())
+    hero_service = HeroService(
+        hero_repository=HeroRepository(db_session),
+        equipment_repository=EquipmentRepository(db_session),
+        leaderboard_service=LeaderboardService()
+    )
+    equipment_service = EquipmentService(
+        EquipmentRepository(db_session),
+        PlayerService(player_repository=PlayerRepository(db_session)),
+        fusion=EquipmentFusion(registry),
+        hero_service=hero_service
+    )
+    install_query_tracking(db_engine)
+    app.dependency_overrides.update({
+        get_current_player_id: lambda: str(player.id),
+        get_hero_service: lambda: hero_service,
+        get_equipment_service: lambda: equipment_service
+    })
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield SimpleNamespace(client=client, heroes=heroes, swords=swords)
+    for dependency in (get_current_player_id, get_hero_service, get_equipment_service):
+        app.dependency_overrides.pop(dependency, None)
+
+
+async def post(client, path: str, body: dict):
+    """POST to a budgeted route and return the response and its statement count"""
+    route = f"POST /api/v1{path}"
+    before = query_tracker.routes.get(route)
+    before = before.total_statements if before else 0
+
+    response = await client.post(f"/api/v1{path}", json=body)
+
+    return response, query_tracker.routes[route].total_statements - before
+
+
+class TestBudgetedRoutes:
+    """Test the declared budgets against the statements the endpoints really run"""
+
+    async def test_bulk_level_up(self, game):
+        """Bulk level-up should load heroes and templates, write, then re-total power"""
+        response, statements = await post(game.client, "/heroes/level-up/bulk", {
+            "hero_ids": [str(hero.id) for hero in game.heroes],
+            "exp_pool": 5000
+        })
+
+        assert response.status_code == 200
+        assert len(response.json()["heroes"]) == 5
+        assert 0 < statements <= 4
+
+    async def test_batch_enhance(self, game):
+        """Batch enhancement should load, debit and write in its budget"""
+        response, statements = await post(game.client, "/equipment/enhance/batch", {
+            "targets": {str(sword.id): 5 for sword in game.swords}
+        })
+
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 8
+        assert 0 < statements <= 6
+
+    async def test_fuse(self, game):
+        """Fusing chosen pieces should stay in its budget"""
+        response, statements = await post(game.client, "/equipment/fuse", {
+            "equipment_ids": [str(sword.id) for sword in game.swords[1:4]]
+        })
+
+        assert response.status_code == 200
+        assert response.json()["result_equipment"]["template_id"] == "steel_sword"
+        assert 0 < statements <= 6
+
+    async def test_fuse_duplicates(self, game):
+        """Fusing every duplicate group should not grow with the inventory"""
+        response, statements = await post(game.client, "/equipment/fuse/duplicates", {
+            "group_size": 3
+        })
+
+        assert response.status_code == 200
+        # Seven unworn swords: two fusions, the worn sword is kept
+        assert response.json()["consumed_count"] == 6
+        assert 0 < statements <= 6
+
+    async def test_budget_can_fail(self, game, monkeypatch):
+        """A route over its budget should fail the request in strict mode"""
+        monkeypatch.setattr(level_up_heroes_bulk, "__query_budget__", 1)
+        # Keep this deliberate failure out of the suite's report
+        monkeypatch.setattr(query_tracker, "routes", {})
+
+        with pytest.raises(QueryBudgetExceeded):
+            await post(game.client, "/heroes/level-up/bulk", {
+                "hero_ids": [str(game.heroes[0].id)],
+                "exp_pool": 100
+            })
@@ -0,0 +1,159 @@
+"""
+Tests for ResponseCache Utility
+Serialized responses with TTLs, ETags and tag invalidation
+"""
+import pytest
+
+from app.utils.cache import (
+    CACHE_TAG_EQUIPMENT_TEMPLATES,
+    CACHE_TAG_HERO_TEMPLATES,
+    ResponseCache,
+    build_cache_key,
+    etag_matches,
+    invalidate_cached_responses,
+    make_etag,
+    player_tag
+)
+
+
+class FakeClock:
+    """Manually advanced clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """Test storing and expiring entries"""
+    
+    def test_hit_returns_stored_bytes(self):
+        """Should return the same serialized body on a hit"""
+        cache = ResponseCache()
+        key = build_cache_key("gacha.get_banners", "/api/v1/gacha/banners")
+        
+        stored = cache.set(key, b'[{"id":"standard"}]', ttl=60)
+        
+        assert cache.get(key) is stored
+        assert stored.etag == make_etag(b'[{"id":"standard"}]')
+    
+    def test_entry_expires_after_ttl(self):
+        """Should miss once the TTL has passed"""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        cache.set(("k",), b"{}", ttl=60)
+        
+        clock.now = 59.9
+        assert cache.get(("k",)) is not None
+        clock.now = 60.0
+        assert cache.get(("k",)) is None
+        assert len(cache) == 0
+    
+    def test_lru_bound(self):
+        """Should evict the least recently used entry"""
+        cache = ResponseCache(max_entries=2)
+        cache.set(("a",), b"a", ttl=60)
+        cache.set(("b",), b"b", ttl=60)
+        cache.get(("a",))
+        
+        cache.set(("c",), b"c", ttl=60)
+        
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is not None
+    
+    def test_invalidate_by_tag(self):
+        """Should drop only entries carrying the tag"""
+        cache = ResponseCache()
+        cache.set(("banners",), b"[]", ttl=60, tags=["gacha_banners"])
+        cache.set(("formations",), b"[]", ttl=60, tags=["formations"])
+        
+        removed = cache.invalidate("gacha_banners")
+        
+        assert removed == 1
+        assert cache.get(("banners",)) is None
+        assert cache.get(("formations",)) is not None
+    
+    def test_invalidate_single_player(self):
+        """Player tags should only drop that player's entries"""
+        cache = ResponseCache()
+        for player_id in ("p1", "p2"):
+            cache.set(
+                build_cache_key("story.get_chapters", "/chapters", player_id=player_id),
+                b"[]",
+                ttl=60,
+                tags=["story_chapters", player_tag("story_chapters", player_id)]
+            )
+        
+        cache.invalidate(player_tag("story_chapters", "p1"))
+        
+        assert cache.get(build_cache_key("story.get_chapters", "/chapters", player_id="p1")) is None
+        assert cache.get(build_cache_key("story.get_chapters", "/chapters", player_id="p2")) is not None
+
+
+class TestCacheKeys:
+    """Test key construction"""
+    
+    def test_query_order_does_not_matter(self):
+        """Equivalent query strings should share a key"""
+        assert build_cache_key("r", "/p", "a=1&b=2") == build_cache_key("r", "/p", "b=2&a=1")
+    
+    def test_player_scope_separates_keys(self):
+        """Different players should get different keys"""
+        assert build_cache_key("r", "/p", player_id="p1") != build_cache_key("r", "/p", player_id="p2")
+
+
+class TestEtags:
+    """Test If-None-Match handling"""
+    
+    @pytest.mark.parametrize("header,expected", [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+    ])
+    def test_etag_matches(self, header, expected):
+        """Should compare ETags weakly and accept lists and wildcards"""
+        assert etag_matches(header, '"abc"') is expected
+
+
+class TestTemplateEndpoints:
+    """Test the cached static data endpoints"""
+    
+    async def test_hero_templates_cached(self, api):
+        """Hero templates should be served from the cache after the first call"""
+        invalidate_cached_responses(CACHE_TAG_HERO_TEMPLATES)
+        
+        first = await api.get("/heroes/templates")
+        second = await api.get("/heroes/templates")
+        
+        assert first.status_code == 200
+        assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+        quan_vu = next(t for t in first.json() if t["template_id"] == "quan_vu")
+        assert quan_vu["element"] == "KIM" and quan_vu["base_stats"]["atk"] > 0
+    
+    async def test_equipment_templates_follow_reload(self, api, monkeypatch):
+        """Reloading templates should drop the cached listing"""
+        from app.api.v1 import equipment
+        from app.domain.static_data import StaticDataRegistry
+        
+        registry = StaticDataRegistry()
+        registry.load_equipment_templates([
+            {"id": "kiem", "name": "Kiếm", "equipment_type": "WEAPON", "base_rarity": 3, "base_atk": 40}
+        ])
+        monkeypatch.setattr(equipment, "static_data", registry)
+        invalidate_cached_responses(CACHE_TAG_EQUIPMENT_TEMPLATES)
+        
+        first = await api.get("/equipment/templates")
+        registry.load_equipment_templates([])
+        stale = await api.get("/equipment/templates")
+        invalidate_cached_responses(CACHE_TAG_EQUIPMENT_TEMPLATES)
+        fresh = await api.get("/equipment/templates")
+        
+        assert first.json()[0]["base_stats"]["atk"] == 40
+        assert first.json()[0]["base_stats"]["def"] == 0
+        assert stale.headers["X-Cache"] == "HIT"
+        assert fresh.json() == []
@@ -0,0 +1,112 @@
+"""
+Tests for StoryService progress
+"""
+import copy
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.security import create_access_token
+from app.models.player import Player
+from app.repositories.player_repository import PlayerRepository
+
+from app.domain.static_data import StaticDataRegistry
+from app.services.story_service import CHAPTERS, StoryService
+
+
+def create_service(player_repository=None):
+    """Story service with its own registry"""
+    return StoryService(player_repository=player_repository, registry=StaticDataRegistry())
+
+
+class TestStoryProgress:
+    """Test progress through the service"""
+
+    async def test_clearing_chapter_unlocks_next(self):
+        """Clearing every stage of chapter 1 should open chapter 2"""
+        service = create_service()
+        for stage in CHAPTERS[0]["stages"]:
+            await service.complete_stage("player-1", stage["id"], 2)
+
+        chapters = await service.get_chapters("player-1")
+        progress = await service.get_progress("player-1")
+
+        assert chapters[1]["is_unlocked"]
+        assert chapters[0]["stages_cleared"] == len(CHAPTERS[0]["stages"])
+        assert progress["chapters_cleared"] == 1
+        assert progress["current_chapter"] == CHAPTERS[1]["id"]
+        assert progress["stars_earned"] == 2 * len(CHAPTERS[0]["stages"])
+
+    async def test_first_clear_only_once(self):
+        """Only the first clear should get first-clear rewards"""
+        service = create_service()
+
+        first = await service.complete_stage("player-1", "stage_1_1", 1)
+        second = await service.complete_stage("player-1", "stage_1_1", 3)
+        chapter = await service.get_chapter("player-1", "chapter_1")
+
+        assert first["first_clear"] and not second["first_clear"]
+        assert chapter["stages"][0]["stars"] == 3
+        assert chapter["stages"][1]["is_unlocked"]
+
+    async def test_progress_saved_as_bytes(self):
+        """With a repository, progress should load and save one binary value"""
+        saved = {}
+        player_repository = AsyncMock()
+        player_repository.get_story_progress.side_effect = lambda player_id: saved.get(player_id)
+        player_repository.save_story_progress.side_effect = (
+            lambda player_id, data: saved.__setitem__(player_id, data)
+        )
+        service = create_service(player_repository)
+
+        await service.complete_stage("player-1", "stage_1_1", 3)
+        progress = await create_service(player_repository).get_progress("player-1")
+
+        assert isinstance(saved["player-1"], bytes)
+        assert (progress["stages_cleared"], progress["stars_earned"]) == (1, 3)
+
+    async def test_reload_keeps_progress_on_moved_stages(self):
+        """Reloading chapters in a new order should keep each stage's stars"""
+        service = create_service()
+        await service.complete_stage("player-1", "stage_2_1", 3)
+
+        original = copy.deepcopy(CHAPTERS)
+        try:
+            await service.reload_chapters(list(reversed(copy.deepcopy(CHAPTERS))))
+            chapter = await service.get_chapter("player-1", "chapter_2")
+        finally:
+            CHAPTERS[:] = original
+
+        assert chapter["stages"][0]["stars"] == 3
+        assert (await service.get_progress("player-1"))["stars_earned"] == 3
+
+    async def test_chapter_reload_keeps_static_data_version(self):
+        """Story reloads should not invalidate stat and set caches"""
+        registry = StaticDataRegistry()
+        version = registry.version
+
+        registry.load_story_chapters(CHAPTERS)
+
+        assert registry.version == version
+        assert registry.story_version == 1
+
+
+class TestStoryEndpoints:
+    """Test the story endpoints on the request's session"""
+
+    async def test_chapters_read_saved_progress(self, api, db_session):
+        """Chapter listings should come from the player's stored progress"""
+        player = Player(id=uuid4(), username="reader", email="r@example.com", password_hash="x")
+        db_session.add(player)
+        await db_session.flush()
+        service = StoryService(player_repository=PlayerRepository(db_session))
+        for stage in CHAPTERS[0]["stages"]:
+            await service.complete_stage(player.id, stage["id"], 1)
+        api.headers["Authorization"] = f"Bearer {create_access_token(str(player.id))}"
+
+        response = await api.get("/story/chapters")
+
+        assert response.status_code == 200
+        assert response.json()[0]["stages_cleared"] == len(CHAPTERS[0]["stages"])
+        assert response.json()[1]["is_unlocked"]
@@ -0,0 +1,97 @@
+"""
+Tests for TeamBuilderService
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from app.core.exceptions import StageNotFoundException
+from app.services.team_builder_service import TeamBuilderService
+
+
+def make_row(row_id, element, atk):
+    """Hero row with its template"""
+    return SimpleNamespace(
+        id=row_id, template_id=f"tpl-{row_id}",
+        template=SimpleNamespace(name=f"Hero {row_id}", element=element),
+        current_hp=1000, current_atk=atk, current_def=50,
+        current_spd=100, current_crit=10, current_dex=10,
+        level=10, stars=3, ascension_level=0, awakening_level=0
+    )
+
+
+class TestBuildTeam:
+    """Test loading the roster and suggesting teams"""
+
+    async def test_suggests_teams_from_roster(self):
+        """Rows should be converted and the best five returned"""
+        hero_repository = AsyncMock()
+        hero_repository.get_by_player.return_value = [
+            make_row(f"h{i}", element, 100 + i * 10)
+            for i, element in enumerate(["KIM", "MOC", "THUY", "HOA", "THO", "KIM", "MOC"])
+        ]
+        service = TeamBuilderService(hero_repository=hero_repository)
+
+        result = await service.build_team("player-1", "stage_1_1", top_k=2)
+
+        assert result["roster_size"] == 7
+        assert len(result["teams"]) == 2
+        assert len(result["teams"][0]["members"]) == 5
+        assert result["teams"][0]["score"] >= result["teams"][1]["score"]
+        hero_repository.get_by_player.assert_awaited_once()
+
+    async def test_simulation_validates_top_teams(self):
+        """Simulated teams should carry a battle result"""
+        service = TeamBuilderService()
+
+        result = await service.build_team("player-1", "stage_1_1", top_k=2, simulate=1)
+
+        simulated = [team for team in result["teams"] if team["simulation"]]
+        assert len(simulated) == 1
+        assert simulated[0]["simulation"]["turns"] > 0
+
+    async def test_unknown_stage(self):
+        """Unknown stages should be rejected before searching"""
+        with pytest.raises(StageNotFoundException):
+            await TeamBuilderService().build_team("player-1", "no-such-stage")
+
+
+class TestAutoBuildEndpoint:
+    """Test POST /teams/auto-build on the per-request services"""
+
+    async def test_suggests_from_stored_roster(self, api, db_session):
+        """The suggestion should be built from the player's stored heroes"""
+        from app.core.security import create_access_token
+        from app.models.hero import Hero, HeroTemplate
+        from app.models.player import Player
+
+        player = Player(id=uuid4(), username="builder", email="b@example.com", password_hash="x")
+        heroes = [
+            Hero(
+                id=uuid4(), player_id=player.id, template_id="quan_vu",
+                current_hp=1100, current_atk=100 + index, current_def=80, current_spd=95,
+                current_crit=15, current_dex=10
+            )
+            for index in range(6)
+        ]
+        db_session.add_all([
+            player,
+            HeroTemplate(
+                id="quan_vu", name="Quan Vũ", element="KIM", base_rarity=5, hero_class="DPS",
+                base_hp=1100, base_atk=120, base_def=80, base_spd=95, base_crit=15, base_dex=10,
+                growth_hp=8, growth_atk=2, growth_def=1, growth_spd=0, growth_crit=0, growth_dex=0
+            ),
+            *heroes
+        ])
+        await db_session.flush()
+        api.headers["Authorization"] = f"Bearer {create_access_token(str(player.id))}"
+
+        response = await api.post("/teams/auto-build", json={"stage_id": "stage_1_1", "top_k": 1})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["roster_size"] == 6
+        members = {member["hero_id"] for member in body["teams"][0]["members"]}
+        assert len(members) == 5
+        assert members <= {str(hero.id) for hero in heroes}
@@ -0,0 +1,140 @@
+"""
+Tests for TeamService
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+from app.core.exceptions import TeamNotFoundException, ValidationException
+from app.repositories.memory_team_repository import InMemoryTeamRepository
+from app.services.team_service import TeamService
+
+
+def create_service():
+    """Team service with a hero service that resolves any hero"""
+    hero_service = AsyncMock()
+    hero_service.get_hero_briefs.side_effect = lambda hero_ids, player_id: {
+        hero_id: {"name": f"Hero {hero_id}", "power": 100} for hero_id in hero_ids
+    }
+    return TeamService(hero_service=hero_service, team_repository=InMemoryTeamRepository())
+
+
+class TestTeamStorage:
+    """Test teams stored per player"""
+
+    async def test_members_stored_compact(self):
+        """Members should be stored as [hero_id, x, y] and resolved on read"""
+        service = create_service()
+        team = (await service.get_teams("player-1"))[0]
+
+        team = await service.add_member(team["id"], "player-1", "h1", {"x": 1, "y": 2})
+
+        record = await service.team_repository.get_for_player(team["id"], "player-1")
+        assert record["members"] == [["h1", 1, 2]]
+        assert team["members"] == [
+            {"hero_id": "h1", "hero_name": "Hero h1", "position": {"x": 1, "y": 2}, "power": 100}
+        ]
+        assert team["total_power"] == 100
+
+    async def test_teams_isolated_per_player(self):
+        """A player should not see or load another player's team"""
+        service = create_service()
+        team = (await service.get_teams("player-1"))[0]
+
+        with pytest.raises(TeamNotFoundException):
+            await service.get_team(team["id"], "player-2")
+        assert [t["id"] for t in await service.get_teams("player-2")] != [team["id"]]
+
+    async def test_slot_reused_after_delete(self):
+        """New teams should take the lowest free slot"""
+        service = create_service()
+        await service.get_teams("player-1")
+        second = await service.create_team("player-1", "Second")
+        await service.create_team("player-1", "Third")
+
+        await service.delete_team(second["id"], "player-1")
+        fourth = await service.create_team("player-1", "Fourth")
+
+        assert fourth["slot_number"] == 2
+
+    async def test_duplicate_slot_rejected(self):
+        """The store should enforce one team per player slot"""
+        repository = InMemoryTeamRepository()
+        record = {
+            "player_id": "player-1", "name": "A", "slot_number": 1,
+            "formation_id": None, "is_default": False, "members": []
+        }
+        await repository.create_team(record)
+
+        with pytest.raises(ValueError):
+            await repository.create_team(record)
+
+
+class TestTeamCache:
+    """Test the per-player team list cache"""
+
+    async def test_reads_served_from_cache(self):
+        """Repeated reads should not hit the store or the hero service"""
+        service = create_service()
+        await service.get_teams("player-1")
+        service.team_repository.get_by_player = AsyncMock()
+
+        teams = await service.get_teams("player-1")
+        await service.get_team(teams[0]["id"], "player-1")
+
+        service.team_repository.get_by_player.assert_not_awaited()
+
+    async def test_writes_invalidate_cache(self):
+        """A write should be visible on the next read"""
+        service = create_service()
+        team = (await service.get_teams("player-1"))[0]
+
+        await service.update_team(team["id"], "player-1", name="Renamed")
+        await service.update_formation(team["id"], "player-1", "ngu_hanh_tran")
+
+        cached = (await service.get_teams("player-1"))[0]
+        assert cached["name"] == "Renamed"
+        assert cached["formation_id"] == "ngu_hanh_tran"
+
+    async def test_hero_lookup_batched(self):
+        """Loading several teams should resolve heroes in one call"""
+        service = create_service()
+        first = (await service.get_teams("player-1"))[0]
+        second = await service.create_team("player-1", "Second")
+        await service.add_member(first["id"], "player-1", "h1", {"x": 0, "y": 0})
+        await service.add_member(second["id"], "player-1", "h2", {"x": 0, "y": 0})
+        service.hero_service.get_hero_briefs.reset_mock()
+
+        teams = await service.get_teams("player-1")
+
+        assert [t["total_power"] for t in teams] == [100, 100]
+        service.hero_service.get_hero_briefs.assert_called_once()
+
+    async def test_hero_power_resolved_on_every_read(self):
+        """Hero changes should show without a team write"""
+        service = create_service()
+        team = (await service.get_teams("player-1"))[0]
+        await service.add_member(team["id"], "player-1", "h1", {"x": 0, "y": 0})
+
+        service.hero_service.get_hero_briefs.side_effect = lambda hero_ids, player_id: {
+            hero_id: {"name": f"Hero {hero_id}", "power": 250} for hero_id in hero_ids
+        }
+
+        assert (await service.get_teams("player-1"))[0]["total_power"] == 250
+        assert (await service.get_team(team["id"], "player-1"))["total_power"] == 250
+
+    async def test_cache_is_bounded(self):
+        """Least recently used players should be dropped past the limit"""
+        service = create_service()
+        service.max_cached_players = 2
+        for player_id in ("player-1", "player-2", "player-1", "player-3"):
+            await service.get_teams(player_id)
+
+        assert list(service._team_cache) == ["player-1", "player-3"]
+
+    async def test_default_team_cannot_be_deleted(self):
+        """Deleting the default team should fail"""
+        service = create_service()
+        team = (await service.get_teams("player-1"))[0]
+
+        with pytest.raises(ValidationException):
+            await service.delete_team(team["id"], "player-1")